@@ -1,52 +1,171 @@
 # -*- coding: utf-8 -*-
 """
 Vercel 서버리스 함수 - 텔레그램 Webhook
+
+콜드 스타트 시 사용자 대기 시간을 줄이기 위해
+- 모듈 로드 시 출력/초기화를 하지 않음 (텔레그램/계산기 모듈은 첫 POST 요청에서 로드)
+- python-telegram-bot 대신 경량 Bot API 클라이언트(utils/telegram_client)를 사용
+  (업데이트는 쓰는 필드만 꺼내고, 답장은 keep-alive 연결 풀로 보냄, getMe 호출도 하지 않음)
+- 금융사 설정은 미리 만들어 둔 설정 번들(data/banks.bundle)에서 로드
+- 처리하지 않는 업데이트(허용되지 않은 채팅방, 도움말이 아닌 명령어, 텍스트가 없는 메시지 등)는
+  앱을 초기화하기 전에 걸러냄 (허용 채팅방 목록은 한 번만 읽어 frozenset으로 보관)
+
+처리가 늦어져 텔레그램이 같은 업데이트를 다시 보내면 최근 처리한 update_id(utils/update_dedup)로 걸러
+계산/답장 없이 바로 200으로 응답 (중복으로 걸러낸 횟수는 GET 응답의 dedup에 표시)
+
+업데이트는 프로세스당 하나인 백그라운드 이벤트 루프(utils/loop_worker)에서 처리하므로
+동시에 들어온 요청이 요청마다 스레드/루프를 만들지 않고 같은 루프에서 겹쳐서 처리됨
+(WEBHOOK_MAX_IN_FLIGHT개를 넘으면 503을 반환하여 텔레그램이 다시 보내도록 함)
+
+WEBHOOK_REPLY_IN_RESPONSE=1이면 답장(sendMessage)을 별도 Bot API 요청 대신 웹훅 응답 본문으로 반환하여 왕복 한 번을 줄임
+(길이 제한을 넘어 나눠 보내는 답장, 기존 답장 수정, 처리 시간 초과 후 답장은 직접 보냄,
+ 응답 본문으로 보낸 답장은 메시지 ID를 알 수 없으므로 원래 메시지를 수정하면 답장을 고치지 않고 새로 보냄)
+
+견적 계산 전에 수락 제어(utils/admission)를 거침: 채팅방별 토큰 버킷으로 한 채팅방이 매물을 한꺼번에 붙여넣어도
+조금씩 처리하고, 동시 계산 수와 대기열 크기를 넘는 요청은 바로 거절(채팅방마다 한 번 안내)
+파싱/계산/포맷은 main.py와 같이 견적 실행기(utils/quote_executor)에서 처리하여 이벤트 루프를 막지 않음
+(동시 계산 수 기본값은 실행기 작업자 수)
+직접 보내는 답장/수정은 채팅방별 간격을 두고 보내며 429 응답이면 retry_after만큼 기다렸다 다시 보냄
+(수락 대기 시간과 계산 시간은 로그에 따로 남기고, 누적 통계는 GET 응답의 admission/pacer/quote_executor에 표시)
+
+로그는 logging(api.webhook 로거)으로 남김: 요청별 처리 과정은 DEBUG, 전송/처리 실패는 WARNING/ERROR
+(봇 토큰은 일부라도 로그에 남기지 않음)
+
+콜드 스타트 측정/예산 확인: python scripts/bench_cold_start.py
 """
 
 import json
+import logging
 import os
 import sys
-import asyncio
+import threading
+from typing import Any, Callable, FrozenSet, NamedTuple, Optional
 
 # 프로젝트 루트를 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Vercel 로그를 위해 stderr와 stdout 모두 사용
-def log_debug(message):
-    """디버그 로그 출력 (Vercel 로그에 표시)"""
-    print(message, file=sys.stderr, flush=True)
-    print(message, flush=True)
-
-# 모듈 로드 시 로그 출력 (즉시 실행)
-print("=" * 60, file=sys.stderr, flush=True)
-print("DEBUG: api/webhook.py module loaded", file=sys.stderr, flush=True)
-print(f"DEBUG: Python version: {sys.version}", file=sys.stderr, flush=True)
-print(f"DEBUG: Working directory: {os.getcwd()}", file=sys.stderr, flush=True)
-print("=" * 60, file=sys.stderr, flush=True)
-# stdout에도 출력
-print("=" * 60, flush=True)
-print("DEBUG: api/webhook.py module loaded", flush=True)
-print(f"DEBUG: Python version: {sys.version}", flush=True)
-print(f"DEBUG: Working directory: {os.getcwd()}", flush=True)
-print("=" * 60, flush=True)
-
-# 전역 애플리케이션 인스턴스
+logger = logging.getLogger(__name__)
+
+
+class WebhookApplication(NamedTuple):
+    """첫 요청에서 만든 봇과 업데이트 처리 함수"""
+    bot: Any  # utils.telegram_client.BotApiClient
+    process_update: Callable[[Any, Any], Any]  # async (WebhookUpdate, WebhookReplySlot) -> None
+    allowed_chat_ids: FrozenSet[int]  # 비어 있으면 모든 채팅방 허용
+    reply_in_response: bool = False  # 답장을 웹훅 응답 본문으로 반환
+    admission: Any = None  # utils.admission.QuoteAdmission
+    quote_executor: Any = None  # utils.quote_executor.QuoteExecutor
+    pacer: Any = None  # utils.admission.ChatPacer
+
+
+# 전역 애플리케이션 인스턴스와 업데이트를 처리하는 이벤트 루프 워커 (첫 POST 요청에서 생성)
 application = None
-_global_loop = None
+_loop_worker = None
+_init_lock = threading.Lock()
+
+# 허용된 채팅방 ID (첫 POST 요청에서 한 번 읽음)
+_allowed_chat_ids = None
+
+# 최근 처리한 update_id (텔레그램 재전송 중복 처리 방지)
+_update_deduplicator = None
+
+# 업데이트 처리를 기다리는 시간 (초, 지나면 응답은 먼저 보내고 처리는 루프에서 계속)
+PROCESS_TIMEOUT = 25.0
+
+# 동시 처리 수 제한에 걸렸을 때 자리가 나기를 기다리는 시간 (초)
+BUSY_WAIT = 5.0
+
+# 도움말을 보여주는 명령어 (그 밖의 명령어는 무시)
+HELP_COMMANDS = ("start", "help")
+
+
+def get_allowed_chat_ids() -> FrozenSet[int]:
+    """허용된 채팅방 ID (ALLOWED_CHAT_IDS 환경변수 또는 config.telegram_config, 처음 한 번만 읽음, 비어 있으면 모두 허용)"""
+    global _allowed_chat_ids
+
+    if _allowed_chat_ids is None:
+        allowed_chat_ids_str = os.getenv("ALLOWED_CHAT_IDS")
+        if not allowed_chat_ids_str:
+            try:
+                from config.telegram_config import ALLOWED_CHAT_IDS  # type: ignore
+                allowed_chat_ids_str = ALLOWED_CHAT_IDS
+            except (ModuleNotFoundError, ImportError):
+                allowed_chat_ids_str = None
+        
+        _allowed_chat_ids = frozenset(
+            int(chat_id.strip()) for chat_id in (allowed_chat_ids_str or "").split(",") if chat_id.strip()
+        )
+    return _allowed_chat_ids
+
+
+def prefilter_update(update, allowed_chat_ids: FrozenSet[int]) -> Optional[str]:
+    """
+    앱 초기화 전에 처리하지 않을 업데이트를 걸러냄
+    
+    Args:
+        update: utils.telegram_update.WebhookUpdate
+        allowed_chat_ids: 허용된 채팅방 ID (비어 있으면 모두 허용)
+    
+    Returns:
+        건너뛰는 이유 (처리할 업데이트면 None)
+    """
+    if update.kind is None:
+        return "unsupported update"
+    if update.chat_id is None or (allowed_chat_ids and update.chat_id not in allowed_chat_ids):
+        return "chat not allowed"
+    if update.kind == "message" and update.command is not None and update.command not in HELP_COMMANDS:
+        return "command"
+    if not update.text:
+        return "no text"
+    return None
 
 
 def get_application():
-    """텔레그램 애플리케이션 인스턴스 가져오기 (싱글톤)"""
+    """텔레그램 봇과 업데이트 처리 함수 가져오기 (싱글톤, 첫 POST 요청에서 생성)"""
+    if application is None:
+        with _init_lock:
+            if application is None:
+                _create_application()
+    return application
+
+
+def get_update_deduplicator():
+    """업데이트 중복 처리 방지 (싱글톤)"""
+    global _update_deduplicator
+
+    if _update_deduplicator is None:
+        from utils.update_dedup import update_deduplicator_from_env
+        with _init_lock:
+            if _update_deduplicator is None:
+                _update_deduplicator = update_deduplicator_from_env()
+    return _update_deduplicator
+
+
+def get_loop_worker():
+    """업데이트를 처리하는 백그라운드 이벤트 루프 워커 (싱글톤)"""
+    global _loop_worker
+
+    if _loop_worker is None:
+        from utils.loop_worker import loop_worker_from_env
+        with _init_lock:
+            if _loop_worker is None:
+                _loop_worker = loop_worker_from_env("webhook-loop")
+    return _loop_worker
+
+
+def _create_application():
+    """봇과 업데이트 처리 함수 생성 (_init_lock 안에서 호출)"""
     global application
 
     if application is None:
-        log_debug("DEBUG: Initializing Telegram application...")
-        from telegram.ext import (
-            Application, MessageHandler, CommandHandler, filters
-        )
-        from parsers.message_parser import MessageParser
+        logger.debug("Initializing Telegram application")
+        from utils.admission import BUSY_NOTICE, AdmissionRejected, chat_pacer_from_env, quote_admission_from_env
+        from utils.telegram_client import bot_api_client_from_env
+        from utils.telegram_update import MAX_MESSAGE_LENGTH, reply_params, split_text
+        from utils.quote_executor import quote_executor_from_env
         from calculator.base_calculator import BaseCalculator
-        from utils.formatter import format_all_results
+        from calculator.bank_registry import get_bank_registry
+        from calculator.requote import quote_store_from_env
 
         # 환경변수에서 토큰 가져오기
         TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -54,39 +173,28 @@ def get_application():
             try:
                 from config.telegram_config import TELEGRAM_BOT_TOKEN  # type: ignore
             except ModuleNotFoundError:
-                log_debug("ERROR: TELEGRAM_BOT_TOKEN not found in environment variables")
+                logger.error("TELEGRAM_BOT_TOKEN not found in environment variables")
                 raise ValueError("TELEGRAM_BOT_TOKEN 환경변수를 설정해주세요.")
-        
-        log_debug(f"DEBUG: TELEGRAM_BOT_TOKEN found: {TELEGRAM_BOT_TOKEN[:10]}...")
 
         # 허용된 채팅방 ID 가져오기
-        ALLOWED_CHAT_IDS_STR = os.getenv("ALLOWED_CHAT_IDS")
-        if not ALLOWED_CHAT_IDS_STR:
-            try:
-                from config.telegram_config import ALLOWED_CHAT_IDS  # type: ignore
-                ALLOWED_CHAT_IDS_STR = ALLOWED_CHAT_IDS
-            except (ModuleNotFoundError, ImportError):
-                ALLOWED_CHAT_IDS_STR = None
+        allowed_chat_ids = get_allowed_chat_ids()
+        logger.debug("Application initialized - allowed_chat_ids: %s", sorted(allowed_chat_ids))
+
+        # 메시지 전송/수정만 하는 Bot API 클라이언트 (연결은 이벤트 루프 워커의 루프에서 열고 요청 간에 재사용)
+        bot = bot_api_client_from_env(TELEGRAM_BOT_TOKEN)
         
-        allowed_chat_ids = []
-        if ALLOWED_CHAT_IDS_STR:
-            allowed_chat_ids = [int(chat_id.strip()) for chat_id in ALLOWED_CHAT_IDS_STR.split(",") if chat_id.strip()]
+        # 답장을 웹훅 응답 본문으로 반환할지 여부
+        reply_in_response = os.getenv("WEBHOOK_REPLY_IN_RESPONSE", "").strip().lower() in ("1", "true", "yes")
         
-        log_debug(f"DEBUG: Application initialized - allowed_chat_ids: {allowed_chat_ids}")
-
-        application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
-
-        def get_chat_id(update):
-            """업데이트에서 채팅방 ID 가져오기"""
-            if update.message:
-                return update.message.chat.id
-            elif update.edited_message:
-                return update.edited_message.chat.id
-            elif update.channel_post:
-                return update.channel_post.chat.id
-            elif update.edited_channel_post:
-                return update.edited_channel_post.chat.id
-            return None
+        # (채팅방, 메시지 ID)별 마지막 산출 기록과 답장 (수정 메시지는 기존 답장을 고침)
+        quote_store = quote_store_from_env()
+        
+        # 파싱/계산/포맷을 이벤트 루프 밖에서 처리하는 견적 실행기
+        quote_executor = quote_executor_from_env()
+        
+        # 견적 계산 수락 제어 (채팅방별 토큰 버킷, 동시 계산 수, 대기열)와 채팅방별 전송 간격/429 재시도
+        admission = quote_admission_from_env(default_max_concurrent=quote_executor.workers)
+        pacer = chat_pacer_from_env()
 
         def is_allowed_chat(chat_id):
             """채팅방이 허용된 목록에 있는지 확인"""
@@ -96,14 +204,31 @@ def get_application():
                 return True
             return chat_id in allowed_chat_ids
 
-        async def start_command(update, context):
-            message = update.message or update.channel_post or update.edited_message or update.edited_channel_post
-            if not message:
+        async def send_reply(update, text, reply_slot):
+            """
+            답장 보내기 (한 번에 보낼 수 있는 답장은 가능하면 웹훅 응답 본문으로 넘기고, 길면 나눠서 직접 보냄)
+            
+            Returns:
+                보낸 답장 메시지 ID (응답 본문으로 넘겼거나 나눠 보냈으면 None)
+            """
+            parts = split_text(text)
+            if len(parts) == 1 and reply_slot.offer("sendMessage", reply_params(update, text)):
+                logger.debug("Reply to chat %s handed to webhook response", update.chat_id)
+                return None
+            if len(parts) > 1:
+                logger.debug("Reply to chat %s split into %d messages", update.chat_id, len(parts))
+            sent = [
+                await pacer.send(update.chat_id, lambda part=part: bot.reply_text(update, part)) for part in parts
+            ]
+            return sent[0]["message_id"] if len(sent) == 1 else None
+
+        async def start_command(update, reply_slot):
+            if update.kind is None:
                 return
             
-            chat_id = get_chat_id(update)
+            chat_id = update.chat_id
             if not is_allowed_chat(chat_id):
-                log_debug(f"DEBUG: Chat {chat_id} is not allowed")
+                logger.debug("Chat %s is not allowed", chat_id)
                 return
             
             welcome_message = (
@@ -123,90 +248,148 @@ def get_application():
                 "이제 담보물건 정보를 보내주시면 계산해드리겠습니다! 🚀"
             )
             try:
-                await message.reply_text(welcome_message)
+                await send_reply(update, welcome_message, reply_slot)
             except Exception as e:
-                log_debug(f"DEBUG: Error sending welcome message: {str(e)}")
+                logger.warning("Error sending welcome message: %s", e)
 
-        async def handle_message(update, context=None):
-            message = update.message or update.channel_post or update.edited_message or update.edited_channel_post
-            
-            if not message:
+        async def handle_message(update, reply_slot):
+            if update.kind is None:
                 return
             
-            chat_id = get_chat_id(update)
+            chat_id = update.chat_id
             if not is_allowed_chat(chat_id):
-                log_debug(f"DEBUG: Chat {chat_id} is not allowed")
+                logger.debug("Chat %s is not allowed", chat_id)
                 return
             
-            message_text = message.text
+            # 텍스트가 없는 메시지는 핸들러가 미리 걸러냄 (prefilter_update)
+            message_text = update.text
             if not message_text:
-                await message.reply_text(
-                    "텍스트 메시지를 보내주세요.\n\n"
-                    "담보물건 정보를 텍스트로 입력해주시면 계산해드립니다.\n\n"
-                    "/start 명령어로 사용 방법을 확인하실 수 있습니다."
-                )
                 return
             
             try:
-                parser = MessageParser()
-                property_data = parser.parse(message_text)
-                results = BaseCalculator.calculate_all_banks(property_data)
-                formatted_result = format_all_results(results)
-                await message.reply_text(formatted_result)
-                log_debug(f"DEBUG: Message sent successfully to chat {chat_id}")
+                # 수정 메시지면 이전 기록의 답장을 고침 (입력이 같은 금융사는 금융사별 결과 캐시가 재사용)
+                previous = quote_store.get(chat_id, update.message_id) if update.is_edit else None
+                
+                # 수락될 때까지 기다린 뒤 실행기에서 파싱/계산/포맷 (답장은 계산 자리를 반납한 뒤에 보냄)
+                async with admission.admit(chat_id) as ticket:
+                    outcome = await quote_executor.quote(message_text, previous)
+                record, formatted_result = outcome.record, outcome.text
+                config_version = get_bank_registry(BaseCalculator).snapshot().version_label
+                logger.debug(
+                    "Quote for chat %s: queued %.1fms (chat rate %.1fms, depth %d) / computed %.1fms "
+                    "(executor queue %.1fms, parse %.1fms, calculate %.1fms, format %.1fms)",
+                    chat_id, ticket.queue_ms, ticket.chat_wait_ms, ticket.queue_depth,
+                    outcome.parse_ms + outcome.calculate_ms + outcome.format_ms,
+                    outcome.queue_ms, outcome.parse_ms, outcome.calculate_ms, outcome.format_ms
+                )
+                
+                replied = False
+                reply_message_id = None
+                if previous is not None and previous.reply_text is not None:
+                    logger.debug(
+                        "Edited message %s in chat %s - updating reply %s",
+                        update.message_id, chat_id, previous.reply_message_id
+                    )
+                    if formatted_result == previous.reply_text:
+                        replied = True
+                        reply_message_id = previous.reply_message_id
+                        logger.debug("Result unchanged, keeping reply %s", reply_message_id)
+                    elif previous.reply_message_id is not None and len(formatted_result) <= MAX_MESSAGE_LENGTH:
+                        try:
+                            await pacer.send(
+                                chat_id, lambda: bot.edit_message_text(chat_id, previous.reply_message_id, formatted_result)
+                            )
+                            replied = True
+                            reply_message_id = previous.reply_message_id
+                            logger.debug("Reply %s edited in chat %s (bank config %s)", reply_message_id, chat_id, config_version)
+                        except Exception as e:
+                            # 답장이 삭제되었거나 너무 오래된 경우 새 답장으로 보냄
+                            logger.debug("Could not edit reply %s: %s", previous.reply_message_id, e)
+                
+                if not replied:
+                    reply_message_id = await send_reply(update, formatted_result, reply_slot)
+                    logger.debug("Message sent successfully to chat %s (bank config %s)", chat_id, config_version)
+                
+                quote_store.put(
+                    chat_id, update.message_id,
+                    record._replace(reply_message_id=reply_message_id, reply_text=formatted_result)
+                )
+            except AdmissionRejected as e:
+                logger.debug("Quote for chat %s rejected (%s), notify: %s", chat_id, e.reason, e.notify)
+                if e.notify:
+                    try:
+                        await send_reply(update, BUSY_NOTICE, reply_slot)
+                    except Exception as notice_error:
+                        logger.warning("Could not send busy notice: %s", notice_error)
             except Exception as e:
-                log_debug(f"DEBUG: Error in handle_message: {str(e)}")
-                import traceback
-                traceback.print_exc(file=sys.stderr)
+                logger.exception("Error in handle_message: %s", e)
                 try:
-                    await message.reply_text(
+                    await send_reply(
+                        update,
                         f"계산 중 오류가 발생했습니다.\n\n"
-                        f"오류 내용: {str(e)}"
+                        f"오류 내용: {str(e)}",
+                        reply_slot
                     )
                 except Exception:
                     pass
 
-        application.add_handler(CommandHandler("start", start_command))
-        application.add_handler(CommandHandler("help", start_command))
-        application.add_handler(MessageHandler(~filters.COMMAND, handle_message))
-        application._handle_message = handle_message
-        
-        log_debug("DEBUG: Telegram application handlers registered")
-
-    return application
+        async def process_update(update, reply_slot):
+            """
+            업데이트 분기: 일반 메시지의 /start, /help는 도움말, 그 밖의 명령어는 무시,
+            나머지 메시지와 채널 게시글/수정 메시지는 계산
+            """
+            if update.kind == "message" and update.command is not None:
+                if update.command in HELP_COMMANDS:
+                    await start_command(update, reply_slot)
+                return
+            await handle_message(update, reply_slot)
 
+        application = WebhookApplication(
+            bot=bot,
+            process_update=process_update,
+            allowed_chat_ids=allowed_chat_ids,
+            reply_in_response=reply_in_response,
+            admission=admission,
+            quote_executor=quote_executor,
+            pacer=pacer
+        )
+        logger.debug("Telegram application handlers registered")
 
-# handler 클래스 정의 전 로그
-print("DEBUG: About to define handler function", file=sys.stderr, flush=True)
-print("DEBUG: About to define handler function", flush=True)
 
 def handler(request):
     """
     Vercel Python 서버리스 함수 핸들러
     Vercel Python은 Request 객체를 받아 Response를 반환합니다.
     """
-    log_debug(f"DEBUG: ===== Request received =====")
-    log_debug(f"DEBUG: Method: {request.method}")
-    log_debug(f"DEBUG: Path: {request.path}")
+    logger.debug("Request received: %s %s", request.method, request.path)
     
     try:
         # GET 요청 처리 (헬스체크)
         if request.method == 'GET':
-            log_debug("DEBUG: GET request received")
+            stats = get_update_deduplicator().stats()
+            status = {
+                "ok": True,
+                "message": "Webhook endpoint is active",
+                "dedup": dict(stats._asdict(), duplicate_rate=round(stats.duplicate_rate, 4))
+            }
+            # 수락 제어/전송 통계는 앱이 초기화된 뒤에만 (헬스체크가 앱을 초기화하지 않도록)
+            app = application
+            if app is not None and app.admission is not None:
+                status["admission"] = app.admission.stats()._asdict()
+                status["pacer"] = app.pacer.stats()._asdict()
+                status["quote_executor"] = app.quote_executor.stats()._asdict()
             return {
                 'statusCode': 200,
                 'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({"ok": True, "message": "Webhook endpoint is active"})
+                'body': json.dumps(status)
             }
         
         # POST 요청 처리 (텔레그램 웹훅)
         if request.method == 'POST':
-            log_debug("DEBUG: ===== POST request received =====")
-            
             # 요청 body 읽기
             body_str = request.body
             if not body_str:
-                log_debug("DEBUG: Empty body, skipping")
+                logger.debug("Empty body, skipping")
                 return {
                     'statusCode': 200,
                     'headers': {'Content-Type': 'application/json'},
@@ -217,7 +400,7 @@ def handler(request):
             try:
                 body = json.loads(body_str) if isinstance(body_str, str) else body_str
             except (json.JSONDecodeError, TypeError):
-                log_debug("DEBUG: Invalid JSON format")
+                logger.debug("Invalid JSON format, skipping")
                 return {
                     'statusCode': 200,
                     'headers': {'Content-Type': 'application/json'},
@@ -226,133 +409,89 @@ def handler(request):
             
             # 텔레그램 update 형식 검증
             if not isinstance(body, dict) or "update_id" not in body:
-                log_debug("DEBUG: Not a telegram update, skipping")
+                logger.debug("Not a telegram update, skipping")
                 return {
                     'statusCode': 200,
                     'headers': {'Content-Type': 'application/json'},
                     'body': json.dumps({"ok": True, "skipped": "not telegram update"})
                 }
             
-            log_debug(f"DEBUG: Telegram update received - update_id: {body.get('update_id')}")
-            
-            # 텔레그램 업데이트 처리
-            from telegram import Update
-            app = get_application()
-            update = Update.de_json(body, app.bot)
-            
-            # 채팅방 ID 확인
-            def get_chat_id_from_update(update):
-                if update.message:
-                    return update.message.chat.id
-                elif update.edited_message:
-                    return update.edited_message.chat.id
-                elif update.channel_post:
-                    return update.channel_post.chat.id
-                elif update.edited_channel_post:
-                    return update.edited_channel_post.chat.id
-                return None
+            # 쓰는 필드만 꺼내서 처리하지 않을 업데이트는 앱 초기화 전에 걸러냄
+            from utils.telegram_update import WebhookReplySlot, parse_update
+            update = parse_update(body)
+            logger.debug("Telegram update %s received - chat_id: %s", update.update_id, update.chat_id)
             
-            chat_id = get_chat_id_from_update(update)
-            log_debug(f"DEBUG: chat_id: {chat_id}")
-            
-            # 허용된 채팅방 ID 확인
-            ALLOWED_CHAT_IDS_STR = os.getenv("ALLOWED_CHAT_IDS")
-            if not ALLOWED_CHAT_IDS_STR:
-                try:
-                    from config.telegram_config import ALLOWED_CHAT_IDS  # type: ignore
-                    ALLOWED_CHAT_IDS_STR = ALLOWED_CHAT_IDS
-                except (ModuleNotFoundError, ImportError):
-                    ALLOWED_CHAT_IDS_STR = None
-            
-            allowed_chat_ids = []
-            if ALLOWED_CHAT_IDS_STR:
-                allowed_chat_ids = [int(chat_id.strip()) for chat_id in ALLOWED_CHAT_IDS_STR.split(",") if chat_id.strip()]
+            skipped = prefilter_update(update, get_allowed_chat_ids())
+            if skipped is not None:
+                logger.debug("Update skipped before processing: %s", skipped)
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json'},
+                    'body': json.dumps({"ok": True, "skipped": skipped})
+                }
             
-            if allowed_chat_ids and chat_id not in allowed_chat_ids:
-                log_debug(f"DEBUG: Chat {chat_id} is not in allowed list")
+            # 이미 받은 업데이트(처리가 늦어 텔레그램이 다시 보낸 것)는 바로 200
+            deduplicator = get_update_deduplicator()
+            try:
+                claimed = deduplicator.claim(update.update_id)
+            except Exception as e:
+                # 중복 확인에 실패해도 견적은 처리
+                logger.warning("Update dedup failed, processing anyway: %s", e)
+                claimed = True
+            if not claimed:
+                logger.debug("Duplicate update %s skipped", update.update_id)
                 return {
                     'statusCode': 200,
                     'headers': {'Content-Type': 'application/json'},
-                    'body': json.dumps({"ok": True, "skipped": "chat not allowed"})
+                    'body': json.dumps({"ok": True, "skipped": "duplicate"})
                 }
             
-            # 비동기 처리
-            async def process():
-                try:
-                    if not app._initialized:
-                        await app.initialize()
-                    
-                    if update.channel_post or update.edited_message or update.edited_channel_post:
-                        if hasattr(app, '_handle_message'):
-                            await app._handle_message(update, None)
-                        else:
-                            await app.process_update(update)
-                    else:
-                        await app.process_update(update)
-                    
-                    log_debug("DEBUG: Message processing completed")
-                except Exception as e:
-                    log_debug(f"DEBUG: Error in process(): {str(e)}")
-                    import traceback
-                    traceback.print_exc(file=sys.stderr)
+            # 텔레그램 업데이트 처리
+            from utils.loop_worker import LoopWorkerBusy
+            try:
+                app = get_application()
+            except Exception:
+                # 처리를 시작하지 못했으므로 다시 오면 처리
+                deduplicator.release(update.update_id)
+                raise
             
-            # 이벤트 루프 실행
-            global _global_loop
+            # 비동기 처리 (응답 본문 모드면 답장을 reply_slot에 넘겨받음)
+            reply_slot = WebhookReplySlot(app.reply_in_response)
             
-            try:
-                loop = asyncio.get_running_loop()
-                log_debug("DEBUG: Event loop already running, using thread")
-                import threading
-                import queue
-                
-                exception_queue = queue.Queue()
-                
-                def run_in_new_thread():
-                    global _global_loop
-                    try:
-                        if _global_loop is None or _global_loop.is_closed():
-                            new_loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(new_loop)
-                        else:
-                            new_loop = _global_loop
-                            asyncio.set_event_loop(new_loop)
-                        
-                        new_loop.run_until_complete(process())
-                        
-                        if not new_loop.is_closed():
-                            _global_loop = new_loop
-                    except Exception as e:
-                        exception_queue.put(e)
-                
-                thread = threading.Thread(target=run_in_new_thread, daemon=False)
-                thread.start()
-                thread.join(timeout=25)
-                
-                if not exception_queue.empty():
-                    raise exception_queue.get()
-                
-                if thread.is_alive():
-                    log_debug("DEBUG: Thread timeout")
-                    raise TimeoutError("Process timeout")
-                    
-            except RuntimeError:
-                log_debug("DEBUG: No running loop, creating new one")
-                
-                if _global_loop is None or _global_loop.is_closed():
-                    _global_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(_global_loop)
-                
+            async def process():
                 try:
-                    _global_loop.run_until_complete(process())
+                    await app.process_update(update, reply_slot)
+                    logger.debug("Message processing completed")
                 except Exception as e:
-                    log_debug(f"DEBUG: Error in process: {str(e)}")
+                    logger.exception("Error in process(): %s", e)
             
+            # 백그라운드 이벤트 루프에서 처리하고 끝날 때까지 기다림
+            try:
+                get_loop_worker().run(process(), timeout=PROCESS_TIMEOUT, wait=BUSY_WAIT)
+            except LoopWorkerBusy as e:
+                # 동시 처리 수 초과: 텔레그램이 같은 업데이트를 다시 보내도록 실패 응답
+                logger.warning("Worker busy, asking Telegram to retry: %s", e)
+                deduplicator.release(update.update_id)
+                return {
+                    'statusCode': 503,
+                    'headers': {'Content-Type': 'application/json', 'Retry-After': '1'},
+                    'body': json.dumps({"ok": False, "error": "busy"})
+                }
+            except TimeoutError as e:
+                logger.warning("Process timeout (still running in background): %s", e)
             except Exception as e:
-                log_debug(f"DEBUG: Event loop error: {str(e)}")
-                import traceback
-                traceback.print_exc(file=sys.stderr)
+                logger.exception("Event loop error: %s", e)
             
-            log_debug("DEBUG: ===== POST request completed =====")
+            # 처리가 끝나기 전에 응답하는 경우(시간 초과) 이후 답장은 코루틴이 직접 보냄
+            payload = reply_slot.take()
+            logger.debug("Update %s completed", update.update_id)
+            if payload is not None:
+                logger.debug("Replying in webhook response (%s)", payload["method"])
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json'},
+                    'body': json.dumps(payload, ensure_ascii=False)
+                }
             return {
                 'statusCode': 200,
                 'headers': {'Content-Type': 'application/json'},
@@ -367,21 +506,10 @@ def handler(request):
         }
         
     except Exception as e:
-        import traceback
         error_msg = str(e)
-        traceback_str = traceback.format_exc()
-        log_debug(f"ERROR: Error processing request: {error_msg}")
-        log_debug(traceback_str)
+        logger.exception("Error processing request: %s", error_msg)
         return {
             'statusCode': 500,
             'headers': {'Content-Type': 'application/json'},
             'body': json.dumps({"error": error_msg})
         }
-
-# 모듈 로드 완료 (즉시 실행)
-print("DEBUG: api/webhook.py module initialization complete", file=sys.stderr, flush=True)
-print(f"DEBUG: handler function ready: {handler}", file=sys.stderr, flush=True)
-print("DEBUG: api/webhook.py module initialization complete", flush=True)
-print(f"DEBUG: handler function ready: {handler}", flush=True)
-log_debug("DEBUG: api/webhook.py module initialization complete")
-log_debug(f"DEBUG: handler function ready: {handler}")
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+금융사 설정 번들
+data/banks의 설정 파일로 만든 계산기(구간 테이블, 견적 큐브 포함)와 지역 역색인을
+파일 하나(data/banks.bundle)에 미리 저장해 두고, 콜드 스타트 시 JSON 파싱/계산기 생성/색인 생성 없이 바로 로드
+
+- 번들에는 설정 파일별 내용 해시와 계산기 코드 해시가 들어 있어,
+  설정 파일이나 계산기 코드가 번들을 만든 뒤 바뀌었으면 번들을 쓰지 않고 설정 파일에서 로드
+- 결과 캐시는 번들에 저장하지 않음 (로드 시 현재 환경변수로 새로 생성)
+- pickle 형식이므로 배포 빌드 단계에서 직접 만든 번들만 사용해야 함 (저장소에는 커밋하지 않음)
+
+번들 만들기: python scripts/build_bank_bundle.py (Vercel은 vercel.json의 buildCommand로 배포할 때 실행)
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from typing import Any, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+
+# 번들 기본 경로
+DEFAULT_BUNDLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "banks.bundle")
+
+# 번들 형식 버전 (BankBundle 구조가 바뀌면 올림)
+BUNDLE_FORMAT = 1
+
+
+class BundleEntry(NamedTuple):
+    """설정 파일 하나의 번들 항목"""
+    filename: str
+    digest: str  # 설정 내용 해시 (앞 8자리, 레지스트리와 같은 방식)
+    calculator: Any
+
+
+class BankBundle(NamedTuple):
+    """번들 파일 내용"""
+    format: int  # BUNDLE_FORMAT
+    calculator_cls: str  # 계산기 클래스 ("모듈.클래스")
+    code_digest: str  # 번들을 만들 때의 계산기 코드 해시
+    entries: Tuple[BundleEntry, ...]  # 설정 파일 목록 순서
+    eligible_by_region: Tuple[FrozenSet[int], ...]  # 지역 ID -> 취급 가능 금융사 위치
+
+
+def config_digest(raw: bytes) -> str:
+    """설정 파일 내용 해시 (앞 8자리)"""
+    return hashlib.sha1(raw).hexdigest()[:8]
+
+
+def code_digest(calculator_cls: Type) -> str:
+    """
+    계산기 코드 해시
+    계산기 클래스가 있는 패키지의 모든 모듈과 지역 목록(utils/regions.py, 역색인의 지역 ID 기준)의 소스로 계산
+    """
+    package_dir = os.path.dirname(os.path.abspath(sys.modules[calculator_cls.__module__].__file__))
+    paths = sorted(
+        os.path.join(package_dir, filename) for filename in os.listdir(package_dir)
+        if filename.endswith(".py")
+    )
+    paths.append(os.path.abspath(sys.modules["utils.regions"].__file__))
+
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+def _class_name(calculator_cls: Type) -> str:
+    return f"{calculator_cls.__module__}.{calculator_cls.__qualname__}"
+
+
+def write_bundle(path: str, calculator_cls: Type, entries: Sequence[BundleEntry],
+                 eligible_by_region: Tuple[FrozenSet[int], ...]) -> BankBundle:
+    """
+    번들 파일 저장 (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        path: 번들 경로
+        calculator_cls: 계산기 클래스
+        entries: 설정 파일 목록 순서의 번들 항목
+        eligible_by_region: 지역 역색인 (BankSnapshot.eligible_by_region)
+    """
+    bundle = BankBundle(
+        format=BUNDLE_FORMAT,
+        calculator_cls=_class_name(calculator_cls),
+        code_digest=code_digest(calculator_cls),
+        entries=tuple(entries),
+        eligible_by_region=eligible_by_region
+    )
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+    return bundle
+
+
+def load_bundle(path: str, calculator_cls: Type, banks_dir: str,
+                filenames: List[str]) -> Tuple[Optional[BankBundle], str]:
+    """
+    번들 로드 (설정 파일/계산기 코드와 일치할 때만)
+
+    Args:
+        path: 번들 경로
+        calculator_cls: 계산기 클래스
+        banks_dir: 금융사 설정 폴더
+        filenames: 설정 폴더의 현재 파일 목록
+
+    Returns:
+        (번들, 사용하지 않은 이유) - 번들을 쓸 수 없으면 번들은 None
+    """
+    if not os.path.exists(path):
+        return None, "번들 없음"
+    try:
+        with open(path, "rb") as f:
+            bundle = pickle.load(f)
+    except Exception as e:
+        # 계산기 코드가 바뀌어 복원할 수 없는 번들 등
+        return None, f"번들 읽기 실패: {e}"
+
+    if not isinstance(bundle, BankBundle) or bundle.format != BUNDLE_FORMAT:
+        return None, "번들 형식이 다름"
+    if bundle.calculator_cls != _class_name(calculator_cls):
+        return None, f"계산기 클래스가 다름 ({bundle.calculator_cls})"
+    if sorted(entry.filename for entry in bundle.entries) != sorted(filenames):
+        return None, "설정 파일 목록이 다름"
+    for entry in bundle.entries:
+        try:
+            with open(os.path.join(banks_dir, entry.filename), "rb") as f:
+                digest = config_digest(f.read())
+        except OSError:
+            return None, f"설정 파일 읽기 실패 ({entry.filename})"
+        if digest != entry.digest:
+            return None, f"설정 파일이 바뀜 ({entry.filename} {entry.digest} -> {digest})"
+    if bundle.code_digest != code_digest(calculator_cls):
+        return None, "계산기 코드가 바뀜"
+    return _reorder(bundle, filenames), ""
+
+
+def _reorder(bundle: BankBundle, filenames: List[str]) -> BankBundle:
+    """번들 항목을 현재 설정 폴더의 파일 순서로 맞춤 (파일 순서는 환경마다 다를 수 있음)"""
+    positions = {entry.filename: position for position, entry in enumerate(bundle.entries)}
+    order = [positions[filename] for filename in filenames]
+    if order == list(range(len(order))):
+        return bundle
+    new_position = {old: new for new, old in enumerate(order)}
+    return bundle._replace(
+        entries=tuple(bundle.entries[old] for old in order),
+        eligible_by_region=tuple(
+            frozenset(new_position[old] for old in eligible) for eligible in bundle.eligible_by_region
+        )
+    )
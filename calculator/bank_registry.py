@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+"""
+금융사 계산기 레지스트리
+data/banks 폴더의 설정 파일을 프로세스당 한 번만 로드하여 계산기 인스턴스를 재사용
+설정 파일이 수정되면 변경된 금융사만 다시 만들어 스냅샷을 교체 (hot reload)
+(변경 감시 스레드는 오래 실행되는 main.py 폴링 모드에서만 start_bank_config_watcher로 시작,
+ 서버리스 웹훅과 견적 실행기 작업 프로세스는 감시하지 않음)
+최초 로드는 미리 만들어 둔 설정 번들(data/banks.bundle)이 설정 파일과 일치하면 번들에서 수행 (bank_bundle 참고)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Type
+from calculator.bank_bundle import DEFAULT_BUNDLE_PATH, BundleEntry, config_digest, load_bundle, write_bundle
+from calculator.quote_cache import QuoteCache, quote_cache_from_env
+from utils.env import env_number
+from utils.regions import ALL_REGIONS
+
+
+logger = logging.getLogger(__name__)
+
+# data/banks 폴더 기본 경로
+DEFAULT_BANKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "banks")
+
+# 설정 파일 변경 확인 주기 (초), 0 이하이면 감시하지 않음
+DEFAULT_WATCH_INTERVAL = 2.0
+
+
+class BankSnapshot(NamedTuple):
+    """
+    레지스트리의 불변 스냅샷
+    한 번 만들어진 스냅샷은 변경되지 않으므로 동시 요청 간에 안전하게 공유 가능
+    """
+    calculators: Tuple[Any, ...]  # 금융사 계산기 인스턴스 (파일 목록 순서)
+    version: int  # 스냅샷 버전 (설정이 바뀔 때마다 1씩 증가)
+    loaded_at: float  # 로드 시각 (time.time())
+    bank_versions: Tuple[Tuple[str, str], ...] = ()  # (파일명, 설정 내용 해시) 목록
+    # 지역 ID -> 취급 가능한 금융사의 calculators 위치 (대상 지역/급지 기준, 비어 있으면 색인 없음)
+    eligible_by_region: Tuple[FrozenSet[int], ...] = ()
+
+    @property
+    def version_label(self) -> str:
+        """로그 표시용 버전 문자열 (예: "v3 ok_config.json@1a2b3c4d, bnk_config.json@5e6f7a8b")"""
+        banks = ", ".join(f"{filename}@{digest}" for filename, digest in self.bank_versions)
+        return f"v{self.version} {banks}" if banks else f"v{self.version}"
+
+
+class _BankEntry(NamedTuple):
+    """설정 파일 하나의 로드 상태"""
+    mtime_ns: int
+    size: int
+    digest: str  # 설정 내용 해시 (앞 8자리)
+    calculator: Any  # 로드 실패 시 None
+
+
+class BankRegistry:
+    """
+    금융사 계산기 레지스트리
+    설정 파일 읽기/JSON 파싱/계산기 생성을 최초 1회만 수행하고,
+    이후 요청은 만들어 둔 스냅샷을 그대로 사용
+    """
+
+    def __init__(self, calculator_cls: Type, banks_dir: Optional[str] = None,
+                 quote_cache: Optional[QuoteCache] = None, bundle_path: Optional[str] = None):
+        """
+        Args:
+            calculator_cls: 계산기 클래스 (BaseCalculator 또는 하위 클래스)
+            banks_dir: 금융사 설정 폴더 경로 (없으면 data/banks)
+            quote_cache: 전체 견적 결과 캐시 (없으면 QUOTE_CACHE_* 환경변수로 생성)
+            bundle_path: 최초 로드에 사용할 설정 번들 경로 (없으면 설정 파일에서 로드)
+        """
+        self.calculator_cls = calculator_cls
+        self.banks_dir = banks_dir or DEFAULT_BANKS_DIR
+        self.bundle_path = bundle_path
+        self.loaded_from_bundle = False  # 최초 스냅샷을 번들에서 만들었는지 (번들이 없거나 맞지 않으면 False)
+        # 스냅샷이 교체되면 비워지는 견적 결과 캐시 (calculate_all_banks에서 사용)
+        self.quote_cache = quote_cache if quote_cache is not None else quote_cache_from_env()
+        self._snapshot: Optional[BankSnapshot] = None
+        self._entries: Dict[str, _BankEntry] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+
+    def snapshot(self) -> BankSnapshot:
+        """
+        현재 스냅샷 반환 (최초 호출 시에만 로드)
+        reload 중이어도 기다리지 않고 직전 스냅샷을 반환
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._refresh(force=True)
+                snapshot = self._snapshot
+        return snapshot
+
+    def reload(self) -> BankSnapshot:
+        """
+        모든 설정 파일을 다시 읽어 새 스냅샷으로 교체
+        이미 스냅샷을 받아간 요청은 기존 스냅샷으로 계속 계산
+        """
+        with self._lock:
+            self._refresh(force=True)
+            return self._snapshot
+
+    def refresh(self) -> bool:
+        """
+        변경된 설정 파일만 다시 읽어 스냅샷 교체 (watcher에서 주기적으로 호출)
+
+        Returns:
+            스냅샷이 교체되었으면 True
+        """
+        with self._lock:
+            return self._refresh(force=False)
+
+    def start_watcher(self, interval: float = DEFAULT_WATCH_INTERVAL) -> None:
+        """
+        설정 파일 변경 감시 스레드 시작 (mtime 기준 polling)
+
+        Args:
+            interval: 확인 주기 (초)
+        """
+        if interval <= 0 or (self._watcher is not None and self._watcher.is_alive()):
+            return
+
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="bank-config-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watcher(self) -> None:
+        """설정 파일 변경 감시 스레드 종료"""
+        self._watcher_stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+
+    def _watch(self, interval: float) -> None:
+        """감시 스레드 본체"""
+        while not self._watcher_stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error("금융사 설정 변경 확인 실패: %s", e, exc_info=True)
+
+    def _refresh(self, force: bool) -> bool:
+        """
+        설정 폴더를 확인하여 변경된 파일만 다시 로드 (lock 안에서 호출)
+
+        Args:
+            force: True이면 변경 여부와 관계없이 모든 파일을 다시 로드
+        """
+        filenames = self._list_config_files()
+        if self._snapshot is None and self.bundle_path and self._load_bundle(filenames):
+            return True
+
+        entries: Dict[str, _BankEntry] = {}
+        changed = force or self._snapshot is None or set(filenames) != set(self._entries)
+
+        for filename in filenames:
+            config_path = os.path.join(self.banks_dir, filename)
+            previous = None if force else self._entries.get(filename)
+            try:
+                stat = os.stat(config_path)
+            except OSError:
+                # 확인 도중 삭제된 파일
+                changed = True
+                continue
+
+            if previous is not None and previous.mtime_ns == stat.st_mtime_ns and previous.size == stat.st_size:
+                entries[filename] = previous
+                continue
+
+            entry = self._load_entry(filename, config_path, stat, previous)
+            entries[filename] = entry
+            if previous is None or entry.digest != previous.digest or entry.calculator is not previous.calculator:
+                changed = True
+
+        self._entries = entries
+        if not changed:
+            return False
+
+        self._publish(filenames)
+        return True
+
+    def _load_bundle(self, filenames: List[str]) -> bool:
+        """
+        설정 번들에서 최초 스냅샷 생성 (lock 안에서 호출)
+        번들이 없거나 설정 파일/계산기 코드와 맞지 않으면 False (설정 파일에서 로드)
+        """
+        bundle, reason = load_bundle(self.bundle_path, self.calculator_cls, self.banks_dir, filenames)
+        if bundle is None:
+            logger.info("금융사 설정 번들 사용 안 함: %s", reason)
+            return False
+
+        entries: Dict[str, _BankEntry] = {}
+        for entry in bundle.entries:
+            stat = os.stat(os.path.join(self.banks_dir, entry.filename))
+            entries[entry.filename] = _BankEntry(stat.st_mtime_ns, stat.st_size, entry.digest, entry.calculator)
+        self._entries = entries
+        self._publish(filenames, bundle.eligible_by_region)
+        self.loaded_from_bundle = True
+        return True
+
+    def save_bundle(self, path: Optional[str] = None) -> int:
+        """
+        현재 설정 파일로 설정 번들 저장 (scripts/build_bank_bundle.py에서 사용)
+
+        Args:
+            path: 번들 경로 (없으면 bundle_path, 그것도 없으면 data/banks.bundle)
+
+        Returns:
+            번들에 저장한 금융사 수
+        """
+        with self._lock:
+            self._refresh(force=True)
+            snapshot = self._snapshot
+            entries = [
+                BundleEntry(filename, self._entries[filename].digest, self._entries[filename].calculator)
+                for filename in self._list_config_files()
+                if filename in self._entries and self._entries[filename].calculator is not None
+            ]
+        write_bundle(path or self.bundle_path or DEFAULT_BUNDLE_PATH, self.calculator_cls,
+                     entries, snapshot.eligible_by_region)
+        return len(entries)
+
+    def _publish(self, filenames: List[str],
+                 eligible_by_region: Optional[Tuple[FrozenSet[int], ...]] = None) -> None:
+        """
+        로드된 설정 파일로 새 스냅샷을 만들어 교체 (lock 안에서 호출)
+
+        Args:
+            filenames: 설정 폴더의 파일 목록 (스냅샷의 계산기 순서)
+            eligible_by_region: 번들에 저장된 지역 역색인 (없으면 계산기로 생성)
+        """
+        entries = self._entries
+        calculators = tuple(
+            entries[filename].calculator for filename in filenames
+            if filename in entries and entries[filename].calculator is not None
+        )
+        self._version += 1
+        snapshot = BankSnapshot(
+            calculators=calculators,
+            version=self._version,
+            loaded_at=time.time(),
+            bank_versions=tuple(
+                (filename, entries[filename].digest) for filename in filenames
+                if filename in entries and entries[filename].calculator is not None
+            ),
+            eligible_by_region=eligible_by_region if eligible_by_region is not None else _build_region_index(calculators)
+        )
+        # 속성 하나를 교체하는 것으로 원자적으로 전환 (기존 스냅샷을 쥔 요청은 영향 없음)
+        self._snapshot = snapshot
+        # 이전 설정으로 계산한 견적은 더 이상 사용하지 않음
+        self.quote_cache.invalidate(snapshot.version)
+        logger.info("금융사 설정 적용: %s", snapshot.version_label)
+
+    def _list_config_files(self) -> List[str]:
+        """설정 폴더의 JSON 파일 목록 (os.listdir 순서 유지)"""
+        if not os.path.exists(self.banks_dir):
+            return []
+        return [
+            filename for filename in os.listdir(self.banks_dir)
+            if filename.endswith("_config.json") or filename.endswith(".json")
+        ]
+
+    def _load_entry(self, filename: str, config_path: str, stat: os.stat_result,
+                    previous: Optional[_BankEntry]) -> _BankEntry:
+        """
+        설정 파일 하나를 읽어 계산기 생성
+        내용이 같으면 기존 계산기를 재사용하고, 로드에 실패하면 기존 계산기를 유지
+        """
+        try:
+            with open(config_path, "rb") as f:
+                raw = f.read()
+            digest = config_digest(raw)
+
+            if previous is not None and previous.digest == digest and previous.calculator is not None:
+                return _BankEntry(stat.st_mtime_ns, stat.st_size, digest, previous.calculator)
+
+            config = json.loads(raw.decode("utf-8"))
+            calculator = self.calculator_cls(config)
+            if previous is not None:
+                logger.info("금융사 설정 변경 감지: %s (%s -> %s)", filename, previous.digest, digest)
+            return _BankEntry(stat.st_mtime_ns, stat.st_size, digest, calculator)
+        except Exception as e:
+            print(f"⚠️  계산기 로드 실패 ({filename}): {e}")
+            if previous is not None and previous.calculator is not None:
+                # 저장 도중의 불완전한 파일 등: 기존 설정으로 계속 계산하고 다음 변경 때 재시도
+                return _BankEntry(stat.st_mtime_ns, stat.st_size, previous.digest, previous.calculator)
+            return _BankEntry(stat.st_mtime_ns, stat.st_size, "", None)
+
+
+def _build_region_index(calculators: Tuple[Any, ...]) -> Tuple[FrozenSet[int], ...]:
+    """
+    지역 ID -> 취급 가능한 금융사 위치 역색인 생성
+    대상 지역이 아니거나 급지가 없거나 6급지인 금융사는 전체 계산 없이 취급 불가지역으로 처리하기 위함
+    (is_region_supported가 없는 계산기가 있으면 색인을 만들지 않음)
+    """
+    if not all(hasattr(calculator, "is_region_supported") for calculator in calculators):
+        return ()
+    return tuple(
+        frozenset(
+            position for position, calculator in enumerate(calculators)
+            if calculator.is_region_supported(region)
+        )
+        for region in ALL_REGIONS
+    )
+
+
+# 계산기 클래스별 레지스트리 (프로세스 전역)
+_registries: Dict[Type, BankRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_bank_registry(calculator_cls: Type) -> BankRegistry:
+    """
+    계산기 클래스에 해당하는 프로세스 전역 레지스트리 반환 (싱글톤)
+    설정 파일 변경 감시는 하지 않음 (start_bank_config_watcher 참고)
+    최초 로드에는 data/banks.bundle을 사용 (BANK_CONFIG_BUNDLE 환경변수로 경로 지정, 0이면 번들 사용 안 함)
+
+    Args:
+        calculator_cls: 계산기 클래스 (BaseCalculator 또는 하위 클래스)
+    """
+    registry = _registries.get(calculator_cls)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(calculator_cls)
+            if registry is None:
+                registry = BankRegistry(calculator_cls, bundle_path=_bundle_path_from_env())
+                _registries[calculator_cls] = registry
+    return registry
+
+
+def start_bank_config_watcher(calculator_cls: Type) -> BankRegistry:
+    """
+    프로세스 전역 레지스트리의 설정 파일 변경 감시 스레드 시작 (오래 실행되는 봇 프로세스에서 호출, main.py)
+    (BANK_CONFIG_WATCH_INTERVAL 환경변수로 주기 조정, 0이면 감시하지 않음)
+
+    Args:
+        calculator_cls: 계산기 클래스 (BaseCalculator 또는 하위 클래스)
+    """
+    registry = get_bank_registry(calculator_cls)
+    registry.start_watcher(_watch_interval_from_env())
+    return registry
+
+
+def _watch_interval_from_env() -> float:
+    """BANK_CONFIG_WATCH_INTERVAL 환경변수 해석 (잘못된 값이면 기본값)"""
+    return env_number("BANK_CONFIG_WATCH_INTERVAL", DEFAULT_WATCH_INTERVAL)
+
+
+def _bundle_path_from_env() -> Optional[str]:
+    """BANK_CONFIG_BUNDLE 환경변수 해석 (없으면 기본 번들, "0"이면 번들 사용 안 함)"""
+    value = os.getenv("BANK_CONFIG_BUNDLE")
+    if value == "0":
+        return None
+    return value or DEFAULT_BUNDLE_PATH
@@ -5,9 +5,71 @@
 """
 
 import json
-import os
-from typing import Dict, List, Optional, Any, Union
-from utils.validators import validate_kb_price, extract_lower_bound_price
+import logging
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any, Union
+from utils.validators import validate_kb_price
+from utils.regions import ALL_REGIONS, METROPOLITAN_KEYS
+from calculator.bank_bundle import config_digest
+from calculator.region_table import BankRegionTable, GRADE_1_GROUP_A
+from calculator.interval_table import IntervalTable, compile_range_map
+from calculator.property_context import PropertyContext, sum_mortgage_max_amount
+from calculator.quote_cube import QuoteCube, NO_CREDIT_SCORE
+from calculator.quote_cache import DEFAULT_BANK_CACHE_SIZE, quote_cache_from_env, quote_fingerprint
+from utils.models import BankQuote, QuoteResult
+from utils.tracing import get_tracer
+
+
+_trace = get_tracer("calculator")
+logger = logging.getLogger(__name__)
+
+# 이미 경고한 설정 점검 결과 ((금융사, 설정 해시)) - 레지스트리 재생성/작업자 예열마다 반복해서 남기지 않음
+_reported_config_issues = set()
+_reported_config_issues_lock = threading.Lock()
+
+# 모든 금융사 계산이 읽는 담보물건 필드 (KB시세, 지역, 근저당권, 신용점수, 필요자금)
+BASE_INPUT_FIELDS = ("kb_price", "region", "region_id", "credit_score", "required_amount")
+
+# 모든 금융사 계산이 읽는 근저당권 필드 (기관명은 OK저축은행 대환 가능 여부 확인에만 사용)
+BASE_MORTGAGE_FIELDS = ("amount", "max_amount", "is_refinance")
+
+# target_regions 약자 -> 실제 지역명 접두어
+REGION_ABBREVIATIONS = {
+    "경북": "경상북도",
+    "경남": "경상남도",
+    "충북": "충청북도",
+    "충남": "충청남도",
+    "전북": "전라북도",
+    "전남": "전라남도",
+    "강원": "강원특별자치도"
+}
+
+
+class QuotePlan(NamedTuple):
+    """
+    금융사 하나의 사전 확인 결과 (prepare_quote -> quote_from_plan)
+    요청 단위 값이므로 계산기 인스턴스에 저장하지 않고 인자로 전달
+    """
+    property_data: Dict[str, Any]  # 파싱된 담보물건 정보
+    kb_price: float  # 적용 KB시세 (하한가 적용 반영, 만원)
+    region: str  # 지역
+    grade: Union[int, str]  # 지역 급지
+    max_ltv: float  # 최대 LTV
+    is_below_standard: bool  # 기준 LTV 이하 지역 여부
+    is_ok_bank: bool  # OK저축은행 여부
+    is_household_for_ok: bool  # OK저축은행 가계자금 계산 여부
+    is_business_product: bool  # 사업자 상품 여부
+    is_household_product: bool  # 가계 상품 여부
+    is_subordinate: bool  # 후순위 여부 (대환하지 않는 근저당권이 있음)
+    is_refinance: bool  # 대환 여부
+    refinance_principal: float  # 대환할 근저당권 원금 합계 (만원)
+    refinance_institutions: List[str]  # 대환하는 금융사 이름 리스트 (가계자금용)
+    total_mortgage: float  # 차감할 기존 근저당권 금액 (채권최고액 또는 원금 기준, 만원)
+    other_max_amount_total: float  # 대환하지 않는 근저당권 채권최고액 합계 (만원)
+    credit_score: Optional[int]  # 신용점수
+    credit_grade: Optional[Union[int, str]]  # 신용등급
+    max_amount_limit: Optional[float]  # 택시/가계 상품 한도 제한 (만원)
+    required_amount: Optional[float]  # 필요자금 (만원)
 
 
 class BaseCalculator:
@@ -16,76 +78,7 @@ class BaseCalculator:
     """
     
     # 전체 지역 리스트 (메인 계산기 기준)
-    ALL_REGIONS = [
-        "서울특별시종로구", "서울특별시중구", "서울특별시용산구", "서울특별시성동구",
-        "서울특별시광진구", "서울특별시동대문구", "서울특별시중랑구", "서울특별시성북구",
-        "서울특별시강북구", "서울특별시도봉구", "서울특별시노원구", "서울특별시은평구",
-        "서울특별시서대문구", "서울특별시마포구", "서울특별시양천구", "서울특별시강서구",
-        "서울특별시구로구", "서울특별시금천구", "서울특별시영등포구", "서울특별시동작구",
-        "서울특별시관악구", "서울특별시서초구", "서울특별시강남구", "서울특별시송파구",
-        "서울특별시강동구",
-        "경기도성남시분당구", "경기도광명시", "경기도과천시", "경기도하남시",
-        "경기도수원시장안구", "경기도수원시권선구", "경기도수원시팔달구", "경기도수원시영통구",
-        "경기도성남시수정구", "경기도성남시중원구", "경기도안양시만안구", "경기도안양시동안구",
-        "경기도부천시소사구", "경기도부천시오정구", "경기도부천시원미구", "경기도고양시덕양구",
-        "경기도고양시일산동구", "경기도고양시일산서구", "인천광역시연수구", "인천광역시부평구",
-        "경기도의정부시", "경기도안산시상록구", "경기도안산시단원구", "경기도구리시",
-        "경기도남양주시", "경기도군포시", "경기도의왕시", "경기도용인시처인구",
-        "경기도용인시기흥구", "경기도용인시수지구", "경기도김포시", "경기도화성시",
-        "경기도평택시", "경기도동두천시", "경기도오산시", "경기도시흥시",
-        "경기도파주시", "경기도안성시", "경기도광주시", "경기도양주시",
-        "경기도이천시", "경기도포천시", "경기도여주시", "경기도연천군",
-        "경기도가평군", "경기도양평군",
-        "인천광역시중구", "인천광역시동구", "인천광역시남동구", "인천광역시계양구",
-        "인천광역시서구", "인천광역시미추홀구", "인천광역시강화군", "인천광역시옹진군",
-        "광주광역시동구", "광주광역시서구", "광주광역시남구", "광주광역시북구", "광주광역시광산구",
-        "대전광역시동구", "대전광역시중구", "대전광역시서구", "대전광역시유성구", "대전광역시대덕구",
-        "울산광역시중구", "울산광역시남구", "울산광역시동구", "울산광역시북구", "울산광역시울주군",
-        "세종특별자치시세종시",
-        "강원특별자치도춘천시", "강원특별자치도원주시", "강원특별자치도강릉시",
-        "강원특별자치도동해시", "강원특별자치도태백시", "강원특별자치도속초시", "강원특별자치도삼척시",
-        "강원특별자치도홍천군", "강원특별자치도횡성군", "강원특별자치도영월군", "강원특별자치도평창군",
-        "강원특별자치도정선군", "강원특별자치도철원군", "강원특별자치도화천군", "강원특별자치도양구군",
-        "강원특별자치도인제군", "강원특별자치도고성군", "강원특별자치도양양군",
-        "충청북도충주시", "충청북도제천시", "충청북도청주시상당구", "충청북도청주시서원구",
-        "충청북도청주시흥덕구", "충청북도청주시청원구", "충청북도보은군", "충청북도옥천군",
-        "충청북도영동군", "충청북도진천군", "충청북도괴산군", "충청북도음성군",
-        "충청북도단양군", "충청북도증평군",
-        "충청남도천안시동남구", "충청남도천안시서북구", "충청남도공주시", "충청남도보령시",
-        "충청남도아산시", "충청남도서산시", "충청남도논산시", "충청남도계룡시",
-        "충청남도당진시", "충청남도금산군", "충청남도부여군", "충청남도서천군",
-        "충청남도청양군", "충청남도홍성군", "충청남도예산군", "충청남도태안군",
-        "전북특별자치도전주시완산구", "전북특별자치도전주시덕진구", "전북특별자치도군산시",
-        "전북특별자치도익산시", "전북특별자치도정읍시", "전북특별자치도남원시", "전북특별자치도김제시",
-        "전북특별자치도완주군", "전북특별자치도진안군", "전북특별자치도무주군", "전북특별자치도장수군",
-        "전북특별자치도임실군", "전북특별자치도순창군", "전북특별자치도고창군", "전북특별자치도부안군",
-        "전라남도목포시", "전라남도여수시", "전라남도순천시", "전라남도나주시",
-        "전라남도광양시", "전라남도담양군", "전라남도곡성군", "전라남도구례군",
-        "전라남도고흥군", "전라남도보성군", "전라남도화순군", "전라남도장흥군",
-        "전라남도강진군", "전라남도해남군", "전라남도영암군", "전라남도무안군",
-        "전라남도함평군", "전라남도영광군", "전라남도장성군", "전라남도완도군",
-        "전라남도진도군", "전라남도신안군",
-        "경상북도포항시남구", "경상북도포항시북구", "경상북도경주시", "경상북도김천시",
-        "경상북도안동시", "경상북도구미시", "경상북도영주시", "경상북도영천시",
-        "경상북도상주시", "경상북도문경시", "경상북도경산시", "경상북도의성군",
-        "경상북도청송군", "경상북도영양군", "경상북도영덕군", "경상북도청도군",
-        "경상북도고령군", "경상북도성주군", "경상북도칠곡군", "경상북도예천군",
-        "경상북도봉화군", "경상북도울진군", "경상북도울릉군",
-        "경상남도진주시", "경상남도통영시", "경상남도사천시", "경상남도김해시",
-        "경상남도밀양시", "경상남도거제시", "경상남도양산시", "경상남도창원시의창구",
-        "경상남도창원시성산구", "경상남도창원시마산합포구", "경상남도창원시마산회원구",
-        "경상남도창원시진해구", "경상남도의령군", "경상남도함안군", "경상남도창녕군",
-        "경상남도고성군", "경상남도남해군", "경상남도하동군", "경상남도산청군",
-        "경상남도함양군", "경상남도거창군", "경상남도합천군",
-        "제주특별자치도제주시", "제주특별자치도서귀포시",
-        "부산광역시중구", "부산광역시서구", "부산광역시동구", "부산광역시영도구",
-        "부산광역시부산진구", "부산광역시동래구", "부산광역시남구", "부산광역시북구",
-        "부산광역시해운대구", "부산광역시사하구", "부산광역시금정구", "부산광역시강서구",
-        "부산광역시연제구", "부산광역시수영구", "부산광역시사상구", "부산광역시기장군",
-        "대구광역시중구", "대구광역시동구", "대구광역시서구", "대구광역시남구",
-        "대구광역시북구", "대구광역시수성구", "대구광역시달서구", "대구광역시달성군",
-        "대구광역시군위군"
-    ]
+    ALL_REGIONS = ALL_REGIONS
     
     def __init__(self, config: Union[Dict[str, Any], str]):
         """
@@ -99,6 +92,114 @@ class BaseCalculator:
         
         self.config = config
         self.bank_name = config.get("bank_name", "Unknown")
+        self.is_ok_bank = self.bank_name == "OK저축은행" or "OK저축은행" in self.bank_name or "오케이저축은행" in self.bank_name
+        
+        # 지역 조회 테이블 (설정 로드 시 한 번만 생성)
+        self.region_table = BankRegionTable(config)
+        
+        # 사업자 상품명 (공백 제거, 기관명 포함 여부 확인용)
+        self.business_product_keys: List[str] = [
+            product_name.replace(" ", "") for product_name in config.get("business_product_names", [])
+        ]
+        
+        # 신용점수/등급 구간 조회 테이블 (설정 로드 시 한 번만 컴파일)
+        self.config_issues: List[str] = []
+        self._compile_interval_tables()
+        if self.config_issues:
+            self._report_config_issues()
+        
+        # 최대 LTV/금리 조회 큐브 (설정이 바뀌면 계산기와 함께 다시 생성)
+        self.quote_cube = QuoteCube(self)
+        
+        # 이 금융사의 계산 결과에 영향을 주는 입력 필드와 그 필드만으로 키를 만드는 결과 캐시
+        # (설정이 바뀌면 계산기가 새로 만들어지므로 캐시도 함께 비워짐)
+        self.input_fields, self.mortgage_fields = self._declare_input_fields()
+        self.result_cache = quote_cache_from_env("BANK_RESULT_CACHE_SIZE", DEFAULT_BANK_CACHE_SIZE)
+    
+    def _report_config_issues(self) -> None:
+        """설정 점검 결과를 경고 로그로 남김 (같은 금융사/설정 내용에는 프로세스당 한 번만)"""
+        key = (self.bank_name, config_digest(json.dumps(self.config, sort_keys=True, ensure_ascii=False).encode("utf-8")))
+        with _reported_config_issues_lock:
+            if key in _reported_config_issues:
+                return
+            _reported_config_issues.add(key)
+        for issue in self.config_issues:
+            logger.warning("%s 설정 점검 (%s): %s", self.bank_name, key[1], issue)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """설정 번들(bank_bundle) 저장용 상태: 결과 캐시는 저장하지 않음"""
+        state = self.__dict__.copy()
+        del state["result_cache"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """번들에서 복원: 결과 캐시는 현재 환경변수로 새로 생성"""
+        self.__dict__.update(state)
+        self.result_cache = quote_cache_from_env("BANK_RESULT_CACHE_SIZE", DEFAULT_BANK_CACHE_SIZE)
+    
+    def _declare_input_fields(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        설정에서 켜진 규칙에 따라 계산이 읽는 담보물건/근저당권 필드 결정
+        (여기에 없는 필드가 바뀌어도 이 금융사의 결과는 같으므로 결과 캐시 키에서 제외)
+        
+        Returns:
+            (담보물건 필드, 근저당권 필드)
+        """
+        fields = list(BASE_INPUT_FIELDS)
+        mortgage_fields = list(BASE_MORTGAGE_FIELDS)
+        
+        # 하한가: 아파트/주상복합 여부와 주소의 층수
+        if self.config.get("lower_bound_price", {}).get("enabled", False):
+            fields += ["property_type", "address"]
+        # 면적 제한
+        if self.config.get("area_limit", {}).get("enabled", False):
+            fields.append("area")
+        # 택시 한도 제한: 특이사항 키워드
+        if self.config.get("taxi_limit", {}).get("enabled", False):
+            fields.append("special_notes")
+        # OK저축은행: 면적별 최대 LTV, 가계자금 대환 요청/조정금리(특이사항, 요청사항), 빌라 선순위, 기관명
+        if self.is_ok_bank or self.config.get("cofix_rate") is not None:
+            fields += ["area", "special_notes", "requests", "property_type"]
+            mortgage_fields.append("institution")
+        
+        return tuple(dict.fromkeys(fields)), tuple(mortgage_fields)
+    
+    def _compile_interval_tables(self):
+        """
+        범위 문자열("920-1000", "1-3" 등) 매핑을 구간 조회 테이블로 컴파일
+        겹치거나 빠진 구간, 매칭되지 않는 범위는 config_issues에 기록
+        """
+        # 신용점수 -> 등급 (credit_score_to_grade, 오름차순 범위만 매칭)
+        score_map = self.config.get("credit_score_to_grade", {})
+        self.credit_grade_table, issues = compile_range_map(score_map, "credit_score_to_grade")
+        self.config_issues.extend(issues)
+        # 신용점수 -> 범위 문자열 (OK 저축은행 스프레드 금리 조회용, 같은 매핑이므로 점검 생략)
+        self.credit_score_range_table, _ = compile_range_map(
+            score_map, "credit_score_to_grade", use_key_as_value=True
+        )
+        
+        # 신용점수 -> 등급 번호 (OK 저축은행, 내림차순 범위 허용)
+        grade_number_map = self.config.get("credit_score_range_to_grade_number", {})
+        self.credit_grade_number_table, issues = compile_range_map(
+            grade_number_map, "credit_score_range_to_grade_number", normalize_order=True
+        )
+        self.config_issues.extend(issues)
+        
+        # 면적/급지별 신용등급 번호 -> 최대 LTV (OK 저축은행)
+        grade_numbers = [number for number in grade_number_map.values() if isinstance(number, int)]
+        grade_domain = (min(grade_numbers), max(grade_numbers)) if grade_numbers else None
+        self.area_grade_credit_ltv_tables: Dict[str, Dict[str, IntervalTable]] = {}
+        for area_key, area_config in self.config.get("max_ltv_by_area_grade_credit", {}).items():
+            grade_tables = {}
+            for grade_key, grade_config in area_config.items():
+                if "all" in grade_config:
+                    continue
+                grade_tables[grade_key], issues = compile_range_map(
+                    grade_config, f"max_ltv_by_area_grade_credit.{area_key}.{grade_key}",
+                    domain=grade_domain, skip_keys=("all",)
+                )
+                self.config_issues.extend(issues)
+            self.area_grade_credit_ltv_tables[area_key] = grade_tables
     
     @staticmethod
     def round_down_to_hundred_thousand(amount: float) -> float:
@@ -114,7 +215,12 @@ class BaseCalculator:
         """
         return (int(amount) // 100) * 100
     
-    def calculate(self, property_data: Dict[str, Any], product_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def calculate(
+        self,
+        property_data: Dict[str, Any],
+        product_type: Optional[str] = None,
+        context: Optional[PropertyContext] = None
+    ) -> Optional[BankQuote]:
         """
         담보대출 한도 및 금리 계산 (범용 구현)
         
@@ -125,156 +231,116 @@ class BaseCalculator:
                 - mortgages: 근저당권 설정 내역 리스트
                 - credit_score: 신용점수 (없으면 None)
                 - etc...
+            product_type: OK저축은행 상품 구분 ("household" 또는 "business")
+            context: 요청 단위 담보물건 컨텍스트 (없으면 property_data로 생성)
         
         Returns:
-            계산 결과 딕셔너리 또는 None (산출 불가 시)
-            {
-                "bank_name": "BNK캐피탈",
-                "results": [
-                    {
-                        "ltv": 80,
-                        "amount": 49300,
-                        "interest_rate": 7.60,
-                        "interest_rate_range": None,  # 신용점수 없을 때만 사용
-                        "type": "후순위",
-                        "available_amount": 49300,  # 대환 시 가용한도
-                        "total_amount": 49300,  # 대환 시 전체 금액
-                        "is_refinance": False
-                    },
+            계산 결과 (BankQuote, 딕셔너리처럼 접근 가능) 또는 None (산출 불가 시)
+            BankQuote(
+                bank_name="BNK캐피탈",
+                results=[
+                    QuoteResult(
+                        ltv=80,
+                        amount=49300,
+                        interest_rate=7.60,
+                        interest_rate_range=None,  # 신용점수 없을 때만 사용
+                        type="후순위",
+                        available_amount=49300,  # 대환 시 가용한도
+                        total_amount=49300,  # 대환 시 전체 금액
+                        is_refinance=False
+                    ),
                     ...
                 ],
-                "conditions": ["조건1", "조건2"],
-                "errors": []
-            }
+                conditions=["조건1", "조건2"],
+                errors=[]
+            )
         """
+        plan, early_result = self.prepare_quote(property_data, product_type, context)
+        if plan is None:
+            return early_result
+        return self.quote_from_plan(plan)
+    
+    def prepare_quote(
+        self,
+        property_data: Dict[str, Any],
+        product_type: Optional[str] = None,
+        context: Optional[PropertyContext] = None
+    ) -> Tuple[Optional[QuotePlan], Optional[BankQuote]]:
+        """
+        금융사별 사전 확인 (시세/지역/급지/면적/최대 LTV/대환 구분/상품 구분/한도 제한)
+        
+        Args:
+            property_data: 파싱된 담보물건 정보
+            product_type: OK저축은행 상품 구분 ("household" 또는 "business")
+            context: 요청 단위 담보물건 컨텍스트 (없으면 property_data로 생성)
+        
+        Returns:
+            (계산 계획, None) 또는 사전 확인에서 결과가 정해진 경우 (None, 계산 결과)
+        """
+        # 금융사와 무관한 계산(KB시세 검증, 지역 ID, 층수, 근저당권 합산)은 컨텍스트에서 한 번만 수행
+        if context is None:
+            context = PropertyContext.from_property_data(property_data)
+        
         # KB시세 검증
-        kb_price_raw = property_data.get("kb_price")
-        print(f"DEBUG: BaseCalculator.calculate - kb_price_raw: {kb_price_raw}, type: {type(kb_price_raw)}")
-        kb_price = self.validate_kb_price(kb_price_raw)
-        print(f"DEBUG: BaseCalculator.calculate - kb_price after validation: {kb_price}")
+        kb_price = context.kb_price
+        _trace.debug("BaseCalculator.calculate - kb_price after validation: %s", kb_price)
         if kb_price is None:
-            print(f"DEBUG: BaseCalculator.calculate - KB price is None, returning None")
-            return None  # 시세 없으면 산출 불가
+            _trace.debug("BaseCalculator.calculate - KB price is None, returning None")
+            return None, None  # 시세 없으면 산출 불가
         
         # KB시세 최소 금액 확인
         min_kb_price = self.config.get("min_kb_price")
         if min_kb_price is not None and kb_price < min_kb_price:
-            print(f"DEBUG: BaseCalculator.calculate - KB price {kb_price}만원 < min_kb_price {min_kb_price}만원, 취급 불가")
-            return {
-                "bank_name": self.bank_name,
-                "results": [],
-                "conditions": self.config.get("conditions", []),
-                "errors": [f"KB시세 {kb_price:,.0f}만원은 최소 {min_kb_price:,.0f}만원 이상이어야 취급 가능합니다"],
-                "min_amount": self.config.get("min_amount", 3000)
-            }
+            _trace.debug("BaseCalculator.calculate - KB price %s만원 < min_kb_price %s만원, 취급 불가", kb_price, min_kb_price)
+            return None, BankQuote(
+                bank_name=self.bank_name,
+                results=[],
+                conditions=self.config.get("conditions", []),
+                errors=[f"KB시세 {kb_price:,.0f}만원은 최소 {min_kb_price:,.0f}만원 이상이어야 취급 가능합니다"],
+                min_amount=self.config.get("min_amount", 3000)
+            )
         
         # 하한가 적용 조건 확인
         lower_bound_config = self.config.get("lower_bound_price", {})
         if lower_bound_config.get("enabled", False):
-            # 하한가 적용 조건 확인
-            property_type = property_data.get("property_type", "")
-            address = property_data.get("address", "")
-            
-            # 아파트/주상복합 확인
-            is_apartment_or_complex = property_type and ("아파트" in property_type or "주상복합" in property_type)
-            
-            # 1,2층 확인 (주소에서 층수 추출)
-            floor = None
-            if address:
-                import re
-                floor_match = re.search(r'(\d+)층', address)
-                if floor_match:
-                    floor = int(floor_match.group(1))
-            
             # 하한가 적용 조건: 아파트/주상복합이고 1층 또는 2층
-            if is_apartment_or_complex and floor in [1, 2]:
-                lower_bound_price = extract_lower_bound_price(kb_price_raw)
+            if context.is_lower_bound_target:
+                lower_bound_price = context.lower_bound_price
                 if lower_bound_price is not None:
-                    print(f"DEBUG: BaseCalculator.calculate - 하한가 적용: 일반가 {kb_price}만원 -> 하한가 {lower_bound_price}만원 (아파트/주상복합 {floor}층)")
+                    _trace.debug("BaseCalculator.calculate - 하한가 적용: 일반가 %s만원 -> 하한가 %s만원 (아파트/주상복합 %s층)", kb_price, lower_bound_price, context.floor)
                     kb_price = lower_bound_price
                 else:
-                    print(f"DEBUG: BaseCalculator.calculate - 하한가 적용 조건 충족하지만 하한가 추출 실패")
+                    _trace.debug("BaseCalculator.calculate - 하한가 적용 조건 충족하지만 하한가 추출 실패")
         
         # 지역 확인
-        region = property_data.get("region", "")
+        region = context.region
         if not region:
-            print(f"DEBUG: BaseCalculator.calculate - region is empty")
-            return None
-        
-        # 메인 계산기 전체 지역 리스트 기준 검증
-        region_clean = region.replace(" ", "")
-        is_valid_region = False
-        for valid_region in self.ALL_REGIONS:
-            if valid_region.replace(" ", "") == region_clean:
-                is_valid_region = True
-                break
+            _trace.debug("BaseCalculator.calculate - region is empty")
+            return None, None
         
-        if not is_valid_region:
-            print(f"DEBUG: BaseCalculator.calculate - Region {region} is not in ALL_REGIONS list, 취급 불가지역")
-            return {
-                "bank_name": self.bank_name,
-                "results": [],
-                "conditions": self.config.get("conditions", []),
-                "errors": ["취급 불가지역"],
-                "min_amount": self.config.get("min_amount", 3000)
-            }
+        # 메인 계산기 전체 지역 리스트 기준 검증 (지역 ID가 없으면 취급 불가)
+        if context.region_id is None:
+            _trace.debug("BaseCalculator.calculate - Region %s is not in ALL_REGIONS list, 취급 불가지역", region)
+            return None, self.unsupported_region_response()
         
         # 대상 지역 확인 (광역 단위로 체크)
-        target_regions = self.config.get("target_regions", [])
-        if target_regions:
-            is_target_region = False
-            # 약자 매핑 (target_regions의 약자를 실제 지역명으로 변환)
-            region_abbreviation_map = {
-                "경북": "경상북도",
-                "경남": "경상남도",
-                "충북": "충청북도",
-                "충남": "충청남도",
-                "전북": "전라북도",
-                "전남": "전라남도",
-                "강원": "강원특별자치도"
-            }
-            
-            for target in target_regions:
-                # 약자 매핑 적용
-                target_full = region_abbreviation_map.get(target, target)
-                if target_full in region or target in region:  # "서울" in "서울특별시광진구" 또는 "경상북도" in "경상북도구미시"
-                    is_target_region = True
-                    break
-            if not is_target_region:
-                print(f"DEBUG: BaseCalculator.calculate - Region {region} is not in target regions: {target_regions}")
-                # 취급 불가지역인 경우 특별한 결과 반환
-                return {
-                    "bank_name": self.bank_name,
-                    "results": [],
-                    "conditions": self.config.get("conditions", []),
-                    "errors": ["취급 불가지역"],
-                    "min_amount": self.config.get("min_amount", 3000)
-                }
+        if not self._is_target_region(region):
+            _trace.debug("BaseCalculator.calculate - Region %s is not in target regions: %s", region, self.config.get("target_regions", []))
+            # 취급 불가지역인 경우 특별한 결과 반환
+            return None, self.unsupported_region_response()
         
         # 급지 확인
         grade = self.get_region_grade(region)
-        print(f"DEBUG: BaseCalculator.calculate - region: {region}, grade: {grade}")
+        _trace.debug("BaseCalculator.calculate - region: %s, grade: %s", region, grade)
         if grade is None:
-            print(f"DEBUG: BaseCalculator.calculate - grade is None for region: {region}, 취급 불가지역")
+            _trace.debug("BaseCalculator.calculate - grade is None for region: %s, 취급 불가지역", region)
             # 급지가 없으면 취급 불가지역으로 처리
-            return {
-                "bank_name": self.bank_name,
-                "results": [],
-                "conditions": self.config.get("conditions", []),
-                "errors": ["취급 불가지역"],
-                "min_amount": self.config.get("min_amount", 3000)
-            }
+            return None, self.unsupported_region_response()
         
         # 6급지인 경우 취급 불가지역으로 처리
         if grade == 6:
-            print(f"DEBUG: BaseCalculator.calculate - grade 6 for region: {region}, 취급 불가지역")
-            return {
-                "bank_name": self.bank_name,
-                "results": [],
-                "conditions": self.config.get("conditions", []),
-                "errors": ["취급 불가지역"],
-                "min_amount": self.config.get("min_amount", 3000)
-            }
+            _trace.debug("BaseCalculator.calculate - grade 6 for region: %s, 취급 불가지역", region)
+            return None, self.unsupported_region_response()
         
         # 면적 제한 확인 (BNK캐피탈 등 특정 금융사만)
         area_limit_config = self.config.get("area_limit", {})
@@ -292,21 +358,21 @@ class BaseCalculator:
                         break
                 
                 if not is_excluded_region and area > max_area:
-                    print(f"DEBUG: BaseCalculator.calculate - area {area}㎡ > max_area {max_area}㎡ for region {region}, 취급 불가")
-                    return {
-                        "bank_name": self.bank_name,
-                        "results": [],
-                        "conditions": self.config.get("conditions", []),
-                        "errors": [f"면적 {area}㎡는 서울지역 이외에서는 135㎡ 초과로 취급 불가"],
-                        "min_amount": self.config.get("min_amount", 3000)
-                    }
+                    _trace.debug("BaseCalculator.calculate - area %s㎡ > max_area %s㎡ for region %s, 취급 불가", area, max_area, region)
+                    return None, BankQuote(
+                        bank_name=self.bank_name,
+                        results=[],
+                        conditions=self.config.get("conditions", []),
+                        errors=[f"면적 {area}㎡는 서울지역 이외에서는 135㎡ 초과로 취급 불가"],
+                        min_amount=self.config.get("min_amount", 3000)
+                    )
         
         # 기준 LTV 이하 지역 확인
         below_standard_ltv = self.get_below_standard_ltv(region)
         is_below_standard = below_standard_ltv is not None
         
         # OK저축은행 가계자금인 경우 확인 (최대 LTV 계산 전에 먼저 확인)
-        is_ok_bank = self.bank_name == "OK저축은행" or "OK저축은행" in self.bank_name or "오케이저축은행" in self.bank_name
+        is_ok_bank = self.is_ok_bank
         is_household_for_ok = False
         if is_ok_bank:
             # product_type이 "household"이면 가계자금
@@ -314,36 +380,29 @@ class BaseCalculator:
         
         # 최대 LTV 확인 (1급지인 경우 A/B 그룹 구분)
         # OK저축은행인 경우 면적과 신용점수 등급을 고려
-        # property_data에 product_type 정보 추가 (get_max_ltv_by_grade에서 사용)
-        if is_household_for_ok:
-            property_data_with_type = property_data.copy()
-            property_data_with_type["_product_type"] = "household"
-            max_ltv = self.get_max_ltv_by_grade(grade, region, property_data_with_type)
-        else:
-            property_data_with_type = property_data.copy()
-            property_data_with_type["_product_type"] = "business"
-            max_ltv = self.get_max_ltv_by_grade(grade, region, property_data_with_type)
-        print(f"DEBUG: BaseCalculator.calculate - grade: {grade}, max_ltv: {max_ltv}, below_standard_ltv: {below_standard_ltv}")  # 추가
+        max_ltv = self.get_max_ltv_by_grade(
+            grade, region, property_data,
+            product_type="household" if is_household_for_ok else "business"
+        )
+        _trace.debug("BaseCalculator.calculate - grade: %s, max_ltv: %s, below_standard_ltv: %s", grade, max_ltv, below_standard_ltv)
         if max_ltv is None or max_ltv == 0:
-            print(f"DEBUG: BaseCalculator.calculate - max_ltv is None or 0 for grade {grade}, returning None")  # 추가
-            return None
+            _trace.debug("BaseCalculator.calculate - max_ltv is None or 0 for grade %s, returning None", grade)
+            return None, None
         
         # 기준 LTV 이하 지역인 경우 해당 LTV를 최대 LTV로 사용
         if is_below_standard:
             max_ltv = below_standard_ltv
-            print(f"DEBUG: BaseCalculator.calculate - 기준 LTV 이하 지역: {region}, 적용 LTV: {max_ltv}%")
+            _trace.debug("BaseCalculator.calculate - 기준 LTV 이하 지역: %s, 적용 LTV: %s%%", region, max_ltv)
         
         # 기존 근저당권 총액 계산 (채권최고액 기준)
-        mortgages = property_data.get("mortgages", [])
-        
-        # 대환할 근저당권 찾기 (여러 개 대비하여 누적합으로 처리)
-        refinance_principal = 0.0  # 대환할 근저당권 원금 합계
+        mortgages = context.mortgages
         refinance_institutions = []  # 대환하는 금융사 이름 리스트 (가계자금용)
-        other_mortgages = []  # 나머지 근저당권들
         
         # 가계자금인 경우: 물상담보 제외, business_product_names에 없는 것만 대환 가능
         if is_household_for_ok:
-            business_product_names = self.config.get("business_product_names", [])
+            # 대환할 근저당권 찾기 (여러 개 대비하여 누적합으로 처리)
+            refinance_principal = 0.0  # 대환할 근저당권 원금 합계
+            other_mortgages = []  # 나머지 근저당권들
             requests = property_data.get("requests", "")
             household_refinance_requested = "가계자금" in requests or "가계" in requests
             
@@ -351,15 +410,14 @@ class BaseCalculator:
                 institution = mortgage.get("institution", "")
                 # 물상담보 체크
                 if "물상" in institution or "물상담보" in institution:
-                    print(f"DEBUG: BaseCalculator.calculate - 가계자금: 물상담보는 대환 불가 - {institution}")
+                    _trace.debug("BaseCalculator.calculate - 가계자금: 물상담보는 대환 불가 - %s", institution)
                     other_mortgages.append(mortgage)
                     continue
                 
                 # business_product_names에 있는지 확인
                 is_business_product = False
                 institution_clean = institution.replace(" ", "")
-                for product_name in business_product_names:
-                    product_name_clean = product_name.replace(" ", "")
+                for product_name_clean in self.business_product_keys:
                     if product_name_clean in institution_clean:
                         is_business_product = True
                         break
@@ -371,38 +429,39 @@ class BaseCalculator:
                         mortgage_amount = float(mortgage.get("amount", 0) or 0)
                         refinance_principal += mortgage_amount
                         refinance_institutions.append(institution)
-                        print(f"DEBUG: BaseCalculator.calculate - 가계자금 대환: priority={mortgage.get('priority')}, institution={institution}, principal={mortgage_amount}만원")
+                        if _trace.debug_enabled:
+                            _trace.debug("BaseCalculator.calculate - 가계자금 대환: priority=%s, institution=%s, principal=%s만원", mortgage.get('priority'), institution, mortgage_amount)
                     else:
                         # 대환 요청이 없으면 후순위로 처리
                         other_mortgages.append(mortgage)
                 else:
                     # business_product_names에 있으면 사업자금이므로 후순위로 처리
                     other_mortgages.append(mortgage)
+            
+            # 나머지 근저당권의 채권최고액/원금 합산
+            other_max_amount_total = self.calculate_total_mortgage(other_mortgages)
+            other_principal_total = sum(float(m.get("amount", 0) or 0) for m in other_mortgages)
         else:
-            # 일반 처리
-            for mortgage in mortgages:
-                if mortgage.get("is_refinance", False):
-                    mortgage_amount = float(mortgage.get("amount", 0) or 0)
-                    refinance_principal += mortgage_amount
-                    print(f"DEBUG: BaseCalculator.calculate - 대환할 근저당권 발견: priority={mortgage.get('priority')}, institution={mortgage.get('institution')}, principal={mortgage_amount}만원")
-                else:
-                    other_mortgages.append(mortgage)
+            # 일반 처리: 대환 요청된 근저당권 기준 (컨텍스트에서 합산 완료)
+            refinance_principal = context.refinance_principal
+            other_mortgages = context.other_mortgages
+            other_max_amount_total = context.other_max_amount_total
+            other_principal_total = context.other_principal_total
         
-        # 나머지 근저당권의 채권최고액만 합산
-        total_mortgage = self.calculate_total_mortgage(other_mortgages)
+        # 나머지 근저당권의 채권최고액만 차감
+        total_mortgage = other_max_amount_total
         
         # OK저축은행인 경우 원금 기준으로 차감하는지 확인
-        is_ok_bank = self.bank_name == "OK저축은행" or "OK저축은행" in self.bank_name or "오케이저축은행" in self.bank_name
         use_principal_for_ok = self.config.get("use_principal_for_calculation", False)  # 원금 기준 계산 여부
         
         if is_ok_bank and use_principal_for_ok:
             # OK저축은행이고 원금 기준 계산이 설정된 경우: 원금 합계 사용
-            total_mortgage_principal = sum(float(m.get("amount", 0) or 0) for m in other_mortgages)
-            print(f"DEBUG: BaseCalculator.calculate - OK저축은행 원금 기준 계산: total_mortgage_principal={total_mortgage_principal}만원 (기존 채권최고액: {total_mortgage}만원)")
+            total_mortgage_principal = other_principal_total
+            _trace.debug("BaseCalculator.calculate - OK저축은행 원금 기준 계산: total_mortgage_principal=%s만원 (기존 채권최고액: %s만원)", total_mortgage_principal, total_mortgage)
             total_mortgage = total_mortgage_principal
         
-        print(f"DEBUG: BaseCalculator.calculate - mortgages: {mortgages}")  # 추가
-        print(f"DEBUG: BaseCalculator.calculate - refinance_principal(대환 원금 합계): {refinance_principal}만원, total_mortgage(차감할 금액): {total_mortgage}")  # 추가
+        _trace.debug("BaseCalculator.calculate - mortgages: %s", mortgages)
+        _trace.debug("BaseCalculator.calculate - refinance_principal(대환 원금 합계): %s만원, total_mortgage(차감할 금액): %s", refinance_principal, total_mortgage)
         
         # 대환 여부 판단
         is_refinance = refinance_principal > 0
@@ -415,17 +474,16 @@ class BaseCalculator:
             
             # 가계자금으로 대환 가능한 근저당권이 없으면 가계자금 산출하지 않음 (None 반환하여 아무것도 표시하지 않음)
             if not has_household_refinance:
-                print(f"DEBUG: BaseCalculator.calculate - 가계자금: 대환 요청된 금융사 중 가계자금으로 대환 가능한 것이 없어서 산출하지 않음")
-                return None
+                _trace.debug("BaseCalculator.calculate - 가계자금: 대환 요청된 금융사 중 가계자금으로 대환 가능한 것이 없어서 산출하지 않음")
+                return None, None
             
             # 가계자금으로 대환 가능한 근저당권이 있으면 산출 진행
             if is_refinance:
-                print(f"DEBUG: BaseCalculator.calculate - 가계자금: 대환 요청 있음, 대환으로 진행 (대환 금융사: {refinance_institutions})")
+                _trace.debug("BaseCalculator.calculate - 가계자금: 대환 요청 있음, 대환으로 진행 (대환 금융사: %s)", refinance_institutions)
             else:
-                print(f"DEBUG: BaseCalculator.calculate - 가계자금: 대환할 근저당권 없음, 후순위로 산출")
+                _trace.debug("BaseCalculator.calculate - 가계자금: 대환할 근저당권 없음, 후순위로 산출")
         
         # OK 저축은행 사업자/가계 상품 구분
-        is_ok_bank = self.bank_name == "OK저축은행" or "OK저축은행" in self.bank_name or "오케이저축은행" in self.bank_name
         is_business_product = False
         is_household_product = False
         
@@ -439,12 +497,10 @@ class BaseCalculator:
                 is_household_for_ok = False
             else:
                 # bank_name이 사업자 상품명 리스트에 있는지 확인
-                business_product_names = self.config.get("business_product_names", [])
                 bank_name_clean = self.bank_name.replace(" ", "")
                 
                 # 사업자 상품명 확인 (현대캐피탈 가계/가계자금 제외)
-                for product_name in business_product_names:
-                    product_name_clean = product_name.replace(" ", "")
+                for product_name_clean in self.business_product_keys:
                     if product_name_clean in bank_name_clean:
                         # "가계" 또는 "가계자금"이 포함되어 있으면 가계 상품
                         if "가계" in bank_name_clean or "가계자금" in bank_name_clean:
@@ -460,7 +516,6 @@ class BaseCalculator:
             # 사업자 상품인 경우: business_product_names에 있는 기관만 대환 가능
             if is_business_product and is_refinance:
                 # 대환할 근저당권이 business_product_names에 있는지 확인
-                business_product_names = self.config.get("business_product_names", [])
                 can_refinance = False
                 refinance_institutions = []
                 
@@ -468,28 +523,25 @@ class BaseCalculator:
                     if mortgage.get("is_refinance", False):
                         institution = mortgage.get("institution", "")
                         institution_clean = institution.replace(" ", "")
-                        for product_name in business_product_names:
-                            product_name_clean = product_name.replace(" ", "")
+                        for product_name_clean in self.business_product_keys:
                             if product_name_clean in institution_clean:
                                 can_refinance = True
                                 refinance_institutions.append(institution)
                                 break
                 
                 if not can_refinance:
-                    print(f"DEBUG: BaseCalculator.calculate - OK 저축은행 사업자 상품: 대환 요청된 기관이 사업자 상품이 아님")
-                    return {
-                        "bank_name": self.bank_name,
-                        "results": [],
-                        "conditions": self.config.get("conditions", []),
-                        "errors": ["사업자 상품은 사업자금 기관만 대환 가능"],
-                        "min_amount": self.config.get("min_amount", 3000)
-                    }
-        
-        # 사업자/가계 상품 정보를 인스턴스 변수로 저장 (get_interest_rate에서 사용)
-        self._is_business_product = is_business_product
-        self._is_household_product = is_household_product
-        self._is_subordinate = len(other_mortgages) > 0  # 후순위 여부
-        self._current_property_data = property_data
+                    _trace.debug("BaseCalculator.calculate - OK 저축은행 사업자 상품: 대환 요청된 기관이 사업자 상품이 아님")
+                    return None, BankQuote(
+                        bank_name=self.bank_name,
+                        results=[],
+                        conditions=self.config.get("conditions", []),
+                        errors=["사업자 상품은 사업자금 기관만 대환 가능"],
+                        min_amount=self.config.get("min_amount", 3000)
+                    )
+        
+        # 사업자/가계 상품 정보 (get_interest_rate에 인자로 전달)
+        # 계산기 인스턴스는 여러 요청이 동시에 공유하므로 요청별 상태를 self에 저장하지 않음
+        is_subordinate = len(other_mortgages) > 0  # 후순위 여부
         
         # 가계 상품: 빌라인 경우 선순위만 산출
         if is_household_product:
@@ -497,14 +549,14 @@ class BaseCalculator:
             if property_type and "빌라" in property_type:
                 # 선순위만 산출 (기존 근저당권이 없어야 함)
                 if len(other_mortgages) > 0:
-                    print(f"DEBUG: BaseCalculator.calculate - OK 저축은행 가계 상품, 빌라인 경우 선순위만 산출 가능")
-                    return {
-                        "bank_name": self.bank_name,
-                        "results": [],
-                        "conditions": self.config.get("conditions", []),
-                        "errors": ["빌라인 경우 선순위만 산출 가능"],
-                        "min_amount": self.config.get("min_amount", 3000)
-                    }
+                    _trace.debug("BaseCalculator.calculate - OK 저축은행 가계 상품, 빌라인 경우 선순위만 산출 가능")
+                    return None, BankQuote(
+                        bank_name=self.bank_name,
+                        results=[],
+                        conditions=self.config.get("conditions", []),
+                        errors=["빌라인 경우 선순위만 산출 가능"],
+                        min_amount=self.config.get("min_amount", 3000)
+                    )
         
         # 신용점수/등급 확인
         credit_score = property_data.get("credit_score")
@@ -520,7 +572,7 @@ class BaseCalculator:
                 for keyword in keywords:
                     if keyword in special_notes:
                         max_amount_limit = taxi_limit_config.get("max_amount", 10000)  # 기본값 1억
-                        print(f"DEBUG: BaseCalculator.calculate - 택시 관련 키워드 '{keyword}' 발견, 한도 제한: {max_amount_limit}만원")
+                        _trace.debug("BaseCalculator.calculate - 택시 관련 키워드 '%s' 발견, 한도 제한: %s만원", keyword, max_amount_limit)
                         break
         
         # 가계 상품: 서울 수도권 한도 제한 (1억)
@@ -538,32 +590,72 @@ class BaseCalculator:
                 # 기존 한도 제한이 없거나 더 큰 경우에만 적용
                 if max_amount_limit is None or max_amount_limit > household_limit_amount:
                     max_amount_limit = household_limit_amount
-                    print(f"DEBUG: BaseCalculator.calculate - OK 저축은행 가계 상품, 서울 수도권 한도 제한: {max_amount_limit}만원")
+                    _trace.debug("BaseCalculator.calculate - OK 저축은행 가계 상품, 서울 수도권 한도 제한: %s만원", max_amount_limit)
         
         # 가계자금인 경우 LTV 70% 고정
         if is_household_for_ok:
             max_ltv = 70
-            print(f"DEBUG: BaseCalculator.calculate - 가계자금: LTV 70% 고정")
+            _trace.debug("BaseCalculator.calculate - 가계자금: LTV 70%% 고정")
         
         # 필요자금이 있으면 LTV별 계산을 건너뛰고 필요자금 기준으로 역산 계산
         required_amount = property_data.get("required_amount")
+        
+        return QuotePlan(
+            property_data=property_data,
+            kb_price=kb_price,
+            region=region,
+            grade=grade,
+            max_ltv=max_ltv,
+            is_below_standard=is_below_standard,
+            is_ok_bank=is_ok_bank,
+            is_household_for_ok=is_household_for_ok,
+            is_business_product=is_business_product,
+            is_household_product=is_household_product,
+            is_subordinate=is_subordinate,
+            is_refinance=is_refinance,
+            refinance_principal=refinance_principal,
+            refinance_institutions=refinance_institutions,
+            total_mortgage=total_mortgage,
+            other_max_amount_total=other_max_amount_total,
+            credit_score=credit_score,
+            credit_grade=credit_grade,
+            max_amount_limit=max_amount_limit,
+            required_amount=required_amount
+        ), None
+    
+    def quote_from_plan(self, plan: QuotePlan) -> Optional[BankQuote]:
+        """
+        계산 계획으로 한도/금리 산출 (택시 한도 역산, 필요자금 역산, LTV 단계별 계산)
+        
+        Returns:
+            계산 결과 (BankQuote, 딕셔너리처럼 접근 가능) 또는 None (산출 불가 시)
+        """
+        property_data = plan.property_data
+        kb_price = plan.kb_price
+        grade = plan.grade
+        max_ltv = plan.max_ltv
+        is_below_standard = plan.is_below_standard
+        is_household_for_ok = plan.is_household_for_ok
+        is_business_product = plan.is_business_product
+        is_household_product = plan.is_household_product
+        is_subordinate = plan.is_subordinate
+        is_refinance = plan.is_refinance
+        refinance_principal = plan.refinance_principal
+        refinance_institutions = plan.refinance_institutions
+        other_max_amount_total = plan.other_max_amount_total
+        credit_score = plan.credit_score
+        credit_grade = plan.credit_grade
+        max_amount_limit = plan.max_amount_limit
+        required_amount = plan.required_amount
+        
         results = []
         
         # 택시 한도 제한이 적용되면 1억을 받기 위해 필요한 LTV를 역산
         if max_amount_limit is not None and not required_amount:
-            print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한 적용, 1억을 받기 위한 LTV 역산")
+            _trace.debug("BaseCalculator.calculate - 택시 한도 제한 적용, 1억을 받기 위한 LTV 역산")
             
             # 근저당권 채권최고액 계산 (대환할 근저당권 제외한 나머지만)
-            mortgage_max_amount = 0.0
-            for mortgage in other_mortgages:
-                # 채권최고액이 있으면 사용, 없으면 원금에 1.2를 곱해서 추정
-                max_amount = mortgage.get("max_amount")
-                if max_amount is not None and isinstance(max_amount, (int, float)):
-                    mortgage_max_amount += max_amount
-                else:
-                    principal = mortgage.get("amount", 0)
-                    if isinstance(principal, (int, float)):
-                        mortgage_max_amount += principal * 1.2
+            mortgage_max_amount = other_max_amount_total
             
             # 대환할 근저당권 원금 추가
             if is_refinance:
@@ -577,11 +669,11 @@ class BaseCalculator:
             required_total = limit_max_amount + mortgage_max_amount
             calculated_ltv = (required_total / kb_price) * 100
             
-            print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한 LTV 역산: mortgage_max_amount(채권최고액)={mortgage_max_amount}만원, limit_max_amount={limit_max_amount}만원, required_total={required_total}만원, calculated_ltv={calculated_ltv:.2f}%")
+            _trace.debug("BaseCalculator.calculate - 택시 한도 제한 LTV 역산: mortgage_max_amount(채권최고액)=%s만원, limit_max_amount=%s만원, required_total=%s만원, calculated_ltv=%.2f%%", mortgage_max_amount, limit_max_amount, required_total, calculated_ltv)
             
             # 계산된 LTV가 max_ltv를 초과하면 불가능
             if calculated_ltv > max_ltv:
-                print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한 LTV {calculated_ltv:.2f}% > max_ltv {max_ltv}%, not possible")
+                _trace.debug("BaseCalculator.calculate - 택시 한도 제한 LTV %.2f%% > max_ltv %s%%, not possible", calculated_ltv, max_ltv)
                 results = []
             else:
                 # 금리 조회를 위해 가장 가까운 ltv_steps 값 찾기
@@ -589,36 +681,42 @@ class BaseCalculator:
                 closest_ltv_for_rate = None
                 if ltv_steps:
                     closest_ltv_for_rate = min(ltv_steps, key=lambda x: abs(x - calculated_ltv))
-                    print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한, using closest LTV {closest_ltv_for_rate}% for rate lookup (calculated: {calculated_ltv:.2f}%)")
+                    _trace.debug("BaseCalculator.calculate - 택시 한도 제한, using closest LTV %s%% for rate lookup (calculated: %.2f%%)", closest_ltv_for_rate, calculated_ltv)
                 else:
                     closest_ltv_for_rate = int(round(calculated_ltv))
                 
                 # 금리 조회
-                rate_info = self.get_interest_rate(credit_score, credit_grade, int(closest_ltv_for_rate), grade)
+                rate_info = self.get_interest_rate(
+                    credit_score, credit_grade, int(closest_ltv_for_rate), grade,
+                    is_business_product=is_business_product,
+                    is_household_product=is_household_product,
+                    is_subordinate=is_subordinate,
+                    property_data=property_data
+                )
                 
                 # 결과 생성 (LTV는 정확히 계산된 값, 금액은 1억)
                 # 100만 단위로 절삭
                 rounded_amount = self.round_down_to_hundred_thousand(max_amount_limit)
-                result = {
-                    "ltv": round(calculated_ltv, 2),
-                    "amount": rounded_amount,
-                    "interest_rate": rate_info.get("interest_rate"),
-                    "interest_rate_range": rate_info.get("interest_rate_range"),
-                    "type": "대환" if is_refinance else "후순위",
-                    "available_amount": rounded_amount,
-                    "total_amount": rounded_amount,
-                    "is_refinance": is_refinance,
-                    "credit_grade": rate_info.get("credit_grade"),
-                    "below_standard_ltv": is_below_standard,
-                    "taxi_limit_applied": True,  # 택시 한도 제한 적용 플래그
-                    "refinance_institutions": refinance_institutions if is_household_for_ok and is_refinance else None  # 가계자금 대환 시 대환하는 금융사 이름
-                }
+                result = QuoteResult(
+                    ltv=round(calculated_ltv, 2),
+                    amount=rounded_amount,
+                    interest_rate=rate_info.get("interest_rate"),
+                    interest_rate_range=rate_info.get("interest_rate_range"),
+                    type="대환" if is_refinance else "후순위",
+                    available_amount=rounded_amount,
+                    total_amount=rounded_amount,
+                    is_refinance=is_refinance,
+                    credit_grade=rate_info.get("credit_grade"),
+                    below_standard_ltv=is_below_standard,
+                    taxi_limit_applied=True,  # 택시 한도 제한 적용 플래그
+                    refinance_institutions=refinance_institutions if is_household_for_ok and is_refinance else None  # 가계자금 대환 시 대환하는 금융사 이름
+                )
                 
                 results = [result]  # 하나의 결과만 반환
-                print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한 결과 생성: LTV {calculated_ltv:.2f}%, amount {max_amount_limit}만원")
+                _trace.debug("BaseCalculator.calculate - 택시 한도 제한 결과 생성: LTV %.2f%%, amount %s만원", calculated_ltv, max_amount_limit)
         
         elif required_amount:
-            print(f"DEBUG: BaseCalculator.calculate - required_amount: {required_amount}만원, calculating LTV from required amount (skipping LTV steps)")  # 추가
+            _trace.debug("BaseCalculator.calculate - required_amount: %s만원, calculating LTV from required amount (skipping LTV steps)", required_amount)
             
             # LTV 역산 공식 (채권최고액 기준):
             # 필요자금(원금)의 채권최고액 = 필요자금 * 1.2
@@ -626,16 +724,7 @@ class BaseCalculator:
             # LTV = (필요자금 채권최고액 + 기존 근저당권 채권최고액) / KB시세 * 100
             
             # 근저당권 채권최고액 계산 (대환할 근저당권 제외한 나머지만)
-            mortgage_max_amount = 0.0
-            for mortgage in other_mortgages:
-                # 채권최고액이 있으면 사용, 없으면 원금에 1.2를 곱해서 추정
-                max_amount = mortgage.get("max_amount")
-                if max_amount is not None and isinstance(max_amount, (int, float)):
-                    mortgage_max_amount += max_amount
-                else:
-                    principal = mortgage.get("amount", 0)
-                    if isinstance(principal, (int, float)):
-                        mortgage_max_amount += principal * 1.2
+            mortgage_max_amount = other_max_amount_total
             
             # 대환할 근저당권 원금 추가
             if is_refinance:
@@ -649,11 +738,11 @@ class BaseCalculator:
             required_total = required_max_amount + mortgage_max_amount
             calculated_ltv = (required_total / kb_price) * 100
             
-            print(f"DEBUG: BaseCalculator.calculate - mortgage_max_amount(채권최고액): {mortgage_max_amount}만원, required_max_amount(채권최고액): {required_max_amount}만원, required_total: {required_total}만원, calculated_ltv: {calculated_ltv:.2f}%")  # 추가
+            _trace.debug("BaseCalculator.calculate - mortgage_max_amount(채권최고액): %s만원, required_max_amount(채권최고액): %s만원, required_total: %s만원, calculated_ltv: %.2f%%", mortgage_max_amount, required_max_amount, required_total, calculated_ltv)
             
             # 계산된 LTV가 max_ltv를 초과하면 불가능
             if calculated_ltv > max_ltv:
-                print(f"DEBUG: BaseCalculator.calculate - calculated_ltv {calculated_ltv:.2f}% > max_ltv {max_ltv}%, not possible")  # 추가
+                _trace.debug("BaseCalculator.calculate - calculated_ltv %.2f%% > max_ltv %s%%, not possible", calculated_ltv, max_ltv)
                 results = []
             else:
                 # 계산된 정확한 LTV 사용 (ltv_steps에 없어도 됨)
@@ -663,12 +752,18 @@ class BaseCalculator:
                 if ltv_steps:
                     # 계산된 LTV에 가장 가까운 ltv_steps 값 찾기
                     closest_ltv_for_rate = min(ltv_steps, key=lambda x: abs(x - calculated_ltv))
-                    print(f"DEBUG: BaseCalculator.calculate - using closest LTV {closest_ltv_for_rate}% for rate lookup (calculated: {calculated_ltv:.2f}%)")  # 추가
+                    _trace.debug("BaseCalculator.calculate - using closest LTV %s%% for rate lookup (calculated: %.2f%%)", closest_ltv_for_rate, calculated_ltv)
                 else:
                     closest_ltv_for_rate = int(round(calculated_ltv))
                 
                 # 금리 조회 (가장 가까운 ltv_steps 값 사용)
-                rate_info = self.get_interest_rate(credit_score, credit_grade, int(closest_ltv_for_rate), grade)
+                rate_info = self.get_interest_rate(
+                    credit_score, credit_grade, int(closest_ltv_for_rate), grade,
+                    is_business_product=is_business_product,
+                    is_household_product=is_household_product,
+                    is_subordinate=is_subordinate,
+                    property_data=property_data
+                )
                 
                 # 택시 관련 한도 제한 적용
                 final_amount = required_amount
@@ -676,7 +771,7 @@ class BaseCalculator:
                 if max_amount_limit is not None and final_amount > max_amount_limit:
                     final_amount = max_amount_limit
                     taxi_limit_applied = True
-                    print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한 적용: {required_amount}만원 -> {final_amount}만원")
+                    _trace.debug("BaseCalculator.calculate - 택시 한도 제한 적용: %s만원 -> %s만원", required_amount, final_amount)
                 
                 # 대환인 경우 total_amount와 available_amount 구분
                 if is_refinance:
@@ -692,157 +787,220 @@ class BaseCalculator:
                 rounded_total_amount = self.round_down_to_hundred_thousand(total_amount)
                 
                 # 결과 생성 (LTV는 정확히 계산된 값 사용, 금액은 정확히 필요자금으로)
-                result = {
-                    "ltv": round(calculated_ltv, 2),  # 소수점 2자리까지 표시
-                    "amount": rounded_amount,
-                    "interest_rate": rate_info.get("interest_rate"),
-                    "interest_rate_range": rate_info.get("interest_rate_range"),
-                    "type": "대환" if is_refinance else "후순위",
-                    "available_amount": rounded_amount,
-                    "total_amount": rounded_total_amount,
-                    "is_refinance": is_refinance,
-                    "credit_grade": rate_info.get("credit_grade"),
-                    "below_standard_ltv": is_below_standard,  # 기준 LTV 이하 지역 여부
-                    "taxi_limit_applied": taxi_limit_applied,  # 택시 한도 제한 적용 플래그
-                    "fixed_rate_comment": rate_info.get("fixed_rate_comment"),  # 고정금리 코멘트
-                    "refinance_institutions": refinance_institutions if is_household_for_ok and is_refinance else None  # 가계자금 대환 시 대환하는 금융사 이름
-                }
+                result = QuoteResult(
+                    ltv=round(calculated_ltv, 2),  # 소수점 2자리까지 표시
+                    amount=rounded_amount,
+                    interest_rate=rate_info.get("interest_rate"),
+                    interest_rate_range=rate_info.get("interest_rate_range"),
+                    type="대환" if is_refinance else "후순위",
+                    available_amount=rounded_amount,
+                    total_amount=rounded_total_amount,
+                    is_refinance=is_refinance,
+                    credit_grade=rate_info.get("credit_grade"),
+                    below_standard_ltv=is_below_standard,  # 기준 LTV 이하 지역 여부
+                    taxi_limit_applied=taxi_limit_applied,  # 택시 한도 제한 적용 플래그
+                    fixed_rate_comment=rate_info.get("fixed_rate_comment"),  # 고정금리 코멘트
+                    refinance_institutions=refinance_institutions if is_household_for_ok and is_refinance else None  # 가계자금 대환 시 대환하는 금융사 이름
+                )
                 
                 results = [result]  # 하나의 결과만 반환
-                print(f"DEBUG: BaseCalculator.calculate - created result with LTV {calculated_ltv:.2f}% and amount {final_amount}만원")  # 추가
+                _trace.debug("BaseCalculator.calculate - created result with LTV %.2f%% and amount %s만원", calculated_ltv, final_amount)
         else:
             # 필요자금이 없고 택시 한도 제한도 없으면 기존대로 LTV별 한도 계산
-            # 가계자금인 경우 LTV 70%만 계산
-            if is_household_for_ok:
-                ltv_steps = [70]
-            else:
-                # 사업자금인 경우 max_ltv_by_area_grade_credit에서 가능한 LTV만 사용
-                if is_ok_bank and is_business_product:
-                    # 사업자금은 max_ltv_by_area_grade_credit에서 가능한 LTV만 사용
-                    # max_ltv는 이미 get_max_ltv_by_grade에서 계산됨
-                    # ltv_steps에서 max_ltv 이하만 사용
-                    all_ltv_steps = self.config.get("ltv_steps", [90, 85, 80, 75, 70, 65])
-                    ltv_steps = [ltv for ltv in all_ltv_steps if ltv <= max_ltv]
-                    print(f"DEBUG: BaseCalculator.calculate - 사업자금: max_ltv={max_ltv}, filtered ltv_steps={ltv_steps}")
-                else:
-                    ltv_steps = self.config.get("ltv_steps", [90, 85, 80, 75, 70, 65])
-            
-            print(f"DEBUG: BaseCalculator.calculate - max_ltv: {max_ltv}, ltv_steps: {ltv_steps}")  # 추가
-            
-            for ltv in ltv_steps:
-                # 최대 LTV를 초과하면 스킵
-                if ltv > max_ltv:
-                    print(f"DEBUG: LTV {ltv} > max_ltv {max_ltv}, skipping")  # 추가
-                    continue
-                
-                # 가용 한도 계산
-                # OK저축은행인 경우 특별한 계산 방식 적용
-                if is_ok_bank and not is_refinance:
-                    # OK저축은행 후순위: 현재 LTV 한도에서 기존 근저당권이 차지하는 LTV 수준의 한도를 차감
-                    # 기존 근저당권이 차지하는 LTV = total_mortgage / kb_price * 100
-                    existing_ltv = (total_mortgage / kb_price) * 100 if kb_price > 0 else 0
-                    # 기존 근저당권 LTV 수준의 한도 계산
-                    existing_ltv_limit = kb_price * (existing_ltv / 100)
-                    # 현재 LTV 한도에서 기존 근저당권 LTV 수준 한도를 차감
-                    max_amount_principal = kb_price * (ltv / 100)
-                    available_principal = max_amount_principal - existing_ltv_limit
-                    amount_info = {
-                        "total_amount": max(0, available_principal),
-                        "available_amount": max(0, available_principal)
-                    }
-                    print(f"DEBUG: BaseCalculator.calculate - OK저축은행 특별 계산: ltv={ltv}%, existing_ltv={existing_ltv:.2f}%, max_amount={max_amount_principal}, existing_limit={existing_ltv_limit}, available={available_principal}")
-                else:
-                    # 일반 계산 방식
-                    amount_info = self.calculate_available_amount(
-                        kb_price, ltv, total_mortgage, is_refinance, refinance_principal
-                    )
-                
-                print(f"DEBUG: LTV {ltv} - amount_info: {amount_info}")  # 추가
-                
-                # 가용 한도가 0 이하면 스킵 (대환인 경우는 마이너스여도 산출)
-                if not is_refinance and amount_info["available_amount"] <= 0:
-                    print(f"DEBUG: LTV {ltv} - available_amount <= 0, skipping")  # 추가
-                    continue
-                
-                # 금리 조회 (82% LTV의 경우 region_grade에 따라 다른 금리 적용)
-                rate_info = self.get_interest_rate(credit_score, credit_grade, ltv, grade)
-                
-                # 가계 상품 한도 제한 적용
-                final_amount = amount_info["available_amount"]
-                if max_amount_limit is not None and final_amount > max_amount_limit:
-                    final_amount = max_amount_limit
-                    print(f"DEBUG: BaseCalculator.calculate - 가계 상품 한도 제한 적용: {amount_info['available_amount']}만원 -> {final_amount}만원")
-                
-                # 100만 단위로 절삭
-                final_amount = self.round_down_to_hundred_thousand(final_amount)
-                final_total_amount = self.round_down_to_hundred_thousand(amount_info["total_amount"])
-                
-                result = {
-                    "ltv": ltv,
-                    "amount": final_amount,
-                    "interest_rate": rate_info.get("interest_rate"),
-                    "interest_rate_range": rate_info.get("interest_rate_range"),
-                    "type": "대환" if is_refinance else "후순위",
-                    "available_amount": final_amount,
-                    "total_amount": final_total_amount,
-                    "is_refinance": is_refinance,
-                    "credit_grade": rate_info.get("credit_grade"),
-                    "below_standard_ltv": is_below_standard,  # 기준 LTV 이하 지역 여부
-                    "fixed_rate_comment": rate_info.get("fixed_rate_comment"),  # 고정금리 코멘트
-                    "refinance_institutions": refinance_institutions if is_household_for_ok and is_refinance else None  # 가계자금 대환 시 대환하는 금융사 이름
-                }
-                
-                results.append(result)
+            results = self.ltv_step_results(plan)
         
         # 결과가 없으면 에러 메시지와 함께 반환 (가용 한도 부족 등)
         if not results:
-            print(f"DEBUG: BaseCalculator.calculate - no results found for {self.bank_name}")
-            # 최대 LTV로 계산했을 때 가용 한도 확인
-            max_ltv_amount = kb_price * (max_ltv / 100)
+            return self.no_result_response(plan)
+        
+        return self.quote_response(results)
+    
+    def get_ltv_steps(self, plan: QuotePlan) -> List[int]:
+        """LTV 단계별 계산에 사용할 LTV 목록"""
+        max_ltv = plan.max_ltv
+        is_ok_bank = plan.is_ok_bank
+        is_household_for_ok = plan.is_household_for_ok
+        is_business_product = plan.is_business_product
+        
+        # 가계자금인 경우 LTV 70%만 계산
+        if is_household_for_ok:
+            ltv_steps = [70]
+        else:
+            # 사업자금인 경우 max_ltv_by_area_grade_credit에서 가능한 LTV만 사용
+            if is_ok_bank and is_business_product:
+                # 사업자금은 max_ltv_by_area_grade_credit에서 가능한 LTV만 사용
+                # max_ltv는 이미 get_max_ltv_by_grade에서 계산됨
+                # ltv_steps에서 max_ltv 이하만 사용
+                all_ltv_steps = self.config.get("ltv_steps", [90, 85, 80, 75, 70, 65])
+                ltv_steps = [ltv for ltv in all_ltv_steps if ltv <= max_ltv]
+                _trace.debug("BaseCalculator.calculate - 사업자금: max_ltv=%s, filtered ltv_steps=%s", max_ltv, ltv_steps)
+            else:
+                ltv_steps = self.config.get("ltv_steps", [90, 85, 80, 75, 70, 65])
+        
+        return ltv_steps
+    
+    def ltv_step_results(self, plan: QuotePlan) -> List[QuoteResult]:
+        """
+        LTV 단계별 한도/금리 계산
+        
+        Returns:
+            LTV 단계별 결과 리스트 (가용 한도가 없는 단계는 제외)
+        """
+        property_data = plan.property_data
+        kb_price = plan.kb_price
+        grade = plan.grade
+        max_ltv = plan.max_ltv
+        is_below_standard = plan.is_below_standard
+        is_ok_bank = plan.is_ok_bank
+        is_household_for_ok = plan.is_household_for_ok
+        is_business_product = plan.is_business_product
+        is_household_product = plan.is_household_product
+        is_subordinate = plan.is_subordinate
+        is_refinance = plan.is_refinance
+        refinance_principal = plan.refinance_principal
+        refinance_institutions = plan.refinance_institutions
+        total_mortgage = plan.total_mortgage
+        credit_score = plan.credit_score
+        credit_grade = plan.credit_grade
+        max_amount_limit = plan.max_amount_limit
+        
+        ltv_steps = self.get_ltv_steps(plan)
+        results = []
+        
+        _trace.debug("BaseCalculator.calculate - max_ltv: %s, ltv_steps: %s", max_ltv, ltv_steps)
+        
+        for ltv in ltv_steps:
+            # 최대 LTV를 초과하면 스킵
+            if ltv > max_ltv:
+                _trace.debug("LTV %s > max_ltv %s, skipping", ltv, max_ltv)
+                continue
             
-            # 대환인 경우: 대환할 근저당권의 원금 + 나머지 근저당권의 채권최고액을 합산하여 체크
-            # 대환이 아닌 경우: 기존 근저당권의 채권최고액만 체크
-            if is_refinance:
-                # 대환할 근저당권의 원금을 채권최고액으로 추정 (원금 × 1.2)
-                refinance_max_amount = refinance_principal * 1.2
-                # 대환할 근저당권의 채권최고액 + 나머지 근저당권의 채권최고액
-                total_mortgage_for_check = refinance_max_amount + total_mortgage
-                print(f"DEBUG: BaseCalculator.calculate - 대환인 경우: refinance_principal={refinance_principal}만원, refinance_max_amount={refinance_max_amount}만원, total_mortgage={total_mortgage}만원, total_mortgage_for_check={total_mortgage_for_check}만원")
-                
-                if total_mortgage_for_check > max_ltv_amount:
-                    shortage = total_mortgage_for_check - max_ltv_amount
-                    print(f"DEBUG: BaseCalculator.calculate - 대환 시 기존 근저당권이 최대 LTV 한도를 초과: {shortage:.0f}만원 초과")
-                    return {
-                        "bank_name": self.bank_name,
-                        "results": [],
-                        "conditions": self.config.get("conditions", []),
-                        "errors": [f"기존 근저당권 채권최고액({total_mortgage_for_check:,.0f}만원)이 최대 한도({max_ltv_amount:,.0f}만원, LTV {max_ltv}%)를 초과하여 추가 대출 불가능"],
-                        "min_amount": self.config.get("min_amount", 3000)
-                    }
+            # 가용 한도 계산
+            # OK저축은행인 경우 특별한 계산 방식 적용
+            if is_ok_bank and not is_refinance:
+                # OK저축은행 후순위: 현재 LTV 한도에서 기존 근저당권이 차지하는 LTV 수준의 한도를 차감
+                # 기존 근저당권이 차지하는 LTV = total_mortgage / kb_price * 100
+                existing_ltv = (total_mortgage / kb_price) * 100 if kb_price > 0 else 0
+                # 기존 근저당권 LTV 수준의 한도 계산
+                existing_ltv_limit = kb_price * (existing_ltv / 100)
+                # 현재 LTV 한도에서 기존 근저당권 LTV 수준 한도를 차감
+                max_amount_principal = kb_price * (ltv / 100)
+                available_principal = max_amount_principal - existing_ltv_limit
+                amount_info = {
+                    "total_amount": max(0, available_principal),
+                    "available_amount": max(0, available_principal)
+                }
+                _trace.debug("BaseCalculator.calculate - OK저축은행 특별 계산: ltv=%s%%, existing_ltv=%.2f%%, max_amount=%s, existing_limit=%s, available=%s", ltv, existing_ltv, max_amount_principal, existing_ltv_limit, available_principal)
             else:
-                # 대환이 아닌 경우: 기존 로직 유지
-                if total_mortgage > max_ltv_amount:
-                    shortage = total_mortgage - max_ltv_amount
-                    print(f"DEBUG: BaseCalculator.calculate - 기존 근저당권이 최대 LTV 한도를 초과: {shortage:.0f}만원 초과")
-                    return {
-                        "bank_name": self.bank_name,
-                        "results": [],
-                        "conditions": self.config.get("conditions", []),
-                        "errors": [f"기존 근저당권 채권최고액({total_mortgage:,.0f}만원)이 최대 한도({max_ltv_amount:,.0f}만원, LTV {max_ltv}%)를 초과하여 추가 대출 불가능"],
-                        "min_amount": self.config.get("min_amount", 3000)
-                    }
+                # 일반 계산 방식
+                amount_info = self.calculate_available_amount(
+                    kb_price, ltv, total_mortgage, is_refinance, refinance_principal
+                )
             
-            print(f"DEBUG: BaseCalculator.calculate - no results found for {self.bank_name}, returning None")
-            return None
+            _trace.debug("LTV %s - amount_info: %s", ltv, amount_info)
+            
+            # 가용 한도가 0 이하면 스킵 (대환인 경우는 마이너스여도 산출)
+            if not is_refinance and amount_info["available_amount"] <= 0:
+                _trace.debug("LTV %s - available_amount <= 0, skipping", ltv)
+                continue
+            
+            # 금리 조회 (82% LTV의 경우 region_grade에 따라 다른 금리 적용)
+            rate_info = self.get_interest_rate(
+                credit_score, credit_grade, ltv, grade,
+                is_business_product=is_business_product,
+                is_household_product=is_household_product,
+                is_subordinate=is_subordinate,
+                property_data=property_data
+            )
+            
+            # 가계 상품 한도 제한 적용
+            final_amount = amount_info["available_amount"]
+            if max_amount_limit is not None and final_amount > max_amount_limit:
+                final_amount = max_amount_limit
+                _trace.debug("BaseCalculator.calculate - 가계 상품 한도 제한 적용: %s만원 -> %s만원", amount_info['available_amount'], final_amount)
+            
+            # 100만 단위로 절삭
+            final_amount = self.round_down_to_hundred_thousand(final_amount)
+            final_total_amount = self.round_down_to_hundred_thousand(amount_info["total_amount"])
+            
+            result = QuoteResult(
+                ltv=ltv,
+                amount=final_amount,
+                interest_rate=rate_info.get("interest_rate"),
+                interest_rate_range=rate_info.get("interest_rate_range"),
+                type="대환" if is_refinance else "후순위",
+                available_amount=final_amount,
+                total_amount=final_total_amount,
+                is_refinance=is_refinance,
+                credit_grade=rate_info.get("credit_grade"),
+                below_standard_ltv=is_below_standard,  # 기준 LTV 이하 지역 여부
+                fixed_rate_comment=rate_info.get("fixed_rate_comment"),  # 고정금리 코멘트
+                refinance_institutions=refinance_institutions if is_household_for_ok and is_refinance else None  # 가계자금 대환 시 대환하는 금융사 이름
+            )
+            
+            results.append(result)
         
-        print(f"DEBUG: BaseCalculator.calculate - {self.bank_name} found {len(results)} results")  # 추가
-        return {
-            "bank_name": self.bank_name,
-            "results": results,
-            "conditions": self.config.get("conditions", []),
-            "errors": [],
-            "min_amount": self.config.get("min_amount", 3000)  # 기본값 3000만원
-        }
+        return results
+    
+    def no_result_response(self, plan: QuotePlan) -> Optional[BankQuote]:
+        """
+        산출 결과가 없을 때의 응답 (기존 근저당권이 최대 한도를 초과하면 에러 메시지, 아니면 None)
+        """
+        kb_price = plan.kb_price
+        max_ltv = plan.max_ltv
+        is_refinance = plan.is_refinance
+        refinance_principal = plan.refinance_principal
+        total_mortgage = plan.total_mortgage
+        
+        _trace.debug("BaseCalculator.calculate - no results found for %s", self.bank_name)
+        # 최대 LTV로 계산했을 때 가용 한도 확인
+        max_ltv_amount = kb_price * (max_ltv / 100)
+        
+        # 대환인 경우: 대환할 근저당권의 원금 + 나머지 근저당권의 채권최고액을 합산하여 체크
+        # 대환이 아닌 경우: 기존 근저당권의 채권최고액만 체크
+        if is_refinance:
+            # 대환할 근저당권의 원금을 채권최고액으로 추정 (원금 × 1.2)
+            refinance_max_amount = refinance_principal * 1.2
+            # 대환할 근저당권의 채권최고액 + 나머지 근저당권의 채권최고액
+            total_mortgage_for_check = refinance_max_amount + total_mortgage
+            _trace.debug("BaseCalculator.calculate - 대환인 경우: refinance_principal=%s만원, refinance_max_amount=%s만원, total_mortgage=%s만원, total_mortgage_for_check=%s만원", refinance_principal, refinance_max_amount, total_mortgage, total_mortgage_for_check)
+            
+            if total_mortgage_for_check > max_ltv_amount:
+                shortage = total_mortgage_for_check - max_ltv_amount
+                _trace.debug("BaseCalculator.calculate - 대환 시 기존 근저당권이 최대 LTV 한도를 초과: %.0f만원 초과", shortage)
+                return BankQuote(
+                    bank_name=self.bank_name,
+                    results=[],
+                    conditions=self.config.get("conditions", []),
+                    errors=[f"기존 근저당권 채권최고액({total_mortgage_for_check:,.0f}만원)이 최대 한도({max_ltv_amount:,.0f}만원, LTV {max_ltv}%)를 초과하여 추가 대출 불가능"],
+                    min_amount=self.config.get("min_amount", 3000)
+                )
+        else:
+            # 대환이 아닌 경우: 기존 로직 유지
+            if total_mortgage > max_ltv_amount:
+                shortage = total_mortgage - max_ltv_amount
+                _trace.debug("BaseCalculator.calculate - 기존 근저당권이 최대 LTV 한도를 초과: %.0f만원 초과", shortage)
+                return BankQuote(
+                    bank_name=self.bank_name,
+                    results=[],
+                    conditions=self.config.get("conditions", []),
+                    errors=[f"기존 근저당권 채권최고액({total_mortgage:,.0f}만원)이 최대 한도({max_ltv_amount:,.0f}만원, LTV {max_ltv}%)를 초과하여 추가 대출 불가능"],
+                    min_amount=self.config.get("min_amount", 3000)
+                )
+        
+        _trace.debug("BaseCalculator.calculate - no results found for %s, returning None", self.bank_name)
+        return None
+    
+    def quote_response(self, results: List[QuoteResult]) -> BankQuote:
+        """산출 결과가 있을 때의 응답"""
+        _trace.debug("BaseCalculator.calculate - %s found %s results", self.bank_name, len(results))
+        return BankQuote(
+            bank_name=self.bank_name,
+            results=results,
+            conditions=self.config.get("conditions", []),
+            errors=[],
+            min_amount=self.config.get("min_amount", 3000)  # 기본값 3000만원
+        )
     
     def credit_score_to_grade(self, credit_score: Optional[int]) -> Optional[int]:
         """
@@ -850,30 +1008,18 @@ class BaseCalculator:
         금융사별 설정 파일의 credit_score_to_grade를 사용하고,
         없으면 전역 설정을 fallback으로 사용
         """
-        print(f"DEBUG: credit_score_to_grade - credit_score: {credit_score}")  # 추가
+        _trace.debug("credit_score_to_grade - credit_score: %s", credit_score)
         if credit_score is None:
-            print(f"DEBUG: credit_score_to_grade - credit_score is None, returning None")  # 추가
+            _trace.debug("credit_score_to_grade - credit_score is None, returning None")
             return None
         
-        # 금융사별 설정 파일의 매핑 확인
-        score_map = self.config.get("credit_score_to_grade", {})
-        print(f"DEBUG: credit_score_to_grade - score_map: {score_map}")  # 추가
-        if score_map:
-            for range_str, grade in score_map.items():
-                # "920-1000" 형식을 파싱
-                parts = range_str.split("-")
-                if len(parts) == 2:
-                    try:
-                        min_score = int(parts[0])
-                        max_score = int(parts[1])
-                        print(f"DEBUG: credit_score_to_grade - checking range {range_str}: {min_score} <= {credit_score} <= {max_score}")  # 추가
-                        if min_score <= credit_score <= max_score:
-                            print(f"DEBUG: credit_score_to_grade - matched! returning grade: {grade}")  # 추가
-                            return grade
-                    except ValueError:
-                        continue
-        
-        print(f"DEBUG: credit_score_to_grade - no match found, returning None")  # 추가
+        # 금융사별 설정 파일의 매핑 확인 (설정 로드 시 컴파일된 구간 테이블)
+        grade = self.credit_grade_table.lookup(credit_score)
+        if grade is not None:
+            _trace.debug("credit_score_to_grade - matched! returning grade: %s", grade)
+            return grade
+        
+        _trace.debug("credit_score_to_grade - no match found, returning None")
         return None
     
     def validate_kb_price(self, kb_price: Any) -> Optional[float]:
@@ -881,144 +1027,172 @@ class BaseCalculator:
         KB시세 검증 및 변환
         시세가 없으면 None 반환 (산출 불가)
         """
-        print(f"DEBUG: BaseCalculator.validate_kb_price - input: {kb_price}, type: {type(kb_price)}")
+        if _trace.debug_enabled:
+            _trace.debug("BaseCalculator.validate_kb_price - input: %s, type: %s", kb_price, type(kb_price))
         result = validate_kb_price(kb_price)
-        print(f"DEBUG: BaseCalculator.validate_kb_price - output: {result}")
+        _trace.debug("BaseCalculator.validate_kb_price - output: %s", result)
         return result
     
+    def _is_target_region(self, region: str) -> bool:
+        """
+        대상 지역(target_regions) 여부 확인 (광역 단위, 설정이 없으면 모든 지역 대상)
+        예: "서울" in "서울특별시광진구", "경북" -> "경상북도" in "경상북도구미시"
+        """
+        target_regions = self.config.get("target_regions", [])
+        if not target_regions:
+            return True
+        for target in target_regions:
+            # 약자 매핑 적용
+            target_full = REGION_ABBREVIATIONS.get(target, target)
+            if target_full in region or target in region:
+                return True
+        return False
+    
+    def is_region_supported(self, region: str) -> bool:
+        """
+        지역만으로 취급 가능 여부 확인 (prepare_quote의 대상 지역/급지 확인과 동일한 기준)
+        대상 지역이 아니거나, 급지가 없거나, 6급지이면 취급 불가
+        금융사 레지스트리가 지역 ID -> 취급 가능 금융사 색인을 만들 때 사용
+        """
+        if not self._is_target_region(region):
+            return False
+        grade = self.region_table.grade(region)
+        return grade is not None and grade != 6
+    
+    def unsupported_region_response(self) -> BankQuote:
+        """취급 불가지역 결과"""
+        return BankQuote(
+            bank_name=self.bank_name,
+            results=[],
+            conditions=self.config.get("conditions", []),
+            errors=["취급 불가지역"],
+            min_amount=self.config.get("min_amount", 3000)
+        )
+    
+    def passes_kb_price_checks(self, kb_price: Optional[float]) -> bool:
+        """KB시세가 있고 최소 금액(min_kb_price) 이상인지 확인 (prepare_quote에서 지역보다 먼저 확인)"""
+        if kb_price is None:
+            return False
+        min_kb_price = self.config.get("min_kb_price")
+        return min_kb_price is None or kb_price >= min_kb_price
+    
     def get_region_grade(self, region: str) -> Optional[int]:
         """
         지역별 급지 조회
         region_grades에 명시된 지역만 처리 (fallback 없음)
         명시되지 않은 지역은 None 반환하여 취급 불가지역으로 처리
         """
-        region_grades = self.config.get("region_grades", {})
-        
-        # 공백 제거 버전으로도 확인
-        region_clean = region.replace(" ", "")
-        
-        # 1. 정확한 매칭 시도 (원본)
-        if region in region_grades:
-            grade = region_grades.get(region)
-            # 광역 단위 키(서울, 경기 등)는 제외 (구체적인 지역만 처리)
-            if grade is not None and not self._is_metropolitan_key(region):
-                print(f"DEBUG: get_region_grade - exact match: {region} -> grade {grade}")
-                return grade
-        
-        # 2. 공백 제거 버전으로 매칭 시도
-        if region_clean in region_grades:
-            grade = region_grades.get(region_clean)
-            if grade is not None and not self._is_metropolitan_key(region_clean):
-                print(f"DEBUG: get_region_grade - clean match: {region_clean} -> grade {grade}")
-                return grade
-        
-        # 3. 키의 공백 제거 버전과 비교
-        for key in region_grades.keys():
-            if key.replace(" ", "") == region_clean:
-                grade = region_grades.get(key)
-                if grade is not None and not self._is_metropolitan_key(key):
-                    print(f"DEBUG: get_region_grade - key clean match: {key} -> {region_clean} -> grade {grade}")
-                    return grade
-        
-        print(f"DEBUG: get_region_grade - no match found for region: {region} (취급 불가지역)")
+        grade = self.region_table.grade(region)
+        if grade is not None:
+            _trace.debug("get_region_grade - match: %s -> grade %s", region, grade)
+            return grade
+        
+        _trace.debug("get_region_grade - no match found for region: %s (취급 불가지역)", region)
         return None
     
     def _is_metropolitan_key(self, key: str) -> bool:
         """
         광역 단위 키인지 확인 (서울, 경기, 인천, 부산 등)
         """
-        metropolitan_keys = ["서울", "경기", "인천", "부산", "광주", "대전", "울산", "세종", 
-                            "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주", "대구"]
-        return key in metropolitan_keys
+        return key in METROPOLITAN_KEYS
     
-    def get_max_ltv_by_grade(self, grade: Union[int, str], region: str = None, property_data: Dict[str, Any] = None) -> Optional[float]:
+    def get_max_ltv_by_grade(
+        self,
+        grade: Union[int, str],
+        region: str = None,
+        property_data: Dict[str, Any] = None,
+        product_type: Optional[str] = None
+    ) -> Optional[float]:
         """
         급지별 최대 LTV 조회
         1급지인 경우 A/B 그룹을 구분하여 반환
         문자 급지(A, B, C, D)도 지원
         OK저축은행인 경우 면적과 신용점수 등급을 고려
+        조회 키(급지, 1급지 그룹, 면적 구분, 신용등급 번호)만 구하고 값은 조회 큐브에서 가져옴
         
         Args:
             grade: 급지 번호 (1, 2, 3, 4) 또는 문자 급지 (A, B, C, D)
             region: 지역명 (1급지 A/B 구분용)
             property_data: 담보물건 정보 (면적, 신용점수 등)
+            product_type: OK저축은행 상품 구분 ("household"이면 면적/신용등급 구분 없음)
         
         Returns:
             최대 LTV (float) 또는 None
         """
         # OK저축은행인 경우 면적과 신용점수 등급을 고려한 LTV 계산 (사업자금만)
-        is_ok_bank = self.bank_name == "OK저축은행" or "OK저축은행" in self.bank_name or "오케이저축은행" in self.bank_name
         # product_type이 "household"이면 가계자금이므로 이 로직을 사용하지 않음
-        is_household_for_ok = False
-        if is_ok_bank and property_data is not None:
-            # product_type 파라미터 확인 (calculate 메서드에서 전달)
-            # 가계자금인 경우 이 로직을 사용하지 않음
-            is_household_for_ok = property_data.get("_product_type") == "household"
-        
-        if is_ok_bank and property_data is not None and not is_household_for_ok:
+        area_key = None
+        credit_key = None
+        if self.is_ok_bank and property_data is not None:
+            is_household_for_ok = product_type == "household"
             area = property_data.get("area")
-            credit_score = property_data.get("credit_score")
-            print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 체크: area={area}, credit_score={credit_score}")
-            
-            if area is not None:
-                # 신용점수가 있는 경우
-                if credit_score is not None:
-                    # 신용점수 범위 문자열을 등급 번호로 변환
-                    credit_grade_number = self._get_ok_credit_grade_number(credit_score)
-                    print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 credit_grade_number: {credit_grade_number}")
-                    if credit_grade_number is not None:
-                        # 면적별 급지별 LTV 조회
-                        max_ltv = self._get_ok_max_ltv_by_area_grade_credit(area, grade, credit_grade_number)
-                        print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 _get_ok_max_ltv_by_area_grade_credit 결과: {max_ltv}")
-                        if max_ltv is not None:
-                            print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 면적별 LTV: area={area}㎡, grade={grade}, credit_grade={credit_grade_number}등급 -> LTV {max_ltv}%")
-                            return max_ltv
+            if not is_household_for_ok and area is not None:
+                credit_score = property_data.get("credit_score")
+                _trace.debug("get_max_ltv_by_grade - OK저축은행 체크: area=%s, credit_score=%s", area, credit_score)
+                area_key = self._ok_area_key(area)
+                if credit_score is None:
+                    credit_key = NO_CREDIT_SCORE
                 else:
-                    # 신용점수가 없는 경우: 해당 급지의 최대 LTV 사용 (면적과 급지만 고려)
-                    print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 신용점수 없음, 면적과 급지만으로 최대 LTV 계산")
-                    max_ltv = self._get_ok_max_ltv_by_area_grade(area, grade)
-                    if max_ltv is not None:
-                        print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 면적별 LTV (신용점수 없음): area={area}㎡, grade={grade} -> LTV {max_ltv}%")
-                        return max_ltv
+                    # 신용점수 범위 문자열을 등급 번호로 변환
+                    credit_key = self._get_ok_credit_grade_number(credit_score)
+        
+        # 1급지인 경우 A/B 그룹 구분 (A/B 그룹에 없으면 기본값 A 그룹)
+        group_key = None
+        if grade == 1 and region:
+            group_key = self.region_table.grade_1_group(region) or GRADE_1_GROUP_A
+        
+        result = self.quote_cube.max_ltv(grade, group_key, area_key, credit_key)
+        _trace.debug("get_max_ltv_by_grade - grade: %s, region: %s, group: %s, area: %s, credit_grade: %s -> LTV %s%%", grade, region, group_key, area_key, credit_key, result)
+        return result
+    
+    def _max_ltv_for_keys(
+        self,
+        grade: Union[int, str],
+        group_key: Optional[str],
+        area_key: Optional[str],
+        credit_key: Any
+    ) -> Optional[float]:
+        """
+        조회 키 조합의 최대 LTV 계산 (조회 큐브의 각 칸을 채우는 규칙)
+        
+        Args:
+            grade: 급지 번호 또는 문자 급지
+            group_key: 1급지 그룹 키 (max_ltv_by_grade 키, 없으면 None)
+            area_key: OK저축은행 사업자금 면적 구분 (없으면 None)
+            credit_key: OK저축은행 신용등급 번호, NO_CREDIT_SCORE 또는 None (매칭 실패)
+        
+        Returns:
+            최대 LTV (float) 또는 None
+        """
+        if area_key is not None:
+            if credit_key == NO_CREDIT_SCORE:
+                # 신용점수가 없는 경우: 해당 급지의 최대 LTV 사용 (면적과 급지만 고려)
+                max_ltv = self._get_ok_max_ltv_by_area_grade(area_key, grade)
+            elif credit_key is not None:
+                # 면적별 급지별 LTV 조회
+                max_ltv = self._get_ok_max_ltv_by_area_grade_credit(area_key, grade, credit_key)
+            else:
+                max_ltv = None
+            if max_ltv is not None:
+                return max_ltv
         
         max_ltv_by_grade = self.config.get("max_ltv_by_grade", {})
-        print(f"DEBUG: get_max_ltv_by_grade - grade: {grade} (type: {type(grade)}), region: {region}, max_ltv_by_grade keys: {list(max_ltv_by_grade.keys())}")  # 추가
         
         # 문자 급지인 경우 (OK 저축은행 등)
         if isinstance(grade, str):
-            result = max_ltv_by_grade.get(grade)
-            print(f"DEBUG: get_max_ltv_by_grade - 문자 급지: {grade} -> LTV {result}%")
-            return result
+            return max_ltv_by_grade.get(grade)
         
-        # 1급지인 경우 A/B 그룹 구분
-        if grade == 1 and region:
-            region_clean = region.replace(" ", "")
-            grade_1_group_a = self.config.get("grade_1_group_a", [])
-            grade_1_group_b = self.config.get("grade_1_group_b", [])
-            
-            # A 그룹 확인
-            for a_region in grade_1_group_a:
-                if a_region.replace(" ", "") == region_clean:
-                    result = max_ltv_by_grade.get("1")
-                    print(f"DEBUG: get_max_ltv_by_grade - 1급지 A그룹: {region} -> LTV {result}%")
-                    return result
-            
-            # B 그룹 확인
-            for b_region in grade_1_group_b:
-                if b_region.replace(" ", "") == region_clean:
-                    result = max_ltv_by_grade.get("1_b")
-                    print(f"DEBUG: get_max_ltv_by_grade - 1급지 B그룹: {region} -> LTV {result}%")
-                    return result
-            
-            # 1급지이지만 A/B 그룹에 없으면 기본값 (A 그룹)
-            result = max_ltv_by_grade.get("1")
-            print(f"DEBUG: get_max_ltv_by_grade - 1급지 (기본값 A그룹): {region} -> LTV {result}%")
-            return result
+        # 1급지 A/B 그룹
+        if group_key is not None:
+            return max_ltv_by_grade.get(group_key)
         
         # JSON 키는 문자열이므로 int를 문자열로 변환하여 조회
-        result = max_ltv_by_grade.get(str(grade))
-        print(f"DEBUG: get_max_ltv_by_grade - result: {result}")  # 추가
-        return result
+        return max_ltv_by_grade.get(str(grade))
+    
+    @staticmethod
+    def _ok_area_key(area: float) -> str:
+        """OK저축은행 면적 구분 (110㎡ 이하/초과)"""
+        return "area_110_below" if area <= 110 else "area_110_over"
     
     def _get_ok_credit_grade_number(self, credit_score: int) -> Optional[int]:
         """
@@ -1030,34 +1204,20 @@ class BaseCalculator:
         Returns:
             등급 번호 (1~8) 또는 None
         """
-        score_range_to_grade = self.config.get("credit_score_range_to_grade_number", {})
-        if not score_range_to_grade:
-            return None
-        
-        for range_str, grade_number in score_range_to_grade.items():
-            parts = range_str.split("-")
-            if len(parts) == 2:
-                try:
-                    score1 = int(parts[0])
-                    score2 = int(parts[1])
-                    # 범위가 내림차순인 경우 (예: 1000-915)와 오름차순인 경우 모두 처리
-                    min_score = min(score1, score2)
-                    max_score = max(score1, score2)
-                    if min_score <= credit_score <= max_score:
-                        print(f"DEBUG: _get_ok_credit_grade_number - credit_score: {credit_score}, range: {range_str} -> grade: {grade_number}")
-                        return grade_number
-                except ValueError:
-                    continue
+        grade_number = self.credit_grade_number_table.lookup(credit_score)
+        if grade_number is not None:
+            _trace.debug("_get_ok_credit_grade_number - credit_score: %s -> grade: %s", credit_score, grade_number)
+            return grade_number
         
-        print(f"DEBUG: _get_ok_credit_grade_number - credit_score: {credit_score}, no match found")
+        _trace.debug("_get_ok_credit_grade_number - credit_score: %s, no match found", credit_score)
         return None
     
-    def _get_ok_max_ltv_by_area_grade_credit(self, area: float, region_grade: Union[int, str], credit_grade_number: int) -> Optional[float]:
+    def _get_ok_max_ltv_by_area_grade_credit(self, area_key: str, region_grade: Union[int, str], credit_grade_number: int) -> Optional[float]:
         """
         OK저축은행: 면적, 급지, 신용등급을 기반으로 최대 LTV 조회
         
         Args:
-            area: 면적 (㎡)
+            area_key: 면적 구분 ("area_110_below" 또는 "area_110_over")
             region_grade: 급지 번호 (1, 2, 3, 4)
             credit_grade_number: 신용등급 번호 (1~8)
         
@@ -1068,8 +1228,6 @@ class BaseCalculator:
         if not max_ltv_config:
             return None
         
-        # 면적 구분 (110㎡ 이하/초과)
-        area_key = "area_110_below" if area <= 110 else "area_110_over"
         area_config = max_ltv_config.get(area_key, {})
         if not area_config:
             return None
@@ -1082,37 +1240,19 @@ class BaseCalculator:
         
         # 4급지는 등급 상관없이 모두 동일한 LTV
         if grade_key == "4" and "all" in grade_config:
-            result = grade_config["all"]
-            print(f"DEBUG: _get_ok_max_ltv_by_area_grade_credit - area: {area}㎡, grade: {grade_key}, credit_grade: {credit_grade_number}등급 -> LTV {result}% (4급지 전체)")
-            return result
-        
-        # 등급 범위별 LTV 조회
-        for grade_range, ltv in grade_config.items():
-            if grade_range == "all":
-                continue
-            
-            # "1-3", "4-6", "7-8" 형식 파싱
-            parts = grade_range.split("-")
-            if len(parts) == 2:
-                try:
-                    min_grade = int(parts[0])
-                    max_grade = int(parts[1])
-                    if min_grade <= credit_grade_number <= max_grade:
-                        print(f"DEBUG: _get_ok_max_ltv_by_area_grade_credit - area: {area}㎡, grade: {grade_key}, credit_grade: {credit_grade_number}등급, range: {grade_range} -> LTV {ltv}%")
-                        return ltv
-                except ValueError:
-                    continue
+            return grade_config["all"]
         
-        print(f"DEBUG: _get_ok_max_ltv_by_area_grade_credit - area: {area}㎡, grade: {grade_key}, credit_grade: {credit_grade_number}등급, no match found")
-        return None
+        # 등급 범위별 LTV 조회 (설정 로드 시 컴파일된 구간 테이블)
+        grade_table = self.area_grade_credit_ltv_tables.get(area_key, {}).get(grade_key)
+        return grade_table.lookup(credit_grade_number) if grade_table is not None else None
     
-    def _get_ok_max_ltv_by_area_grade(self, area: float, region_grade: Union[int, str]) -> Optional[float]:
+    def _get_ok_max_ltv_by_area_grade(self, area_key: str, region_grade: Union[int, str]) -> Optional[float]:
         """
         OK저축은행: 면적과 급지만으로 최대 LTV 조회 (신용점수 없을 때 사용)
         해당 급지의 신용등급 범위 중 가장 높은 LTV를 반환
         
         Args:
-            area: 면적 (㎡)
+            area_key: 면적 구분 ("area_110_below" 또는 "area_110_over")
             region_grade: 급지 번호 (1, 2, 3, 4)
         
         Returns:
@@ -1122,8 +1262,6 @@ class BaseCalculator:
         if not max_ltv_config:
             return None
         
-        # 면적 구분 (110㎡ 이하/초과)
-        area_key = "area_110_below" if area <= 110 else "area_110_over"
         area_config = max_ltv_config.get(area_key, {})
         if not area_config:
             return None
@@ -1136,9 +1274,7 @@ class BaseCalculator:
         
         # 4급지는 등급 상관없이 모두 동일한 LTV
         if grade_key == "4" and "all" in grade_config:
-            result = grade_config["all"]
-            print(f"DEBUG: _get_ok_max_ltv_by_area_grade - area: {area}㎡, grade: {grade_key} -> LTV {result}% (4급지 전체)")
-            return result
+            return grade_config["all"]
         
         # 신용등급 범위별 LTV 중 최대값 찾기
         max_ltv = None
@@ -1147,12 +1283,6 @@ class BaseCalculator:
                 continue
             if max_ltv is None or ltv > max_ltv:
                 max_ltv = ltv
-        
-        if max_ltv is not None:
-            print(f"DEBUG: _get_ok_max_ltv_by_area_grade - area: {area}㎡, grade: {grade_key} -> 최대 LTV {max_ltv}% (신용점수 없음)")
-        else:
-            print(f"DEBUG: _get_ok_max_ltv_by_area_grade - area: {area}㎡, grade: {grade_key}, no match found")
-        
         return max_ltv
     
     def get_below_standard_ltv(self, region: str) -> Optional[float]:
@@ -1165,49 +1295,16 @@ class BaseCalculator:
         Returns:
             기준 LTV 이하 지역인 경우 해당 LTV (float), 아니면 None
         """
-        below_standard_ltv_regions = self.config.get("below_standard_ltv_regions", {})
-        region_clean = region.replace(" ", "")
-        
-        # 정확한 매칭 시도
-        if region in below_standard_ltv_regions:
-            ltv = below_standard_ltv_regions[region]
-            print(f"DEBUG: get_below_standard_ltv - exact match: {region} -> LTV {ltv}%")
-            return ltv
-        
-        # 공백 제거 버전으로 매칭 시도
-        if region_clean in below_standard_ltv_regions:
-            ltv = below_standard_ltv_regions[region_clean]
-            print(f"DEBUG: get_below_standard_ltv - clean match: {region_clean} -> LTV {ltv}%")
-            return ltv
-        
-        # 키의 공백 제거 버전과 비교
-        for key in below_standard_ltv_regions.keys():
-            if key.replace(" ", "") == region_clean:
-                ltv = below_standard_ltv_regions[key]
-                print(f"DEBUG: get_below_standard_ltv - key clean match: {key} -> LTV {ltv}%")
-                return ltv
-        
-        return None
+        ltv = self.region_table.below_standard_ltv(region)
+        if ltv is not None:
+            _trace.debug("get_below_standard_ltv - match: %s -> LTV %s%%", region, ltv)
+        return ltv
     
     def calculate_total_mortgage(self, mortgages: List[Dict[str, Any]]) -> float:
         """
         기존 근저당권 총액 계산 (채권최고액 기준, 만원 단위)
         """
-        total = 0.0
-        for mortgage in mortgages:
-            # 채권최고액이 있으면 사용, 없으면 원금에 1.2를 곱해서 추정
-            max_amount = mortgage.get("max_amount")
-            if max_amount is not None and isinstance(max_amount, (int, float)):
-                total += max_amount
-                print(f"DEBUG: calculate_total_mortgage - using max_amount(채권최고액): {max_amount}만원")
-            else:
-                # 채권최고액이 없으면 원금에 1.2를 곱해서 추정
-                amount = mortgage.get("amount", 0)
-                if isinstance(amount, (int, float)):
-                    estimated_max = amount * 1.2
-                    total += estimated_max
-                    print(f"DEBUG: calculate_total_mortgage - estimated max_amount from amount: {amount}만원 -> {estimated_max}만원")
-        return total
+        return sum_mortgage_max_amount(mortgages)
     
     def calculate_available_amount(
         self, 
@@ -1235,8 +1332,8 @@ class BaseCalculator:
         """
         # LTV는 원금 기준이므로, 최대 대출 금액(원금) 계산
         max_amount_principal = kb_price * (ltv / 100)
-        print(f"DEBUG: calculate_available_amount - kb_price: {kb_price}, ltv: {ltv}, total_mortgage(나머지 채권최고액): {total_mortgage}, is_refinance: {is_refinance}, refinance_principal(대환 원금): {refinance_principal}")  # 추가
-        print(f"DEBUG: calculate_available_amount - max_amount_principal (kb_price * ltv/100): {max_amount_principal}")  # 추가
+        _trace.debug("calculate_available_amount - kb_price: %s, ltv: %s, total_mortgage(나머지 채권최고액): %s, is_refinance: %s, refinance_principal(대환 원금): %s", kb_price, ltv, total_mortgage, is_refinance, refinance_principal)
+        _trace.debug("calculate_available_amount - max_amount_principal (kb_price * ltv/100): %s", max_amount_principal)
         
         if is_refinance:
             # 대환인 경우:
@@ -1251,7 +1348,7 @@ class BaseCalculator:
                 "total_amount": total_refinance_amount,
                 "available_amount": available_principal
             }
-            print(f"DEBUG: calculate_available_amount - 대환: available_principal={available_principal}, total_refinance_amount={total_refinance_amount}, result={result}")  # 추가
+            _trace.debug("calculate_available_amount - 대환: available_principal=%s, total_refinance_amount=%s, result=%s", available_principal, total_refinance_amount, result)
             return result
         else:
             # 후순위인 경우: 채권최고액 기준으로 차감
@@ -1261,7 +1358,7 @@ class BaseCalculator:
                 "total_amount": max(0, available_principal),
                 "available_amount": max(0, available_principal)
             }
-            print(f"DEBUG: calculate_available_amount - 후순위: available_principal={available_principal}, result={result}")  # 추가
+            _trace.debug("calculate_available_amount - 후순위: available_principal=%s, result=%s", available_principal, result)
             return result
     
     def get_interest_rate(
@@ -1269,7 +1366,12 @@ class BaseCalculator:
         credit_score: Optional[int], 
         credit_grade: Optional[int],
         ltv: int,
-        region_grade: Optional[Union[int, str]] = None
+        region_grade: Optional[Union[int, str]] = None,
+        *,
+        is_business_product: bool = False,
+        is_household_product: bool = False,
+        is_subordinate: bool = False,
+        property_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         신용등급별 금리 조회
@@ -1280,6 +1382,10 @@ class BaseCalculator:
             credit_grade: 신용등급 (1-7) 또는 신용점수 범위 문자열 (OK 저축은행)
             ltv: LTV 비율
             region_grade: 지역 급지 (1, 2, 3, 4 또는 A, B, C, D)
+            is_business_product: 사업자 상품 여부 (OK 저축은행)
+            is_household_product: 가계 상품 여부 (OK 저축은행)
+            is_subordinate: 후순위 여부 (OK 저축은행 가계 상품 조정금리)
+            property_data: 담보물건 정보 (OK 저축은행 가계 상품 조정금리 확인용)
         
         Returns:
             {
@@ -1289,81 +1395,57 @@ class BaseCalculator:
             }
         """
         # OK 저축은행인지 확인 (cofix_rate가 있으면 OK 저축은행)
-        cofix_rate = self.config.get("cofix_rate")
-        if cofix_rate is not None:
-            # 사업자/가계 상품 구분 (property_data에서 확인)
-            is_business_product = getattr(self, '_is_business_product', False)
-            is_household_product = getattr(self, '_is_household_product', False)
-            is_subordinate = getattr(self, '_is_subordinate', False)
-            property_data = getattr(self, '_current_property_data', None)
+        if self.config.get("cofix_rate") is not None:
             return self._get_ok_interest_rate(
-                credit_score, ltv, region_grade, cofix_rate,
+                credit_score, ltv, region_grade,
                 is_business_product, is_household_product, is_subordinate, property_data
             )
         
-        ltv_rates = self.config.get("interest_rates_by_ltv", {})
-        
         # 82% LTV이고 2급지인 경우 특별 처리
         if ltv == 82 and region_grade == 2:
             ltv_key = "82_2"
-            print(f"DEBUG: get_interest_rate - 82% LTV with region_grade 2, using key: {ltv_key}")  # 추가
         else:
             ltv_key = str(ltv)
         
-        print(f"DEBUG: get_interest_rate - ltv: {ltv}, credit_score: {credit_score}, credit_grade: {credit_grade}, region_grade: {region_grade}")  # 추가
-        print(f"DEBUG: get_interest_rate - ltv_key: {ltv_key}, available ltv_keys: {list(ltv_rates.keys())}")  # 추가
+        interest_rate, interest_rate_range, result_grade = self.quote_cube.general_rate(ltv_key, credit_grade)
+        _trace.debug("get_interest_rate - ltv_key: %s, credit_score: %s, credit_grade: %s, region_grade: %s -> rate: %s, range: %s", ltv_key, credit_score, credit_grade, region_grade, interest_rate, interest_rate_range)
+        return {
+            "interest_rate": interest_rate,
+            "interest_rate_range": interest_rate_range,
+            "credit_grade": result_grade
+        }
+    
+    def _general_rate_cell(self, ltv_key: str, credit_grade: Optional[Union[int, str]]) -> Tuple[Any, Any, Any]:
+        """
+        LTV 키와 신용등급 조합의 금리 계산 (조회 큐브의 각 칸을 채우는 규칙)
         
+        Returns:
+            (금리, (최저, 최고) 금리 범위, 신용등급)
+        """
+        ltv_rates = self.config.get("interest_rates_by_ltv", {})
         if ltv_key not in ltv_rates:
-            print(f"DEBUG: get_interest_rate - LTV {ltv_key} not found in interest_rates_by_ltv")  # 추가
-            return {
-                "interest_rate": None,
-                "interest_rate_range": None,
-                "credit_grade": credit_grade
-            }
+            return None, None, credit_grade
         
         grade_rates = ltv_rates[ltv_key]
-        print(f"DEBUG: get_interest_rate - grade_rates for LTV {ltv_key}: {grade_rates}")  # 추가
         
         if credit_grade is not None:
             # 신용등급이 있으면 해당 등급의 금리 반환
             grade_key = str(credit_grade)
-            print(f"DEBUG: get_interest_rate - looking for grade_key: {grade_key}")  # 추가
             if grade_key in grade_rates:
-                rate = grade_rates[grade_key]
-                print(f"DEBUG: get_interest_rate - found rate: {rate} for grade {credit_grade}")  # 추가
-                return {
-                    "interest_rate": rate,
-                    "interest_rate_range": None,
-                    "credit_grade": credit_grade
-                }
-            else:
-                print(f"DEBUG: get_interest_rate - grade_key {grade_key} not found in grade_rates")  # 추가
+                return grade_rates[grade_key], None, credit_grade
         
         # 신용점수/등급이 없으면 최저~최고 금리 범위 반환
         all_rates = [v for v in grade_rates.values() if isinstance(v, (int, float))]
         if all_rates:
-            min_rate = min(all_rates)
-            max_rate = max(all_rates)
-            print(f"DEBUG: get_interest_rate - no credit_grade, returning range: {min_rate}~{max_rate}")  # 추가
-            return {
-                "interest_rate": None,
-                "interest_rate_range": (min_rate, max_rate),
-                "credit_grade": None
-            }
+            return None, (min(all_rates), max(all_rates)), None
         
-        print(f"DEBUG: get_interest_rate - no rates found, returning None")  # 추가
-        return {
-            "interest_rate": None,
-            "interest_rate_range": None,
-            "credit_grade": credit_grade
-        }
+        return None, None, credit_grade
     
     def _get_ok_interest_rate(
         self,
         credit_score: Optional[int],
         ltv: int,
         region_grade: Optional[Union[int, str]],
-        cofix_rate: float,
         is_business_product: bool = False,
         is_household_product: bool = False,
         is_subordinate: bool = False,
@@ -1373,12 +1455,12 @@ class BaseCalculator:
         OK 저축은행 금리 계산
         사업자 상품: 스프레드 금리 + CoFix + 급지별 가산금리
         가계 상품: 스프레드 금리 + CoFix + 조정금리(거치식/원리금분할상환, 6개월 변동금리, 후순위)
+        스프레드 + CoFix + 급지별 가산금리는 조회 큐브에 미리 계산되어 있고 조정금리만 요청마다 더함
         
         Args:
             credit_score: 신용점수
             ltv: LTV 비율
             region_grade: 지역 급지 (1, 2, 3, 4) - 숫자로 통일됨
-            cofix_rate: CoFix 금리
             is_business_product: 사업자 상품 여부
             is_household_product: 가계 상품 여부
             is_subordinate: 후순위 여부
@@ -1394,43 +1476,21 @@ class BaseCalculator:
         """
         # 사업자/가계 상품에 따라 다른 금리 테이블 사용
         if is_business_product:
-            ltv_rates = self.config.get("business_interest_rates_by_ltv", {})
-            grade_additional_rates = self.config.get("business_grade_additional_rates", {})
+            product_type = "business"
         elif is_household_product:
-            ltv_rates = self.config.get("household_interest_rates_by_ltv", {})
-            grade_additional_rates = {}  # 가계 상품은 급지별 가산금리 없음
+            product_type = "household"
         else:
-            # 기본값 (기존 호환성)
-            ltv_rates = self.config.get("interest_rates_by_ltv", {})
-            grade_additional_rates = self.config.get("grade_additional_rates", {})
-        
-        credit_score_to_grade = self.config.get("credit_score_to_grade", {})
-        
-        ltv_key = str(ltv)
-        
-        # 사업자 상품: 70% 이하일 경우 70% 금리 사용
-        if is_business_product and ltv_key not in ltv_rates and ltv <= 70:
-            ltv_key = "70"
-            print(f"DEBUG: _get_ok_interest_rate - 사업자 상품, LTV {ltv}%는 70% 금리 적용")
+            product_type = None  # 기본값 (기존 호환성)
         
-        if ltv_key not in ltv_rates:
+        base_rates = self.quote_cube.ok_rate(product_type, ltv, region_grade)
+        if base_rates is None:
             return {
                 "interest_rate": None,
                 "interest_rate_range": None,
                 "credit_grade": None,
                 "fixed_rate_comment": None
             }
-        
-        score_rates = ltv_rates[ltv_key]
-        
-        # 급지별 가산금리 (사업자 상품만)
-        additional_rate = 0.0
-        if is_business_product:
-            if isinstance(region_grade, int):
-                grade_key = str(region_grade)
-                additional_rate = grade_additional_rates.get(grade_key, 0.0)
-            elif isinstance(region_grade, str):
-                additional_rate = grade_additional_rates.get(region_grade, 0.0)
+        base_rates_by_range, range_base_rates = base_rates
         
         # 가계 상품 조정금리
         household_adjustment = 0.0
@@ -1452,32 +1512,18 @@ class BaseCalculator:
             if is_subordinate:
                 household_adjustment += household_adjustment_rates.get("subordinate_loan", 0.4)
         
-        # 신용점수가 있으면 해당 범위의 스프레드 금리 사용
+        # 사업자 상품 고정금리 코멘트
+        fixed_rate_comment = "고정금리 선택시 -0.3%" if is_business_product else None
+        
+        # 신용점수가 있으면 해당 범위의 기준 금리 사용
         if credit_score is not None:
-            # 신용점수 범위 찾기
-            score_range = None
-            for range_str in credit_score_to_grade.keys():
-                parts = range_str.split("-")
-                if len(parts) == 2:
-                    try:
-                        min_score = int(parts[0])
-                        max_score = int(parts[1])
-                        if min_score <= credit_score <= max_score:
-                            score_range = range_str
-                            break
-                    except ValueError:
-                        continue
+            # 신용점수 범위 찾기 (설정 로드 시 컴파일된 구간 테이블)
+            score_range = self.credit_score_range_table.lookup(credit_score)
             
-            if score_range and score_range in score_rates:
-                spread_rate = score_rates[score_range]
-                final_rate = spread_rate + cofix_rate + additional_rate + household_adjustment
-                print(f"DEBUG: _get_ok_interest_rate - credit_score: {credit_score}, score_range: {score_range}, spread: {spread_rate}, cofix: {cofix_rate}, additional: {additional_rate}, household_adjustment: {household_adjustment}, final: {final_rate}")
-                
-                # 사업자 상품 고정금리 코멘트
-                fixed_rate_comment = None
-                if is_business_product:
-                    fixed_rate_comment = "고정금리 선택시 -0.3%"
-                
+            if score_range and score_range in base_rates_by_range:
+                base_rate = base_rates_by_range[score_range]
+                final_rate = base_rate + household_adjustment
+                _trace.debug("_get_ok_interest_rate - credit_score: %s, score_range: %s, base(spread+cofix+additional): %s, household_adjustment: %s, final: %s", credit_score, score_range, base_rate, household_adjustment, final_rate)
                 return {
                     "interest_rate": round(final_rate, 2),
                     "interest_rate_range": None,
@@ -1486,17 +1532,11 @@ class BaseCalculator:
                 }
         
         # 신용점수가 없으면 최저~최고 금리 범위 반환
-        all_rates = [v + cofix_rate + additional_rate + household_adjustment for v in score_rates.values() if isinstance(v, (int, float))]
+        all_rates = [base_rate + household_adjustment for base_rate in range_base_rates]
         if all_rates:
             min_rate = min(all_rates)
             max_rate = max(all_rates)
-            print(f"DEBUG: _get_ok_interest_rate - no credit_score, returning range: {min_rate:.2f}~{max_rate:.2f}")
-            
-            # 사업자 상품 고정금리 코멘트
-            fixed_rate_comment = None
-            if is_business_product:
-                fixed_rate_comment = "고정금리 선택시 -0.3%"
-            
+            _trace.debug("_get_ok_interest_rate - no credit_score, returning range: %.2f~%.2f", min_rate, max_rate)
             return {
                 "interest_rate": None,
                 "interest_rate_range": (round(min_rate, 2), round(max_rate, 2)),
@@ -1511,8 +1551,79 @@ class BaseCalculator:
             "fixed_rate_comment": None
         }
     
+    def ok_rate_tables(self, product_type: Optional[str]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        OK 저축은행 상품별 금리 테이블
+        
+        Args:
+            product_type: "business", "household" 또는 None (기본 테이블)
+        
+        Returns:
+            (LTV별 신용점수 범위별 스프레드 금리, 급지별 가산금리)
+        """
+        if product_type == "business":
+            return (self.config.get("business_interest_rates_by_ltv", {}),
+                    self.config.get("business_grade_additional_rates", {}))
+        if product_type == "household":
+            return self.config.get("household_interest_rates_by_ltv", {}), {}  # 가계 상품은 급지별 가산금리 없음
+        return self.config.get("interest_rates_by_ltv", {}), self.config.get("grade_additional_rates", {})
+    
+    def _ok_rate_cell(
+        self,
+        product_type: Optional[str],
+        ltv: int,
+        region_grade: Optional[Union[int, str]]
+    ) -> Optional[Tuple[Dict[str, float], Tuple[float, ...]]]:
+        """
+        OK 저축은행 상품/LTV/급지 조합의 기준 금리 계산 (조회 큐브의 각 칸을 채우는 규칙)
+        기준 금리 = 스프레드 + CoFix + 급지별 가산금리 (조정금리를 더하는 순서까지 기존 계산과 동일)
+        
+        Returns:
+            ({신용점수 범위: 기준 금리}, 범위 금리용 기준 금리 튜플) 또는 None (해당 LTV 금리 테이블 없음)
+        """
+        ltv_rates, grade_additional_rates = self.ok_rate_tables(product_type)
+        is_business_product = product_type == "business"
+        ltv_key = str(ltv)
+        
+        # 사업자 상품: 70% 이하일 경우 70% 금리 사용
+        if is_business_product and ltv_key not in ltv_rates and ltv <= 70:
+            ltv_key = "70"
+        
+        if ltv_key not in ltv_rates:
+            return None
+        
+        score_rates = ltv_rates[ltv_key]
+        cofix_rate = self.config.get("cofix_rate")
+        
+        # 급지별 가산금리 (사업자 상품만)
+        additional_rate = 0.0
+        if is_business_product:
+            if isinstance(region_grade, int):
+                additional_rate = grade_additional_rates.get(str(region_grade), 0.0)
+            elif isinstance(region_grade, str):
+                additional_rate = grade_additional_rates.get(region_grade, 0.0)
+        
+        base_rates = {
+            score_range: spread_rate + cofix_rate + additional_rate
+            for score_range, spread_rate in score_rates.items()
+            if isinstance(spread_rate, (int, float))
+        }
+        return base_rates, tuple(base_rates.values())
+    
+    def product_types(self) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        금융사 하나에서 계산할 상품 목록
+        
+        Returns:
+            (product_type, 결과에 표시할 금융사 이름) 리스트
+            OK저축은행은 가계자금과 사업자금을 각각 계산, 일반 금융사는 (None, None) 하나
+        """
+        if self.is_ok_bank:
+            return [("household", "OK저축은행 가계자금"), ("business", "OK저축은행 사업자금")]
+        return [(None, None)]
+    
     @classmethod
-    def calculate_all_banks(cls, property_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def calculate_all_banks(cls, property_data: Dict[str, Any]) -> List[BankQuote]:
         """
         모든 금융사에 대해 계산 수행
         
@@ -1522,54 +1633,90 @@ class BaseCalculator:
         Returns:
             계산 결과 리스트 (에러 메시지가 있는 경우도 포함)
         """
-        # data/banks 폴더 경로
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        banks_dir = os.path.join(current_dir, "..", "data", "banks")
+        # 프로세스 전역 레지스트리에서 계산기 스냅샷 가져오기 (설정 파일은 최초 1회만 로드)
+        from calculator.bank_registry import get_bank_registry
+        registry = get_bank_registry(cls)
+        snapshot = registry.snapshot()
+
+        # 같은 매물(계산기가 읽는 필드가 모두 같은 입력)을 같은 설정으로 계산한 결과가 있으면 그대로 사용
+        quote_cache = registry.quote_cache
+        fingerprint = quote_fingerprint(property_data) if quote_cache.enabled else None
+        if fingerprint is not None:
+            cached_results = quote_cache.get(snapshot.version, fingerprint)
+            if cached_results is not None:
+                _trace.debug("calculate_all_banks - quote cache hit (config v%s)", snapshot.version)
+                return cached_results
+
+        # 금융사와 무관한 계산은 요청당 한 번만 수행하여 모든 계산기가 공유
+        context = PropertyContext.from_property_data(property_data)
+
+        # 지역 ID -> 취급 가능 금융사 색인 (색인에 쓰인 표준 지역명일 때만 사용)
+        eligible = None
+        region_id = context.region_id
+        if region_id is not None and snapshot.eligible_by_region and ALL_REGIONS[region_id] == context.region:
+            eligible = snapshot.eligible_by_region[region_id]
+
+        # 모든 계산기 실행 (취급 불가지역인 금융사는 색인에서 바로 결과 생성)
+        results = []
+        for position, calculator in enumerate(snapshot.calculators):
+            if eligible is not None and position not in eligible and calculator.passes_kb_price_checks(context.kb_price):
+                results.extend(calculator.unsupported_region_results())
+            else:
+                results.extend(cls.calculate_bank(calculator, property_data, context))
         
-        if not os.path.exists(banks_dir):
-            return []
+        if fingerprint is not None:
+            quote_cache.put(snapshot.version, fingerprint, results)
+        return results
+    
+    def unsupported_region_results(self) -> List[BankQuote]:
+        """
+        취급 불가지역 결과를 상품별로 생성 (calculate_bank와 같은 형식, OK저축은행은 가계/사업자 각각)
+        """
+        results = []
+        for _, display_name in self.product_types():
+            result = self.unsupported_region_response()
+            if display_name is not None:
+                result["bank_name"] = display_name
+            results.append(result)
+        return results
+    
+    @staticmethod
+    def calculate_bank(calculator: "BaseCalculator", property_data: Dict[str, Any],
+                       context: PropertyContext) -> List[BankQuote]:
+        """
+        금융사 하나의 모든 상품 계산 (에러가 나면 그 전까지 계산된 결과만 반환)
         
-        calculators = []
+        Args:
+            calculator: 금융사 계산기
+            property_data: 파싱된 담보물건 정보
+            context: 요청 단위 담보물건 컨텍스트
         
-        # 모든 JSON 파일 찾기 및 계산기 생성
-        for filename in os.listdir(banks_dir):
-            if filename.endswith("_config.json") or filename.endswith(".json"):
-                config_path = os.path.join(banks_dir, filename)
-                try:
-                    calculator = cls(config_path)
-                    calculators.append(calculator)
-                except Exception as e:
-                    print(f"⚠️  계산기 로드 실패 ({filename}): {e}")
-                    continue
+        Returns:
+            계산 결과 리스트 (취급 불가지역 등 에러 메시지가 있는 결과 포함)
+        """
+        # 이 금융사가 읽는 필드가 모두 같은 입력의 결과가 있으면 그대로 사용 (다른 필드만 바뀐 수정 메시지 등)
+        result_cache = calculator.result_cache
+        fingerprint = None
+        if result_cache.enabled:
+            fingerprint = quote_fingerprint(property_data, calculator.input_fields, calculator.mortgage_fields)
+            if fingerprint is not None:
+                cached_results = result_cache.get(0, fingerprint)
+                if cached_results is not None:
+                    return cached_results
         
-        # 모든 계산기 실행
         results = []
-        for calculator in calculators:
-            try:
-                # OK저축은행인 경우 가계자금과 사업자금을 각각 계산
-                is_ok_bank = calculator.bank_name == "OK저축은행" or "OK저축은행" in calculator.bank_name or "오케이저축은행" in calculator.bank_name
-                
-                if is_ok_bank:
-                    # 가계자금 계산
-                    household_result = calculator.calculate(property_data, product_type="household")
-                    if household_result is not None:
-                        household_result["bank_name"] = "OK저축은행 가계자금"
-                        results.append(household_result)
-                    
-                    # 사업자금 계산
-                    business_result = calculator.calculate(property_data, product_type="business")
-                    if business_result is not None:
-                        business_result["bank_name"] = "OK저축은행 사업자금"
-                        results.append(business_result)
-                else:
-                    # 일반 금융사는 기존대로 계산
-                    result = calculator.calculate(property_data)
-                    if result is not None:
-                        # 취급 불가지역인 경우도 포함 (errors에 "취급 불가지역"이 있으면)
-                        results.append(result)
-            except Exception as e:
-                print(f"계산기 {calculator.bank_name} 에러: {e}")
-                continue
-        
+        try:
+            for product_type, display_name in calculator.product_types():
+                result = calculator.calculate(property_data, product_type=product_type, context=context)
+                if result is not None:
+                    if display_name is not None:
+                        result["bank_name"] = display_name
+                    results.append(result)
+        except Exception as e:
+            print(f"계산기 {calculator.bank_name} 에러: {e}")
+            return results
+        
+        # 에러 없이 끝난 결과만 저장
+        if fingerprint is not None:
+            result_cache.put(0, fingerprint, results)
         return results
-
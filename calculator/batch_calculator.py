@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+여러 담보물건 일괄 계산 (금리 변경 후 저장된 물건 재산출 등)
+LTV 단계별 한도 계산과 100만 단위 절삭을 NumPy 배열 연산으로 처리하고,
+택시 한도/필요자금 역산처럼 분기가 많은 경우는 기존 계산 경로를 그대로 사용
+결과는 물건별 calculate_all_banks 결과와 완전히 동일
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 물건별 순차 계산
+    np = None
+
+from calculator.base_calculator import BaseCalculator, QuotePlan
+from calculator.property_context import PropertyContext
+from utils.models import BankQuote, QuoteResult
+
+
+# 배열 계산 도중 에러가 난 물건 표시 (calculate_bank로 다시 계산)
+_FAILED = object()
+
+
+def calculate_all_banks_batch(
+    properties: Sequence[Dict[str, Any]],
+    calculator_cls: Type[BaseCalculator] = BaseCalculator
+) -> List[List[BankQuote]]:
+    """
+    여러 담보물건에 대해 모든 금융사 계산 수행
+
+    Args:
+        properties: 파싱된 담보물건 정보 리스트
+        calculator_cls: 계산기 클래스
+
+    Returns:
+        물건별 계산 결과 리스트 (각 항목은 calculate_all_banks 결과와 동일)
+    """
+    if np is None:
+        return [calculator_cls.calculate_all_banks(property_data) for property_data in properties]
+
+    from calculator.bank_registry import get_bank_registry
+    calculators = get_bank_registry(calculator_cls).snapshot().calculators
+
+    # 금융사와 무관한 계산은 물건당 한 번만 수행
+    contexts = [PropertyContext.from_property_data(property_data) for property_data in properties]
+
+    results: List[List[BankQuote]] = [[] for _ in properties]
+    for calculator in calculators:
+        for index, bank_results in enumerate(_calculate_bank_batch(calculator, properties, contexts)):
+            results[index].extend(bank_results)
+    return results
+
+
+def _calculate_bank_batch(
+    calculator: BaseCalculator,
+    properties: Sequence[Dict[str, Any]],
+    contexts: List[PropertyContext]
+) -> List[List[BankQuote]]:
+    """
+    금융사 하나를 모든 물건에 대해 계산 (calculate_bank와 같은 결과)
+    에러가 난 물건은 calculate_bank로 다시 계산하여 에러 처리까지 동일하게 맞춤
+    """
+    count = len(properties)
+    product_results: List[List[Optional[BankQuote]]] = []
+    failed = set()
+
+    for product_type, _ in calculator.product_types():
+        outcomes: List[Optional[BankQuote]] = [None] * count
+        vector_groups: Dict[Tuple[int, ...], List[Tuple[int, QuotePlan]]] = {}
+
+        for index in range(count):
+            if index in failed:
+                continue
+            try:
+                plan, early_result = calculator.prepare_quote(properties[index], product_type, contexts[index])
+                if plan is None:
+                    outcomes[index] = early_result
+                elif plan.max_amount_limit is None and not plan.required_amount:
+                    # 일반적인 LTV 단계별 계산: 배열 연산 대상
+                    ltv_steps = tuple(calculator.get_ltv_steps(plan))
+                    vector_groups.setdefault(ltv_steps, []).append((index, plan))
+                else:
+                    # 택시 한도/필요자금 역산: 기존 계산 경로
+                    outcomes[index] = calculator.quote_from_plan(plan)
+            except Exception:
+                failed.add(index)
+
+        for ltv_steps, rows in vector_groups.items():
+            for index, outcome in _quote_ltv_steps(calculator, ltv_steps, rows):
+                if outcome is _FAILED:
+                    failed.add(index)
+                else:
+                    outcomes[index] = outcome
+
+        product_results.append(outcomes)
+
+    bank_results: List[List[BankQuote]] = []
+    product_names = [display_name for _, display_name in calculator.product_types()]
+    for index in range(count):
+        if index in failed:
+            bank_results.append(calculator.calculate_bank(calculator, properties[index], contexts[index]))
+            continue
+        row_results = []
+        for outcomes, display_name in zip(product_results, product_names):
+            result = outcomes[index]
+            if result is not None:
+                if display_name is not None:
+                    result["bank_name"] = display_name
+                row_results.append(result)
+        bank_results.append(row_results)
+    return bank_results
+
+
+def _quote_ltv_steps(
+    calculator: BaseCalculator,
+    ltv_steps: Tuple[int, ...],
+    rows: List[Tuple[int, QuotePlan]]
+) -> List[Tuple[int, Optional[BankQuote]]]:
+    """
+    LTV 단계가 같은 물건들의 LTV 단계별 한도를 (물건 수 x LTV 단계 수) 배열로 한 번에 계산
+    연산 순서는 calculate_available_amount / OK저축은행 특별 계산과 동일하게 유지 (부동소수점 결과 일치)
+
+    Returns:
+        (물건 인덱스, 계산 결과) 리스트
+    """
+    plans = [plan for _, plan in rows]
+    if not ltv_steps:
+        return [(index, calculator.no_result_response(plan)) for index, plan in rows]
+
+    kb_price = np.array([plan.kb_price for plan in plans], dtype=np.float64)[:, None]
+    total_mortgage = np.array([plan.total_mortgage for plan in plans], dtype=np.float64)[:, None]
+    refinance_principal = np.array([plan.refinance_principal for plan in plans], dtype=np.float64)[:, None]
+    max_ltv = np.array([plan.max_ltv for plan in plans], dtype=np.float64)[:, None]
+    is_refinance = np.array([plan.is_refinance for plan in plans], dtype=bool)[:, None]
+    is_ok_special = np.array([plan.is_ok_bank and not plan.is_refinance for plan in plans], dtype=bool)[:, None]
+    ltv = np.array(ltv_steps, dtype=np.float64)[None, :]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # LTV는 원금 기준이므로, 최대 대출 금액(원금) 계산
+        max_amount_principal = kb_price * (ltv / 100)
+
+        # 대환: LTV 최대 금액 - 대환할 근저당권 원금 - 나머지 근저당권 채권최고액 (마이너스 허용)
+        # 후순위: LTV 최대 금액 - 기존 근저당권 채권최고액
+        available = np.where(
+            is_refinance,
+            max_amount_principal - refinance_principal - total_mortgage,
+            max_amount_principal - total_mortgage
+        )
+
+        # OK저축은행 후순위: 기존 근저당권이 차지하는 LTV 수준의 한도를 차감
+        existing_ltv = np.where(kb_price > 0, (total_mortgage / kb_price) * 100, 0)
+        existing_ltv_limit = kb_price * (existing_ltv / 100)
+        available = np.where(is_ok_special, max_amount_principal - existing_ltv_limit, available)
+
+        total = np.where(is_refinance, refinance_principal + available, available)
+
+    # 최대 LTV 초과 단계와 가용 한도가 없는 후순위 단계는 제외
+    included = (ltv <= max_ltv) & (is_refinance | (available > 0))
+
+    if not (np.isfinite(available[included]).all() and np.isfinite(total[included]).all()):
+        # 비정상 값(0원 시세 등)은 기존 계산 경로에서 동일하게 처리
+        return [(index, _FAILED) for index, _ in rows]
+
+    # 100만 단위 절삭: (int(amount) // 100) * 100
+    amounts = (np.floor_divide(np.trunc(np.where(included, available, 0)), 100) * 100).astype(np.int64).tolist()
+    total_amounts = (np.floor_divide(np.trunc(np.where(included, total, 0)), 100) * 100).astype(np.int64).tolist()
+    included = included.tolist()
+
+    # 금리는 (신용점수, 신용등급, 급지, 상품 구분, LTV) 조합별로 한 번만 조회
+    rate_cache: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+    outcomes = []
+    for row, (index, plan) in enumerate(rows):
+        try:
+            outcomes.append((index, _build_outcome(
+                calculator, plan, ltv_steps, included[row], amounts[row], total_amounts[row], rate_cache
+            )))
+        except Exception:
+            outcomes.append((index, _FAILED))
+    return outcomes
+
+
+def _build_outcome(
+    calculator: BaseCalculator,
+    plan: QuotePlan,
+    ltv_steps: Tuple[int, ...],
+    included: List[bool],
+    amounts: List[int],
+    total_amounts: List[int],
+    rate_cache: Dict[Tuple[Any, ...], Dict[str, Any]]
+) -> Optional[BankQuote]:
+    """배열 계산 결과로 물건 하나의 결과 생성 (ltv_step_results + quote_from_plan의 결과 처리와 동일)"""
+    rate_key = None
+    results = []
+    for step, step_ltv in enumerate(ltv_steps):
+        if not included[step]:
+            continue
+        if rate_key is None:
+            rate_key = _rate_key(plan)
+        rate_info = rate_cache.get((rate_key, step_ltv))
+        if rate_info is None:
+            rate_info = calculator.get_interest_rate(
+                plan.credit_score, plan.credit_grade, step_ltv, plan.grade,
+                is_business_product=plan.is_business_product,
+                is_household_product=plan.is_household_product,
+                is_subordinate=plan.is_subordinate,
+                property_data=plan.property_data
+            )
+            rate_cache[(rate_key, step_ltv)] = rate_info
+        final_amount = amounts[step]
+        results.append(QuoteResult(
+            ltv=step_ltv,
+            amount=final_amount,
+            interest_rate=rate_info.get("interest_rate"),
+            interest_rate_range=rate_info.get("interest_rate_range"),
+            type="대환" if plan.is_refinance else "후순위",
+            available_amount=final_amount,
+            total_amount=total_amounts[step],
+            is_refinance=plan.is_refinance,
+            credit_grade=rate_info.get("credit_grade"),
+            below_standard_ltv=plan.is_below_standard,
+            fixed_rate_comment=rate_info.get("fixed_rate_comment"),
+            refinance_institutions=plan.refinance_institutions if plan.is_household_for_ok and plan.is_refinance else None
+        ))
+
+    if results:
+        return calculator.quote_response(results)
+    return calculator.no_result_response(plan)
+
+
+def _rate_key(plan: QuotePlan) -> Tuple[Any, ...]:
+    """금리 조회 결과를 공유할 수 있는 조건 (get_interest_rate 인자 중 LTV 제외)"""
+    # 가계 상품 조정금리는 특이사항/요청사항 문구에 따라 달라짐
+    adjustment_text = None
+    if plan.is_household_product:
+        property_data = plan.property_data
+        adjustment_text = (property_data.get("special_notes", ""), property_data.get("requests", ""))
+    return (
+        plan.credit_score, plan.credit_grade, plan.grade,
+        plan.is_business_product, plan.is_household_product, plan.is_subordinate, adjustment_text
+    )
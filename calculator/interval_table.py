@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+구간 조회 테이블
+"920-1000" 같은 범위 문자열 매핑을 설정 로드 시 정렬된 경계 배열로 컴파일하고
+조회는 bisect로 수행 (요청마다 split/int 파싱 반복 없음)
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class IntervalTable:
+    """
+    범위 문자열 매핑을 컴파일한 조회 테이블
+
+    경계값(각 범위의 시작/끝)을 정렬해 두고,
+    - 경계값 자체에 해당하는 값 (point_values)
+    - 인접한 두 경계값 사이 구간에 해당하는 값 (gap_values)
+    을 미리 계산해 두므로 범위가 겹치거나 정수가 아닌 점수여도
+    "설정 파일 순서상 먼저 나온 범위 우선" 규칙을 그대로 유지
+    """
+
+    __slots__ = ("points", "point_values", "gap_values")
+
+    def __init__(self, ranges: List[Tuple[float, float, Any]]):
+        """
+        Args:
+            ranges: (최소값, 최대값, 값) 리스트 - 앞에 있는 범위가 우선
+        """
+        self.points: List[float] = sorted({bound for low, high, _ in ranges for bound in (low, high)})
+        self.point_values: List[Any] = [self._first_match(ranges, point) for point in self.points]
+        self.gap_values: List[Any] = [
+            self._first_match(ranges, (self.points[i] + self.points[i + 1]) / 2)
+            for i in range(len(self.points) - 1)
+        ]
+
+    @staticmethod
+    def _first_match(ranges: List[Tuple[float, float, Any]], value: float) -> Any:
+        """value를 포함하는 첫 번째 범위의 값 (없으면 None)"""
+        for low, high, result in ranges:
+            if low <= value <= high:
+                return result
+        return None
+
+    def values(self) -> List[Any]:
+        """조회 결과로 나올 수 있는 값 목록 (None 제외, 중복 제거, 처음 나온 순서)"""
+        seen: List[Any] = []
+        for value in self.point_values + self.gap_values:
+            if value is not None and value not in seen:
+                seen.append(value)
+        return seen
+
+    def lookup(self, value: Optional[float]) -> Any:
+        """
+        value가 속한 범위의 값 조회
+
+        Returns:
+            매칭된 범위의 값 또는 None (어느 범위에도 속하지 않음)
+        """
+        if value is None:
+            return None
+        points = self.points
+        index = bisect_left(points, value)
+        if index < len(points) and points[index] == value:
+            return self.point_values[index]
+        if 0 < index < len(points):
+            return self.gap_values[index - 1]
+        return None
+
+
+def compile_range_map(
+    range_map: Dict[str, Any],
+    name: str,
+    normalize_order: bool = False,
+    use_key_as_value: bool = False,
+    domain: Optional[Tuple[int, int]] = None,
+    skip_keys: Tuple[str, ...] = ()
+) -> Tuple[IntervalTable, List[str]]:
+    """
+    "최소-최대" 형식 키의 매핑을 IntervalTable로 컴파일하고 설정 오류를 점검
+
+    Args:
+        range_map: {"920-1000": 값, ...} 형식 매핑
+        name: 설정 항목 이름 (점검 메시지용)
+        normalize_order: True이면 "1000-915"처럼 내림차순으로 적힌 범위도 허용
+                         False이면 내림차순 범위는 매칭되지 않음 (점검 메시지로 보고)
+        use_key_as_value: True이면 값 대신 범위 문자열 자체를 조회 결과로 사용
+        domain: 전체가 포함되어야 하는 정수 범위 (최소, 최대) - 빠진 구간 점검용
+        skip_keys: 범위가 아닌 특수 키 (예: "all")
+
+    Returns:
+        (조회 테이블, 점검 메시지 리스트)
+    """
+    ranges: List[Tuple[float, float, Any]] = []
+    issues: List[str] = []
+
+    for range_str, value in range_map.items():
+        if range_str in skip_keys:
+            continue
+        parts = range_str.split("-")
+        try:
+            if len(parts) != 2:
+                raise ValueError(range_str)
+            low = int(parts[0])
+            high = int(parts[1])
+        except ValueError:
+            issues.append(f"{name}: 범위 형식 오류 '{range_str}' (무시됨)")
+            continue
+
+        if low > high:
+            if normalize_order:
+                low, high = high, low
+            else:
+                issues.append(f"{name}: 범위 '{range_str}'의 최소값이 최대값보다 커서 매칭되지 않음")
+                continue
+
+        ranges.append((low, high, range_str if use_key_as_value else value))
+
+    issues.extend(_check_coverage(ranges, name, domain))
+    return IntervalTable(ranges), issues
+
+
+def _check_coverage(ranges: List[Tuple[float, float, Any]], name: str,
+                    domain: Optional[Tuple[int, int]]) -> List[str]:
+    """겹치는 범위와 빠진 구간 점검 (정수 단위)"""
+    issues: List[str] = []
+    if not ranges:
+        return issues
+
+    ordered = sorted(ranges, key=lambda r: (r[0], r[1]))
+    covered_high = None
+    covered_range = None
+    for low, high, _ in ordered:
+        label = f"{low}-{high}"
+        if covered_high is not None:
+            if low <= covered_high:
+                issues.append(f"{name}: 범위 {covered_range}와 {label}가 겹침 (먼저 적힌 범위 우선)")
+            elif low > covered_high + 1:
+                issues.append(f"{name}: {covered_high + 1}~{low - 1} 구간이 어느 범위에도 포함되지 않음")
+        if covered_high is None or high > covered_high:
+            covered_high = high
+            covered_range = label
+
+    if domain is not None:
+        domain_low, domain_high = domain
+        if ordered[0][0] > domain_low:
+            issues.append(f"{name}: {domain_low}~{ordered[0][0] - 1} 구간이 어느 범위에도 포함되지 않음")
+        if covered_high < domain_high:
+            issues.append(f"{name}: {covered_high + 1}~{domain_high} 구간이 어느 범위에도 포함되지 않음")
+
+    return issues
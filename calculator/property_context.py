@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+요청 단위 담보물건 컨텍스트
+KB시세 검증, 지역 ID 조회, 층수 추출, 근저당권 합산처럼 금융사와 무관한 계산을
+요청당 한 번만 수행하여 모든 금융사 계산기가 공유
+"""
+
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from utils.money import parse_kb_price
+from utils.regions import ALL_REGIONS, REGION_COUNT, get_region_id
+from utils.tracing import get_tracer
+
+
+_trace = get_tracer("calculator")
+
+# 주소의 층수 (예: "... 2층 201호")
+_FLOOR_PATTERN = re.compile(r'(\d+)층')
+
+# 하한가 적용 대상 층
+LOWER_BOUND_FLOORS = (1, 2)
+
+
+class PropertyContext(NamedTuple):
+    """
+    담보물건 컨텍스트 (불변)
+    calculate_all_banks에서 요청당 한 번 만들어 모든 금융사 계산에 전달
+    """
+    property_data: Dict[str, Any]  # 파싱된 담보물건 정보 (금융사별 규칙에서 참조)
+    kb_price: Optional[float]  # 검증된 KB시세 일반가 (만원, 없으면 None)
+    lower_bound_price: Optional[float]  # KB시세 하한가 (하한가 적용 대상일 때만, 없으면 None)
+    is_lower_bound_target: bool  # 하한가 적용 대상 물건 여부 (아파트/주상복합 1, 2층)
+    floor: Optional[int]  # 주소에서 추출한 층수
+    region: str  # 지역 (공백 제거 전 원문)
+    region_id: Optional[int]  # 지역 ID (ALL_REGIONS에 없으면 None)
+    mortgages: Tuple[Dict[str, Any], ...]  # 근저당권 설정 내역
+    refinance_principal: float  # 대환 요청된 근저당권 원금 합계 (만원)
+    other_mortgages: Tuple[Dict[str, Any], ...]  # 대환하지 않는 나머지 근저당권
+    other_max_amount_total: float  # 나머지 근저당권 채권최고액 합계 (없으면 원금 × 1.2로 추정)
+    other_principal_total: float  # 나머지 근저당권 원금 합계
+
+    @classmethod
+    def from_property_data(cls, property_data: Dict[str, Any]) -> "PropertyContext":
+        """
+        파싱된 담보물건 정보로 컨텍스트 생성
+
+        Args:
+            property_data: 파싱된 담보물건 정보
+        """
+        kb_price_raw = property_data.get("kb_price")
+        if _trace.debug_enabled:
+            _trace.debug("PropertyContext - kb_price_raw: %s, type: %s", kb_price_raw, type(kb_price_raw))
+        # 일반가/하한가를 한 번에 해석 (파서가 이미 숫자로 바꾼 값이면 문자열 파싱 없음)
+        kb = parse_kb_price(kb_price_raw)
+        kb_price = float(kb.general) if kb.general is not None else None
+
+        # 하한가 적용 대상 확인: 아파트/주상복합이고 1층 또는 2층
+        property_type = property_data.get("property_type", "")
+        is_apartment_or_complex = bool(property_type) and ("아파트" in property_type or "주상복합" in property_type)
+        address = property_data.get("address", "")
+        floor = None
+        if address:
+            floor_match = _FLOOR_PATTERN.search(address)
+            if floor_match:
+                floor = int(floor_match.group(1))
+        is_lower_bound_target = is_apartment_or_complex and floor in LOWER_BOUND_FLOORS
+        lower_bound_price = float(kb.lower) if is_lower_bound_target and kb.lower is not None else None
+
+        # 파서가 주소에서 찾은 지역 ID를 그대로 사용 (지역이 바뀐 입력이면 지역명으로 다시 조회)
+        region = property_data.get("region", "") or ""
+        region_id = property_data.get("region_id")
+        if region_id is None or not 0 <= region_id < REGION_COUNT or ALL_REGIONS[region_id] != region:
+            region_id = get_region_id(region) if region else None
+
+        # 대환 요청된 근저당권 원금 합계 / 나머지 근저당권
+        mortgages = tuple(property_data.get("mortgages", []))
+        refinance_principal = 0.0
+        other_mortgages = []
+        for mortgage in mortgages:
+            if mortgage.get("is_refinance", False):
+                mortgage_amount = float(mortgage.get("amount", 0) or 0)
+                refinance_principal += mortgage_amount
+                if _trace.debug_enabled:
+                    _trace.debug("PropertyContext - 대환할 근저당권 발견: priority=%s, institution=%s, principal=%s만원", mortgage.get('priority'), mortgage.get('institution'), mortgage_amount)
+            else:
+                other_mortgages.append(mortgage)
+
+        return cls(
+            property_data=property_data,
+            kb_price=kb_price,
+            lower_bound_price=lower_bound_price,
+            is_lower_bound_target=is_lower_bound_target,
+            floor=floor,
+            region=region,
+            region_id=region_id,
+            mortgages=mortgages,
+            refinance_principal=refinance_principal,
+            other_mortgages=tuple(other_mortgages),
+            other_max_amount_total=sum_mortgage_max_amount(other_mortgages),
+            other_principal_total=sum(float(m.get("amount", 0) or 0) for m in other_mortgages)
+        )
+
+
+def sum_mortgage_max_amount(mortgages: List[Dict[str, Any]]) -> float:
+    """
+    근저당권 채권최고액 합계 (만원 단위)
+    채권최고액이 없으면 원금에 1.2를 곱해서 추정
+    """
+    total = 0.0
+    for mortgage in mortgages:
+        max_amount = mortgage.get("max_amount")
+        if max_amount is not None and isinstance(max_amount, (int, float)):
+            total += max_amount
+            _trace.debug("calculate_total_mortgage - using max_amount(채권최고액): %s만원", max_amount)
+        else:
+            amount = mortgage.get("amount", 0)
+            if isinstance(amount, (int, float)):
+                estimated_max = amount * 1.2
+                total += estimated_max
+                _trace.debug("calculate_total_mortgage - estimated max_amount from amount: %s만원 -> %s만원", amount, estimated_max)
+    return total
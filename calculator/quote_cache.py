@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+전체 견적 결과 캐시 (LRU + TTL)
+같은 매물을 여러 번 붙여넣거나 여러 채팅방에 전달해도 calculate_all_banks를 다시 계산하지 않도록,
+계산기가 읽는 필드만으로 만든 지문(fingerprint)과 금융사 설정 스냅샷 버전을 키로 결과를 보관
+
+- 크기 제한(가장 오래 사용하지 않은 항목부터 제거)과 유효 시간(TTL) 제한
+- 설정 스냅샷이 교체되면(hot reload) 레지스트리가 캐시를 비우고,
+  이전 스냅샷으로 계산 중이던 요청의 결과는 저장하지 않음
+- 캐시된 결과는 여러 요청이 공유하므로 호출하는 쪽에서 수정하지 않아야 함
+
+금융사별 결과 캐시도 같은 QuoteCache를 사용 (키: 해당 금융사가 읽는 필드만으로 만든 지문,
+BaseCalculator.input_fields 참고), 설정이 바뀐 금융사는 계산기가 새로 만들어지므로 캐시도 새로 시작
+
+설정 (환경변수):
+    QUOTE_CACHE_SIZE=256          # 전체 견적 최대 항목 수, 0이면 캐시 사용 안 함
+    BANK_RESULT_CACHE_SIZE=512    # 금융사별 결과 최대 항목 수, 0이면 캐시 사용 안 함
+    QUOTE_CACHE_TTL=600           # 유효 시간 (초)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, NamedTuple, Optional, Tuple
+from utils.env import env_int, env_number
+
+
+# 기본 최대 항목 수 (전체 견적 / 금융사별 결과) / 유효 시간 (초)
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_BANK_CACHE_SIZE = 512
+DEFAULT_CACHE_TTL = 600.0
+
+# 계산기가 읽는 담보물건 필드 (이 밖의 필드는 결과에 영향 없음: 성명, 나이, 직업 등)
+QUOTE_FIELDS = (
+    "kb_price", "property_type", "address", "region", "region_id", "area",
+    "credit_score", "required_amount", "special_notes", "requests"
+)
+
+# 계산기가 읽는 근저당권 필드 (순위는 추적 로그에만 쓰임)
+MORTGAGE_FIELDS = ("amount", "max_amount", "institution", "is_refinance")
+
+
+class QuoteCacheStats(NamedTuple):
+    """캐시 통계"""
+    size: int  # 현재 항목 수
+    max_size: int  # 최대 항목 수
+    hits: int  # 캐시에서 결과를 찾은 횟수
+    misses: int  # 결과가 없어 계산한 횟수
+    evictions: int  # 크기 제한으로 제거한 항목 수
+    expirations: int  # 유효 시간이 지나 제거한 항목 수
+    invalidations: int  # 설정 스냅샷 교체로 캐시를 비운 횟수
+
+    @property
+    def hit_rate(self) -> float:
+        """적중률 (조회가 없었으면 0)"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def quote_fingerprint(
+    property_data: Any,
+    fields: Tuple[str, ...] = QUOTE_FIELDS,
+    mortgage_fields: Tuple[str, ...] = MORTGAGE_FIELDS
+) -> Optional[Tuple[Hashable, ...]]:
+    """
+    담보물건 정보에서 계산 결과를 결정하는 필드만 모은 지문
+
+    Args:
+        property_data: 파싱된 담보물건 정보 (PropertyData 또는 딕셔너리)
+        fields: 지문에 넣을 담보물건 필드 (기본: 모든 계산기가 읽는 필드)
+        mortgage_fields: 지문에 넣을 근저당권 필드 (비어 있으면 근저당권 제외)
+
+    Returns:
+        해시 가능한 튜플, 해시할 수 없는 값이 들어 있으면 None (캐시하지 않음)
+    """
+    fingerprint = tuple(property_data.get(name) for name in fields)
+    if mortgage_fields:
+        mortgages = property_data.get("mortgages") or ()
+        fingerprint += (tuple(tuple(mortgage.get(name) for name in mortgage_fields) for mortgage in mortgages),)
+    try:
+        hash(fingerprint)
+    except TypeError:
+        return None
+    return fingerprint
+
+
+class QuoteCache:
+    """
+    스레드 안전한 LRU + TTL 캐시 (키: (스냅샷 버전, 지문))
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL):
+        """
+        Args:
+            max_size: 최대 항목 수 (0 이하이면 저장하지 않음)
+            ttl: 유효 시간 (초)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[int, Hashable], Tuple[float, List[Any]]]" = OrderedDict()
+        self._version = 0  # 현재 스냅샷 버전 (이보다 오래된 버전의 결과는 저장하지 않음)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, version: int, fingerprint: Hashable) -> Optional[List[Any]]:
+        """
+        캐시된 결과 조회 (없거나 만료되었으면 None)
+
+        Args:
+            version: 계산에 사용할 스냅샷 버전
+            fingerprint: quote_fingerprint 결과
+        """
+        key = (version, fingerprint)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, results = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        # 호출하는 쪽에서 리스트에 추가/삭제해도 캐시에는 영향 없도록 복사본 반환
+        return list(results)
+
+    def put(self, version: int, fingerprint: Hashable, results: List[Any]) -> None:
+        """
+        계산 결과 저장 (이전 스냅샷으로 계산한 결과는 저장하지 않음)
+
+        Args:
+            version: 계산에 사용한 스냅샷 버전
+            fingerprint: quote_fingerprint 결과
+            results: 저장할 결과 (전체 견적은 calculate_all_banks 결과, 금융사별 캐시는 상품별 결과)
+        """
+        if self.max_size <= 0:
+            return
+        key = (version, fingerprint)
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if version < self._version:
+                return
+            if version > self._version:
+                self._invalidate(version)
+            self._entries[key] = (expires_at, list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, version: int) -> None:
+        """
+        설정 스냅샷 교체 시 모든 항목 제거 (레지스트리에서 호출)
+
+        Args:
+            version: 새 스냅샷 버전
+        """
+        with self._lock:
+            if version > self._version:
+                self._invalidate(version)
+
+    def _invalidate(self, version: int) -> None:
+        """모든 항목 제거 (lock 안에서 호출)"""
+        self._version = version
+        if self._entries:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        """모든 항목 제거 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> QuoteCacheStats:
+        """현재 통계"""
+        with self._lock:
+            return QuoteCacheStats(
+                size=len(self._entries),
+                max_size=self.max_size,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations
+            )
+
+
+def quote_cache_from_env(size_variable: str = "QUOTE_CACHE_SIZE", default_size: int = DEFAULT_CACHE_SIZE) -> QuoteCache:
+    """
+    환경변수로 캐시 생성 (잘못된 값이면 기본값)
+
+    Args:
+        size_variable: 최대 항목 수 환경변수 이름 (QUOTE_CACHE_SIZE 또는 BANK_RESULT_CACHE_SIZE)
+        default_size: 환경변수가 없을 때의 최대 항목 수
+    """
+    return QuoteCache(
+        max_size=env_int(size_variable, default_size),
+        ttl=env_number("QUOTE_CACHE_TTL", DEFAULT_CACHE_TTL)
+    )
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+금융사별 견적 조회 큐브
+설정 로드 시 (급지, 1급지 그룹, 면적 구분, 신용등급) -> 최대 LTV,
+(LTV, 신용등급) -> 금리, (상품, LTV, 급지) -> CoFix/급지별 가산금리가 반영된 기준 금리를
+미리 계산해 두고, 요청 처리 중에는 조회만 수행
+
+- 계산기 생성 시 함께 만들어지므로 설정 파일이 바뀌어 레지스트리가 계산기를
+  다시 만들면 큐브도 자동으로 다시 만들어짐
+- 설정에 나오지 않는 조합(예: LTV 단계에 없는 역산 LTV)은 처음 조회할 때 계산하여 채움
+- 각 칸의 값은 계산기의 기존 규칙(_max_ltv_for_keys, _general_rate_cell, _ok_rate_cell)으로 계산하므로
+  조회 결과는 매번 직접 계산한 결과와 동일
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from calculator.region_table import GRADE_1_GROUP_A, GRADE_1_GROUP_B
+
+
+# 최대 LTV 신용등급 키: 신용점수 없음 (OK저축은행은 해당 급지의 최대 LTV 사용)
+NO_CREDIT_SCORE = "no_credit_score"
+
+# OK저축은행 면적 구분 (110㎡ 이하/초과)
+AREA_KEYS = ("area_110_below", "area_110_over")
+
+# OK저축은행 금리 테이블 상품 구분 (None: 기본 테이블)
+OK_RATE_PRODUCTS = ("business", "household", None)
+
+
+class QuoteCube:
+    """
+    금융사 설정을 조회 키 조합별 값으로 펼친 테이블
+
+    - max_ltv_cells: (급지, 1급지 그룹 키, 면적 구분, 신용등급 번호) -> 최대 LTV
+    - general_rate_cells: (LTV 키, 신용등급) -> (금리, 금리 범위, 신용등급)
+    - ok_rate_cells: (상품, LTV, 급지) -> ({신용점수 범위: 기준 금리}, 범위 금리용 기준 금리 튜플) 또는 None
+      기준 금리 = 스프레드 + CoFix + 급지별 가산금리 (가계 상품 조정금리만 요청마다 더함)
+    """
+
+    __slots__ = ("max_ltv_cells", "general_rate_cells", "ok_rate_cells", "_calculator")
+
+    def __init__(self, calculator: Any):
+        """
+        Args:
+            calculator: 설정과 구간 테이블이 준비된 BaseCalculator
+        """
+        self._calculator = calculator
+        self.max_ltv_cells: Dict[Tuple[Any, ...], Optional[float]] = {}
+        self.general_rate_cells: Dict[Tuple[Any, ...], Tuple[Any, Any, Any]] = {}
+        self.ok_rate_cells: Dict[Tuple[Any, ...], Optional[Tuple[Dict[str, float], Tuple[float, ...]]]] = {}
+
+        config = calculator.config
+        grades = calculator.region_table.grade_values()
+
+        # 최대 LTV: OK저축은행 사업자금만 면적/신용등급 구분
+        area_keys = (None,) + AREA_KEYS if calculator.is_ok_bank else (None,)
+        credit_keys = (None, NO_CREDIT_SCORE) + tuple(calculator.credit_grade_number_table.values())
+        for grade in grades:
+            group_keys = (None, GRADE_1_GROUP_A, GRADE_1_GROUP_B) if grade == 1 else (None,)
+            for group_key in group_keys:
+                for area_key in area_keys:
+                    for credit_key in credit_keys:
+                        self.max_ltv(grade, group_key, area_key, credit_key)
+
+        if config.get("cofix_rate") is not None:
+            # OK저축은행: 상품별 LTV x 급지 (급지별 가산금리는 사업자 상품만)
+            for product_type in OK_RATE_PRODUCTS:
+                for ltv_key in calculator.ok_rate_tables(product_type)[0]:
+                    if not ltv_key.isdigit():
+                        continue
+                    for grade in (grades if product_type == "business" else (None,)):
+                        self.ok_rate(product_type, int(ltv_key), grade)
+        else:
+            credit_grades = (None,) + tuple(calculator.credit_grade_table.values())
+            for ltv_key in config.get("interest_rates_by_ltv", {}):
+                for credit_grade in credit_grades:
+                    self.general_rate(ltv_key, credit_grade)
+
+    @staticmethod
+    def _fill(cells: Dict[Tuple[Any, ...], Any], key: Tuple[Any, ...], compute: Callable[..., Any]) -> Any:
+        """처음 보는 조합은 계산기 규칙으로 계산하여 채움 (같은 키는 항상 같은 값이므로 동시 호출에도 안전)"""
+        value = compute(*key)
+        cells[key] = value
+        return value
+
+    def max_ltv(self, grade: Union[int, str], group_key: Optional[str],
+                area_key: Optional[str], credit_key: Any) -> Optional[float]:
+        """
+        최대 LTV 조회
+
+        Args:
+            grade: 지역 급지
+            group_key: 1급지 그룹 키 (1급지가 아니거나 지역이 없으면 None)
+            area_key: OK저축은행 사업자금 면적 구분 (그 밖에는 None)
+            credit_key: 신용등급 번호, NO_CREDIT_SCORE 또는 None (면적 구분이 있을 때만 사용)
+        """
+        key = (grade, group_key, area_key, credit_key)
+        try:
+            return self.max_ltv_cells[key]
+        except KeyError:
+            return self._fill(self.max_ltv_cells, key, self._calculator._max_ltv_for_keys)
+
+    def general_rate(self, ltv_key: str, credit_grade: Any) -> Tuple[Any, Any, Any]:
+        """일반 금융사 금리 조회: (금리, 금리 범위, 신용등급)"""
+        key = (ltv_key, credit_grade)
+        try:
+            return self.general_rate_cells[key]
+        except KeyError:
+            return self._fill(self.general_rate_cells, key, self._calculator._general_rate_cell)
+
+    def ok_rate(self, product_type: Optional[str], ltv: int,
+                region_grade: Optional[Union[int, str]]) -> Optional[Tuple[Dict[str, float], Tuple[float, ...]]]:
+        """OK저축은행 기준 금리 조회 (해당 LTV 금리 테이블이 없으면 None)"""
+        key = (product_type, ltv, region_grade if product_type == "business" else None)
+        try:
+            return self.ok_rate_cells[key]
+        except KeyError:
+            return self._fill(self.ok_rate_cells, key, self._calculator._ok_rate_cell)
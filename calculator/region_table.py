@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+금융사별 지역 조회 테이블
+설정 로드 시 한 번만 만들어 지역 ID로 급지/기준 LTV 이하/1급지 그룹을 바로 조회
+"""
+
+from typing import Any, Dict, Optional, Tuple, Union
+from utils.regions import (
+    ALL_REGIONS, METROPOLITAN_KEYS, REGION_ID_BY_KEY, normalize_region_key
+)
+
+
+# 1급지 그룹별 max_ltv_by_grade 키
+GRADE_1_GROUP_A = "1"
+GRADE_1_GROUP_B = "1_b"
+
+
+class BankRegionTable:
+    """
+    금융사 설정(region_grades, below_standard_ltv_regions, grade_1_group_a/b)을
+    지역 ID 기준 조회 테이블로 컴파일
+
+    - 지역 ID가 있는 지역(ALL_REGIONS): 튜플 인덱스로 조회
+    - 그 밖의 설정 키(예: "경기도부천시"): 공백 제거 지역명 딕셔너리로 조회
+    """
+
+    __slots__ = (
+        "grades", "below_standard_ltvs", "grade_1_groups",
+        "_grades_by_key", "_below_standard_ltvs_by_key", "_grade_1_groups_by_key"
+    )
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Args:
+            config: 금융사별 설정 딕셔너리
+        """
+        # 공백 제거 지역명 -> 값 (설정 파일 순서상 먼저 나온 키 우선)
+        self._grades_by_key: Dict[str, Union[int, str]] = {}
+        for key, grade in config.get("region_grades", {}).items():
+            # 광역 단위 키(서울, 경기 등)는 제외 (구체적인 지역만 처리)
+            if grade is None or key in METROPOLITAN_KEYS:
+                continue
+            key_clean = normalize_region_key(key)
+            if key_clean in METROPOLITAN_KEYS:
+                continue
+            self._grades_by_key.setdefault(key_clean, grade)
+
+        self._below_standard_ltvs_by_key: Dict[str, float] = {}
+        for key, ltv in config.get("below_standard_ltv_regions", {}).items():
+            self._below_standard_ltvs_by_key.setdefault(normalize_region_key(key), ltv)
+
+        # A 그룹이 B 그룹보다 우선
+        self._grade_1_groups_by_key: Dict[str, str] = {}
+        for group_key, regions in ((GRADE_1_GROUP_A, config.get("grade_1_group_a", [])),
+                                   (GRADE_1_GROUP_B, config.get("grade_1_group_b", []))):
+            for region in regions:
+                self._grade_1_groups_by_key.setdefault(normalize_region_key(region), group_key)
+
+        # 지역 ID -> 값 (ALL_REGIONS 순서)
+        region_keys = [normalize_region_key(region) for region in ALL_REGIONS]
+        self.grades: Tuple[Optional[Union[int, str]], ...] = tuple(
+            self._grades_by_key.get(key) for key in region_keys
+        )
+        self.below_standard_ltvs: Tuple[Optional[float], ...] = tuple(
+            self._below_standard_ltvs_by_key.get(key) for key in region_keys
+        )
+        self.grade_1_groups: Tuple[Optional[str], ...] = tuple(
+            self._grade_1_groups_by_key.get(key) for key in region_keys
+        )
+
+    def grade_values(self) -> Tuple[Union[int, str], ...]:
+        """설정에 나오는 급지 값 목록 (중복 제거, 처음 나온 순서)"""
+        return tuple(dict.fromkeys(self._grades_by_key.values()))
+
+    def grade(self, region: str) -> Optional[Union[int, str]]:
+        """지역 급지 조회 (설정에 없으면 None)"""
+        key = normalize_region_key(region)
+        region_id = REGION_ID_BY_KEY.get(key)
+        if region_id is not None:
+            return self.grades[region_id]
+        return self._grades_by_key.get(key)
+
+    def below_standard_ltv(self, region: str) -> Optional[float]:
+        """기준 LTV 이하 지역의 LTV 조회 (해당 지역이 아니면 None)"""
+        key = normalize_region_key(region)
+        region_id = REGION_ID_BY_KEY.get(key)
+        if region_id is not None:
+            return self.below_standard_ltvs[region_id]
+        return self._below_standard_ltvs_by_key.get(key)
+
+    def grade_1_group(self, region: str) -> Optional[str]:
+        """1급지 그룹의 max_ltv_by_grade 키 조회 ("1": A 그룹, "1_b": B 그룹, 없으면 None)"""
+        key = normalize_region_key(region)
+        region_id = REGION_ID_BY_KEY.get(key)
+        if region_id is not None:
+            return self.grade_1_groups[region_id]
+        return self._grade_1_groups_by_key.get(key)
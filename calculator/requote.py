@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+수정 메시지 재산출
+메시지별 마지막 결과/봇 답장을 (채팅방, 메시지 ID) 단위로 보관해 두고,
+같은 메시지가 수정되면 다시 계산하여 새 답장 대신 기존 답장을 고침 (결과가 같으면 그대로 둠)
+
+- 다시 계산할 때 입력이 바뀌지 않은 금융사는 금융사별 결과 캐시(calculate_bank, 금융사가 읽는 필드로 키 생성)가 재사용
+- 보관 개수에 제한이 있음 (가장 오래 사용하지 않은 메시지부터 제거)
+- 프로세스 메모리에 보관하므로 다른 인스턴스(서버리스 콜드 스타트 등)에서 받은 수정은 새 메시지처럼 처리
+
+설정 (환경변수):
+    QUOTE_STORE_SIZE=1000   # 보관할 메시지 수
+"""
+
+import threading
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple, Type
+from calculator.base_calculator import BaseCalculator
+from utils.env import env_int
+from utils.models import BankQuote
+
+
+# 기본 보관 메시지 수
+DEFAULT_STORE_SIZE = 1000
+
+
+class QuoteRecord(NamedTuple):
+    """메시지 하나의 마지막 산출 기록"""
+    results: List[BankQuote]  # calculate_all_banks 결과
+    reply_message_id: Optional[int] = None  # 봇이 보낸 답장 메시지 ID (수정 시 이 메시지를 고침)
+    reply_text: Optional[str] = None  # 답장 내용 (결과가 같으면 답장을 고치지 않음)
+
+
+def requote(
+    property_data,
+    previous: Optional[QuoteRecord] = None,
+    calculator_cls: Type[BaseCalculator] = BaseCalculator
+) -> QuoteRecord:
+    """
+    메시지 산출 (이전 기록이 있으면 답장 정보를 이어받음)
+
+    Args:
+        property_data: 파싱된 담보물건 정보
+        previous: 같은 메시지의 이전 기록 (새 메시지면 None)
+        calculator_cls: 계산기 클래스
+
+    Returns:
+        새 기록 (답장 정보는 이전 기록에서 이어받음)
+    """
+    return QuoteRecord(
+        results=calculator_cls.calculate_all_banks(property_data),
+        reply_message_id=previous.reply_message_id if previous is not None else None,
+        reply_text=previous.reply_text if previous is not None else None
+    )
+
+
+class QuoteStore:
+    """
+    (채팅방 ID, 메시지 ID) -> QuoteRecord 보관소 (스레드 안전, 개수 제한)
+    """
+
+    def __init__(self, max_size: int = DEFAULT_STORE_SIZE):
+        """
+        Args:
+            max_size: 보관할 메시지 수 (0 이하이면 보관하지 않음)
+        """
+        self.max_size = max_size
+        self._records: "OrderedDict[Tuple[int, int], QuoteRecord]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, chat_id: int, message_id: int) -> Optional[QuoteRecord]:
+        """메시지의 마지막 기록 (없으면 None)"""
+        key = (chat_id, message_id)
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None:
+                self._records.move_to_end(key)
+            return record
+
+    def put(self, chat_id: int, message_id: int, record: QuoteRecord) -> None:
+        """메시지의 기록 저장 (개수 제한을 넘으면 가장 오래 사용하지 않은 기록 제거)"""
+        if self.max_size <= 0:
+            return
+        key = (chat_id, message_id)
+        with self._lock:
+            self._records[key] = record
+            self._records.move_to_end(key)
+            while len(self._records) > self.max_size:
+                self._records.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+def quote_store_from_env() -> QuoteStore:
+    """QUOTE_STORE_SIZE 환경변수로 보관소 생성 (잘못된 값이면 기본값)"""
+    return QuoteStore(env_int("QUOTE_STORE_SIZE", DEFAULT_STORE_SIZE))
@@ -1,6 +1,16 @@
 # -*- coding: utf-8 -*-
 """
 텔레그램 봇 메인 진입점
+
+업데이트는 동시에 처리하고(concurrent_updates), 파싱/계산/포맷은 견적 실행기(utils/quote_executor)에서
+처리하므로 느린 메시지 하나가 다른 채팅방의 업데이트를 막지 않음
+(QUOTE_EXECUTOR=thread|process|inline, QUOTE_WORKERS로 조정)
+
+견적은 수락 제어(utils/admission)를 거쳐 실행기에 넘김: 채팅방별 토큰 버킷, 동시 계산 수(기본 실행기 작업자 수),
+대기열 크기를 넘는 요청은 바로 거절하고, 답장은 채팅방별 간격을 두고 보내며 429 응답이면 retry_after 후 다시 보냄
+
+오래 실행되는 프로세스이므로 시작할 때 금융사 설정 파일 변경 감시를 켬 (재시작 없이 반영, BANK_CONFIG_WATCH_INTERVAL)
+(QUOTE_EXECUTOR=process의 작업 프로세스는 감시하지 않으므로 설정 변경은 재시작 후 반영)
 """
 
 import asyncio
@@ -14,9 +24,10 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
 from config.telegram_config import TELEGRAM_BOT_TOKEN
-from parsers.message_parser import MessageParser
+from utils.admission import BUSY_NOTICE, AdmissionRejected, chat_pacer_from_env, quote_admission_from_env
+from utils.quote_executor import quote_executor_from_env
 from calculator.base_calculator import BaseCalculator
-from utils.formatter import format_all_results
+from calculator.bank_registry import start_bank_config_watcher
 
 # 로깅 설정
 logging.basicConfig(
@@ -25,6 +36,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 파싱/계산/포맷을 처리하는 실행기 (봇 시작 시 작업자를 미리 띄움)
+quote_executor = quote_executor_from_env()
+
+# 견적 수락 제어 (동시 계산 수는 실행기 작업자 수에 맞춤)와 채팅방별 전송 간격/429 재시도
+admission = quote_admission_from_env(default_max_concurrent=quote_executor.workers)
+pacer = chat_pacer_from_env()
+
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """봇 시작 명령어"""
@@ -44,38 +62,71 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "/help - 도움말 보기\n\n"
         "이제 담보물건 정보를 보내주시면 계산해드리겠습니다! 🚀"
     )
-    await update.message.reply_text(welcome_message)
+    await pacer.send(update.effective_chat.id, lambda: update.message.reply_text(welcome_message))
 
 
 async def calculate(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """담보대출 계산 처리"""
     message_text = update.message.text
+    chat_id = update.effective_chat.id if update.effective_chat else None
     
     if not message_text:
-        await update.message.reply_text("메시지가 비어있습니다.")
+        await pacer.send(chat_id, lambda: update.message.reply_text("메시지가 비어있습니다."))
         return
     
     try:
-        # 메시지 파싱
-        parser = MessageParser()
-        property_data = parser.parse(message_text)
-        
-        # 계산 수행
-        results = BaseCalculator.calculate_all_banks(property_data)
+        # 수락될 때까지 기다린 뒤 파싱/계산/포맷 (실행기에서 처리하는 동안 다른 업데이트는 계속 처리됨)
+        async with admission.admit(chat_id) as ticket:
+            outcome = await quote_executor.quote(message_text)
+        logger.info(
+            "견적 처리 (chat %s): 수락 대기 %.1fms (채팅방 제한 %.1fms, 대기열 %d) / "
+            "실행기 대기 %.1fms / 파싱 %.1fms / 계산 %.1fms / 포맷 %.1fms",
+            chat_id, ticket.queue_ms, ticket.chat_wait_ms, ticket.queue_depth,
+            outcome.queue_ms, outcome.parse_ms, outcome.calculate_ms, outcome.format_ms
+        )
         
-        # 결과 포맷팅
-        formatted_result = format_all_results(results)
+        # 결과 전송 (채팅방별 간격, 429면 retry_after 후 다시)
+        await pacer.send(chat_id, lambda: update.message.reply_text(outcome.text))
         
-        # 결과 전송
-        await update.message.reply_text(formatted_result)
+    except AdmissionRejected as e:
+        logger.warning("견적 요청 거절 (chat %s): %s", chat_id, e.reason)
+        if e.notify:
+            await pacer.send(chat_id, lambda: update.message.reply_text(BUSY_NOTICE))
         
     except Exception as e:
         logger.error(f"계산 중 오류 발생: {e}", exc_info=True)
-        await update.message.reply_text(
+        error_text = (
             f"계산 중 오류가 발생했습니다.\n\n"
             f"오류 내용: {str(e)}\n\n"
             f"메시지 형식을 확인해주세요."
         )
+        await pacer.send(chat_id, lambda: update.message.reply_text(error_text))
+
+
+async def post_init(application: Application):
+    """봇 시작 시 견적 실행기 작업자를 미리 띄우고 금융사 설정 로드, 설정 파일 변경 감시 시작"""
+    await quote_executor.start()
+    start_bank_config_watcher(BaseCalculator)
+
+
+async def post_shutdown(application: Application):
+    """봇 종료 시 견적 실행기 종료 및 누적 통계 출력"""
+    quote_executor.shutdown()
+    stats = quote_executor.stats()
+    logger.info(
+        "견적 실행기 통계: %s %d개, 처리 %d건, 최대 대기열 %d, 평균 대기 %.1fms / 파싱 %.1fms / 계산 %.1fms / 포맷 %.1fms",
+        stats.kind, stats.workers, stats.completed, stats.max_queue_depth,
+        stats.avg_queue_ms, stats.avg_parse_ms, stats.avg_calculate_ms, stats.avg_format_ms
+    )
+    admitted = admission.stats()
+    sent = pacer.stats()
+    logger.info(
+        "수락 제어 통계: 수락 %d건, 거절 %d건 (대기열 %d / 채팅방 제한 %d), 최대 대기열 %d, 평균 수락 대기 %.1fms / "
+        "전송 %d건, 간격 대기 %d회, 429 재시도 %d회, 실패 %d건",
+        admitted.admitted, admitted.rejected_queue_full + admitted.rejected_chat_rate,
+        admitted.rejected_queue_full, admitted.rejected_chat_rate, admitted.max_queue_depth, admitted.avg_queue_ms,
+        sent.sent, sent.paced, sent.retried, sent.failed
+    )
 
 
 def main():
@@ -86,7 +137,15 @@ def main():
         return
     
     # 텔레그램 봇 애플리케이션 생성
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    # 여러 채팅방의 업데이트를 동시에 처리 (계산은 견적 실행기에서)
+    application = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .concurrent_updates(True)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
     
     # 핸들러 등록
     application.add_handler(CommandHandler("start", start))
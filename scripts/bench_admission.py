@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+견적 수락 제어와 채팅방별 전송 속도 조절(utils/admission) 측정/확인 스크립트
+채팅방별 전송 간격을 지키지 않으면 429(retry_after)로 응답하는 Bot API 대역 서버를 띄우고,
+한 채팅방이 매물을 한꺼번에 붙여넣는 동안 다른 채팅방도 메시지를 보내는 상황을 api/webhook.handler로 흉내냅니다.
+
+    1. 수락 제어/전송 간격을 끈 경우: 모든 견적을 한꺼번에 계산하고 답장이 429에 걸려 유실됨
+    2. 켠 경우: 채팅방 제한을 넘는 요청은 거절(안내 한 번), 수락된 견적의 답장은 모두 전달,
+       다른 채팅방은 기다리지 않음, 수락 대기 시간과 계산 시간을 따로 기록
+    3. 429 응답 후 retry_after만큼 기다렸다 다시 보내 전달되는지
+    4. 동시 계산 수 + 대기열이 가득 차면 기다리지 않고 바로 거절(queue_full)되는지
+    5. GET 응답에 수락 제어/전송 통계가 나오는지
+
+답장이 유실되거나 다른 채팅방이 막히거나 거절 안내가 두 번 이상 가면 실패로 종료합니다.
+
+사용법: python scripts/bench_admission.py [붙여넣는 매물 수] [다른 채팅방 메시지 수]
+"""
+
+import sys
+import os
+import io
+import re
+import json
+import time
+import logging
+import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api.webhook as webhook
+from utils.admission import BUSY_NOTICE, AdmissionRejected, ChatPacer, QuoteAdmission
+from utils.loop_worker import LoopWorker
+from utils.telegram_client import BotApiClient
+from scripts.bench_samples import SAMPLE_MESSAGES
+from scripts.bench_telegram_client import TOKEN, StandInBotApi, sample_update
+
+
+BROKER_CHAT = -1001
+OTHER_CHAT = -1002
+
+# 대역 서버의 채팅방별 전송 간격 (초, 실제 텔레그램은 채팅방당 초당 1건 정도, 측정 시간을 줄이려고 줄임)
+SERVER_CHAT_INTERVAL = 0.25
+
+# 수락 제어를 끈 설정 / 켠 설정 (채팅방 제한은 측정 시간에 맞춰 줄임, 전송 간격은 서버 제한보다 조금 길게)
+DISABLED = {
+    "QUOTE_CHAT_RATE": "0", "QUOTE_MAX_CONCURRENT": "64", "QUOTE_QUEUE_SIZE": "64",
+    "TELEGRAM_CHAT_SEND_INTERVAL": "0", "TELEGRAM_SEND_RETRIES": "0",
+}
+ENABLED = {
+    "QUOTE_CHAT_RATE": "2", "QUOTE_CHAT_BURST": "3", "QUOTE_CHAT_MAX_WAIT": "3",
+    "QUOTE_MAX_CONCURRENT": "4", "QUOTE_QUEUE_SIZE": "64",
+    "TELEGRAM_CHAT_SEND_INTERVAL": str(SERVER_CHAT_INTERVAL * 1.2), "TELEGRAM_SEND_RETRIES": "2",
+}
+
+QUOTE_LOG = re.compile(
+    r"Quote for chat (-?\d+): queued ([\d.]+)ms \(chat rate ([\d.]+)ms, depth (\d+)\) / computed ([\d.]+)ms"
+)
+
+
+def chat_update(update_id: int, chat_id: int, text: str) -> dict:
+    """chat_id 채팅방(그룹)에서 온 메시지 업데이트"""
+    body = sample_update(update_id, text, chat_type="supergroup")
+    body["message"]["chat"]["id"] = chat_id
+    return body
+
+
+@contextlib.contextmanager
+def capture_webhook_log():
+    """웹훅 로거의 DEBUG 로그를 StringIO에 모음 (견적 로그의 수락 대기/계산 시간 확인용)"""
+    output = io.StringIO()
+    handler = logging.StreamHandler(output)
+    previous_level = webhook.logger.level
+    webhook.logger.addHandler(handler)
+    webhook.logger.setLevel(logging.DEBUG)
+    try:
+        yield output
+    finally:
+        webhook.logger.removeHandler(handler)
+        webhook.logger.setLevel(previous_level)
+
+
+def post(body):
+    response = webhook.handler(SimpleNamespace(method="POST", path="/api/webhook", body=json.dumps(body)))
+    return response["statusCode"]
+
+
+def burst(settings: dict, base_url: str, broker: int, others: int):
+    """
+    새 애플리케이션으로 브로커 채팅방 broker건과 다른 채팅방 others건을 한꺼번에 보냄
+
+    Returns:
+        (걸린 초, 응답 코드 목록, 견적 로그 [(채팅방, 수락 대기 ms, 채팅방 제한 ms, 계산 ms)], 애플리케이션)
+    """
+    os.environ.update(settings, TELEGRAM_BOT_TOKEN=TOKEN, TELEGRAM_API_BASE_URL=base_url)
+    os.environ.pop("ALLOWED_CHAT_IDS", None)
+    os.environ.pop("WEBHOOK_REPLY_IN_RESPONSE", None)
+    webhook.application = None
+    webhook._update_deduplicator = None
+
+    bodies = [
+        chat_update(index + 1, BROKER_CHAT, SAMPLE_MESSAGES[index % len(SAMPLE_MESSAGES)]) for index in range(broker)
+    ] + [
+        chat_update(broker + index + 1, OTHER_CHAT, SAMPLE_MESSAGES[index % len(SAMPLE_MESSAGES)]) for index in range(others)
+    ]
+    with capture_webhook_log() as output, contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        webhook.get_application()  # 초기화/모듈 로드는 측정에서 제외
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(bodies)) as pool:
+            codes = list(pool.map(post, bodies))
+        elapsed = time.perf_counter() - start
+        app = webhook.application
+        webhook.get_loop_worker().shutdown()
+    quotes = [
+        (int(chat_id), float(queued), float(chat_wait), float(computed))
+        for chat_id, queued, chat_wait, _, computed in QUOTE_LOG.findall(output.getvalue())
+    ]
+    return elapsed, codes, quotes, app
+
+
+def delivered(server: StandInBotApi, chat_id: int):
+    """(채팅방에 전달된 답장 텍스트 목록, 429로 거절된 수)"""
+    throttled = [params for _, params in server.throttled if params.get("chat_id") == chat_id]
+    sent = [params for _, params in server.calls if params.get("chat_id") == chat_id]
+    for params in throttled:
+        sent.remove(params)
+    return [params["text"] for params in sent], len(throttled)
+
+
+async def retry_check(base_url: str, server: StandInBotApi):
+    """대역 서버 간격보다 짧은 간격으로 3건을 차례로 보내 429 후 다시 보내는지 (전달 수, 전송 통계)"""
+    client = BotApiClient(TOKEN, base_url)
+    pacer = ChatPacer(interval=SERVER_CHAT_INTERVAL / 2, max_retries=2)
+    server.retry_after = SERVER_CHAT_INTERVAL  # 실제 텔레그램은 정수 초
+    sent = 0
+    try:
+        for index in range(3):
+            await pacer.send(-1003, lambda: client.send_message(-1003, f"견적 {index}"))
+            sent += 1
+    finally:
+        server.retry_after = 1
+        await client.close()
+    return sent, pacer.stats()
+
+
+async def queue_full_check():
+    """동시 계산 1 + 대기열 2에서 4번째 요청이 기다리지 않고 거절되는지 (결과 목록, 거절까지 걸린 ms)"""
+    admission = QuoteAdmission(chat_rate=0, max_concurrent=1, max_queue=2)
+    results = []
+
+    async def request(chat_id):
+        started = time.perf_counter()
+        try:
+            async with admission.admit(chat_id) as ticket:
+                await asyncio.sleep(0.1)  # 계산
+                results.append(("admitted", chat_id, ticket.queue_depth))
+        except AdmissionRejected as e:
+            results.append((e.reason, chat_id, (time.perf_counter() - started) * 1000))
+
+    await asyncio.gather(*(request(chat_id) for chat_id in range(4)))
+    return results, admission.stats()
+
+
+def main():
+    broker = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    others = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    failures = []
+
+    server = StandInBotApi()
+    server.chat_interval = SERVER_CHAT_INTERVAL
+    server_worker = LoopWorker(name="stand-in-bot-api")
+    base_url = f"http://127.0.0.1:{server_worker.run(server.start())}"
+    saved = {name: os.environ.get(name) for name in set(DISABLED) | set(ENABLED)}
+    try:
+        print(f"브로커 채팅방 {broker}건 붙여넣기 + 다른 채팅방 {others}건 (대역 서버 채팅방별 간격 {SERVER_CHAT_INTERVAL * 1000:.0f} ms)")
+
+        server.calls.clear()
+        server.throttled.clear()
+        elapsed, codes, quotes, _ = burst(DISABLED, base_url, broker, others)
+        broker_texts, broker_429 = delivered(server, BROKER_CHAT)
+        other_texts, other_429 = delivered(server, OTHER_CHAT)
+        print(f"  수락 제어 끔   {elapsed:5.2f}s, 계산 {len(quotes)}건, "
+              f"전달 브로커 {len(broker_texts)}/{broker} · 다른 채팅방 {len(other_texts)}/{others}, "
+              f"429 {broker_429 + other_429}건")
+
+        server.calls.clear()
+        server.throttled.clear()
+        elapsed, codes, quotes, app = burst(ENABLED, base_url, broker, others)
+        broker_texts, broker_429 = delivered(server, BROKER_CHAT)
+        other_texts, other_429 = delivered(server, OTHER_CHAT)
+        admitted, pacer = app.admission.stats(), app.pacer.stats()
+        broker_quotes = [quote for quote in quotes if quote[0] == BROKER_CHAT]
+        other_quotes = [quote for quote in quotes if quote[0] == OTHER_CHAT]
+        notices = broker_texts.count(BUSY_NOTICE)
+        print(f"  수락 제어 켬   {elapsed:5.2f}s, 계산 {len(quotes)}건, 거절 "
+              f"{admitted.rejected_chat_rate + admitted.rejected_queue_full}건 (안내 {notices}건), "
+              f"전달 브로커 {len(broker_texts) - notices}/{len(broker_quotes)} · 다른 채팅방 {len(other_texts)}/{others}, "
+              f"429 {broker_429 + other_429}건 (재시도 {pacer.retried}, 실패 {pacer.failed})")
+        for label, chat_quotes in (("브로커", broker_quotes), ("다른 채팅방", other_quotes)):
+            if chat_quotes:
+                print(f"    {label:<6} 수락 대기 평균 {sum(q[1] for q in chat_quotes) / len(chat_quotes):7.1f} ms "
+                      f"(최대 {max(q[1] for q in chat_quotes):7.1f}) / 계산 평균 {sum(q[3] for q in chat_quotes) / len(chat_quotes):5.1f} ms")
+
+        if any(code != 200 for code in codes):
+            failures.append(f"200이 아닌 웹훅 응답: {codes}")
+        if len(broker_quotes) + admitted.rejected_chat_rate + admitted.rejected_queue_full != broker:
+            failures.append("브로커 요청 수와 계산 + 거절 수가 다름")
+        if not admitted.rejected_chat_rate:
+            failures.append("채팅방 제한을 넘는 요청이 거절되지 않음")
+        if notices != 1:
+            failures.append(f"거절 안내가 {notices}건 (1건이어야 함)")
+        if len(broker_texts) - notices != len(broker_quotes) or pacer.failed:
+            failures.append("수락된 견적의 답장이 유실됨")
+        if len(other_quotes) != others or len(other_texts) != others:
+            failures.append("다른 채팅방 메시지가 처리/전달되지 않음")
+        if other_quotes and max(quote[1] for quote in other_quotes) > 100:
+            failures.append("다른 채팅방이 브로커 채팅방 제한에 막힘")
+        if len(quotes) != admitted.admitted:
+            failures.append("수락 대기/계산 시간 로그 수가 수락 수와 다름")
+
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            get_body = json.loads(webhook.handler(SimpleNamespace(method="GET", path="/api/webhook", body=None))["body"])
+        print(f"  GET admission: {get_body.get('admission')}")
+        if (get_body.get("admission") or {}).get("admitted") != admitted.admitted or "pacer" not in get_body:
+            failures.append("GET 응답에 수락 제어/전송 통계가 없음")
+
+        server.calls.clear()
+        server.throttled.clear()
+        sent, stats = server_worker.run(retry_check(base_url, server))
+        print(f"429 재시도: 3건 중 {sent}건 전달, 429 {len(server.throttled)}건, 재시도 {stats.retried}회, 실패 {stats.failed}건")
+        if sent != 3 or not server.throttled or stats.retried != len(server.throttled) or stats.failed:
+            failures.append("429 응답 후 retry_after만큼 기다려 다시 보내지 않음")
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        server_worker.shutdown()
+
+    results, stats = asyncio.run(queue_full_check())
+    rejected = [result for result in results if result[0] == "queue_full"]
+    print(f"대기열 가득 참 (동시 1, 대기열 2, 요청 4): {results}")
+    if len(rejected) != 1 or rejected[0][2] > 50 or stats.admitted != 3 or stats.max_queue_depth != 2:
+        failures.append("대기열이 가득 찼을 때 바로 거절되지 않음")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("✅ 채팅방 제한/대기열 초과 요청은 거절, 수락된 답장은 429 없이(또는 재시도로) 모두 전달, 다른 채팅방은 막히지 않음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+요청당 메모리 할당 측정 스크립트 (tracemalloc)
+샘플 메시지를 파싱하고 모든 금융사 계산까지 수행하는 요청 한 건이
+남기는 메모리(파싱 결과 + 계산 결과)와 처리 중 최대 추가 할당량을 측정합니다.
+
+사용법: python scripts/bench_allocation.py [반복 횟수]
+"""
+
+import sys
+import os
+import tracemalloc
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 같은 입력을 반복 계산하므로 견적/금융사별 결과 캐시를 끄고 실제 계산의 할당량을 측정
+os.environ.setdefault("QUOTE_CACHE_SIZE", "0")
+os.environ.setdefault("BANK_RESULT_CACHE_SIZE", "0")
+
+from parsers.message_parser import MessageParser
+from calculator.base_calculator import BaseCalculator
+from scripts.bench_samples import SAMPLE_MESSAGES
+
+
+def handle_request(parser: MessageParser, message: str):
+    """요청 한 건 처리 (파싱 + 모든 금융사 계산)"""
+    property_data = parser.parse(message)
+    return property_data, BaseCalculator.calculate_all_banks(property_data)
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    parser = MessageParser()
+    for message in SAMPLE_MESSAGES:
+        handle_request(parser, message)  # 레지스트리 로드, 정규식 컴파일 등 워밍업
+
+    request_count = rounds * len(SAMPLE_MESSAGES)
+    kept = []
+    peak_total = 0
+    tracemalloc.start()
+    start_size, _ = tracemalloc.get_traced_memory()
+    for _ in range(rounds):
+        for message in SAMPLE_MESSAGES:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            kept.append(handle_request(parser, message))
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before
+    end_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"요청 {request_count}건 (샘플 메시지 {len(SAMPLE_MESSAGES)}개 x {rounds}회)")
+    print(f"요청당 남는 메모리 (파싱 결과 + 계산 결과)  {(end_size - start_size) / request_count / 1024:8.2f} KiB")
+    print(f"요청당 처리 중 최대 추가 할당              {peak_total / request_count / 1024:8.2f} KiB")
+
+
+if __name__ == "__main__":
+    main()
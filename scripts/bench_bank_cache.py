@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+금융사별 결과 캐시 점검/측정 스크립트
+1. 금융사마다 선언한 입력 필드(input_fields, mortgage_fields)에 없는 필드를 바꿔도
+   결과가 같은지 확인합니다 (다르면 선언이 빠진 것이므로 실패로 종료).
+2. 메시지 한 줄(특이사항, 요청사항, 면적 등)을 고친 재요청에서 다시 계산되는 금융사 수를 출력합니다.
+
+사용법: python scripts/bench_bank_cache.py
+"""
+
+import sys
+import os
+import copy
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 점검 중에는 전체 견적 캐시 불필요
+os.environ["QUOTE_CACHE_SIZE"] = "0"
+
+from calculator.base_calculator import BaseCalculator
+from calculator.bank_registry import get_bank_registry
+from calculator.property_context import PropertyContext
+from calculator.quote_cache import QuoteCache
+from scripts.stress_concurrency import build_cases
+
+
+# 선언되지 않은 필드에 넣어 볼 값 (계산 분기를 바꿀 만한 값)
+FIELD_MUTATIONS = {
+    "name": ["김철수"],
+    "age": [99],
+    "occupation": ["개인택시"],
+    "residence": ["미거주"],
+    "ownership": ["공동소유"],
+    "address": ["서울특별시 강남구 1 1층 101호", "경기도 수원시 2층"],
+    "area": [200.0, 59.9],
+    "household_count": [1],
+    "property_type": ["빌라", "아파트", "주상복합"],
+    "special_notes": ["개인택시 운수업 거치식", "원리금분할상환"],
+    "requests": ["가계자금 대환 거치식", "선순위 대환"],
+}
+MORTGAGE_MUTATIONS = {
+    "institution": ["물상담보 하나은행", "OK저축은행"],
+}
+
+# 재요청에서 고칠 줄 (필드, 새 값)
+EDITS = [
+    ("name", "김철수"),
+    ("special_notes", "개인택시"),
+    ("requests", "가계자금 대환 거치식"),
+    ("area", 140.0),
+    ("credit_score", 820),
+]
+
+
+def quote(calculator, property_data):
+    """캐시 없이 금융사 하나 계산"""
+    return BaseCalculator.calculate_bank(calculator, property_data, PropertyContext.from_property_data(property_data))
+
+
+def check_declared_fields(calculators, cases) -> int:
+    """선언되지 않은 필드를 바꿔도 결과가 같은지 확인하고 불일치 건수 반환"""
+    mismatches = 0
+    for calculator in calculators:
+        undeclared = [name for name in FIELD_MUTATIONS if name not in calculator.input_fields]
+        undeclared_mortgage = [name for name in MORTGAGE_MUTATIONS if name not in calculator.mortgage_fields]
+        for case in cases:
+            expected = quote(calculator, case)
+            variants = []
+            for name in undeclared:
+                for value in FIELD_MUTATIONS[name]:
+                    variant = copy.deepcopy(case)
+                    variant[name] = value
+                    variants.append((name, value, variant))
+            for name in undeclared_mortgage:
+                for value in MORTGAGE_MUTATIONS[name]:
+                    variant = copy.deepcopy(case)
+                    for mortgage in variant["mortgages"]:
+                        mortgage[name] = value
+                    variants.append((f"mortgages.{name}", value, variant))
+            for name, value, variant in variants:
+                if quote(calculator, variant) != expected:
+                    mismatches += 1
+                    if mismatches <= 5:
+                        print(f"❌ {calculator.bank_name}: 선언되지 않은 {name}={value!r} 변경으로 결과가 바뀜")
+    return mismatches
+
+
+def main():
+    snapshot = get_bank_registry(BaseCalculator).snapshot()
+    calculators = snapshot.calculators
+    for calculator in calculators:
+        print(f"{calculator.bank_name}: {', '.join(calculator.input_fields)} / 근저당권 {', '.join(calculator.mortgage_fields)}")
+
+    for calculator in calculators:
+        calculator.result_cache = QuoteCache(max_size=0)
+    cases = build_cases()
+    mismatches = check_declared_fields(calculators, cases)
+    if mismatches:
+        print(f"❌ 선언되지 않은 필드로 결과가 바뀐 경우 {mismatches}건")
+        sys.exit(1)
+    print(f"✅ 입력 조합 {len(cases)}개에서 선언되지 않은 필드는 결과에 영향 없음")
+
+    print()
+    print("한 줄 수정 후 재요청 시 다시 계산한 금융사 수 (전체 견적 캐시 없음)")
+    for field_name, value in EDITS:
+        for calculator in calculators:
+            calculator.result_cache = QuoteCache()
+        recomputed = 0
+        for case in cases:
+            BaseCalculator.calculate_all_banks(case)
+            before = sum(calculator.result_cache.stats().misses for calculator in calculators)
+            edited = copy.deepcopy(case)
+            edited[field_name] = value
+            BaseCalculator.calculate_all_banks(edited)
+            recomputed += sum(calculator.result_cache.stats().misses for calculator in calculators) - before
+        print(f"  {field_name:<16} 평균 {recomputed / len(cases):.2f}개 / 금융사 {len(calculators)}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+일괄 계산(calculate_all_banks_batch) 성능/결과 비교 스크립트
+샘플 메시지로 만든 입력 조합의 KB시세를 조금씩 바꿔 N건의 담보물건을 만들고
+물건별 calculate_all_banks 반복과 일괄 계산의 처리 시간을 비교합니다.
+두 결과가 완전히 같지 않으면 실패로 종료합니다.
+
+사용법: python scripts/bench_batch.py [물건 수]
+"""
+
+import sys
+import os
+import copy
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 같은 입력을 반복 계산하므로 견적/금융사별 결과 캐시를 끄고 실제 계산 시간을 측정
+os.environ.setdefault("QUOTE_CACHE_SIZE", "0")
+os.environ.setdefault("BANK_RESULT_CACHE_SIZE", "0")
+
+from calculator.base_calculator import BaseCalculator
+from calculator.batch_calculator import calculate_all_banks_batch, np
+from scripts.stress_concurrency import build_cases
+
+
+def build_properties(count: int):
+    """입력 조합을 반복하며 KB시세를 0.5%씩 바꿔 count건 생성"""
+    cases = build_cases()
+    properties = []
+    for index in range(count):
+        property_data = copy.deepcopy(cases[index % len(cases)])
+        if isinstance(property_data.get("kb_price"), (int, float)):
+            property_data["kb_price"] = round(property_data["kb_price"] * (1 + 0.005 * (index // len(cases))))
+        properties.append(property_data)
+    return properties
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    if np is None:
+        print("⚠️  numpy가 설치되어 있지 않아 일괄 계산도 물건별 순차 계산으로 동작합니다")
+
+    properties = build_properties(count)
+    BaseCalculator.calculate_all_banks(properties[0])  # 레지스트리 로드 등 워밍업
+
+    start = time.perf_counter()
+    expected = [BaseCalculator.calculate_all_banks(property_data) for property_data in properties]
+    scalar_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = calculate_all_banks_batch(properties)
+    batch_elapsed = time.perf_counter() - start
+
+    print(f"물건 {count}건")
+    print(f"물건별 계산  {scalar_elapsed:8.3f}초")
+    print(f"일괄 계산    {batch_elapsed:8.3f}초 ({scalar_elapsed / batch_elapsed:.1f}x)")
+
+    mismatches = [index for index, (a, b) in enumerate(zip(expected, actual)) if a != b]
+    if mismatches:
+        print(f"❌ 결과가 다른 물건 {len(mismatches)}건 (첫 번째: {mismatches[0]})")
+        sys.exit(1)
+    print("✅ 모든 결과가 물건별 계산과 동일")
+
+
+if __name__ == "__main__":
+    main()
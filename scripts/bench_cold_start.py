@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+웹훅 콜드 스타트 측정 스크립트
+새 파이썬 프로세스에서 서버리스 함수가 처음 요청을 처리할 때까지의 단계를 측정하고,
+단계별 예산(ms)을 넘거나 콜드 스타트 조건이 깨지면 실패로 종료합니다.
+
+단계:
+    1. api/webhook.py 로드 (출력이 없어야 함)
+    2. Bot API 클라이언트(httpx) 로드/생성 + 첫 업데이트 해석 (python-telegram-bot은 로드되지 않아야 함)
+    3. 걸러지는 업데이트(허용되지 않은 채팅방, 명령어, 텍스트 없는 메시지) 처리: 앱 초기화/계산기/asyncio 로드가 없어야 함
+    4. 첫 견적: 파서/계산기/포맷터 모듈 로드 + 금융사 설정 로드(번들) + 파싱/계산/포맷
+각 단계를 `python -X importtime`으로도 실행하여 모듈 로드 시간이 큰 순서로 출력합니다.
+측정 전에 배포 빌드 단계와 같이 금융사 설정 번들(data/banks.bundle)을 만듭니다.
+
+사용법: python scripts/bench_cold_start.py [반복 횟수]
+    COLD_START_BUDGET_SCALE=2  # 느린 환경에서 예산 배수
+"""
+
+import sys
+import os
+import json
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scripts.bench_samples import SAMPLE_MESSAGES
+
+
+# 단계별 예산 (ms, 반복 실행의 중앙값 기준)
+BUDGETS_MS = {
+    "webhook_import": 15.0,
+    # asyncio + httpx 로드(설치되어 있으면 httpcore가 trio도 로드) + httpx.AsyncClient의 SSL 컨텍스트 생성
+    # 측정 중앙값 약 250 ms (trio 제외 시 약 190 ms)에 여유를 둠
+    "bot_client_import": 400.0,
+    "dropped_update": 15.0,
+    "first_quote": 120.0,
+}
+
+# importtime 출력에서 측정 구간 시작 표시
+MARKER = "-- cold start measure --"
+
+# 자식 프로세스에서 실행할 단계 (stdout에 JSON 한 줄 출력)
+STAGE_CODE = {
+    "webhook_import": """
+import io, json, sys, time, contextlib
+sys.stderr.write({marker!r} + "\\n")
+output = io.StringIO()
+start = time.perf_counter()
+with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+    import api.webhook
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "output": output.getvalue()}}))
+""",
+    "bot_client_import": """
+import json, sys, time
+sys.stderr.write({marker!r} + "\\n")
+start = time.perf_counter()
+from utils.telegram_client import BotApiClient
+from utils.telegram_update import parse_update
+BotApiClient("0:bench")
+parse_update({{"update_id": 1, "message": {{"message_id": 1, "chat": {{"id": 1, "type": "private"}}, "text": "/start"}}}})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "telegram": "telegram" in sys.modules}}))
+""",
+    "dropped_update": """
+import io, json, os, sys, time, contextlib
+os.environ["ALLOWED_CHAT_IDS"] = "1"
+sys.stderr.write({marker!r} + "\\n")
+from types import SimpleNamespace
+with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    import api.webhook as webhook
+    start = time.perf_counter()
+    skipped = []
+    for message in (
+        {{"chat": {{"id": 2, "type": "private"}}, "text": "안녕하세요"}},
+        {{"chat": {{"id": 1, "type": "private"}}, "text": "/settings", "entities": [{{"type": "bot_command", "offset": 0, "length": 9}}]}},
+        {{"chat": {{"id": 1, "type": "private"}}, "sticker": {{"file_id": "x"}}}},
+    ):
+        body = json.dumps({{"update_id": 1, "message": dict(message, message_id=1, date=0)}})
+        response = webhook.handler(SimpleNamespace(method="POST", path="/api/webhook", body=body))
+        skipped.append(json.loads(response["body"]).get("skipped"))
+    elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "skipped": skipped,
+    "initialized": webhook.application is not None
+        or any(name in sys.modules for name in ("asyncio", "calculator.base_calculator", "parsers.message_parser")),
+}}))
+""",
+    "first_quote": """
+import io, json, os, sys, time, contextlib
+sys.stderr.write({marker!r} + "\\n")
+start = time.perf_counter()
+from parsers.message_parser import MessageParser
+from calculator.base_calculator import BaseCalculator
+from calculator.bank_registry import get_bank_registry
+from calculator.requote import requote
+from utils.formatter import format_all_results
+imported = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    registry = get_bank_registry(BaseCalculator)
+    registry.snapshot()
+loaded = time.perf_counter()
+record = requote(MessageParser().parse({message!r}))
+format_all_results(record.results)
+done = time.perf_counter()
+print(json.dumps({{
+    "ms": (done - start) * 1000,
+    "imports_ms": (imported - start) * 1000,
+    "bank_load_ms": (loaded - imported) * 1000,
+    "quote_ms": (done - loaded) * 1000,
+    "bundle": registry.loaded_from_bundle,
+}}))
+""",
+}
+
+
+def run_stage(name: str, importtime: bool = False):
+    """새 프로세스에서 단계를 실행하고 (결과, importtime 출력) 반환"""
+    code = STAGE_CODE[name].format(marker=MARKER, message=SAMPLE_MESSAGES[0])
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    completed = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, encoding="utf-8")
+    if completed.returncode != 0:
+        raise RuntimeError(f"{name} 실행 실패:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+
+def slowest_imports(importtime_output: str, count: int = 8):
+    """importtime 출력에서 측정 구간의 모듈을 자체 로드 시간이 큰 순서로 반환 [(µs, 모듈)]"""
+    lines = importtime_output.splitlines()
+    if MARKER in lines:
+        lines = lines[lines.index(MARKER) + 1:]
+    modules = []
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            modules.append((int(self_us), name.strip()))
+    return sorted(modules, reverse=True)[:count]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    scale = float(os.getenv("COLD_START_BUDGET_SCALE", "1"))
+    failures = []
+
+    # 배포 빌드 단계(vercel.json의 buildCommand)와 같이 번들을 먼저 만듦 (번들은 저장소에 커밋하지 않음)
+    build = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "scripts", "build_bank_bundle.py")],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if build.returncode != 0:
+        print(f"❌ 금융사 설정 번들 생성 실패: {build.stderr.strip()[-200:]}")
+        sys.exit(1)
+
+    for name in STAGE_CODE:
+        results = [run_stage(name)[0] for _ in range(runs)]
+        if isinstance(results[0].get("skipped"), str):
+            print(f"{name:<16} 건너뜀 ({results[0]['skipped']})")
+            continue
+
+        median = statistics.median(result["ms"] for result in results)
+        budget = BUDGETS_MS[name] * scale
+        status = "✅" if median <= budget else "❌"
+        print(f"{status} {name:<16} {median:7.1f} ms (예산 {budget:.0f} ms, {runs}회 중앙값)")
+        if median > budget:
+            failures.append(f"{name}: {median:.1f} ms > 예산 {budget:.0f} ms")
+
+        details = {key: value for key, value in results[0].items() if key.endswith("_ms")}
+        if details:
+            print("     " + ", ".join(
+                f"{key[:-3]} {statistics.median(result[key] for result in results):.1f} ms" for key in details
+            ))
+        if results[0].get("output"):
+            failures.append(f"{name}: 모듈 로드 시 출력 발생 ({results[0]['output'][:80]!r})")
+        if results[0].get("telegram"):
+            failures.append(f"{name}: python-telegram-bot이 로드됨")
+        if results[0].get("initialized"):
+            failures.append(f"{name}: 걸러질 업데이트에서 앱/계산기/asyncio를 로드함 ({results[0]['skipped']})")
+        if name == "dropped_update" and None in results[0]["skipped"]:
+            failures.append(f"{name}: 걸러지지 않은 업데이트가 있음 ({results[0]['skipped']})")
+        if name == "first_quote" and not results[0].get("bundle"):
+            failures.append(f"{name}: 금융사 설정 번들을 사용하지 않음 (python scripts/build_bank_bundle.py --check)")
+
+        _, importtime_output = run_stage(name, importtime=True)
+        for self_us, module in slowest_imports(importtime_output):
+            print(f"       {self_us / 1000:6.1f} ms  {module}")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("✅ 콜드 스타트 예산 이내")
+
+
+if __name__ == "__main__":
+    main()
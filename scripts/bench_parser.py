@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+메시지 파서(MessageParser.parse) 성능 측정 스크립트
+샘플 상담 메시지와 KB시세 표기만 바꾼 변형 메시지를 반복 파싱하여
+메시지 종류별/전체 메시지당 처리 시간을 출력합니다. (추적 로그 off 상태)
+
+사용법: python scripts/bench_parser.py [반복 횟수]
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parsers.message_parser import MessageParser
+from utils.tracing import configure_tracing
+from scripts.bench_samples import SAMPLE_MESSAGES
+
+
+# 샘플 메시지의 KB시세 줄을 다른 표기로 바꾼 변형 (KB시세 처리 경로별 비용 확인용)
+KB_VARIANTS = [
+    ("콜론 없음", "KB시세 일반 62,000만원 하한 58,000만원"),
+    ("값 다음 줄", "KB시세 :\n\n125,000만원"),
+    ("KB 띄어쓰기", "KB 시세 : 5억"),
+]
+
+
+def build_messages():
+    """(이름, 메시지) 리스트: 샘플 메시지 + 첫 번째 샘플의 KB시세 표기 변형"""
+    messages = [(f"샘플 {index + 1}", message) for index, message in enumerate(SAMPLE_MESSAGES)]
+
+    base_lines = SAMPLE_MESSAGES[0].split("\n")
+    kb_index = next(index for index, line in enumerate(base_lines) if "KB시세" in line)
+    # KB시세 줄과 이어지는 하한/상한 줄을 변형 표기로 교체
+    end_index = kb_index + 1
+    while end_index < len(base_lines) and base_lines[end_index].startswith(("하한", "상한")):
+        end_index += 1
+    for label, kb_text in KB_VARIANTS:
+        variant_lines = base_lines[:kb_index] + kb_text.split("\n") + base_lines[end_index:]
+        messages.append((label, "\n".join(variant_lines)))
+    return messages
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    configure_tracing("off")
+
+    parser = MessageParser()
+    messages = build_messages()
+    for _, message in messages:
+        parser.parse(message)  # 워밍업
+
+    total_elapsed = 0.0
+    for label, message in messages:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            parser.parse(message)
+        elapsed = time.perf_counter() - start
+        total_elapsed += elapsed
+        line_count = message.count("\n") + 1
+        print(f"{label:<12} {elapsed / rounds * 1_000_000:8.1f} µs/메시지 ({line_count}줄)")
+
+    print(f"{'전체 평균':<12} {total_elapsed / (rounds * len(messages)) * 1_000_000:8.1f} µs/메시지")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+견적 캐시(QuoteCache) 효과 측정 스크립트
+같은 매물을 여러 번 붙여넣는 상황(샘플 메시지 x 반복 횟수, 성명만 바꿈)을
+캐시 없이/캐시 사용으로 처리해 시간과 적중률을 비교합니다.
+캐시 결과가 직접 계산한 결과와 다르거나, 설정 다시 로드 후 캐시가 비워지지 않으면 실패로 종료합니다.
+
+사용법: python scripts/bench_quote_cache.py [반복 횟수]
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 전체 견적 캐시 효과만 측정하도록 금융사별 결과 캐시는 끔
+os.environ.setdefault("BANK_RESULT_CACHE_SIZE", "0")
+
+from parsers.message_parser import MessageParser
+from calculator.base_calculator import BaseCalculator
+from calculator.bank_registry import get_bank_registry
+from calculator.quote_cache import QuoteCache
+from scripts.bench_samples import SAMPLE_MESSAGES
+
+
+def run(parsed_messages, rounds: int):
+    """모든 메시지를 rounds번 계산하고 (경과 시간, 마지막 결과 목록) 반환"""
+    start = time.perf_counter()
+    results = []
+    for _ in range(rounds):
+        results = [BaseCalculator.calculate_all_banks(property_data) for property_data in parsed_messages]
+    return time.perf_counter() - start, results
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    parser = MessageParser()
+    parsed_messages = []
+    for index, message in enumerate(SAMPLE_MESSAGES):
+        property_data = parser.parse(message)
+        property_data["name"] = f"고객{index}"  # 결과에 영향 없는 필드만 다른 재전송
+        parsed_messages.append(property_data)
+
+    registry = get_bank_registry(BaseCalculator)
+    registry.snapshot()  # 설정 로드 워밍업
+
+    registry.quote_cache = QuoteCache(max_size=0)
+    uncached_elapsed, expected = run(parsed_messages, rounds)
+
+    registry.quote_cache = QuoteCache()
+    cached_elapsed, actual = run(parsed_messages, rounds)
+    stats = registry.quote_cache.stats()
+
+    count = rounds * len(parsed_messages)
+    print(f"요청 {count}건 (샘플 메시지 {len(parsed_messages)}개 x {rounds}회)")
+    print(f"캐시 없음  {uncached_elapsed * 1e6 / count:8.1f} µs/요청")
+    print(f"캐시 사용  {cached_elapsed * 1e6 / count:8.1f} µs/요청 ({uncached_elapsed / cached_elapsed:.1f}x)")
+    print(f"적중 {stats.hits} / 실패 {stats.misses} (적중률 {stats.hit_rate:.1%}), 항목 {stats.size}/{stats.max_size}")
+
+    if actual != expected:
+        print("❌ 캐시 결과가 직접 계산한 결과와 다름")
+        sys.exit(1)
+
+    registry.reload()
+    stats = registry.quote_cache.stats()
+    if stats.size != 0 or stats.invalidations != 1:
+        print(f"❌ 설정 다시 로드 후 캐시가 비워지지 않음: {stats}")
+        sys.exit(1)
+    print("✅ 캐시 결과가 직접 계산한 결과와 동일, 설정 다시 로드 시 캐시 비움")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+견적 실행기(QuoteExecutor) 측정 스크립트
+폴링 모드처럼 이벤트 루프 하나에서 메시지 여러 개를 동시에 처리하면서,
+실행기 종류(inline/thread/process)별로 처리 시간, 이벤트 루프가 막힌 최대 시간(다른 채팅방 업데이트가 기다리는 시간),
+대기열 길이와 단계별 평균 시간을 출력합니다.
+실행기 결과가 직접 계산한 결과와 다르면 실패로 종료합니다.
+
+사용법: python scripts/bench_quote_executor.py [메시지 수] [작업자 수]
+"""
+
+import sys
+import os
+import time
+import asyncio
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 매 메시지 실제 계산을 하도록 결과 캐시는 끔 (작업 프로세스에도 상속)
+os.environ["QUOTE_CACHE_SIZE"] = "0"
+os.environ["BANK_RESULT_CACHE_SIZE"] = "0"
+
+from parsers.message_parser import MessageParser
+from calculator.base_calculator import BaseCalculator
+from utils.formatter import format_all_results
+from utils.quote_executor import QuoteExecutor
+from scripts.bench_samples import SAMPLE_MESSAGES
+
+
+async def measure(executor: QuoteExecutor, messages):
+    """메시지를 동시에 처리하고 (경과 시간, 이벤트 루프 최대 지연 ms, 결과 목록) 반환"""
+    await executor.start()
+    stop = asyncio.Event()
+    max_lag = 0.0
+
+    async def heartbeat():
+        # 1ms마다 깨어나며 예정보다 늦게 깨어난 시간 = 이벤트 루프가 막혀 있던 시간
+        nonlocal max_lag
+        while not stop.is_set():
+            expected = time.perf_counter() + 0.001
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, time.perf_counter() - expected)
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(*(executor.quote(message) for message in messages))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    return elapsed, max_lag * 1000, outcomes
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    messages = [SAMPLE_MESSAGES[index % len(SAMPLE_MESSAGES)] for index in range(count)]
+    expected = [format_all_results(BaseCalculator.calculate_all_banks(MessageParser().parse(m))) for m in messages]
+
+    print(f"메시지 {count}건 동시 처리")
+    failed = False
+    for kind in ("inline", "thread", "process"):
+        executor = QuoteExecutor(kind, workers)
+        try:
+            elapsed, max_lag_ms, outcomes = asyncio.run(measure(executor, messages))
+        finally:
+            executor.shutdown()
+        stats = executor.stats()
+        print(
+            f"  {kind:<8} 작업자 {stats.workers:>2}개  {elapsed * 1000:7.1f} ms"
+            f"  이벤트 루프 최대 지연 {max_lag_ms:6.1f} ms  최대 대기열 {stats.max_queue_depth:>3}"
+            f"  평균 대기 {stats.avg_queue_ms:6.1f} / 파싱 {stats.avg_parse_ms:.2f} / 계산 {stats.avg_calculate_ms:.2f}"
+            f" / 포맷 {stats.avg_format_ms:.2f} ms"
+        )
+        if [outcome.text for outcome in outcomes] != expected:
+            print(f"  ❌ {kind}: 결과가 직접 계산한 결과와 다름")
+            failed = True
+
+    if failed:
+        sys.exit(1)
+    print("✅ 모든 실행기 결과가 직접 계산한 결과와 동일")
+
+
+if __name__ == "__main__":
+    main()
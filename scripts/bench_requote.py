@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+수정 메시지 재산출(requote) 점검/측정 스크립트
+입력 조합마다 한 줄(특이사항, 요청사항, 면적, 신용점수, 성명)을 고친 수정 메시지를
+금융사별 결과 캐시를 쓰는 재산출과 캐시 없이 처음부터 계산한 결과로 비교하고 처리 시간을 출력합니다.
+두 결과가 다르거나 이전 답장 정보를 이어받지 않으면 실패로 종료합니다.
+
+사용법: python scripts/bench_requote.py
+"""
+
+import sys
+import os
+import copy
+import time
+import contextlib
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 재산출 자체를 측정하도록 전체 견적 캐시는 끔 (금융사별 결과 캐시는 사용)
+os.environ["QUOTE_CACHE_SIZE"] = "0"
+
+from calculator.base_calculator import BaseCalculator
+from calculator.bank_registry import get_bank_registry
+from calculator.requote import requote
+from scripts.bench_bank_cache import EDITS
+from scripts.stress_concurrency import build_cases
+
+
+@contextlib.contextmanager
+def bank_cache_disabled():
+    """금융사별 결과 캐시를 잠시 끔 (처음부터 계산한 결과/시간 측정용)"""
+    calculators = get_bank_registry(BaseCalculator).snapshot().calculators
+    sizes = [calculator.result_cache.max_size for calculator in calculators]
+    for calculator in calculators:
+        calculator.result_cache.max_size = 0
+    try:
+        yield
+    finally:
+        for calculator, size in zip(calculators, sizes):
+            calculator.result_cache.max_size = size
+
+
+def main():
+    cases = build_cases()
+    BaseCalculator.calculate_all_banks(cases[0])  # 레지스트리 로드 워밍업
+    records = [requote(case)._replace(reply_message_id=index, reply_text="이전 답장") for index, case in enumerate(cases)]
+
+    print(f"입력 조합 {len(cases)}개")
+    mismatches = 0
+    for field_name, value in EDITS:
+        edited_cases = []
+        for case in cases:
+            edited = copy.deepcopy(case)
+            edited[field_name] = value
+            edited_cases.append(edited)
+
+        with bank_cache_disabled():
+            start = time.perf_counter()
+            expected = [BaseCalculator.calculate_all_banks(edited) for edited in edited_cases]
+            full_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        requoted = [requote(edited, record) for edited, record in zip(edited_cases, records)]
+        requote_elapsed = time.perf_counter() - start
+
+        field_mismatches = sum(
+            1 for results, record, previous in zip(expected, requoted, records)
+            if results != record.results or (record.reply_message_id, record.reply_text) != (previous.reply_message_id, previous.reply_text)
+        )
+        mismatches += field_mismatches
+        print(
+            f"  {field_name:<16} 전체 계산 {full_elapsed * 1e6 / len(cases):7.1f} µs"
+            f" / 재산출 {requote_elapsed * 1e6 / len(cases):7.1f} µs"
+            + (f"  ❌ 결과 불일치 {field_mismatches}건" if field_mismatches else "")
+        )
+
+    if mismatches:
+        sys.exit(1)
+    print("✅ 재산출 결과가 모두 처음부터 계산한 결과와 동일")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크/부하 테스트 공용 샘플 메시지
+실제 상담 메시지 형식 (개인정보는 임의 값)
+"""
+
+from typing import List
+
+
+SAMPLE_MESSAGES: List[str] = [
+    # 아파트, 후순위 (1순위 물상담보)
+    "성   명 : 홍길동 (50)\n"
+    "직   업 : 직장인\n"
+    "신용점수 : 700\n"
+    "거주여부 : 거주\n"
+    "소유현황 : 단독소유\n"
+    "주   소 : 충청남도 천안시 서북구 1\n"
+    "면   적 : 25.95㎡\n"
+    "세대수 : 120세대 (2개동)\n"
+    "구   분 : 아파트\n"
+    "KB시세: 일반 90,000만원\n"
+    "하한 85,000만원\n"
+    "상한 95,000만원\n"
+    "=========설정내역=========\n"
+    "1순위 : 물상담보 하나은행\n"
+    "           24,000 (20,000)만원\n"
+    "========================\n"
+    "특이사항 : *하우스머치 59,400(25.11.01) / 월250만\n"
+    "요청사항 : 필요자금 3000",
+
+    # 빌라, 설정 없음, 개인택시 가계자금 대환 요청
+    "성   명 : 홍길동 (48)\n"
+    "직   업 : 개인택시\n"
+    "신용점수 : 950\n"
+    "거주여부 : 거주\n"
+    "소유현황 : 단독소유\n"
+    "주   소 : 경기도 수원시 영통구 매탄동 11 15층\n"
+    "면   적 : 140.0㎡\n"
+    "세대수 : 120세대 (2개동)\n"
+    "구   분 : 빌라\n"
+    "KB시세: 일반 90,000만원\n"
+    "하한 85,000만원\n"
+    "상한 95,000만원\n"
+    "=========설정내역=========\n"
+    "\n"
+    "========================\n"
+    "특이사항 : 개인택시 운영\n"
+    "요청사항 : 신한은행 대환 가계자금 거치식",
+
+    # 서울 빌라, 근저당 2건 (공백 없는 주소)
+    "성   명 : 홍길동 (79)\n"
+    "직   업 : 직장인\n"
+    "신용점수 : 1000\n"
+    "거주여부 : 거주\n"
+    "소유현황 : 단독소유\n"
+    "주   소 : 서울특별시광진구자양동842-1미산빌5차동 3층 301호\n"
+    "면   적 : 84.9㎡\n"
+    "세대수 : 120세대 (2개동)\n"
+    "구   분 : 빌라\n"
+    "KB시세 : 일반 175,000만원\n"
+    "하한 171,000만원\n"
+    "=========설정내역=========\n"
+    "1순위 : 신한은행\n"
+    "           60,000 (50,000)만원\n"
+    "2순위 : BNK캐피탈\n"
+    "           12,000 (10,000)만원\n"
+    "========================\n"
+    "특이사항 : *하우스머치 59,400(25.11.01) / 월250만\n"
+    "요청사항 : 없음",
+
+    # 부산 아파트 고층, 사업자
+    "성   명 : 홍길동 (77)\n"
+    "직   업 : 개인택시\n"
+    "신용점수 : 760\n"
+    "거주여부 : 거주\n"
+    "소유현황 : 단독소유\n"
+    "주   소 : 부산광역시 해운대구 우동 1 20층\n"
+    "면   적 : 115.2㎡\n"
+    "세대수 : 120세대 (2개동)\n"
+    "구   분 : 아파트\n"
+    "KB시세 : 12,000만원\n"
+    "=========설정내역=========\n"
+    "1순위 : 물상담보 하나은행\n"
+    "           24,000 (20,000)만원\n"
+    "========================\n"
+    "특이사항 : *하우스머치 59,400(25.11.01) / 월250만\n"
+    "요청사항 : *사업자 보유 부가세누락 신고조건 / 3순위 확인부탁드립니다",
+
+    # 서울 아파트 저층, 하한가 적용, 선순위 대환
+    "성   명 : 홍길동 (41)\n"
+    "직   업 : 직장인\n"
+    "신용점수 : 880\n"
+    "거주여부 : 거주\n"
+    "소유현황 : 단독소유\n"
+    "주   소 : 서울특별시 강남구 대치동 1 2층\n"
+    "면   적 : 84.97㎡\n"
+    "세대수 : 820세대 (9개동)\n"
+    "구   분 : 아파트\n"
+    "KB시세: 일반 250,000만원\n"
+    "하한 235,000만원\n"
+    "상한 262,000만원\n"
+    "=========설정내역=========\n"
+    "1순위 : 국민은행\n"
+    "           72,000 (60,000)만원\n"
+    "========================\n"
+    "특이사항 : 없음\n"
+    "요청사항 : 선순위 대환",
+]
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+경량 Bot API 클라이언트(utils/telegram_client, utils/telegram_update) 측정/확인 스크립트
+텔레그램 대신 로컬 대역 서버(Bot API 흉내, keep-alive 지원)를 띄워 확인합니다.
+
+    1. 업데이트 해석: parse_update와 python-telegram-bot Update.de_json(설치된 경우)의 업데이트당 CPU 시간
+    2. sendMessage: 연결 풀(keep-alive) 재사용과 요청마다 새 연결의 요청당 시간, 대역 서버가 받은 연결 수
+    3. 서버가 유휴 연결을 닫은 뒤에도 새 연결로 보내 성공하는지, chunked 응답 처리,
+       요청을 받은 뒤 응답 없이 끊으면 다시 보내지 않고 오류를 올리는지
+    4. api/webhook.handler 전체 경로: 대역 서버로 답장/수정이 가는지 (채팅방, 인용, 내용)
+
+연결 재사용이 안 되거나 답장이 기대와 다르면 실패로 종료합니다.
+
+사용법: python scripts/bench_telegram_client.py [요청 수]
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import asyncio
+import contextlib
+from types import SimpleNamespace
+
+import httpx
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 채팅방별 수락/전송 간격 제한은 scripts/bench_admission.py에서 확인 (여기서는 왕복 시간만 측정)
+os.environ.setdefault("QUOTE_CHAT_RATE", "0")
+os.environ.setdefault("TELEGRAM_CHAT_SEND_INTERVAL", "0")
+
+from utils.loop_worker import LoopWorker
+from utils.telegram_client import BotApiClient
+from utils.telegram_update import parse_update
+from scripts.bench_samples import SAMPLE_MESSAGES
+
+
+TOKEN = "123456:bench"
+
+
+class StandInBotApi:
+    """
+    Bot API 대역 서버 (sendMessage/editMessageText에 ok 응답, 받은 호출 기록)
+    chat_interval을 주면 같은 채팅방으로 그보다 빨리 온 요청에 429(retry_after) 응답 (텔레그램 전송 제한 흉내)
+    drop_after_request를 주면 그 수만큼 요청을 받아 기록한 뒤 응답 없이 연결을 닫음 (응답 도중 끊김 흉내)
+    """
+
+    def __init__(self):
+        self.calls = []  # (메서드, 파라미터)
+        self.connections = 0
+        self.chunked = False  # True면 Transfer-Encoding: chunked로 응답
+        self.latency = 0.0  # 응답 전 대기 시간 (초, 네트워크 왕복 흉내)
+        self.chat_interval = 0.0  # 채팅방별 최소 전송 간격 (초, 0이면 제한 없음)
+        self.retry_after = 1  # 429 응답의 retry_after (초)
+        self.throttled = []  # 429로 거절한 (메서드, 파라미터)
+        self.drop_after_request = 0  # 남은 '받고 응답 없이 닫기' 횟수
+        self._last_sent = {}  # 채팅방 -> 마지막으로 받아들인 시각
+        self._writers = set()
+        self._message_id = 1000
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def drop_idle_connections(self) -> None:
+        """유휴 연결을 서버 쪽에서 닫음 (keep-alive 시간 초과 흉내)"""
+        for writer in list(self._writers):
+            writer.close()
+        await asyncio.sleep(0.01)
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                method = request_line.split()[1].decode().rsplit("/", 1)[-1]
+                params = json.loads(body)
+                self.calls.append((method, params))
+                if self.drop_after_request:
+                    self.drop_after_request -= 1
+                    return
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+
+                now = time.monotonic()
+                chat_id = params.get("chat_id")
+                if self.chat_interval and now - self._last_sent.get(chat_id, -self.chat_interval) < self.chat_interval:
+                    self.throttled.append((method, params))
+                    payload = json.dumps({
+                        "ok": False, "error_code": 429,
+                        "description": f"Too Many Requests: retry after {self.retry_after}",
+                        "parameters": {"retry_after": self.retry_after},
+                    }).encode("utf-8")
+                    writer.write(
+                        b"HTTP/1.1 429 Too Many Requests\r\nContent-Type: application/json\r\n"
+                        b"Content-Length: %d\r\n\r\n" % len(payload) + payload
+                    )
+                    await writer.drain()
+                    continue
+                self._last_sent[chat_id] = now
+
+                self._message_id += 1
+                result = {"message_id": self._message_id, "chat": {"id": chat_id}, "text": params.get("text")}
+                payload = json.dumps({"ok": True, "result": result}).encode("utf-8")
+                if self.chunked:
+                    half = len(payload) // 2
+                    chunks = b"".join(
+                        b"%x\r\n%s\r\n" % (len(part), part) for part in (payload[:half], payload[half:])
+                    )
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nTransfer-Encoding: chunked\r\n\r\n"
+                        + chunks + b"0\r\n\r\n"
+                    )
+                else:
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                        b"Content-Length: %d\r\n\r\n" % len(payload) + payload
+                    )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+def sample_update(update_id: int, text: str, kind: str = "message", chat_type: str = "private",
+                  message_id: int = None) -> dict:
+    """웹훅으로 들어오는 업데이트 JSON (텔레그램이 보내는 필드 구성, 수정 메시지는 message_id를 원래 메시지와 같게)"""
+    message_id = update_id if message_id is None else message_id
+    return {
+        "update_id": update_id,
+        kind: {
+            "message_id": message_id,
+            "from": {"id": 42, "is_bot": False, "first_name": "상담", "language_code": "ko"},
+            "chat": {"id": -100 - message_id % 3 if chat_type != "private" else 42, "type": chat_type, "title": "상담방"},
+            "date": 1760000000,
+            "text": text,
+            **({"entities": [{"type": "bot_command", "offset": 0, "length": len(text.split()[0])}]}
+               if text.startswith("/") else {}),
+            **({"edit_date": 1760000060} if kind.startswith("edited") else {}),
+        },
+    }
+
+
+def measure_decode(count: int):
+    """업데이트당 해석 시간 (µs): parse_update, Update.de_json(설치된 경우)"""
+    updates = [sample_update(index, SAMPLE_MESSAGES[index % len(SAMPLE_MESSAGES)]) for index in range(count)]
+    start = time.perf_counter()
+    for update in updates:
+        parse_update(update)
+    slim_us = (time.perf_counter() - start) / count * 1e6
+
+    try:
+        from telegram import Bot, Update
+    except ImportError:
+        return slim_us, None
+    bot = Bot(TOKEN)
+    start = time.perf_counter()
+    for update in updates:
+        Update.de_json(update, bot)
+    return slim_us, (time.perf_counter() - start) / count * 1e6
+
+
+async def measure_send(base_url: str, server: StandInBotApi, count: int, pooled: bool):
+    """sendMessage를 count번 보내고 (요청당 ms, 대역 서버가 받은 연결 수) 반환"""
+    if pooled:
+        client = BotApiClient(TOKEN, base_url)
+    else:
+        # 유휴 연결을 보관하지 않음 (요청마다 새 연결)
+        client = BotApiClient(TOKEN, http=httpx.AsyncClient(
+            base_url=base_url, limits=httpx.Limits(max_keepalive_connections=0)
+        ))
+    connections = server.connections
+    start = time.perf_counter()
+    for index in range(count):
+        await client.send_message(42, f"견적 {index}")
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return elapsed / count * 1000, server.connections - connections
+
+
+def run_webhook(base_url: str, server: StandInBotApi, server_worker: LoopWorker):
+    """api/webhook.handler로 메시지/수정 메시지/명령어를 보내고 대역 서버가 받은 호출 반환"""
+    os.environ["TELEGRAM_BOT_TOKEN"] = TOKEN
+    os.environ["TELEGRAM_API_BASE_URL"] = base_url
+    os.environ.pop("ALLOWED_CHAT_IDS", None)
+    import api.webhook as webhook
+
+    from calculator.requote import requote
+    from parsers.message_parser import MessageParser
+    from utils.formatter import format_all_results
+
+    first, edited = SAMPLE_MESSAGES[0], SAMPLE_MESSAGES[0].replace("일반 90,000만원", "일반 80,000만원")
+    bodies = [
+        sample_update(1, "/start@bench_bot"),
+        sample_update(2, first, chat_type="supergroup"),
+        sample_update(3, edited, kind="edited_message", chat_type="supergroup", message_id=2),
+    ]
+    server.calls.clear()
+    connections = server.connections
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        for body in bodies:
+            response = webhook.handler(SimpleNamespace(method="POST", path="/api/webhook", body=json.dumps(body)))
+            if response["statusCode"] != 200:
+                raise RuntimeError(f"웹훅 응답 {response}")
+        connections = server.connections - connections
+        webhook.get_loop_worker().shutdown()
+
+    expected_first = format_all_results(requote(MessageParser().parse(first)).results)
+    expected_edit = format_all_results(requote(MessageParser().parse(edited)).results)
+    return server.calls, connections, expected_first, expected_edit
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    failures = []
+
+    slim_us, de_json_us = measure_decode(count * 10)
+    line = f"업데이트 해석: parse_update {slim_us:.1f} µs"
+    line += f", Update.de_json {de_json_us:.1f} µs ({de_json_us / slim_us:.0f}x)" if de_json_us else " (python-telegram-bot 미설치, de_json 비교 건너뜀)"
+    print(line)
+
+    server = StandInBotApi()
+    server_worker = LoopWorker(name="stand-in-bot-api")
+    base_url = f"http://127.0.0.1:{server_worker.run(server.start())}"
+    try:
+        fresh_ms, fresh_connections = server_worker.run(measure_send(base_url, server, count, pooled=False))
+        pooled_ms, pooled_connections = server_worker.run(measure_send(base_url, server, count, pooled=True))
+        print(f"sendMessage {count}건: 요청마다 새 연결 {fresh_ms:.3f} ms/건 (연결 {fresh_connections}개)")
+        print(f"                 연결 풀 재사용   {pooled_ms:.3f} ms/건 (연결 {pooled_connections}개, {fresh_ms / pooled_ms:.1f}x)")
+        if pooled_connections != 1:
+            failures.append(f"연결 풀이 연결을 재사용하지 않음 (연결 {pooled_connections}개)")
+
+        async def reconnect_check():
+            client = BotApiClient(TOKEN, base_url)
+            connections = server.connections
+            await client.send_message(42, "첫 요청")
+            await server.drop_idle_connections()
+            server.chunked = True
+            try:
+                sent = await client.send_message(42, "끊긴 뒤 요청")
+            finally:
+                server.chunked = False
+                await client.close()
+            return sent, server.connections - connections
+
+        sent, reconnections = server_worker.run(reconnect_check())
+        print(f"유휴 연결이 끊긴 뒤 재전송: 연결 {reconnections}개, chunked 응답 message_id {sent['message_id']}")
+        if sent.get("text") != "끊긴 뒤 요청" or reconnections != 2:
+            failures.append("유휴 연결이 끊긴 뒤 다시 보내지 못함")
+
+        async def no_replay_check():
+            client = BotApiClient(TOKEN, base_url)
+            await client.send_message(42, "첫 요청")
+            server.drop_after_request = 1
+            try:
+                await client.send_message(42, "응답 전에 끊긴 요청")
+            except httpx.HTTPError as e:
+                error = e
+            else:
+                error = None
+            finally:
+                server.drop_after_request = 0
+                await client.close()
+            return error
+
+        error = server_worker.run(no_replay_check())
+        received = sum(1 for _, params in server.calls if params.get("text") == "응답 전에 끊긴 요청")
+        print(f"요청을 보낸 뒤 끊김: {type(error).__name__ if error else '오류 없음'}, 서버가 받은 횟수 {received}")
+        if error is None or received != 1:
+            failures.append(f"요청을 보낸 뒤 끊긴 연결에서 다시 보냄 (서버가 받은 횟수 {received})")
+
+        calls, webhook_connections, expected_first, expected_edit = run_webhook(base_url, server, server_worker)
+        methods = [method for method, _ in calls]
+        print(f"웹훅 경로: {methods} (연결 {webhook_connections}개)")
+        if methods != ["sendMessage", "sendMessage", "editMessageText"]:
+            failures.append(f"웹훅 호출 순서가 다름: {methods}")
+        else:
+            (_, welcome), (_, reply), (_, edit) = calls
+            if welcome["chat_id"] != 42 or "reply_to_message_id" in welcome or "환영" not in welcome["text"]:
+                failures.append(f"/start 답장이 다름: {welcome}")
+            if reply.get("reply_to_message_id") != 2 or reply["text"] != expected_first:
+                failures.append("그룹 답장이 원래 메시지를 인용하지 않거나 내용이 다름")
+            if edit["message_id"] != server._message_id - 1 or edit["text"] != expected_edit:
+                failures.append("수정 메시지가 기존 답장을 고치지 않음")
+        if webhook_connections != 1:
+            failures.append(f"웹훅 요청 간 연결을 재사용하지 않음 (연결 {webhook_connections}개)")
+    finally:
+        server_worker.shutdown()
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("✅ 연결 재사용, 재연결(보낸 뒤 끊기면 재전송 안 함), 웹훅 답장/수정 모두 정상")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+추적 로그(tracing) 비용 측정 스크립트
+샘플 메시지의 파싱 + 전체 금융사 계산을 추적 off / debug 상태로 각각 반복 실행하여
+메시지당 처리 시간을 비교합니다. (debug 출력은 os.devnull로 버림)
+
+사용법: python scripts/bench_tracing.py [반복 횟수]
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 같은 입력을 반복 계산하므로 견적/금융사별 결과 캐시를 끄고 실제 계산 시간을 측정
+os.environ.setdefault("QUOTE_CACHE_SIZE", "0")
+os.environ.setdefault("BANK_RESULT_CACHE_SIZE", "0")
+
+from parsers.message_parser import MessageParser
+from calculator.base_calculator import BaseCalculator
+from utils.tracing import configure_tracing, set_trace_stream
+from scripts.bench_samples import SAMPLE_MESSAGES
+
+
+def run_once(parser: MessageParser) -> None:
+    """샘플 메시지 전체를 한 번씩 파싱/계산"""
+    for message in SAMPLE_MESSAGES:
+        parsed_data = parser.parse(message)
+        BaseCalculator.calculate_all_banks(parsed_data)
+
+
+def measure(label: str, spec: str, rounds: int) -> float:
+    """
+    추적 레벨을 적용한 상태로 반복 실행하여 메시지당 평균 시간(µs) 반환
+
+    Args:
+        label: 출력용 이름
+        spec: MORTGAGE_TRACE 형식 레벨 설정
+        rounds: 반복 횟수
+    """
+    configure_tracing(spec)
+    parser = MessageParser()
+    run_once(parser)  # 레지스트리 로드 등 워밍업
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        run_once(parser)
+    elapsed = time.perf_counter() - start
+
+    per_message = elapsed / (rounds * len(SAMPLE_MESSAGES)) * 1_000_000
+    print(f"{label:<8} {per_message:10.1f} µs/메시지")
+    return per_message
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    with open(os.devnull, "w") as devnull:
+        set_trace_stream(devnull)
+        off = measure("off", "off", rounds)
+        debug = measure("debug", "debug", rounds)
+        configure_tracing("off")
+
+    print(f"debug/off: {debug / off:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+웹훅 업데이트 중복 처리 방지(utils/update_dedup) 측정/확인 스크립트
+
+    1. 재전송: 처리가 느린 동안 텔레그램이 같은 업데이트를 다시 보내는 상황을 api/webhook.handler로 흉내내어
+       중복 처리 방지를 켠 경우와 끈 경우의 처리(계산/답장) 횟수, 중복 응답 시간을 비교
+    2. 동시 처리 수 초과(503)로 처리하지 못한 업데이트는 다시 오면 처리되는지
+    3. SQLite: 여러 프로세스가 같은 파일로 같은 update_id를 받으면 한 번만 처리되는지, claim 시간 (메모리와 비교)
+    4. GET 응답에 중복으로 걸러낸 횟수가 나오는지
+
+같은 업데이트가 두 번 처리되거나 처리해야 할 업데이트가 걸러지면 실패로 종료합니다.
+
+사용법: python scripts/bench_update_dedup.py [업데이트 수] [재전송 횟수]
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import asyncio
+import tempfile
+import threading
+import contextlib
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.pop("UPDATE_DEDUP_DB", None)
+
+import api.webhook as webhook
+from api.webhook import WebhookApplication
+from utils.loop_worker import LoopWorker
+from utils.update_dedup import SqliteUpdateDeduplicator, UpdateDeduplicator
+from scripts.bench_samples import SAMPLE_MESSAGES
+from scripts.bench_telegram_client import sample_update
+
+
+def install(processing: float, processed: list, dedup_size: int, max_in_flight: int = 32):
+    """처리에 processing초 걸리는 가짜 애플리케이션과 새 중복 처리 방지/워커 설치"""
+
+    async def process_update(update, reply_slot):
+        await asyncio.sleep(processing)  # 계산 + sendMessage
+        processed.append(update.update_id)
+
+    webhook.application = WebhookApplication(
+        bot=None, process_update=process_update, allowed_chat_ids=frozenset()
+    )
+    webhook._loop_worker = LoopWorker(max_in_flight, "bench-dedup-loop")
+    webhook._update_deduplicator = UpdateDeduplicator(dedup_size)
+
+
+def post(body):
+    """웹훅 요청 하나 (응답 코드, 건너뛴 이유, 걸린 ms)"""
+    start = time.perf_counter()
+    response = webhook.handler(SimpleNamespace(method="POST", path="/api/webhook", body=json.dumps(body)))
+    elapsed = (time.perf_counter() - start) * 1000
+    return response["statusCode"], json.loads(response["body"]).get("skipped"), elapsed
+
+
+def retry_storm(updates: int, retries: int, dedup_size: int, processing: float):
+    """업데이트마다 처리 중에 retries번 다시 보내고 (처리 횟수, 중복 응답 평균 ms, 응답 코드별 개수) 반환"""
+    processed = []
+    install(processing, processed, dedup_size)
+    bodies = [sample_update(index + 1, SAMPLE_MESSAGES[index % len(SAMPLE_MESSAGES)]) for index in range(updates)]
+
+    def deliver(body):
+        # 첫 전송이 처리 중일 때 재전송 (텔레그램은 응답이 늦으면 같은 업데이트를 다시 보냄)
+        with ThreadPoolExecutor(max_workers=retries + 1) as pool:
+            first = pool.submit(post, body)
+            time.sleep(processing / 4)
+            again = [pool.submit(post, body) for _ in range(retries)]
+            return [first.result()] + [future.result() for future in again]
+
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = [result for group in pool.map(deliver, bodies) for result in group]
+    webhook._loop_worker.shutdown()
+
+    duplicate_ms = [elapsed for _, skipped, elapsed in results if skipped == "duplicate"]
+    codes = {code: [result[0] for result in results].count(code) for code in sorted({result[0] for result in results})}
+    return len(processed), sum(duplicate_ms) / len(duplicate_ms) if duplicate_ms else 0.0, codes
+
+
+def busy_release_check():
+    """동시 처리 수 1에서 503을 받은 업데이트가 재전송 시 처리되는지 (처리된 update_id 목록)"""
+    processed = []
+    install(0.2, processed, 4096, max_in_flight=1)
+    busy_wait, webhook.BUSY_WAIT = webhook.BUSY_WAIT, 0.01
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            first = threading.Thread(target=post, args=(sample_update(1, SAMPLE_MESSAGES[0]),))
+            first.start()
+            time.sleep(0.05)
+            busy = post(sample_update(2, SAMPLE_MESSAGES[1]))[0]
+            first.join()
+            retried = post(sample_update(2, SAMPLE_MESSAGES[1]))[0]
+    finally:
+        webhook.BUSY_WAIT = busy_wait
+        webhook._loop_worker.shutdown()
+    return busy, retried, processed
+
+
+def claim_worker(path: str, count: int, start_event) -> int:
+    """다른 프로세스에서 같은 update_id들을 claim하고 처리하겠다고 받은 수 반환"""
+    deduplicator = SqliteUpdateDeduplicator(path, max_size=count * 2)
+    start_event.wait()
+    claimed = sum(deduplicator.claim(update_id) for update_id in range(count))
+    deduplicator.close()
+    return claimed
+
+
+def claim_time(deduplicator, count: int) -> float:
+    """claim 한 번의 평균 µs (모두 새 update_id)"""
+    start = time.perf_counter()
+    for update_id in range(count):
+        deduplicator.claim(update_id)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main():
+    updates = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    retries = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    processing = 0.2
+    failures = []
+
+    print(f"업데이트 {updates}건, 처리 중 재전송 {retries}회씩 (처리 {processing * 1000:.0f} ms)")
+    plain_processed, _, plain_codes = retry_storm(updates, retries, 0, processing)
+    print(f"  중복 처리 방지 끔   처리 {plain_processed:>4}건, 응답 {plain_codes}")
+    dedup_processed, duplicate_ms, dedup_codes = retry_storm(updates, retries, 4096, processing)
+    print(f"  중복 처리 방지 켬   처리 {dedup_processed:>4}건, 응답 {dedup_codes}, 중복 응답 평균 {duplicate_ms:.2f} ms")
+    stats = webhook._update_deduplicator.stats()
+    print(f"  통계: 처리 {stats.processed}, 중복 {stats.duplicates} (중복 비율 {stats.duplicate_rate:.0%})")
+    if dedup_processed != updates:
+        failures.append(f"중복 처리 방지를 켰는데 {dedup_processed}건 처리 (업데이트 {updates}건)")
+    if stats.duplicates != updates * retries:
+        failures.append(f"중복 횟수가 다름 ({stats.duplicates} != {updates * retries})")
+
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        get_response = webhook.handler(SimpleNamespace(method="GET", path="/api/webhook", body=None))
+    get_body = json.loads(get_response["body"])
+    print(f"  GET dedup: {get_body.get('dedup')}")
+    if (get_body.get("dedup") or {}).get("duplicates") != stats.duplicates:
+        failures.append("GET 응답에 중복 통계가 없음")
+
+    busy, retried, processed = busy_release_check()
+    print(f"  동시 처리 수 초과: 첫 응답 {busy}, 재전송 응답 {retried}, 처리 {processed}")
+    if busy != 503 or retried != 200 or sorted(processed) != [1, 2]:
+        failures.append("503 응답한 업데이트가 재전송 시 처리되지 않음")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "updates.sqlite3")
+        count = 2000
+        context = multiprocessing.get_context("spawn")
+        start_event = context.Manager().Event()
+        with context.Pool(2) as pool:
+            pending = [pool.apply_async(claim_worker, (path, count, start_event)) for _ in range(2)]
+            time.sleep(0.5)
+            start_event.set()
+            claimed = [result.get() for result in pending]
+        print(f"SQLite 프로세스 2개가 같은 update_id {count}개를 받음: 처리 {claimed} (합계 {sum(claimed)})")
+        if sum(claimed) != count:
+            failures.append(f"여러 프로세스에서 중복 처리됨 (합계 {sum(claimed)} != {count})")
+
+        sqlite = SqliteUpdateDeduplicator(os.path.join(directory, "timing.sqlite3"), max_size=count)
+        memory_us = claim_time(UpdateDeduplicator(count), count)
+        sqlite_us = claim_time(sqlite, count)
+        expired = SqliteUpdateDeduplicator(os.path.join(directory, "expire.sqlite3"), window=0.05)
+        expired.claim(1)
+        time.sleep(0.1)
+        reclaimed = expired.claim(1)
+        print(f"claim 시간: 메모리 {memory_us:.1f} µs, SQLite {sqlite_us:.1f} µs / 유효 시간이 지난 update_id 다시 처리: {reclaimed}")
+        if not reclaimed:
+            failures.append("유효 시간이 지난 update_id가 계속 걸러짐")
+        sqlite.close()
+        expired.close()
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("✅ 재전송된 업데이트는 한 번만 처리, 처리하지 못한 업데이트는 다시 처리")
+
+
+if __name__ == "__main__":
+    main()
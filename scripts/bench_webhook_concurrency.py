@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+웹훅 동시 처리 측정 스크립트
+api/webhook.handler에 동시에 POST 요청을 보내 처리량을 측정합니다.
+텔레그램 대신 가짜 애플리케이션(실제 파싱/계산 + 답장 전송 대기 시간 흉내)을 넣어 실행하며,
+요청을 하나씩 처리하는 경우(동시 처리 수 1, 이전 방식처럼 직렬화)와 기본 동시 처리 수를 비교합니다.
+모든 요청이 처리되지 않거나 기본 설정의 처리량이 직렬 처리보다 높지 않으면 실패로 종료합니다.
+
+사용법: python scripts/bench_webhook_concurrency.py [요청 수] [동시 요청 스레드 수] [답장 대기 ms]
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 매 요청 실제 계산을 하도록 결과 캐시는 끔
+os.environ["QUOTE_CACHE_SIZE"] = "0"
+os.environ["BANK_RESULT_CACHE_SIZE"] = "0"
+
+import api.webhook as webhook
+from api.webhook import WebhookApplication
+from parsers.message_parser import MessageParser
+from calculator.requote import requote
+from utils.formatter import format_all_results
+from utils.loop_worker import LoopWorker
+from scripts.bench_samples import SAMPLE_MESSAGES
+
+
+def fake_application(reply_latency: float, processed: list) -> WebhookApplication:
+    """파싱/계산/포맷은 실제로 하고 답장 전송은 reply_latency초 대기로 대신하는 애플리케이션"""
+
+    async def process_update(update, reply_slot):
+        record = requote(MessageParser().parse(update.text))
+        format_all_results(record.results)
+        await asyncio.sleep(reply_latency)  # sendMessage 왕복
+        processed.append(update.update_id)
+
+    return WebhookApplication(
+        bot=None,
+        process_update=process_update,
+        allowed_chat_ids=frozenset()
+    )
+
+
+def run(max_in_flight: int, requests: int, threads: int, reply_latency: float):
+    """동시 요청을 보내고 (경과 시간, 처리된 요청 수, 응답 코드별 개수) 반환"""
+    processed = []
+    webhook.application = fake_application(reply_latency, processed)
+    webhook._loop_worker = LoopWorker(max_in_flight, "bench-webhook-loop")
+    webhook._update_deduplicator = None
+
+    bodies = [
+        json.dumps({"update_id": index, "message": {
+            "message_id": index, "chat": {"id": 42, "type": "private"}, "text": SAMPLE_MESSAGES[index % len(SAMPLE_MESSAGES)]
+        }})
+        for index in range(requests)
+    ]
+
+    def post(body):
+        return webhook.handler(SimpleNamespace(method="POST", path="/api/webhook", body=body))["statusCode"]
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            status_codes = list(pool.map(post, bodies))
+    elapsed = time.perf_counter() - start
+    webhook._loop_worker.shutdown()
+
+    counts = {code: status_codes.count(code) for code in sorted(set(status_codes))}
+    return elapsed, len(processed), counts
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    reply_latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 50.0) / 1000
+
+    print(f"요청 {requests}건, 동시 요청 스레드 {threads}개, 답장 대기 {reply_latency * 1000:.0f} ms")
+    serial_elapsed, serial_done, serial_counts = run(1, requests, threads, reply_latency)
+    print(f"직렬 처리 (동시 1)   {requests / serial_elapsed:8.1f} 요청/초, 처리 {serial_done}건, 응답 {serial_counts}")
+    worker_elapsed, worker_done, worker_counts = run(32, requests, threads, reply_latency)
+    print(f"이벤트 루프 워커 (동시 32) {requests / worker_elapsed:8.1f} 요청/초, 처리 {worker_done}건, 응답 {worker_counts}"
+          f" ({serial_elapsed / worker_elapsed:.1f}x)")
+
+    if worker_done != requests or worker_counts != {200: requests}:
+        print("❌ 처리되지 않은 요청이 있음")
+        sys.exit(1)
+    if worker_elapsed >= serial_elapsed:
+        print("❌ 동시 처리량이 직렬 처리보다 높지 않음")
+        sys.exit(1)
+    print("✅ 모든 요청 처리, 동시 요청이 같은 루프에서 겹쳐서 처리됨")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+웹훅 응답 본문 답장(WEBHOOK_REPLY_IN_RESPONSE) 측정/확인 스크립트
+로컬 Bot API 대역 서버(응답 전 대기 시간으로 네트워크 왕복 흉내)를 띄우고 api/webhook.handler에 메시지를 보내,
+답장을 별도 요청으로 보내는 경우와 응답 본문으로 반환하는 경우의 요청당 처리 시간을 비교합니다.
+
+확인 항목:
+    - 응답 본문 모드: 답장이 응답 본문(sendMessage)으로 나가고 대역 서버로는 요청이 가지 않음
+    - 길이 제한을 넘는 답장은 나눠서 직접 보냄
+    - 응답 본문으로 보낸 답장의 원래 메시지를 수정하면 결과가 같을 때는 답장하지 않음
+    - 핸들러가 먼저 응답한 뒤(처리 시간 초과)에는 응답 본문으로 넘기지 못함
+
+답장 내용이 직접 보낸 경우와 다르거나 응답 본문 모드가 더 빠르지 않으면 실패로 종료합니다.
+
+사용법: python scripts/bench_webhook_reply.py [메시지 수] [왕복 ms]
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import contextlib
+from types import SimpleNamespace
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 채팅방별 수락/전송 간격 제한은 scripts/bench_admission.py에서 확인 (여기서는 왕복 시간만 측정)
+os.environ.setdefault("QUOTE_CHAT_RATE", "0")
+os.environ.setdefault("TELEGRAM_CHAT_SEND_INTERVAL", "0")
+
+import api.webhook as webhook
+import utils.telegram_update as telegram_update
+from utils.loop_worker import LoopWorker
+from utils.telegram_update import WebhookReplySlot
+from scripts.bench_samples import SAMPLE_MESSAGES
+from scripts.bench_telegram_client import TOKEN, StandInBotApi, sample_update
+
+
+def post_all(bodies, reply_in_response: bool, base_url: str):
+    """새 애플리케이션으로 업데이트를 하나씩 보내고 (요청당 ms, 응답 본문 목록) 반환"""
+    os.environ["TELEGRAM_BOT_TOKEN"] = TOKEN
+    os.environ["TELEGRAM_API_BASE_URL"] = base_url
+    os.environ["WEBHOOK_REPLY_IN_RESPONSE"] = "1" if reply_in_response else "0"
+    os.environ.pop("ALLOWED_CHAT_IDS", None)
+    webhook.application = None
+    webhook._update_deduplicator = None
+
+    responses = []
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        # 연결/모듈 로드는 측정에서 제외
+        webhook.handler(SimpleNamespace(method="POST", path="/api/webhook", body=json.dumps(sample_update(0, "/help"))))
+        start = time.perf_counter()
+        for body in bodies:
+            response = webhook.handler(SimpleNamespace(method="POST", path="/api/webhook", body=json.dumps(body)))
+            responses.append(json.loads(response["body"]))
+        elapsed = time.perf_counter() - start
+        webhook.get_loop_worker().shutdown()
+    return elapsed / len(bodies) * 1000, responses
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 40.0) / 1000
+    bodies = [
+        sample_update(index + 1, SAMPLE_MESSAGES[index % len(SAMPLE_MESSAGES)], chat_type="supergroup")
+        for index in range(count)
+    ]
+    failures = []
+
+    server = StandInBotApi()
+    server.latency = latency
+    server_worker = LoopWorker(name="stand-in-bot-api")
+    base_url = f"http://127.0.0.1:{server_worker.run(server.start())}"
+    try:
+        server.calls.clear()
+        outbound_ms, _ = post_all(bodies, False, base_url)
+        sent = [params for method, params in server.calls if method == "sendMessage"][1:]
+
+        server.calls.clear()
+        inline_ms, responses = post_all(bodies, True, base_url)
+        inline_calls = len(server.calls)
+
+        print(f"메시지 {count}건, Bot API 왕복 {latency * 1000:.0f} ms")
+        print(f"  별도 요청으로 답장   {outbound_ms:7.1f} ms/건")
+        print(f"  응답 본문으로 답장   {inline_ms:7.1f} ms/건 ({outbound_ms - inline_ms:.1f} ms 단축, 대역 서버 요청 {inline_calls}건)")
+
+        expected = [dict(params, method="sendMessage") for params in sent]
+        if responses != expected:
+            failures.append("응답 본문 답장이 직접 보낸 답장과 다름")
+        if inline_calls != 0:
+            failures.append(f"응답 본문 모드에서 대역 서버로 요청이 감 ({inline_calls}건)")
+        if inline_ms >= outbound_ms:
+            failures.append("응답 본문 모드가 더 빠르지 않음")
+
+        # 길이 제한을 넘는 답장: 제한을 줄여 나눠 보내는지 확인
+        split_text = telegram_update.split_text
+        telegram_update.split_text = lambda text: split_text(text, 120)
+        server.latency = 0.0
+        server.calls.clear()
+        try:
+            _, responses = post_all(bodies[2:3], True, base_url)
+        finally:
+            telegram_update.split_text = split_text
+        parts = [
+            params["text"] for method, params in server.calls
+            if method == "sendMessage" and params["chat_id"] == expected[2]["chat_id"]
+        ]
+        print(f"  긴 답장: 직접 {len(parts)}건으로 나눠 보냄, 응답 본문 {responses[0]}")
+        if len(parts) < 2 or responses[0] != {"ok": True} or any(len(part) > 120 for part in parts) \
+                or "\n".join(parts).replace("\n", "") != expected[2]["text"].replace("\n", ""):
+            failures.append("긴 답장을 나눠서 직접 보내지 않음")
+
+        # 응답 본문으로 답장한 메시지를 수정: 결과가 같으면 답장하지 않음
+        message = sample_update(7, SAMPLE_MESSAGES[0], chat_type="supergroup")
+        edited = sample_update(8, SAMPLE_MESSAGES[0] + "\n", kind="edited_message", chat_type="supergroup", message_id=7)
+        server.calls.clear()
+        _, responses = post_all([message, edited], True, base_url)
+        print(f"  결과가 같은 수정 메시지: 응답 본문 {responses[1]}, 대역 서버 요청 {len(server.calls)}건")
+        if responses[0].get("method") != "sendMessage" or responses[1] != {"ok": True} or server.calls:
+            failures.append("결과가 같은 수정 메시지에 다시 답장함")
+
+        slot = WebhookReplySlot()
+        slot.take()
+        if slot.offer("sendMessage", {"chat_id": 1, "text": "늦은 답장"}):
+            failures.append("핸들러가 응답한 뒤에도 응답 본문으로 넘겨짐")
+    finally:
+        os.environ.pop("WEBHOOK_REPLY_IN_RESPONSE", None)
+        server_worker.shutdown()
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("✅ 응답 본문 답장이 직접 보낸 답장과 같고 왕복 한 번만큼 빠름")
+
+
+if __name__ == "__main__":
+    main()
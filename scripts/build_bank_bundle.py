@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+금융사 설정 번들(data/banks.bundle) 생성 스크립트
+Vercel 배포 빌드 단계(vercel.json의 buildCommand)에서 실행되며, 번들은 저장소에 커밋하지 않습니다.
+로컬에서는 data/banks의 설정 파일이나 calculator 패키지 코드를 고친 뒤 실행하여 번들을 다시 만듭니다.
+(번들이 없거나 맞지 않으면 서버는 설정 파일에서 로드하므로 계산 결과는 같고 콜드 스타트만 느려짐)
+
+사용법:
+    python scripts/build_bank_bundle.py           # 번들 생성
+    python scripts/build_bank_bundle.py --check   # 번들이 현재 설정/코드와 맞는지 확인 (맞지 않으면 실패로 종료)
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator.base_calculator import BaseCalculator
+from calculator.bank_bundle import DEFAULT_BUNDLE_PATH, load_bundle
+from calculator.bank_registry import BankRegistry
+
+
+def check(path: str) -> bool:
+    """번들이 현재 설정 파일/계산기 코드와 맞는지 확인"""
+    registry = BankRegistry(BaseCalculator)
+    bundle, reason = load_bundle(path, BaseCalculator, registry.banks_dir, registry._list_config_files())
+    if bundle is None:
+        print(f"❌ 번들을 사용할 수 없음: {reason}")
+        print("   python scripts/build_bank_bundle.py 로 다시 만드세요.")
+        return False
+
+    # 번들 계산기의 설정이 설정 파일과 같은지 확인
+    expected = {calculator.bank_name: calculator.config for calculator in registry.snapshot().calculators}
+    actual = {entry.calculator.bank_name: entry.calculator.config for entry in bundle.entries}
+    if actual != expected:
+        print("❌ 번들의 설정이 설정 파일과 다름")
+        return False
+    print(f"✅ 번들이 현재 설정/코드와 일치 ({', '.join(f'{e.filename}@{e.digest}' for e in bundle.entries)})")
+    return True
+
+
+def main():
+    path = os.path.normpath(DEFAULT_BUNDLE_PATH)
+    if "--check" in sys.argv[1:]:
+        sys.exit(0 if check(path) else 1)
+
+    count = BankRegistry(BaseCalculator).save_bundle(path)
+    print(f"✅ 금융사 {count}개 번들 저장: {path} ({os.path.getsize(path):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+계산기 동시성 부하 테스트 스크립트
+하나의 계산기 스냅샷(공유 인스턴스)으로 수천 건의 계산을 스레드 풀에서 동시에 실행하고
+결과가 순차 실행 결과와 완전히 같은지 확인합니다.
+
+사용법: python scripts/stress_concurrency.py [반복 횟수] [스레드 수]
+"""
+
+import sys
+import os
+import copy
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 같은 입력을 반복 계산하므로 견적/금융사별 결과 캐시를 끄고 계산기 자체를 검증
+os.environ.setdefault("QUOTE_CACHE_SIZE", "0")
+os.environ.setdefault("BANK_RESULT_CACHE_SIZE", "0")
+
+from parsers.message_parser import MessageParser
+from calculator.base_calculator import BaseCalculator
+from scripts.bench_samples import SAMPLE_MESSAGES
+
+
+def build_cases():
+    """
+    샘플 메시지를 파싱한 뒤 신용점수/필요자금/요청사항을 바꿔 가며 입력 조합 생성
+    (OK저축은행 가계/사업자, 대환/후순위, 택시 한도 등 분기를 고루 통과하도록)
+    """
+    parser = MessageParser()
+    parsed_samples = [parser.parse(message) for message in SAMPLE_MESSAGES]
+
+    credit_scores = [None, 600, 760, 880, 950]
+    required_amounts = [None, 3000]
+    requests_list = [None, "신한은행 대환 가계자금 거치식", "선순위 대환 6개월 변동금리"]
+
+    cases = []
+    for parsed_data, credit_score, required_amount, requests in itertools.product(
+        parsed_samples, credit_scores, required_amounts, requests_list
+    ):
+        case = copy.deepcopy(parsed_data)
+        case["credit_score"] = credit_score
+        case["required_amount"] = required_amount
+        if requests is not None:
+            case["requests"] = requests
+            for mortgage in case.get("mortgages", []):
+                mortgage["is_refinance"] = True
+        cases.append(case)
+    return cases
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+    # 스레드 전환을 자주 일으켜 공유 상태 경합을 드러냄
+    sys.setswitchinterval(1e-6)
+
+    cases = build_cases()
+    expected = [BaseCalculator.calculate_all_banks(case) for case in cases]
+
+    jobs = list(range(len(cases))) * rounds
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        actual = list(executor.map(lambda index: BaseCalculator.calculate_all_banks(cases[index]), jobs))
+
+    mismatches = [
+        (job_number, index) for job_number, (index, result) in enumerate(zip(jobs, actual))
+        if result != expected[index]
+    ]
+
+    print(f"입력 조합 {len(cases)}개 x {rounds}회 = 계산 {len(jobs)}건 (스레드 {workers}개)")
+    if mismatches:
+        job_number, index = mismatches[0]
+        print(f"❌ 순차 실행과 다른 결과 {len(mismatches)}건 (첫 번째: 작업 {job_number}, 입력 {index})")
+        print(f"순차: {expected[index]}")
+        print(f"동시: {actual[job_number]}")
+        sys.exit(1)
+    print("✅ 모든 결과가 순차 실행과 동일")
+
+
+if __name__ == "__main__":
+    main()
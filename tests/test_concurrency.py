@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+공유 계산기 스냅샷 동시 실행 결과 고정
+여러 스레드가 같은 계산기 인스턴스로 동시에 계산해도 결과가 순차 실행과 같아야 함
+(큰 규모의 부하 테스트는 scripts/stress_concurrency.py)
+"""
+
+import copy
+import itertools
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator.base_calculator import BaseCalculator
+from parsers.message_parser import MessageParser
+from scripts.bench_samples import SAMPLE_MESSAGES
+
+
+ROUNDS = 20
+WORKERS = 8
+
+
+@pytest.fixture
+def uncached_calculator(monkeypatch):
+    """
+    견적/금융사별 결과 캐시를 끈 계산기 클래스 (같은 입력을 반복 계산해도 매번 계산기를 거치도록)
+    레지스트리는 계산기 클래스별이므로 새 하위 클래스로 캐시 설정이 다른 레지스트리를 만듦
+    """
+    monkeypatch.setenv("QUOTE_CACHE_SIZE", "0")
+    monkeypatch.setenv("BANK_RESULT_CACHE_SIZE", "0")
+    monkeypatch.setenv("BANK_CONFIG_BUNDLE", "0")
+    return type("UncachedCalculator", (BaseCalculator,), {})
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    """스레드 전환을 자주 일으켜 공유 상태 경합을 드러냄"""
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(previous)
+
+
+def build_cases():
+    """샘플 메시지의 신용점수/필요자금/요청사항을 바꿔 가며 입력 조합 생성 (OK저축은행, 대환 분기 포함)"""
+    parser = MessageParser()
+    cases = []
+    for message, credit_score, requests in itertools.product(
+        SAMPLE_MESSAGES, [None, 600, 880], [None, "신한은행 대환 가계자금 거치식"]
+    ):
+        case = copy.deepcopy(parser.parse(message))
+        case["credit_score"] = credit_score
+        if requests is not None:
+            case["requests"] = requests
+            for mortgage in case.get("mortgages", []):
+                mortgage["is_refinance"] = True
+        cases.append(case)
+    return cases
+
+
+def test_shared_calculators_match_serial_run(uncached_calculator, frequent_thread_switches):
+    cases = build_cases()
+    expected = [uncached_calculator.calculate_all_banks(case) for case in cases]
+
+    jobs = list(range(len(cases))) * ROUNDS
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        actual = list(executor.map(lambda index: uncached_calculator.calculate_all_banks(cases[index]), jobs))
+
+    for index, result in zip(jobs, actual):
+        assert result == expected[index], f"입력 {index}의 동시 실행 결과가 순차 실행과 다름"
+
+
+def test_uncached_calculator_matches_default_calculator(uncached_calculator):
+    """캐시를 끈 계산기와 기본 계산기(캐시 사용)의 결과가 같음"""
+    for case in build_cases():
+        assert uncached_calculator.calculate_all_banks(case) == BaseCalculator.calculate_all_banks(case)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+금액 해석 변경(utils/money) 이후 파서 결과 고정
+이전 파서는 아래 표현을 잘못 읽었음 (괄호 안이 이전 값, 만원 단위):
+    필요자금 5천만      -> 5000   (5)
+    필요자금 1억 2천    -> 12000  (10000, 천 단위 무시)
+    KB시세: 17억 5천    -> 175000 (175)
+    KB시세 : 3억        -> 30000  (None, 콜론 앞 공백이 있으면 못 읽음)
+"""
+
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parsers.message_parser import MessageParser
+from utils.money import parse_kb_price, parse_money
+from utils.validators import parse_amount, validate_kb_price
+
+
+MESSAGE_TEMPLATE = (
+    "성   명 : 홍길동 (50)\n"
+    "직   업 : 직장인\n"
+    "신용점수 : 700\n"
+    "주   소 : 충청남도 천안시 서북구 1\n"
+    "면   적 : 25.95㎡\n"
+    "구   분 : 아파트\n"
+    "{kb_price}\n"
+    "=========설정내역=========\n"
+    "1순위 : 물상담보 하나은행\n"
+    "           24,000 (20,000)만원\n"
+    "========================\n"
+    "요청사항 : {requests}"
+)
+
+DEFAULT_KB_PRICE = "KB시세: 일반 90,000만원\n하한 85,000만원\n상한 95,000만원"
+
+
+def parse(kb_price: str = DEFAULT_KB_PRICE, requests: str = "필요자금 3000"):
+    return MessageParser().parse(MESSAGE_TEMPLATE.format(kb_price=kb_price, requests=requests))
+
+
+@pytest.mark.parametrize("requests, expected", [
+    ("필요자금 5천만", 5000.0),
+    ("필요자금 1억 2천", 12000.0),
+    ("필요자금 1억", 10000.0),
+    ("필요자금 10,000만원", 10000.0),
+    ("필요자금 3000", 3000.0),
+])
+def test_required_amount(requests, expected):
+    assert parse(requests=requests)["required_amount"] == expected
+
+
+@pytest.mark.parametrize("kb_price, expected", [
+    ("KB시세: 17억 5천", 175000.0),
+    ("KB시세 : 3억", 30000.0),
+    ("KB시세: 5억원", 50000.0),
+    (DEFAULT_KB_PRICE, 90000.0),
+])
+def test_kb_price(kb_price, expected):
+    assert parse(kb_price=kb_price)["kb_price"] == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("5천만", 5000),
+    ("1억 2천", 12000),
+    ("17억 5천", 175000),
+    ("3억", 30000),
+    ("1.5억", 15000),
+    ("12,500만원", 12500),
+])
+def test_parse_money(text, expected):
+    assert parse_money(text) == expected
+    assert parse_amount(text) == expected
+
+
+def test_kb_price_labels():
+    price = parse_kb_price("일반 90,000만원 하한 85,000만원 상한 95,000만원")
+    assert (price.general, price.lower, price.upper) == (90000, 85000, 95000)
+    assert validate_kb_price("17억 5천") == 175000
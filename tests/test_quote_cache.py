@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+견적 결과 캐시(calculator/quote_cache) 동작 고정
+LRU/TTL 제거, 계산기가 읽는 필드만으로 만든 지문, 설정 스냅샷 교체 시 비움
+"""
+
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import calculator.quote_cache as quote_cache_module
+from calculator.bank_registry import BankRegistry
+from calculator.base_calculator import BaseCalculator
+from calculator.quote_cache import DEFAULT_CACHE_SIZE, QuoteCache, quote_cache_from_env, quote_fingerprint
+
+
+PROPERTY = {
+    "kb_price": 90000, "property_type": "아파트", "address": "충청남도 천안시 서북구 1",
+    "region": "충청남도천안시서북구", "region_id": 128, "area": 25.95, "credit_score": 700,
+    "required_amount": 3000, "special_notes": None, "requests": "필요자금 3000",
+    "mortgages": [{"rank": 1, "amount": 20000, "max_amount": 24000, "institution": "하나은행", "is_refinance": False}],
+    "name": "홍길동", "age": 50,
+}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """캐시가 읽는 monotonic 시계를 직접 움직임"""
+    now = [1000.0]
+    monkeypatch.setattr(quote_cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_lru_evicts_least_recently_used():
+    cache = QuoteCache(max_size=2)
+    cache.put(1, "a", ["A"])
+    cache.put(1, "b", ["B"])
+    assert cache.get(1, "a") == ["A"]  # a를 최근 사용으로
+    cache.put(1, "c", ["C"])
+
+    assert cache.get(1, "b") is None
+    assert cache.get(1, "a") == ["A"]
+    assert cache.get(1, "c") == ["C"]
+    stats = cache.stats()
+    assert (stats.size, stats.evictions, stats.hits, stats.misses) == (2, 1, 3, 1)
+
+
+def test_ttl_expires_entries(clock):
+    cache = QuoteCache(max_size=4, ttl=10)
+    cache.put(1, "a", ["A"])
+    clock[0] += 9.9
+    assert cache.get(1, "a") == ["A"]
+    clock[0] += 0.2
+    assert cache.get(1, "a") is None
+    assert cache.stats().expirations == 1
+
+
+def test_returned_list_is_a_copy():
+    cache = QuoteCache()
+    cache.put(1, "a", ["A"])
+    cache.get(1, "a").append("B")
+    assert cache.get(1, "a") == ["A"]
+
+
+def test_disabled_cache_stores_nothing():
+    cache = QuoteCache(max_size=0)
+    assert not cache.enabled
+    cache.put(1, "a", ["A"])
+    assert cache.get(1, "a") is None
+
+
+def test_new_version_clears_and_stale_results_are_dropped():
+    cache = QuoteCache()
+    cache.put(1, "a", ["A"])
+    cache.invalidate(2)
+    assert cache.get(1, "a") is None
+    assert cache.stats().invalidations == 1
+
+    # 이전 스냅샷으로 계산이 끝난 결과는 저장하지 않음
+    cache.put(1, "a", ["A"])
+    assert cache.stats().size == 0
+    cache.put(2, "a", ["A2"])
+    assert cache.get(2, "a") == ["A2"]
+
+
+def test_fingerprint_ignores_fields_calculators_do_not_read():
+    other = dict(PROPERTY, name="김철수", age=35)
+    other["mortgages"] = [dict(PROPERTY["mortgages"][0], rank=2)]
+    assert quote_fingerprint(other) == quote_fingerprint(PROPERTY)
+
+
+@pytest.mark.parametrize("field, value", [
+    ("kb_price", 95000), ("credit_score", 880), ("requests", "선순위 대환"), ("region_id", 1),
+])
+def test_fingerprint_changes_with_read_fields(field, value):
+    assert quote_fingerprint(dict(PROPERTY, **{field: value})) != quote_fingerprint(PROPERTY)
+
+
+def test_fingerprint_includes_mortgages():
+    other = dict(PROPERTY, mortgages=[dict(PROPERTY["mortgages"][0], is_refinance=True)])
+    assert quote_fingerprint(other) != quote_fingerprint(PROPERTY)
+    assert quote_fingerprint(other, mortgage_fields=()) == quote_fingerprint(PROPERTY, mortgage_fields=())
+
+
+def test_unhashable_fingerprint_is_not_cached():
+    assert quote_fingerprint(dict(PROPERTY, special_notes=["목록"])) is None
+
+
+@pytest.mark.parametrize("value, expected", [("16", 16), ("0", 0), ("abc", DEFAULT_CACHE_SIZE), ("", DEFAULT_CACHE_SIZE)])
+def test_cache_size_from_env(monkeypatch, value, expected):
+    monkeypatch.setenv("QUOTE_CACHE_SIZE", value)
+    assert quote_cache_from_env().max_size == expected
+
+
+def test_registry_reload_clears_quote_cache():
+    cache = QuoteCache()
+    registry = BankRegistry(BaseCalculator, quote_cache=cache)
+    version = registry.snapshot().version
+    cache.put(version, "a", ["A"])
+
+    registry.reload()
+    assert cache.get(version, "a") is None
+    assert cache.stats().invalidations == 1
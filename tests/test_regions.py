@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+주소 -> 행정구역 매칭(utils/regions.match_region) 결과 고정
+정식 명칭 > 별칭(시/도 약칭, 옛 명칭, 시/구 글자 생략) > 광역 단위 지역명 순으로 찾음
+"""
+
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.regions import (
+    ALL_REGIONS, MIN_ALIAS_LENGTH, REGION_ALIASES, REGION_ID_BY_KEY, RegionMatcher, get_region_id, match_region
+)
+
+
+@pytest.mark.parametrize("address, region", [
+    # 정식 명칭
+    ("서울특별시 강남구 역삼동 1-1", "서울특별시강남구"),
+    ("경기도 수원시 영통구", "경기도수원시영통구"),
+    ("충청남도 천안시 서북구 1", "충청남도천안시서북구"),
+    ("경기도 광주시 오포읍", "경기도광주시"),
+    ("광주광역시 서구", "광주광역시서구"),
+    # 시/도 약칭
+    ("서울 강남구 역삼동 1-1", "서울특별시강남구"),
+    ("광주 서구", "광주광역시서구"),
+    ("서울 중구", "서울특별시중구"),
+    ("인천 중구", "인천광역시중구"),
+    # 옛 명칭
+    ("전라북도 전주시 완산구", "전북특별자치도전주시완산구"),
+    ("강원도 홍천군", "강원특별자치도홍천군"),
+    # 시/구 글자 생략
+    ("수원 영통 1", "경기도수원시영통구"),
+])
+def test_match_region(address, region):
+    assert match_region(address) == (region, get_region_id(region))
+
+
+@pytest.mark.parametrize("address, expected", [
+    ("부산 어딘가", ("부산", None)),  # 광역 단위로만 찾음
+    ("없는주소", (None, None)),
+    ("", (None, None)),
+    (None, (None, None)),
+])
+def test_match_region_without_district(address, expected):
+    assert match_region(address) == expected
+
+
+def test_canonical_names_match_themselves():
+    """모든 정식 명칭은 자기 자신으로 매칭됨 (별칭이 정식 명칭을 가리지 않음)"""
+    for region_id, region in enumerate(ALL_REGIONS):
+        assert match_region(region) == (region, region_id)
+
+
+def test_aliases_are_unambiguous():
+    """별칭은 최소 길이 이상이고 정식 명칭과 겹치지 않으며, 매칭하면 자기 지역이 나옴"""
+    for alias, region_id in REGION_ALIASES.items():
+        assert len(alias) >= MIN_ALIAS_LENGTH
+        assert alias not in REGION_ID_BY_KEY
+        assert match_region(alias) == (ALL_REGIONS[region_id], region_id)
+
+
+def test_region_matcher_prefers_earlier_pattern():
+    """포함된 패턴 중 앞에 있는(우선순위가 높은) 패턴의 값을 반환"""
+    matcher = RegionMatcher([("abc", 1), ("bc", 2), ("c", 3)])
+    assert matcher.find("xxabc") == 1
+    assert matcher.find("xxbc") == 2
+    assert matcher.find("cx") == 3
+    assert matcher.find("zz") is None
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+수정 메시지 재산출(calculator/requote) 동작 고정
+다시 계산한 결과는 처음부터 계산한 결과와 같고, 답장 정보는 이전 기록에서 이어받음
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator.base_calculator import BaseCalculator
+from calculator.requote import DEFAULT_STORE_SIZE, QuoteRecord, QuoteStore, quote_store_from_env, requote
+from parsers.message_parser import MessageParser
+from scripts.bench_samples import SAMPLE_MESSAGES
+from utils.quote_executor import QuoteExecutor
+
+
+ORIGINAL = SAMPLE_MESSAGES[0]
+EDITED = ORIGINAL.replace("일반 90,000만원", "일반 80,000만원")
+
+
+def test_requote_new_message():
+    property_data = MessageParser().parse(ORIGINAL)
+    record = requote(property_data)
+    assert record.results == BaseCalculator.calculate_all_banks(property_data)
+    assert (record.reply_message_id, record.reply_text) == (None, None)
+
+
+def test_requote_carries_reply_over_and_recalculates():
+    parser = MessageParser()
+    previous = requote(parser.parse(ORIGINAL))._replace(reply_message_id=77, reply_text="이전 답장")
+
+    record = requote(parser.parse(EDITED), previous)
+    assert record.results == BaseCalculator.calculate_all_banks(parser.parse(EDITED))
+    assert record.results != previous.results
+    assert (record.reply_message_id, record.reply_text) == (77, "이전 답장")
+
+
+def test_quote_executor_passes_previous_record():
+    previous = QuoteRecord(results=[], reply_message_id=77, reply_text="이전 답장")
+    outcome = asyncio.run(QuoteExecutor("inline").quote(EDITED, previous))
+    assert outcome.record.reply_message_id == 77
+    assert outcome.record.results == BaseCalculator.calculate_all_banks(MessageParser().parse(EDITED))
+
+
+def test_store_evicts_least_recently_used():
+    store = QuoteStore(max_size=2)
+    first, second, third = (QuoteRecord(results=[], reply_message_id=index) for index in range(3))
+    store.put(1, 10, first)
+    store.put(1, 11, second)
+    assert store.get(1, 10) is first  # 10을 최근 사용으로
+    store.put(2, 10, third)
+
+    assert store.get(1, 11) is None
+    assert store.get(1, 10) is first
+    assert store.get(2, 10) is third  # 채팅방이 다르면 다른 메시지
+    assert len(store) == 2
+
+
+def test_disabled_store_keeps_nothing():
+    store = QuoteStore(max_size=0)
+    store.put(1, 10, QuoteRecord(results=[]))
+    assert store.get(1, 10) is None
+
+
+@pytest.mark.parametrize("value, expected", [("5", 5), ("0", 0), ("많이", DEFAULT_STORE_SIZE)])
+def test_store_size_from_env(monkeypatch, value, expected):
+    monkeypatch.setenv("QUOTE_STORE_SIZE", value)
+    assert quote_store_from_env().max_size == expected
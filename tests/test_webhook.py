@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+api/webhook.handler 동작 고정
+Bot API는 httpx.MockTransport 대역으로 바꾸고 받은 호출을 확인 (네트워크 없이 실행)
+(처리 시간/연결 재사용 측정은 scripts/bench_telegram_client.py, scripts/bench_webhook_reply.py)
+"""
+
+import json
+import logging
+import os
+import sys
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api.webhook as webhook
+import utils.telegram_client as telegram_client
+from calculator.requote import requote
+from parsers.message_parser import MessageParser
+from scripts.bench_samples import SAMPLE_MESSAGES
+from utils.formatter import format_all_results
+from utils.telegram_update import WebhookReplySlot, parse_update, split_text
+
+
+TOKEN = "123456:test"
+GROUP_CHAT = -100123
+PRIVATE_CHAT = 42
+
+ORIGINAL = SAMPLE_MESSAGES[0]
+EDITED = ORIGINAL.replace("일반 90,000만원", "일반 80,000만원")
+
+
+class RecordingBotApi:
+    """Bot API 대역 (받은 호출을 기록하고 ok 응답, 보낸 메시지 ID는 1001부터)"""
+
+    def __init__(self):
+        self.calls = []  # (메서드, 파라미터)
+        self.message_id = 1000
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        params = json.loads(request.content)
+        self.calls.append((method, params))
+        self.message_id += 1
+        result = {"message_id": self.message_id, "chat": {"id": params.get("chat_id")}, "text": params.get("text")}
+        return httpx.Response(200, json={"ok": True, "result": result})
+
+
+@pytest.fixture
+def bot_api(monkeypatch):
+    """새 웹훅 애플리케이션이 대역 Bot API로 보내도록 설정 (테스트가 끝나면 전역 상태 복원)"""
+    api = RecordingBotApi()
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", TOKEN)
+    monkeypatch.delenv("ALLOWED_CHAT_IDS", raising=False)
+    monkeypatch.delenv("WEBHOOK_REPLY_IN_RESPONSE", raising=False)
+    monkeypatch.setenv("QUOTE_EXECUTOR", "inline")
+    monkeypatch.setenv("QUOTE_CHAT_RATE", "0")
+    monkeypatch.setenv("TELEGRAM_CHAT_SEND_INTERVAL", "0")
+    monkeypatch.setattr(telegram_client, "bot_api_client_from_env", lambda token: telegram_client.BotApiClient(
+        token, http=httpx.AsyncClient(base_url=telegram_client.DEFAULT_BASE_URL, transport=httpx.MockTransport(api))
+    ))
+    for name in ("application", "_loop_worker", "_allowed_chat_ids", "_update_deduplicator"):
+        monkeypatch.setattr(webhook, name, None)
+    yield api
+    if webhook._loop_worker is not None:
+        webhook._loop_worker.shutdown()
+
+
+def message_update(update_id: int, text: str, message_id: int = None, edited: bool = False,
+                   chat_id: int = GROUP_CHAT) -> dict:
+    """웹훅으로 들어오는 메시지 업데이트 (수정 메시지는 message_id를 원래 메시지와 같게)"""
+    message = {
+        "message_id": update_id if message_id is None else message_id,
+        "from": {"id": 42, "is_bot": False, "first_name": "상담"},
+        "chat": {"id": chat_id, "type": "private" if chat_id > 0 else "supergroup"},
+        "date": 1760000000,
+        "text": text,
+    }
+    if text.startswith("/"):
+        message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(text.split()[0])}]
+    if edited:
+        message["edit_date"] = 1760000060
+    return {"update_id": update_id, "edited_message" if edited else "message": message}
+
+
+def post(body: dict) -> dict:
+    response = webhook.handler(SimpleNamespace(method="POST", path="/api/webhook", body=json.dumps(body)))
+    assert response["statusCode"] == 200, response
+    return json.loads(response["body"])
+
+
+def expected_reply(text: str) -> str:
+    return format_all_results(requote(MessageParser().parse(text)).results)
+
+
+def test_group_message_quotes_original(bot_api):
+    post(message_update(1, ORIGINAL))
+    [(method, params)] = bot_api.calls
+    assert method == "sendMessage"
+    assert params["chat_id"] == GROUP_CHAT
+    assert params["reply_to_message_id"] == 1
+    assert params["text"] == expected_reply(ORIGINAL)
+
+
+def test_edited_message_edits_original_reply(bot_api):
+    post(message_update(1, ORIGINAL))
+    reply_message_id = bot_api.message_id
+    post(message_update(2, EDITED, message_id=1, edited=True))
+
+    assert [method for method, _ in bot_api.calls] == ["sendMessage", "editMessageText"]
+    _, edit = bot_api.calls[1]
+    assert edit == {"chat_id": GROUP_CHAT, "message_id": reply_message_id, "text": expected_reply(EDITED)}
+
+
+def test_edit_with_unchanged_result_keeps_reply(bot_api):
+    post(message_update(1, ORIGINAL))
+    post(message_update(2, ORIGINAL + "\n", message_id=1, edited=True))
+    assert [method for method, _ in bot_api.calls] == ["sendMessage"]
+
+
+def test_edit_of_unknown_message_sends_new_reply(bot_api):
+    """보관소에 없는 메시지(다른 인스턴스가 받은 메시지 등)의 수정은 새 메시지처럼 답장"""
+    post(message_update(2, EDITED, message_id=1, edited=True))
+    [(method, params)] = bot_api.calls
+    assert method == "sendMessage"
+    assert params["text"] == expected_reply(EDITED)
+
+
+def test_reply_in_response_body(bot_api, monkeypatch):
+    monkeypatch.setenv("WEBHOOK_REPLY_IN_RESPONSE", "1")
+    body = post(message_update(1, ORIGINAL))
+    assert body == {
+        "method": "sendMessage", "chat_id": GROUP_CHAT, "text": expected_reply(ORIGINAL),
+        "reply_to_message_id": 1, "allow_sending_without_reply": True,
+    }
+    assert bot_api.calls == []
+
+
+def test_help_in_response_body(bot_api, monkeypatch):
+    monkeypatch.setenv("WEBHOOK_REPLY_IN_RESPONSE", "1")
+    body = post(message_update(1, "/start", chat_id=PRIVATE_CHAT))
+    assert body["method"] == "sendMessage"
+    assert body["chat_id"] == PRIVATE_CHAT
+    assert "reply_to_message_id" not in body
+    assert bot_api.calls == []
+
+
+def test_edit_after_response_body_reply_sends_new_reply(bot_api, monkeypatch):
+    """응답 본문으로 보낸 답장은 메시지 ID를 모르므로 결과가 바뀌면 새로 답장하고, 같으면 아무것도 보내지 않음"""
+    monkeypatch.setenv("WEBHOOK_REPLY_IN_RESPONSE", "1")
+    post(message_update(1, ORIGINAL))
+    assert post(message_update(2, ORIGINAL + "\n", message_id=1, edited=True)) == {"ok": True}
+
+    body = post(message_update(3, EDITED, message_id=1, edited=True))
+    assert body["method"] == "sendMessage"
+    assert body["text"] == expected_reply(EDITED)
+    assert bot_api.calls == []
+
+
+def test_reply_slot_after_take():
+    """핸들러가 먼저 응답했으면(처리 시간 초과 등) offer가 실패하여 코루틴이 직접 보냄"""
+    slot = WebhookReplySlot()
+    assert slot.take() is None
+    assert not slot.offer("sendMessage", {"chat_id": 1, "text": "늦은 답장"})
+
+    slot = WebhookReplySlot()
+    assert slot.offer("sendMessage", {"chat_id": 1, "text": "답장"})
+    assert not slot.offer("sendMessage", {"chat_id": 1, "text": "두 번째 답장"})
+    assert slot.take() == {"method": "sendMessage", "chat_id": 1, "text": "답장"}
+
+    assert not WebhookReplySlot(enabled=False).offer("sendMessage", {"chat_id": 1, "text": "답장"})
+
+
+@pytest.mark.parametrize("text", [
+    "\n".join(f"{index}번째 줄" for index in range(40)),
+    "가" * 25 + "\n" + "나" * 5,
+])
+def test_split_text_keeps_lines_within_limit(text):
+    parts = split_text(text, limit=20)
+    assert all(len(part) <= 20 for part in parts)
+    assert "".join(parts).replace("\n", "") == text.replace("\n", "")
+    assert split_text("짧은 답장", limit=20) == ["짧은 답장"]
+
+
+@pytest.mark.parametrize("body, allowed, expected", [
+    ({"update_id": 1, "callback_query": {"id": "1"}}, frozenset(), "unsupported update"),
+    (message_update(1, "매물"), frozenset([1]), "chat not allowed"),
+    (message_update(1, "/settings"), frozenset(), "command"),
+    ({"update_id": 1, "message": {"message_id": 1, "chat": {"id": 5, "type": "private"}, "photo": []}}, frozenset(), "no text"),
+    (message_update(1, "/help@bench_bot"), frozenset(), None),
+    (message_update(1, "매물", chat_id=GROUP_CHAT), frozenset([GROUP_CHAT]), None),
+    ({"update_id": 1, "channel_post": {"message_id": 1, "chat": {"id": -1001, "type": "channel"}, "text": "매물"}},
+     frozenset(), None),
+])
+def test_prefilter_update(body, allowed, expected):
+    assert webhook.prefilter_update(parse_update(body), allowed) == expected
+
+
+def test_dropped_update_does_not_initialize_application(bot_api, monkeypatch):
+    monkeypatch.setenv("ALLOWED_CHAT_IDS", "1")
+    assert post(message_update(1, ORIGINAL)) == {"ok": True, "skipped": "chat not allowed"}
+    assert post(message_update(2, "/settings", chat_id=1)) == {"ok": True, "skipped": "command"}
+    assert webhook.application is None
+    assert bot_api.calls == []
+
+
+def test_bot_token_is_not_logged(bot_api, caplog):
+    with caplog.at_level(logging.DEBUG, logger=webhook.logger.name):
+        post(message_update(1, ORIGINAL))
+    assert "Quote for chat" in caplog.text
+    assert TOKEN.split(":")[0] not in caplog.text
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""
+견적 요청 수락 제어와 채팅방별 전송 속도 조절
+한 채팅방에서 매물 수십 건을 한꺼번에 붙여넣어도 전체 금융사 계산이 한꺼번에 돌지 않고,
+답장이 텔레그램 전송 제한(429)에 걸리지 않도록 함 (api/webhook.py, main.py)
+
+- QuoteAdmission: 견적 계산 전에 수락
+  - 채팅방별 토큰 버킷 (burst건까지 바로, 이후 초당 rate건), 토큰이 없으면 생길 때까지 기다림
+  - 동시에 계산하는 견적 수 제한 (max_concurrent), 자리를 기다리는 요청은 대기열에
+  - 대기열(max_queue)이 가득 찼거나 채팅방 대기 시간이 max_chat_wait를 넘으면 바로 거절 (AdmissionRejected)
+  - 수락까지 기다린 시간(queue_ms)을 계산 시간과 따로 기록, stats()로 누적 통계
+- ChatPacer: 채팅방마다 전송 간격(interval)을 두고, 429 응답의 retry_after만큼 기다린 뒤 다시 보냄
+- asyncio 객체는 처음 사용할 때 실행 중인 이벤트 루프에 묶이므로 같은 루프에서만 사용
+
+설정 (환경변수, quote_admission_from_env / chat_pacer_from_env):
+    QUOTE_CHAT_RATE=0.5          # 채팅방별 초당 견적 수, 0이면 채팅방 제한 없음
+    QUOTE_CHAT_BURST=5           # 채팅방별로 바로 처리하는 견적 수
+    QUOTE_CHAT_MAX_WAIT=20       # 채팅방 제한으로 기다릴 수 있는 최대 시간 (초)
+    QUOTE_MAX_CONCURRENT=4       # 동시에 계산하는 견적 수
+    QUOTE_QUEUE_SIZE=64          # 수락을 기다릴 수 있는 요청 수 (넘으면 거절)
+    TELEGRAM_CHAT_SEND_INTERVAL=1.0   # 채팅방별 전송 간격 (초), 0이면 간격 없음
+    TELEGRAM_SEND_RETRIES=2           # 429 응답 후 다시 보내는 횟수
+"""
+
+import asyncio
+import contextlib
+import time
+from datetime import timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, NamedTuple, Optional, TypeVar
+from utils.env import env_int, env_number
+
+
+# 채팅방별 초당 견적 수 / 바로 처리하는 견적 수 / 최대 대기 시간 (초)
+DEFAULT_CHAT_RATE = 0.5
+DEFAULT_CHAT_BURST = 5
+DEFAULT_CHAT_MAX_WAIT = 20.0  # 웹훅 처리 대기 시간(PROCESS_TIMEOUT 25초) 안에 답장하도록
+
+# 동시 계산 수 / 대기열 크기
+DEFAULT_MAX_CONCURRENT = 4
+DEFAULT_QUEUE_SIZE = 64
+
+# 채팅방별 전송 간격 (초) / 429 후 다시 보내는 횟수 / 이보다 긴 retry_after는 기다리지 않음 (초)
+DEFAULT_SEND_INTERVAL = 1.0
+DEFAULT_SEND_RETRIES = 2
+MAX_RETRY_AFTER = 30.0
+
+# 채팅방별 상태가 이 수를 넘으면 쉬고 있는 채팅방 정리
+MAX_TRACKED_CHATS = 1024
+
+# 견적 요청을 거절했을 때 채팅방에 보내는 안내 (채팅방마다 수락될 때까지 한 번만)
+BUSY_NOTICE = "요청이 많아 처리하지 못했습니다. 잠시 후 다시 보내주세요."
+
+T = TypeVar("T")
+
+
+class AdmissionRejected(Exception):
+    """견적 요청 거절 (대기열이 가득 찼거나 채팅방 대기 시간 초과)"""
+
+    def __init__(self, reason: str, notify: bool):
+        """
+        Args:
+            reason: "queue_full" 또는 "chat_rate"
+            notify: 이 채팅방이 마지막으로 수락된 뒤 처음 거절된 경우 True (안내 답장은 이때만)
+        """
+        super().__init__(f"견적 요청 거절: {reason}")
+        self.reason = reason
+        self.notify = notify
+
+
+class AdmissionTicket(NamedTuple):
+    """수락된 견적 요청"""
+    queue_ms: float  # 수락까지 기다린 시간 (채팅방 제한 + 동시 계산 자리)
+    chat_wait_ms: float  # 그중 채팅방 토큰을 기다린 시간
+    queue_depth: int  # 들어올 때 먼저 기다리던 요청 수
+
+
+class AdmissionStats(NamedTuple):
+    """수락 제어 누적 통계"""
+    admitted: int
+    rejected_queue_full: int
+    rejected_chat_rate: int
+    waiting: int  # 지금 수락을 기다리는 요청 수
+    running: int  # 지금 계산 중인 견적 수
+    max_queue_depth: int
+    avg_queue_ms: float
+    max_queue_ms: float
+
+
+class QuoteAdmission:
+    """
+    채팅방별 토큰 버킷 + 동시 계산 수 제한 + 크기 제한 대기열
+    """
+
+    def __init__(self, chat_rate: float = DEFAULT_CHAT_RATE, chat_burst: int = DEFAULT_CHAT_BURST,
+                 max_concurrent: int = DEFAULT_MAX_CONCURRENT, max_queue: int = DEFAULT_QUEUE_SIZE,
+                 max_chat_wait: float = DEFAULT_CHAT_MAX_WAIT):
+        """
+        Args:
+            chat_rate: 채팅방별 초당 견적 수 (0 이하이면 채팅방 제한 없음)
+            chat_burst: 채팅방별로 기다리지 않고 처리하는 견적 수 (버킷 크기)
+            max_concurrent: 동시에 계산하는 견적 수
+            max_queue: 수락을 기다릴 수 있는 요청 수
+            max_chat_wait: 채팅방 토큰을 기다릴 수 있는 최대 시간 (초)
+        """
+        self.chat_rate = chat_rate
+        self.chat_burst = max(1, chat_burst)
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.max_chat_wait = max_chat_wait
+        self._buckets: Dict[Hashable, List[float]] = {}  # 채팅방 -> [토큰 (음수면 예약된 대기), 갱신 시각]
+        self._rejected_chats = set()  # 마지막 수락 이후 거절된 채팅방 (안내 답장은 한 번만)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._waiting = 0
+        self._running = 0
+        self._admitted = 0
+        self._rejected = {"queue_full": 0, "chat_rate": 0}
+        self._max_queue_depth = 0
+        self._total_queue_ms = 0.0
+        self._max_queue_ms = 0.0
+
+    @contextlib.asynccontextmanager
+    async def admit(self, chat_id: Hashable) -> AsyncIterator[AdmissionTicket]:
+        """
+        견적 계산 자리를 받을 때까지 기다림 (async with 블록 안에서 계산, 블록을 나가면 자리 반납)
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 채팅방 대기 시간이 max_chat_wait를 넘음 (기다리지 않고 바로)
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrent)
+        started = time.monotonic()
+        chat_wait = self._reserve(chat_id, started)
+        if chat_wait > self.max_chat_wait:
+            self._refund(chat_id)
+            raise self._reject(chat_id, "chat_rate")
+        must_wait = chat_wait > 0 or self._slots.locked()
+        if must_wait and self._waiting >= self.max_queue:
+            self._refund(chat_id)
+            raise self._reject(chat_id, "queue_full")
+
+        queue_depth = self._waiting
+        if must_wait:
+            self._waiting += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._waiting)
+            try:
+                if chat_wait > 0:
+                    await asyncio.sleep(chat_wait)
+                await self._slots.acquire()
+            except BaseException:
+                self._refund(chat_id)
+                raise
+            finally:
+                self._waiting -= 1
+        else:
+            await self._slots.acquire()
+
+        queue_ms = (time.monotonic() - started) * 1000
+        self._admitted += 1
+        self._total_queue_ms += queue_ms
+        self._max_queue_ms = max(self._max_queue_ms, queue_ms)
+        self._rejected_chats.discard(chat_id)
+        self._running += 1
+        try:
+            yield AdmissionTicket(queue_ms, chat_wait * 1000, queue_depth)
+        finally:
+            self._running -= 1
+            self._slots.release()
+
+    def _reserve(self, chat_id: Hashable, now: float) -> float:
+        """채팅방 토큰 하나 예약하고 토큰이 생길 때까지 기다릴 시간(초) 반환 (토큰이 없으면 음수로 예약)"""
+        if self.chat_rate <= 0:
+            return 0.0
+        bucket = self._buckets.get(chat_id)
+        if bucket is None:
+            if len(self._buckets) >= MAX_TRACKED_CHATS:
+                self._forget_idle_chats(now)
+            bucket = self._buckets[chat_id] = [float(self.chat_burst), now]
+        tokens = min(float(self.chat_burst), bucket[0] + (now - bucket[1]) * self.chat_rate) - 1
+        bucket[0], bucket[1] = tokens, now
+        return -tokens / self.chat_rate if tokens < 0 else 0.0
+
+    def _refund(self, chat_id: Hashable) -> None:
+        """예약한 토큰 되돌리기 (거절/취소)"""
+        bucket = self._buckets.get(chat_id)
+        if bucket is not None and self.chat_rate > 0:
+            bucket[0] = min(float(self.chat_burst), bucket[0] + 1)
+
+    def _forget_idle_chats(self, now: float) -> None:
+        """버킷이 다시 가득 찬(쉬고 있는) 채팅방 정리"""
+        for chat_id, (tokens, updated_at) in list(self._buckets.items()):
+            if tokens + (now - updated_at) * self.chat_rate >= self.chat_burst:
+                del self._buckets[chat_id]
+                self._rejected_chats.discard(chat_id)
+
+    def _reject(self, chat_id: Hashable, reason: str) -> AdmissionRejected:
+        self._rejected[reason] += 1
+        notify = chat_id not in self._rejected_chats
+        self._rejected_chats.add(chat_id)
+        return AdmissionRejected(reason, notify)
+
+    def stats(self) -> AdmissionStats:
+        """현재 통계"""
+        return AdmissionStats(
+            self._admitted, self._rejected["queue_full"], self._rejected["chat_rate"],
+            self._waiting, self._running, self._max_queue_depth,
+            self._total_queue_ms / self._admitted if self._admitted else 0.0, self._max_queue_ms
+        )
+
+
+class PacerStats(NamedTuple):
+    """전송 속도 조절 누적 통계"""
+    sent: int
+    paced: int  # 전송 간격 때문에 기다린 횟수
+    retried: int  # 429 응답 후 다시 보낸 횟수
+    failed: int  # 다시 보내도 실패한 횟수 (429 외 오류 포함)
+    total_wait_ms: float
+
+
+class ChatPacer:
+    """
+    채팅방별 전송 간격 유지 + 429(retry_after) 응답 후 다시 보내기
+    """
+
+    def __init__(self, interval: float = DEFAULT_SEND_INTERVAL, max_retries: int = DEFAULT_SEND_RETRIES,
+                 max_retry_after: float = MAX_RETRY_AFTER):
+        """
+        Args:
+            interval: 같은 채팅방으로 보내는 전송 사이 최소 간격 (초, 0이면 간격 없음)
+            max_retries: 429 응답 후 다시 보내는 횟수 (0이면 다시 보내지 않음)
+            max_retry_after: 이보다 긴 retry_after는 기다리지 않고 실패로 처리 (초)
+        """
+        self.interval = interval
+        self.max_retries = max(0, max_retries)
+        self.max_retry_after = max_retry_after
+        self._next_send: Dict[Hashable, float] = {}
+        self._sent = 0
+        self._paced = 0
+        self._retried = 0
+        self._failed = 0
+        self._total_wait = 0.0
+
+    async def send(self, chat_id: Hashable, send: Callable[[], Awaitable[T]]) -> T:
+        """
+        채팅방 전송 간격을 지켜 send()를 호출 (429 응답이면 retry_after만큼 기다렸다 다시)
+
+        Args:
+            chat_id: 받는 채팅방
+            send: 전송 코루틴을 만드는 함수 (다시 보낼 때마다 새로 호출)
+
+        Raises:
+            send()가 낸 예외 (429가 아니거나, 다시 보내는 횟수를 넘었거나, retry_after가 너무 김)
+        """
+        attempt = 0
+        while True:
+            await self._wait_turn(chat_id)
+            try:
+                result = await send()
+            except Exception as e:
+                retry_after = _retry_after(e)
+                if retry_after is None or attempt >= self.max_retries or retry_after > self.max_retry_after:
+                    self._failed += 1
+                    raise
+                attempt += 1
+                self._retried += 1
+                # 텔레그램이 알려준 시간 동안 이 채팅방으로는 보내지 않음
+                self._next_send[chat_id] = max(self._next_send.get(chat_id, 0.0), time.monotonic() + retry_after)
+                continue
+            self._sent += 1
+            return result
+
+    async def _wait_turn(self, chat_id: Hashable) -> None:
+        """채팅방의 다음 전송 차례까지 기다리고 그다음 차례 예약"""
+        now = time.monotonic()
+        if len(self._next_send) >= MAX_TRACKED_CHATS:
+            for key, at in list(self._next_send.items()):
+                if at <= now:
+                    del self._next_send[key]
+        at = max(now, self._next_send.get(chat_id, 0.0))
+        self._next_send[chat_id] = at + self.interval
+        if at > now:
+            self._paced += 1
+            self._total_wait += at - now
+            await asyncio.sleep(at - now)
+
+    def stats(self) -> PacerStats:
+        """현재 통계"""
+        return PacerStats(self._sent, self._paced, self._retried, self._failed, self._total_wait * 1000)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """429 오류의 retry_after (초), 429가 아니면 None (BotApiError, python-telegram-bot RetryAfter 모두)"""
+    value: Any = getattr(error, "retry_after", None)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def quote_admission_from_env(default_max_concurrent: int = DEFAULT_MAX_CONCURRENT) -> QuoteAdmission:
+    """
+    환경변수로 수락 제어 생성 (잘못된 값이면 기본값)
+
+    Args:
+        default_max_concurrent: QUOTE_MAX_CONCURRENT가 없을 때의 동시 계산 수 (견적 실행기 작업자 수 등)
+    """
+    return QuoteAdmission(
+        chat_rate=env_number("QUOTE_CHAT_RATE", DEFAULT_CHAT_RATE),
+        chat_burst=env_int("QUOTE_CHAT_BURST", DEFAULT_CHAT_BURST),
+        max_concurrent=env_int("QUOTE_MAX_CONCURRENT", default_max_concurrent),
+        max_queue=env_int("QUOTE_QUEUE_SIZE", DEFAULT_QUEUE_SIZE),
+        max_chat_wait=env_number("QUOTE_CHAT_MAX_WAIT", DEFAULT_CHAT_MAX_WAIT)
+    )
+
+
+def chat_pacer_from_env() -> ChatPacer:
+    """TELEGRAM_CHAT_SEND_INTERVAL, TELEGRAM_SEND_RETRIES 환경변수로 생성 (잘못된 값이면 기본값)"""
+    return ChatPacer(
+        interval=env_number("TELEGRAM_CHAT_SEND_INTERVAL", DEFAULT_SEND_INTERVAL),
+        max_retries=env_int("TELEGRAM_SEND_RETRIES", DEFAULT_SEND_RETRIES)
+    )
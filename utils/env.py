@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+숫자 환경변수 해석 (각 모듈의 *_from_env 생성 함수에서 공통으로 사용)
+없거나 빈 값, 숫자가 아닌 값이면 기본값을 반환하여 설정 오류로 봇이 멈추지 않도록 함
+
+- env_number: 실수 (시간/비율 설정, 예: UPDATE_DEDUP_WINDOW=600, QUOTE_CHAT_RATE=0.5)
+- env_int: 정수 (크기/개수 설정, 예: QUOTE_STORE_SIZE=256), 소수는 버림 ("2.5" -> 2)
+- 웹훅 콜드 스타트에서 로드되므로 표준 라이브러리 os만 사용
+"""
+
+import os
+from typing import Optional
+
+
+def env_number(name: str, default: float) -> float:
+    """숫자 환경변수 해석 (없거나 잘못된 값이면 기본값)"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+def env_int(name: str, default: Optional[int]) -> Optional[int]:
+    """정수 환경변수 해석 (없거나 잘못된 값이면 기본값, 소수는 버림)"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(float(value))
+    except (ValueError, OverflowError):
+        return default
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+백그라운드 이벤트 루프 워커
+프로세스당 하나의 이벤트 루프를 전용 스레드에서 계속 실행하고,
+동기 코드(서버리스 핸들러 등)는 코루틴을 run_coroutine_threadsafe로 넘긴 뒤 결과를 기다림
+
+- 요청마다 스레드/이벤트 루프를 만들지 않으므로 동시에 들어온 요청의 네트워크 대기가 겹쳐서 처리됨
+- 같은 루프를 계속 쓰므로 루프에 묶인 HTTP 연결(Bot API 클라이언트의 연결 풀)을 요청 간에 재사용 가능
+- 동시에 처리 중인 코루틴 수를 제한 (제한을 넘으면 LoopWorkerBusy)
+- 프로세스 종료 시 남은 작업을 취소하고 루프를 닫음 (atexit)
+
+설정 (환경변수, loop_worker_from_env):
+    WEBHOOK_MAX_IN_FLIGHT=32   # 동시에 처리할 요청 수
+"""
+
+import asyncio
+import atexit
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Coroutine, Optional
+from utils.env import env_int
+
+
+# 기본 동시 처리 수 / 처리 대기 시간 (초) / 종료 대기 시간 (초)
+DEFAULT_MAX_IN_FLIGHT = 32
+DEFAULT_TIMEOUT = 25.0
+DEFAULT_SHUTDOWN_TIMEOUT = 5.0
+
+
+class LoopWorkerBusy(Exception):
+    """동시 처리 수 제한에 걸려 작업을 받지 못함"""
+
+
+class LoopWorker:
+    """
+    전용 스레드에서 실행되는 이벤트 루프 (처음 작업을 받을 때 시작)
+    """
+
+    def __init__(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, name: str = "loop-worker"):
+        """
+        Args:
+            max_in_flight: 동시에 처리할 코루틴 수 (1 이상)
+            name: 스레드 이름
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.name = name
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """워커의 이벤트 루프 (실행 중이 아니면 시작)"""
+        loop = self._loop
+        if loop is None or self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._loop is None or self._thread is None or not self._thread.is_alive():
+                    self._start()
+                loop = self._loop
+        return loop
+
+    def _start(self) -> None:
+        """루프 스레드 시작 (lock 안에서 호출, 루프가 돌기 시작할 때까지 기다림)"""
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            try:
+                loop.run_forever()
+            finally:
+                _cancel_pending(loop)
+                loop.close()
+
+        thread = threading.Thread(target=run, name=self.name, daemon=True)
+        thread.start()
+        started.wait()
+        self._loop = loop
+        self._thread = thread
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = DEFAULT_TIMEOUT,
+            wait: Optional[float] = None) -> Any:
+        """
+        코루틴을 워커 루프에서 실행하고 결과를 기다림 (워커 스레드가 아닌 곳에서 호출)
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 결과를 기다릴 시간 (초, None이면 끝날 때까지)
+                시간이 지나도 코루틴은 취소하지 않고 루프에서 계속 실행
+            wait: 동시 처리 수 제한에 걸렸을 때 자리가 날 때까지 기다릴 시간 (초, None이면 timeout과 같음)
+
+        Raises:
+            LoopWorkerBusy: 기다려도 자리가 나지 않음 (코루틴은 실행하지 않음)
+            TimeoutError: timeout 안에 끝나지 않음
+        """
+        if not self._slots.acquire(timeout=timeout if wait is None else wait):
+            coro.close()
+            raise LoopWorkerBusy(f"동시 처리 수 제한 ({self.max_in_flight}개) 초과")
+        try:
+            future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        except BaseException:
+            self._slots.release()
+            coro.close()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            raise TimeoutError(f"{timeout}초 안에 처리가 끝나지 않음") from None
+
+    def shutdown(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT) -> None:
+        """루프를 멈추고 남은 작업을 취소한 뒤 스레드 종료를 기다림 (다시 run하면 새로 시작)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+
+def _cancel_pending(loop: asyncio.AbstractEventLoop) -> None:
+    """루프에 남은 작업을 취소하고 취소가 처리될 때까지 실행 (루프 스레드에서 호출)"""
+    pending = asyncio.all_tasks(loop)
+    for task in pending:
+        task.cancel()
+    if pending:
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    loop.run_until_complete(loop.shutdown_asyncgens())
+
+
+def loop_worker_from_env(name: str = "loop-worker") -> LoopWorker:
+    """WEBHOOK_MAX_IN_FLIGHT 환경변수로 워커 생성 (잘못된 값이면 기본값), 프로세스 종료 시 자동으로 닫음"""
+    worker = LoopWorker(env_int("WEBHOOK_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT), name)
+    atexit.register(worker.shutdown)
+    return worker
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+담보물건/근저당권/산출 결과 데이터 모델
+파서 -> 계산기 -> 포맷터로 전달되는 데이터를 __slots__ 데이터클래스로 표현
+(키마다 해시 테이블 항목을 만드는 딕셔너리보다 객체당 메모리가 적고 필드가 고정됨)
+
+기존 호출 코드와의 호환을 위해 딕셔너리처럼 읽고 쓸 수 있음
+- data["kb_price"], data.get("region"), data["credit_score"] = 700, "mortgages" in data
+- 정의되지 않은 키에 쓰면 KeyError, 읽으면 get()은 기본값/[]는 KeyError
+- to_dict()로 일반 딕셔너리 변환 (하위 모델도 함께 변환)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+
+class DictCompat:
+    """__slots__ 데이터클래스에 딕셔너리 방식 접근을 제공 (필드명 = 키)"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+
+    def values(self) -> List[Any]:
+        return [getattr(self, key) for key in self.__slots__]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, getattr(self, key)) for key in self.__slots__]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """일반 딕셔너리로 변환 (리스트 안의 모델도 딕셔너리로 변환)"""
+        return {key: _plain(getattr(self, key)) for key in self.__slots__}
+
+
+def _plain(value: Any) -> Any:
+    """모델(또는 모델 리스트)을 딕셔너리(리스트)로 변환"""
+    if isinstance(value, DictCompat):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+@dataclass(slots=True)
+class Mortgage(DictCompat):
+    """근저당권 설정 내역 한 건 (금액은 만원 단위)"""
+    priority: int  # 순위
+    amount: Optional[float]  # 원금
+    max_amount: Optional[float]  # 채권최고액
+    institution: Optional[str]  # 기관명/유형
+    is_refinance: bool = False  # 대환 요청 여부
+
+
+@dataclass(slots=True)
+class PropertyData(DictCompat):
+    """파싱된 담보물건 정보 (MessageParser.parse 결과)"""
+    name: Optional[str] = None  # 성명
+    age: Optional[int] = None  # 나이
+    occupation: Optional[str] = None  # 직업
+    credit_score: Optional[int] = None  # 신용점수
+    residence: Optional[str] = None  # 거주여부
+    ownership: Optional[str] = None  # 소유현황
+    address: Optional[str] = None  # 주소
+    area: Optional[float] = None  # 면적 (㎡)
+    household_count: Optional[int] = None  # 세대수
+    property_type: Optional[str] = None  # 구분 (아파트, 빌라 등)
+    kb_price: Union[float, str, None] = None  # KB시세 (검증 후 만원 단위, 검증 전에는 원문)
+    mortgages: List[Mortgage] = field(default_factory=list)  # 근저당권 설정 내역
+    special_notes: Optional[str] = None  # 특이사항
+    requests: Optional[str] = None  # 요청사항
+    region: Optional[str] = None  # 주소에서 찾은 지역
+    region_id: Optional[int] = None  # 지역 ID (utils.regions)
+    required_amount: Optional[float] = None  # 필요자금 (만원)
+
+
+@dataclass(slots=True)
+class QuoteResult(DictCompat):
+    """LTV 단계(또는 역산 LTV) 하나의 한도/금리 산출 결과 (금액은 만원 단위)"""
+    ltv: float  # LTV (역산한 경우 소수점 2자리)
+    amount: float  # 한도 (100만 단위 절삭)
+    interest_rate: Optional[float]  # 금리 (신용점수 있을 때)
+    interest_rate_range: Optional[Tuple[float, float]]  # (최저, 최고) 금리 (신용점수 없을 때)
+    type: str  # "후순위" 또는 "대환"
+    available_amount: float  # 가용 한도 (대환 시 대환 원금 제외)
+    total_amount: float  # 전체 대출 금액 (대환 시 대환 원금 포함)
+    is_refinance: bool  # 대환 여부
+    credit_grade: Optional[Union[int, str]]  # 금리 적용 신용등급 (OK저축은행은 신용점수 범위)
+    below_standard_ltv: bool  # 기준 LTV 이하 지역 여부
+    taxi_limit_applied: bool = False  # 택시 한도 제한 적용 여부
+    fixed_rate_comment: Optional[str] = None  # 고정금리 코멘트 (사업자 상품)
+    refinance_institutions: Optional[List[str]] = None  # 가계자금 대환 시 대환하는 금융사 이름
+
+
+@dataclass(slots=True)
+class BankQuote(DictCompat):
+    """금융사(상품) 하나의 계산 결과"""
+    bank_name: str  # 결과에 표시할 금융사 이름
+    results: List[QuoteResult]  # 산출 결과 (없으면 빈 리스트)
+    conditions: List[str]  # 특이 조건
+    errors: List[str]  # 산출 불가 사유 (취급 불가지역, 한도 초과 등)
+    min_amount: float = 3000  # 최소진행금액 (만원)
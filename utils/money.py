@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+한국어 금액 표현 파서 (만원 단위 정수)
+"1억 2천", "12,500만원", "5천만", "1.5억", "일반 175,000만원 하한 171,000만원" 같은 표현을
+컴파일된 정규식(유한 상태 기계) 하나로 한 번만 훑어 만원 단위 정수로 변환
+
+- 금액 하나 = 억 > 천 > 백 > 만 순서의 단위 묶음 (예: "1억 2천5백만원" -> 12500)
+  단위 없는 숫자는 만원으로 보고, 억/천/백 뒤에 오면 더해짐 (예: "1억 5000" -> 15000)
+- "원"만 붙은 금액은 원 단위로 보고 만원으로 환산 (예: "50,000,000원" -> 5000)
+- 소수점은 단위에 곱해 정수로 계산 (예: "1.15억" -> 11500)
+- 날짜처럼 점이 두 번 이상 나오는 숫자(예: "25.11.01")는 금액으로 보지 않음
+- KB시세의 일반/하한/상한 표시는 KbPrice 하나로 반환하여 호출하는 쪽에서 문자열을 다시 파싱하지 않도록 함
+"""
+
+import re
+from typing import NamedTuple, Optional, Tuple, Union
+
+
+# 숫자 한 덩어리 (쉼표 자릿수 구분, 소수점 한 번), 숫자/점 중간에서 시작하거나 점이 또 이어지면 제외
+_NUMBER = r"\d+(?:,\d+)*(?:\.\d+)?(?![.,]?\d)"
+
+# 금액 표현: 억 > 천 > 백 > 만/원 순서의 단위 묶음 (적어도 하나의 숫자로 시작)
+_AMOUNT = (
+    r"(?<![\d.,])(?=\d)"
+    rf"(?:(?P<eok>{_NUMBER})\s*억원?\s*)?"
+    rf"(?:(?P<cheon>{_NUMBER})\s*천(?:만)?원?\s*)?"
+    rf"(?:(?P<baek>{_NUMBER})\s*백(?:만)?원?\s*)?"
+    rf"(?:(?P<man>{_NUMBER})(?:\s*(?P<man_unit>만원?|원)|(?!\s*[억천백])))?"
+)
+
+# KB시세 구분 표시 또는 금액 (앞에서부터 한 번에 훑음)
+_MONEY_TOKEN_PATTERN = re.compile(rf"(?P<label>일반|하한|상한)|{_AMOUNT}")
+
+# 금액 하나만 읽기 (주어진 위치에서 시작)
+_AMOUNT_PATTERN = re.compile(_AMOUNT)
+
+# 단위 없는 숫자를 KB시세로 인정하는 최소 자릿수 (층수, 날짜 조각 등 제외)
+MIN_PLAIN_DIGITS = 3
+
+# 단위별 만원 환산 (분자, 분모)
+_UNIT_SCALES = (("eok", 10000, 1), ("cheon", 1000, 1), ("baek", 100, 1))
+
+# KB시세 구분 표시 -> KbPrice 필드 순서
+_LABEL_SLOTS = {"일반": 0, "하한": 1, "상한": 2}
+
+# 시세 없음 표시
+NO_PRICE_TEXTS = ("", "시세없음")
+
+
+class KbPrice(NamedTuple):
+    """KB시세 (만원 단위 정수, 없으면 None)"""
+    general: Optional[int]  # 일반가 (표시가 없으면 처음 나온 금액)
+    lower: Optional[int]  # 하한가
+    upper: Optional[int]  # 상한가
+
+
+NO_KB_PRICE = KbPrice(None, None, None)
+
+
+def _scaled(number: str, numerator: int, denominator: int) -> int:
+    """숫자 문자열 x 단위를 만원 단위 정수로 (소수점도 정수 연산으로 계산, 나머지는 버림)"""
+    number = number.replace(",", "")
+    if "." in number:
+        whole, fraction = number.split(".", 1)
+        fraction_scale = 10 ** len(fraction)
+        return (int(whole) * fraction_scale + int(fraction)) * numerator // (fraction_scale * denominator)
+    return int(number) * numerator // denominator
+
+
+def _amount_value(match: "re.Match", min_plain_digits: int) -> Optional[int]:
+    """
+    금액 매칭 결과를 만원 단위 정수로 변환
+
+    Args:
+        match: _AMOUNT 패턴 매칭 결과
+        min_plain_digits: 단위 없는 숫자만 있을 때 필요한 최소 자릿수 (미달이면 None)
+    """
+    total = 0
+    has_unit = False
+    for group, numerator, denominator in _UNIT_SCALES:
+        number = match.group(group)
+        if number is not None:
+            total += _scaled(number, numerator, denominator)
+            has_unit = True
+
+    number = match.group("man")
+    if number is not None:
+        unit = match.group("man_unit")
+        if unit == "원":
+            total += _scaled(number, 1, 10000)
+        else:
+            total += _scaled(number, 1, 1)
+        if unit is None and not has_unit and len(number.split(".", 1)[0].replace(",", "")) < min_plain_digits:
+            return None
+        has_unit = has_unit or unit is not None
+    elif not has_unit:
+        return None
+    return total
+
+
+def read_amount(text: str, pos: int = 0) -> Optional[Tuple[int, int]]:
+    """
+    주어진 위치에서 시작하는 금액 하나 읽기
+
+    Args:
+        text: 금액이 포함된 문자열
+        pos: 금액이 시작하는 위치 (숫자여야 함)
+
+    Returns:
+        (만원 단위 금액, 금액이 끝난 위치), 해당 위치에 금액이 없으면 None
+    """
+    match = _AMOUNT_PATTERN.match(text, pos)
+    if match is None or match.end() == pos:
+        return None
+    value = _amount_value(match, 1)
+    if value is None:
+        return None
+    return value, match.end()
+
+
+def parse_money(text: Union[str, int, float, None]) -> Optional[int]:
+    """
+    문자열에서 처음 나오는 금액을 만원 단위 정수로 변환
+    예: "27,000만원" -> 27000, "1억 2천" -> 12000, "5천만" -> 5000
+
+    Args:
+        text: 금액 문자열 (숫자면 만원 단위 값으로 보고 정수로 변환)
+
+    Returns:
+        만원 단위 금액, 금액이 없으면 None
+    """
+    if text is None:
+        return None
+    if isinstance(text, (int, float)):
+        return int(text)
+    for match in _AMOUNT_PATTERN.finditer(text):
+        if match.end() == match.start():
+            continue
+        value = _amount_value(match, 1)
+        if value is not None:
+            return value
+    return None
+
+
+def parse_kb_price(kb_price: Union[str, int, float, None]) -> KbPrice:
+    """
+    KB시세 표현을 일반/하한/상한가로 변환 (한 번만 훑음)
+    예: "일반 175,000만원 하한 171,000만원" -> KbPrice(175000, 171000, None)
+
+    - 구분 표시 뒤에 처음 나오는 금액이 해당 구분의 가격
+    - 표시 없는 금액은 일반가 (일반가가 아직 없을 때)
+    - 일반가가 없으면 처음 나온 금액을 일반가로 사용
+    - 단위 없는 숫자는 MIN_PLAIN_DIGITS자리 이상만 금액으로 인정
+    - 숫자로 주어지면 이미 변환된 일반가로 보고 그대로 사용 (100만원 미만은 없음으로 처리)
+
+    Args:
+        kb_price: KB시세 문자열 또는 만원 단위 숫자
+
+    Returns:
+        KbPrice (시세가 없으면 모든 필드가 None)
+    """
+    if kb_price is None:
+        return NO_KB_PRICE
+    if isinstance(kb_price, (int, float)):
+        value = int(kb_price)
+        return KbPrice(value, None, None) if value >= 10 ** (MIN_PLAIN_DIGITS - 1) else NO_KB_PRICE
+
+    text = str(kb_price).strip()
+    if text in NO_PRICE_TEXTS:
+        return NO_KB_PRICE
+
+    prices = [None, None, None]
+    first = None
+    slot = None
+    for match in _MONEY_TOKEN_PATTERN.finditer(text):
+        label = match.group("label")
+        if label is not None:
+            slot = _LABEL_SLOTS[label]
+            continue
+        if match.end() == match.start():
+            continue
+        value = _amount_value(match, MIN_PLAIN_DIGITS)
+        if value is None:
+            continue
+        if first is None:
+            first = value
+        target = 0 if slot is None else slot
+        if prices[target] is None:
+            prices[target] = value
+        slot = None
+
+    if prices[0] is None:
+        prices[0] = first
+    return KbPrice(*prices)
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+견적 실행기
+메시지 파싱/전체 금융사 계산/결과 포맷팅(CPU 작업)을 이벤트 루프 밖의 실행기에서 처리하여,
+느린 메시지 하나가 다른 채팅방의 업데이트 처리를 막지 않도록 함 (main.py 폴링 모드, api/webhook.py 이벤트 루프 워커)
+수정 메시지는 이전 산출 기록(calculator.requote.QuoteRecord)을 함께 넘겨 기존 답장 정보를 이어받음
+
+- thread: 스레드 풀 (기본, 이벤트 루프는 막히지 않지만 계산은 GIL 때문에 한 번에 하나씩)
+- process: 프로세스 풀 (계산도 병렬, 작업 프로세스는 시작 시 모듈과 금융사 설정 번들을 미리 로드)
+- inline: 이벤트 루프에서 바로 계산 (이전 동작)
+
+메시지마다 대기열 길이와 단계별 시간(대기, 파싱, 계산, 포맷)을 기록하고 stats()로 누적 통계를 확인
+
+설정 (환경변수, quote_executor_from_env):
+    QUOTE_EXECUTOR=thread      # thread, process, inline
+    QUOTE_WORKERS=4            # 작업 스레드/프로세스 수 (process 기본값은 CPU 수)
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional, Tuple
+from utils.env import env_int
+
+
+logger = logging.getLogger(__name__)
+
+# 실행기 종류
+EXECUTOR_KINDS = ("thread", "process", "inline")
+
+# 기본 실행기 / 스레드 풀 작업 스레드 수
+DEFAULT_EXECUTOR = "thread"
+DEFAULT_THREAD_WORKERS = 4
+
+
+class QuoteOutcome(NamedTuple):
+    """메시지 하나의 견적 결과와 단계별 시간 (ms)"""
+    text: str  # 포맷된 결과 메시지
+    queue_ms: float  # 실행기 대기열에서 기다린 시간
+    parse_ms: float
+    calculate_ms: float
+    format_ms: float
+    queue_depth: int  # 제출 시점에 먼저 기다리거나 처리 중이던 메시지 수
+    record: Any = None  # calculator.requote.QuoteRecord (산출 결과, 이전 기록의 답장 정보)
+
+    @property
+    def total_ms(self) -> float:
+        return self.queue_ms + self.parse_ms + self.calculate_ms + self.format_ms
+
+
+class QuoteExecutorStats(NamedTuple):
+    """누적 통계"""
+    kind: str
+    workers: int
+    completed: int  # 처리한 메시지 수
+    in_flight: int  # 대기 중이거나 처리 중인 메시지 수 (현재 대기열 길이)
+    max_queue_depth: int  # 가장 길었던 대기열
+    avg_queue_ms: float
+    avg_parse_ms: float
+    avg_calculate_ms: float
+    avg_format_ms: float
+
+
+def _quote_message(message_text: str, previous: Any,
+                   submitted_at: float) -> Tuple[Any, str, float, float, float, float]:
+    """
+    작업 스레드/프로세스에서 실행: 파싱 -> 계산 -> 포맷
+    (time.monotonic은 프로세스 간에도 같은 시계이므로 대기 시간 계산에 사용)
+
+    Returns:
+        (산출 기록, 포맷된 결과, 대기, 파싱, 계산, 포맷 시간 ms)
+    """
+    from parsers.message_parser import MessageParser
+    from calculator.requote import requote
+    from utils.formatter import format_all_results
+
+    started = time.monotonic()
+    property_data = MessageParser().parse(message_text)
+    parsed = time.monotonic()
+    record = requote(property_data, previous)
+    calculated = time.monotonic()
+    text = format_all_results(record.results)
+    formatted = time.monotonic()
+    return (
+        record,
+        text,
+        max(0.0, started - submitted_at) * 1000,
+        (parsed - started) * 1000,
+        (calculated - parsed) * 1000,
+        (formatted - calculated) * 1000,
+    )
+
+
+def _warm_worker() -> int:
+    """작업 프로세스 시작 시 모듈과 금융사 설정을 미리 로드 (첫 메시지가 로드 시간을 기다리지 않도록)"""
+    from calculator.base_calculator import BaseCalculator
+    from calculator.bank_registry import get_bank_registry
+
+    importlib.import_module("parsers.message_parser")
+    importlib.import_module("utils.formatter")
+    get_bank_registry(BaseCalculator).snapshot()
+    return os.getpid()
+
+
+class QuoteExecutor:
+    """
+    견적 계산을 실행기에 넘기고 결과를 기다리는 비동기 인터페이스
+    """
+
+    def __init__(self, kind: str = DEFAULT_EXECUTOR, workers: Optional[int] = None):
+        """
+        Args:
+            kind: "thread", "process", "inline"
+            workers: 작업 스레드/프로세스 수 (없으면 thread 4개, process는 CPU 수)
+        """
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"지원하지 않는 견적 실행기: {kind} ({', '.join(EXECUTOR_KINDS)} 중 하나)")
+        self.kind = kind
+        if kind == "inline":
+            self.workers = 1
+        elif workers is not None and workers > 0:
+            self.workers = workers
+        else:
+            self.workers = (os.cpu_count() or 1) if kind == "process" else DEFAULT_THREAD_WORKERS
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._totals = [0.0, 0.0, 0.0, 0.0]  # 대기, 파싱, 계산, 포맷 (ms)
+
+    def _get_executor(self) -> Optional[Executor]:
+        """실행기 (처음 사용할 때 생성, inline이면 None)"""
+        if self.kind == "inline":
+            return None
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.kind == "process":
+                        # 이미 스레드가 떠 있는 봇 프로세스를 fork하지 않도록 spawn 사용
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.workers,
+                            mp_context=multiprocessing.get_context("spawn"),
+                            initializer=_warm_worker
+                        )
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.workers, thread_name_prefix="quote"
+                        )
+        return self._executor
+
+    async def start(self) -> None:
+        """작업 스레드/프로세스를 미리 띄우고 모듈과 금융사 설정을 로드 (봇 시작 시 호출)"""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        if executor is None:
+            _warm_worker()
+            return
+        started = time.monotonic()
+        # 작업 수만큼 동시에 제출해야 풀이 작업자를 모두 띄움
+        pids = await asyncio.gather(*(loop.run_in_executor(executor, _warm_worker) for _ in range(self.workers)))
+        logger.info(
+            "견적 실행기 준비: %s %d개 (프로세스 %d개, %.0fms)",
+            self.kind, self.workers, len(set(pids)), (time.monotonic() - started) * 1000
+        )
+
+    async def quote(self, message_text: str, previous: Any = None) -> QuoteOutcome:
+        """
+        메시지 하나를 파싱/계산/포맷 (실행기에서 처리하고 결과를 기다림)
+
+        Args:
+            message_text: 텔레그램 메시지
+            previous: 수정 메시지의 이전 산출 기록 (QuoteRecord, 답장 정보를 이어받음)
+        """
+        with self._lock:
+            queue_depth = self._in_flight
+            self._in_flight += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._in_flight)
+        try:
+            executor = self._get_executor()
+            submitted_at = time.monotonic()
+            if executor is None:
+                result = _quote_message(message_text, previous, submitted_at)
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(executor, _quote_message, message_text, previous, submitted_at)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        record, text, *times = result
+        outcome = QuoteOutcome(text, *times, queue_depth=queue_depth, record=record)
+        with self._lock:
+            self._completed += 1
+            for index, value in enumerate(times):
+                self._totals[index] += value
+        return outcome
+
+    def stats(self) -> QuoteExecutorStats:
+        """누적 통계"""
+        with self._lock:
+            count = self._completed or 1
+            return QuoteExecutorStats(
+                self.kind, self.workers, self._completed, self._in_flight, self._max_queue_depth,
+                *(total / count for total in self._totals)
+            )
+
+    def shutdown(self) -> None:
+        """실행기 종료 (처리 중인 메시지는 끝날 때까지 기다림)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def quote_executor_from_env() -> QuoteExecutor:
+    """QUOTE_EXECUTOR, QUOTE_WORKERS 환경변수로 실행기 생성 (잘못된 값이면 기본값)"""
+    kind = (os.getenv("QUOTE_EXECUTOR") or DEFAULT_EXECUTOR).strip().lower()
+    if kind not in EXECUTOR_KINDS:
+        logger.warning("QUOTE_EXECUTOR=%s 는 지원하지 않아 %s 사용", kind, DEFAULT_EXECUTOR)
+        kind = DEFAULT_EXECUTOR
+    return QuoteExecutor(kind, env_int("QUOTE_WORKERS", None))
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+행정구역 인덱스
+전체 지역 리스트와 공백 제거 지역명 -> 정수 지역 ID 매핑
+주소 문자열에서 행정구역을 찾는 매칭 오토마톤 (별칭 포함)
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# 전체 지역 리스트 (메인 계산기 기준)
+ALL_REGIONS = [
+    "서울특별시종로구", "서울특별시중구", "서울특별시용산구", "서울특별시성동구",
+    "서울특별시광진구", "서울특별시동대문구", "서울특별시중랑구", "서울특별시성북구",
+    "서울특별시강북구", "서울특별시도봉구", "서울특별시노원구", "서울특별시은평구",
+    "서울특별시서대문구", "서울특별시마포구", "서울특별시양천구", "서울특별시강서구",
+    "서울특별시구로구", "서울특별시금천구", "서울특별시영등포구", "서울특별시동작구",
+    "서울특별시관악구", "서울특별시서초구", "서울특별시강남구", "서울특별시송파구",
+    "서울특별시강동구",
+    "경기도성남시분당구", "경기도광명시", "경기도과천시", "경기도하남시",
+    "경기도수원시장안구", "경기도수원시권선구", "경기도수원시팔달구", "경기도수원시영통구",
+    "경기도성남시수정구", "경기도성남시중원구", "경기도안양시만안구", "경기도안양시동안구",
+    "경기도부천시소사구", "경기도부천시오정구", "경기도부천시원미구", "경기도고양시덕양구",
+    "경기도고양시일산동구", "경기도고양시일산서구", "인천광역시연수구", "인천광역시부평구",
+    "경기도의정부시", "경기도안산시상록구", "경기도안산시단원구", "경기도구리시",
+    "경기도남양주시", "경기도군포시", "경기도의왕시", "경기도용인시처인구",
+    "경기도용인시기흥구", "경기도용인시수지구", "경기도김포시", "경기도화성시",
+    "경기도평택시", "경기도동두천시", "경기도오산시", "경기도시흥시",
+    "경기도파주시", "경기도안성시", "경기도광주시", "경기도양주시",
+    "경기도이천시", "경기도포천시", "경기도여주시", "경기도연천군",
+    "경기도가평군", "경기도양평군",
+    "인천광역시중구", "인천광역시동구", "인천광역시남동구", "인천광역시계양구",
+    "인천광역시서구", "인천광역시미추홀구", "인천광역시강화군", "인천광역시옹진군",
+    "광주광역시동구", "광주광역시서구", "광주광역시남구", "광주광역시북구", "광주광역시광산구",
+    "대전광역시동구", "대전광역시중구", "대전광역시서구", "대전광역시유성구", "대전광역시대덕구",
+    "울산광역시중구", "울산광역시남구", "울산광역시동구", "울산광역시북구", "울산광역시울주군",
+    "세종특별자치시세종시",
+    "강원특별자치도춘천시", "강원특별자치도원주시", "강원특별자치도강릉시",
+    "강원특별자치도동해시", "강원특별자치도태백시", "강원특별자치도속초시", "강원특별자치도삼척시",
+    "강원특별자치도홍천군", "강원특별자치도횡성군", "강원특별자치도영월군", "강원특별자치도평창군",
+    "강원특별자치도정선군", "강원특별자치도철원군", "강원특별자치도화천군", "강원특별자치도양구군",
+    "강원특별자치도인제군", "강원특별자치도고성군", "강원특별자치도양양군",
+    "충청북도충주시", "충청북도제천시", "충청북도청주시상당구", "충청북도청주시서원구",
+    "충청북도청주시흥덕구", "충청북도청주시청원구", "충청북도보은군", "충청북도옥천군",
+    "충청북도영동군", "충청북도진천군", "충청북도괴산군", "충청북도음성군",
+    "충청북도단양군", "충청북도증평군",
+    "충청남도천안시동남구", "충청남도천안시서북구", "충청남도공주시", "충청남도보령시",
+    "충청남도아산시", "충청남도서산시", "충청남도논산시", "충청남도계룡시",
+    "충청남도당진시", "충청남도금산군", "충청남도부여군", "충청남도서천군",
+    "충청남도청양군", "충청남도홍성군", "충청남도예산군", "충청남도태안군",
+    "전북특별자치도전주시완산구", "전북특별자치도전주시덕진구", "전북특별자치도군산시",
+    "전북특별자치도익산시", "전북특별자치도정읍시", "전북특별자치도남원시", "전북특별자치도김제시",
+    "전북특별자치도완주군", "전북특별자치도진안군", "전북특별자치도무주군", "전북특별자치도장수군",
+    "전북특별자치도임실군", "전북특별자치도순창군", "전북특별자치도고창군", "전북특별자치도부안군",
+    "전라남도목포시", "전라남도여수시", "전라남도순천시", "전라남도나주시",
+    "전라남도광양시", "전라남도담양군", "전라남도곡성군", "전라남도구례군",
+    "전라남도고흥군", "전라남도보성군", "전라남도화순군", "전라남도장흥군",
+    "전라남도강진군", "전라남도해남군", "전라남도영암군", "전라남도무안군",
+    "전라남도함평군", "전라남도영광군", "전라남도장성군", "전라남도완도군",
+    "전라남도진도군", "전라남도신안군",
+    "경상북도포항시남구", "경상북도포항시북구", "경상북도경주시", "경상북도김천시",
+    "경상북도안동시", "경상북도구미시", "경상북도영주시", "경상북도영천시",
+    "경상북도상주시", "경상북도문경시", "경상북도경산시", "경상북도의성군",
+    "경상북도청송군", "경상북도영양군", "경상북도영덕군", "경상북도청도군",
+    "경상북도고령군", "경상북도성주군", "경상북도칠곡군", "경상북도예천군",
+    "경상북도봉화군", "경상북도울진군", "경상북도울릉군",
+    "경상남도진주시", "경상남도통영시", "경상남도사천시", "경상남도김해시",
+    "경상남도밀양시", "경상남도거제시", "경상남도양산시", "경상남도창원시의창구",
+    "경상남도창원시성산구", "경상남도창원시마산합포구", "경상남도창원시마산회원구",
+    "경상남도창원시진해구", "경상남도의령군", "경상남도함안군", "경상남도창녕군",
+    "경상남도고성군", "경상남도남해군", "경상남도하동군", "경상남도산청군",
+    "경상남도함양군", "경상남도거창군", "경상남도합천군",
+    "제주특별자치도제주시", "제주특별자치도서귀포시",
+    "부산광역시중구", "부산광역시서구", "부산광역시동구", "부산광역시영도구",
+    "부산광역시부산진구", "부산광역시동래구", "부산광역시남구", "부산광역시북구",
+    "부산광역시해운대구", "부산광역시사하구", "부산광역시금정구", "부산광역시강서구",
+    "부산광역시연제구", "부산광역시수영구", "부산광역시사상구", "부산광역시기장군",
+    "대구광역시중구", "대구광역시동구", "대구광역시서구", "대구광역시남구",
+    "대구광역시북구", "대구광역시수성구", "대구광역시달서구", "대구광역시달성군",
+    "대구광역시군위군"
+]
+
+
+# 광역 단위 키 (서울, 경기 등) - 급지 조회 시 구체적인 지역만 처리하기 위해 제외
+METROPOLITAN_KEYS = frozenset([
+    "서울", "경기", "인천", "부산", "광주", "대전", "울산", "세종",
+    "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주", "대구"
+])
+
+
+def normalize_region_key(region: str) -> str:
+    """
+    지역명 정규화 (공백 제거)
+    예: "서울특별시 강남구" -> "서울특별시강남구"
+    """
+    return region.replace(" ", "")
+
+
+# 공백 제거 지역명 -> 지역 ID (ALL_REGIONS의 인덱스)
+REGION_ID_BY_KEY: Dict[str, int] = {
+    normalize_region_key(region): region_id for region_id, region in enumerate(ALL_REGIONS)
+}
+
+# 지역 ID 개수 (금융사별 조회 테이블 크기)
+REGION_COUNT = len(ALL_REGIONS)
+
+
+def get_region_id(region: Optional[str]) -> Optional[int]:
+    """
+    지역명을 지역 ID로 변환
+
+    Args:
+        region: 지역명 (공백 포함 가능)
+
+    Returns:
+        지역 ID 또는 None (전체 지역 리스트에 없는 지역)
+    """
+    if not region:
+        return None
+    return REGION_ID_BY_KEY.get(normalize_region_key(region))
+
+
+# 시/도 정식 명칭 -> 주소에 쓰이는 다른 표기 (약칭, 옛 명칭)
+# "광주시"는 경기도 광주시와 겹치므로 광주광역시 별칭에서 제외
+PROVINCE_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "서울특별시": ("서울", "서울시"),
+    "부산광역시": ("부산", "부산시"),
+    "대구광역시": ("대구", "대구시"),
+    "인천광역시": ("인천", "인천시"),
+    "광주광역시": ("광주",),
+    "대전광역시": ("대전", "대전시"),
+    "울산광역시": ("울산", "울산시"),
+    "세종특별자치시": ("세종",),
+    "경기도": ("경기",),
+    "강원특별자치도": ("강원도", "강원"),
+    "충청북도": ("충북",),
+    "충청남도": ("충남",),
+    "전북특별자치도": ("전라북도", "전북"),
+    "전라남도": ("전남",),
+    "경상북도": ("경북",),
+    "경상남도": ("경남",),
+    "제주특별자치도": ("제주도", "제주"),
+}
+
+# 행정구역을 찾지 못했을 때 사용하는 광역 단위 지역명 (앞에 있는 것 우선)
+FALLBACK_REGIONS = ("서울", "경기", "인천", "부산", "대구", "광주", "대전", "울산",
+                    "세종", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주")
+
+# 별칭 최소 길이 (두 글자 구/군 이름은 다른 단어 안에서 잘못 매칭되기 쉬움)
+MIN_ALIAS_LENGTH = 3
+
+
+def _split_province(region: str) -> Tuple[str, str]:
+    """공백 제거 지역명을 (시/도, 나머지)로 분리 (예: "경기도수원시영통구" -> ("경기도", "수원시영통구"))"""
+    for province in PROVINCE_ALIASES:
+        if region.startswith(province):
+            return province, region[len(province):]
+    return "", region
+
+
+def _region_aliases(region: str) -> List[str]:
+    """
+    지역 하나의 별칭 후보
+    - 시/도 약칭/옛 명칭 + 나머지: "서울강남구", "전라북도전주시완산구", "강원도홍천군"
+    - 시/도 없이 나머지만: "강남구", "수원시영통구"
+    - 구가 있는 시: 마지막 구만 ("영통구"), 시/구 글자 생략 ("수원영통", "수원시영통", "수원영통구")
+    """
+    province, rest = _split_province(region)
+    aliases = [alias + rest for alias in PROVINCE_ALIASES.get(province, ())]
+    aliases.append(rest)
+
+    city_end = rest.find("시")
+    if 0 < city_end < len(rest) - 1 and rest.endswith("구"):
+        city = rest[:city_end]
+        district = rest[city_end + 1:]
+        aliases.append(district)
+        aliases.append(city + district[:-1])
+        aliases.append(city + "시" + district[:-1])
+        aliases.append(city + district)
+    return aliases
+
+
+def build_region_aliases() -> Dict[str, int]:
+    """
+    별칭 -> 지역 ID (여러 지역에 해당하는 별칭과 너무 짧은 별칭, 정식 명칭과 같은 별칭은 제외)
+    """
+    candidates: Dict[str, set] = {}
+    for region_id, region in enumerate(ALL_REGIONS):
+        for alias in _region_aliases(normalize_region_key(region)):
+            candidates.setdefault(alias, set()).add(region_id)
+    return {
+        alias: next(iter(region_ids)) for alias, region_ids in candidates.items()
+        if len(region_ids) == 1 and len(alias) >= MIN_ALIAS_LENGTH and alias not in REGION_ID_BY_KEY
+    }
+
+
+# 별칭 -> 지역 ID
+REGION_ALIASES: Dict[str, int] = build_region_aliases()
+
+
+class RegionMatcher:
+    """
+    여러 지역명 패턴을 주소 문자열에서 한 번에 찾는 Aho-Corasick 오토마톤
+
+    패턴마다 우선순위(작을수록 우선)를 두고, 주소를 한 번 훑으면서
+    주소에 포함된 패턴 중 우선순위가 가장 높은 패턴의 값을 반환
+    (각 상태에 실패 링크를 따라 도달하는 패턴 중 최고 우선순위를 미리 계산해 둠)
+    """
+
+    __slots__ = ("_goto", "_fail", "_best", "_values")
+
+    def __init__(self, patterns: List[Tuple[str, Any]]):
+        """
+        Args:
+            patterns: (패턴, 값) 리스트 - 앞에 있는 패턴이 우선 (같은 패턴은 처음 것만 사용)
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._best: List[Optional[int]] = [None]
+        self._values: List[Any] = []
+
+        for pattern, value in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._best.append(None)
+                state = next_state
+            if self._best[state] is None:
+                self._best[state] = len(self._values)
+                self._values.append(value)
+
+        # 실패 링크 (너비 우선) 및 상태별 최고 우선순위 패턴
+        self._fail: List[int] = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail_target if fail_target != next_state else 0
+                inherited = self._best[self._fail[next_state]]
+                if inherited is not None and (self._best[next_state] is None or inherited < self._best[next_state]):
+                    self._best[next_state] = inherited
+                queue.append(next_state)
+
+    def find(self, text: str) -> Optional[Any]:
+        """text에 포함된 패턴 중 우선순위가 가장 높은 패턴의 값 (없으면 None)"""
+        goto = self._goto
+        fail = self._fail
+        best_states = self._best
+        best = None
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            candidate = best_states[state]
+            if candidate is not None and (best is None or candidate < best):
+                best = candidate
+                if best == 0:
+                    break
+        return self._values[best] if best is not None else None
+
+
+def _build_region_matcher() -> RegionMatcher:
+    """
+    주소 매칭 오토마톤 생성
+    우선순위: 정식 명칭(긴 것 우선) > 별칭(긴 것 우선) > 광역 단위 지역명(FALLBACK_REGIONS 순서)
+    """
+    names = sorted(REGION_ID_BY_KEY.items(), key=lambda item: -len(item[0]))
+    aliases = sorted(REGION_ALIASES.items(), key=lambda item: -len(item[0]))
+    patterns: List[Tuple[str, Any]] = [(name, (ALL_REGIONS[region_id], region_id)) for name, region_id in names]
+    patterns += [(alias, (ALL_REGIONS[region_id], region_id)) for alias, region_id in aliases]
+    patterns += [(region, (region, None)) for region in FALLBACK_REGIONS]
+    return RegionMatcher(patterns)
+
+
+_REGION_MATCHER = _build_region_matcher()
+
+
+def match_region(address: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
+    """
+    주소에서 행정구역(구/시/군 단위) 찾기
+    공백을 제거한 주소를 한 번 훑어 정식 명칭 > 별칭 > 광역 단위 지역명 순으로 가장 알맞은 지역 선택
+
+    Args:
+        address: 주소 (공백 포함 가능)
+
+    Returns:
+        (지역명, 지역 ID) - 광역 단위로만 찾은 경우 ("서울", None), 못 찾으면 (None, None)
+        예: "서울 강남구 역삼동 1-1" -> ("서울특별시강남구", 22)
+    """
+    if not address:
+        return None, None
+    match = _REGION_MATCHER.find(normalize_region_key(address))
+    return match if match is not None else (None, None)
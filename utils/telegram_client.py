@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+경량 텔레그램 Bot API 클라이언트 (웹훅 경로용)
+python-telegram-bot의 Bot(getMe, 요청 객체 변환 등) 대신 sendMessage/editMessageText를 JSON으로 바로 보냄
+
+- HTTP는 httpx.AsyncClient 하나를 공유 (python-telegram-bot이 의존하므로 항상 설치되어 있음)
+  keep-alive 연결 풀 크기는 httpx.Limits로 지정하고, 유휴 연결이 서버에서 끊긴 경우의 처리도 httpx에 맡김
+  (httpx는 보낸 요청을 다시 보내지 않으므로 sendMessage가 두 번 전달되지 않음)
+- 연결은 처음 사용한 이벤트 루프에 묶이므로 같은 루프(utils/loop_worker)에서만 사용
+- base_url을 바꾸면 로컬 대역 서버로 보낼 수 있음 (scripts/bench_telegram_client.py 참고)
+- 업데이트 해석/답장 파라미터는 utils/telegram_update (asyncio를 로드하지 않음)
+
+설정 (환경변수):
+    TELEGRAM_API_BASE_URL=https://api.telegram.org   # Bot API 주소
+    TELEGRAM_API_POOL_SIZE=4                        # 최대 동시 연결 수
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+import httpx
+
+from utils.env import env_int
+from utils.telegram_update import WebhookUpdate, reply_params
+
+
+# 기본 Bot API 주소 / 최대 동시 연결 수 / 요청 시간 제한 (초)
+DEFAULT_BASE_URL = "https://api.telegram.org"
+DEFAULT_POOL_SIZE = 4
+DEFAULT_TIMEOUT = 10.0
+
+
+class BotApiError(Exception):
+    """Bot API가 ok=false를 반환하거나 응답을 해석할 수 없음"""
+
+    def __init__(self, description: str, error_code: Optional[int] = None, retry_after: Optional[int] = None):
+        super().__init__(description)
+        self.error_code = error_code
+        self.retry_after = retry_after
+
+
+class BotApiClient:
+    """
+    httpx.AsyncClient 하나(keep-alive 연결 풀)를 공유하는 Bot API 클라이언트 (sendMessage, editMessageText 등 JSON 메서드)
+    """
+
+    def __init__(self, token: str, base_url: Optional[str] = None, pool_size: int = DEFAULT_POOL_SIZE,
+                 timeout: float = DEFAULT_TIMEOUT, http: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            token: 봇 토큰
+            base_url: Bot API 주소 (없으면 api.telegram.org, http:// 주소도 가능)
+            pool_size: 최대 동시 연결 수 (유휴 연결은 이 수만큼 보관)
+            timeout: 요청 시간 제한 (초, 연결/전송/수신 단계별)
+            http: 사용할 httpx.AsyncClient (없으면 base_url, pool_size, timeout으로 생성)
+        """
+        self.pool_size = max(1, pool_size)
+        self.http = http if http is not None else httpx.AsyncClient(
+            base_url=base_url or DEFAULT_BASE_URL,
+            limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+            timeout=timeout
+        )
+        self._path_prefix = f"/bot{token}/"
+
+    async def call(self, method: str, params: Dict[str, Any]) -> Any:
+        """
+        Bot API 메서드 호출
+
+        Returns:
+            응답의 result
+
+        Raises:
+            BotApiError: ok=false 응답 (description, error_code, retry_after 포함)
+            httpx.HTTPError: 연결 실패/시간 초과 (요청을 보낸 뒤 연결이 끊긴 경우 포함, 다시 보내지 않음)
+        """
+        response = await self.http.post(
+            self._path_prefix + method,
+            content=json.dumps(params, ensure_ascii=False).encode("utf-8"),
+            headers={"Content-Type": "application/json"}
+        )
+        try:
+            data = response.json()
+        except ValueError:
+            raise BotApiError(f"{method}: 응답을 해석할 수 없음 (HTTP {response.status_code})", response.status_code) from None
+        if not data.get("ok"):
+            parameters = data.get("parameters") or {}
+            raise BotApiError(
+                data.get("description") or f"{method} 실패 (HTTP {response.status_code})",
+                data.get("error_code", response.status_code),
+                parameters.get("retry_after")
+            )
+        return data.get("result")
+
+    async def send_message(self, chat_id: int, text: str, reply_to_message_id: Optional[int] = None) -> Dict[str, Any]:
+        """sendMessage (보낸 메시지 객체 반환)"""
+        params: Dict[str, Any] = {"chat_id": chat_id, "text": text}
+        if reply_to_message_id is not None:
+            params["reply_to_message_id"] = reply_to_message_id
+            params["allow_sending_without_reply"] = True
+        return await self.call("sendMessage", params)
+
+    async def reply_text(self, update: WebhookUpdate, text: str) -> Dict[str, Any]:
+        """업데이트의 메시지에 답장 (reply_params 참고, 보낸 메시지 객체 반환)"""
+        return await self.call("sendMessage", reply_params(update, text))
+
+    async def edit_message_text(self, chat_id: int, message_id: int, text: str) -> Any:
+        """editMessageText"""
+        return await self.call("editMessageText", {"chat_id": chat_id, "message_id": message_id, "text": text})
+
+    async def close(self) -> None:
+        """연결 풀 닫기 (이후에는 사용할 수 없음)"""
+        await self.http.aclose()
+
+
+def bot_api_client_from_env(token: str) -> BotApiClient:
+    """TELEGRAM_API_BASE_URL, TELEGRAM_API_POOL_SIZE 환경변수로 클라이언트 생성 (잘못된 값이면 기본값)"""
+    pool_size = env_int("TELEGRAM_API_POOL_SIZE", DEFAULT_POOL_SIZE)
+    return BotApiClient(token, os.getenv("TELEGRAM_API_BASE_URL") or None, pool_size)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+텔레그램 웹훅 업데이트 해석과 답장 파라미터
+python-telegram-bot의 Update 대신 웹훅 body에서 쓰는 필드(업데이트 종류, 채팅방/메시지 ID, 텍스트, 명령어)만 꺼냄
+
+- 네트워크/asyncio를 쓰지 않으므로 웹훅이 앱을 초기화하기 전에 업데이트를 걸러낼 때도 사용 (api/webhook.py)
+- 답장 전송은 utils/telegram_client, 웹훅 응답 본문으로 답장할 때는 WebhookReplySlot
+"""
+
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+# 메시지를 담는 업데이트 종류 (웹훅에서 처리하는 것만)
+MESSAGE_KINDS = ("message", "edited_message", "channel_post", "edited_channel_post")
+
+# 텔레그램 메시지 최대 길이 (글자 수)
+MAX_MESSAGE_LENGTH = 4096
+
+
+class WebhookUpdate(NamedTuple):
+    """웹훅 업데이트에서 사용하는 필드만 꺼낸 값"""
+    update_id: int
+    kind: Optional[str]  # MESSAGE_KINDS 중 하나 (메시지가 없는 업데이트는 None)
+    chat_id: Optional[int] = None
+    chat_type: Optional[str] = None  # private, group, supergroup, channel
+    message_id: Optional[int] = None
+    text: Optional[str] = None
+    command: Optional[str] = None  # 메시지 맨 앞의 명령어 이름 ("/start@봇이름" -> "start")
+
+    @property
+    def is_edit(self) -> bool:
+        return self.kind in ("edited_message", "edited_channel_post")
+
+
+def parse_update(body: Dict[str, Any]) -> WebhookUpdate:
+    """
+    웹훅 body(JSON 객체)에서 필요한 필드만 꺼냄
+
+    명령어 기준은 telegram.ext의 filters.COMMAND와 같음 (첫 엔티티가 메시지 맨 앞의 bot_command)
+    """
+    for kind in MESSAGE_KINDS:
+        message = body.get(kind)
+        if message is not None:
+            break
+    else:
+        return WebhookUpdate(body.get("update_id"), None)
+
+    chat = message.get("chat") or {}
+    text = message.get("text")
+    command = None
+    entities = message.get("entities")
+    if text and entities:
+        first = entities[0]
+        if first.get("type") == "bot_command" and first.get("offset") == 0:
+            command = text[1:first.get("length", 0)].split("@")[0].lower()
+    return WebhookUpdate(
+        update_id=body.get("update_id"),
+        kind=kind,
+        chat_id=chat.get("id"),
+        chat_type=chat.get("type"),
+        message_id=message.get("message_id"),
+        text=text,
+        command=command
+    )
+
+
+def reply_params(update: WebhookUpdate, text: str) -> Dict[str, Any]:
+    """
+    업데이트의 메시지에 답장하는 sendMessage 파라미터 (python-telegram-bot의 Message.reply_text 기본 동작과 같이
+    개인 채팅은 그냥 보내고, 그룹/채널은 원래 메시지를 인용)
+    """
+    params: Dict[str, Any] = {"chat_id": update.chat_id, "text": text}
+    if update.chat_type != "private":
+        params["reply_to_message_id"] = update.message_id
+        params["allow_sending_without_reply"] = True
+    return params
+
+
+def split_text(text: str, limit: int = MAX_MESSAGE_LENGTH) -> List[str]:
+    """
+    메시지 길이 제한에 맞게 줄 단위로 나눔 (한 줄이 limit보다 길면 그 줄은 글자 수로 자름)
+
+    Returns:
+        나눈 메시지 목록 (제한 이내면 [text])
+    """
+    if len(text) <= limit:
+        return [text]
+
+    parts = []
+    current = ""
+    for line in text.split("\n"):
+        while len(line) > limit:
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(line[:limit])
+            line = line[limit:]
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) > limit:
+            parts.append(current)
+            current = line
+        else:
+            current = candidate
+    if current:
+        parts.append(current)
+    return parts
+
+
+class WebhookReplySlot:
+    """
+    웹훅 응답 본문으로 보낼 Bot API 호출 하나를 받아 두는 자리
+    (텔레그램은 웹훅 응답 본문의 메서드 호출을 실행하지만 결과는 돌려주지 않고, 응답당 하나만 가능)
+
+    업데이트를 처리하는 코루틴이 offer하고, 응답을 만드는 핸들러가 take함
+    핸들러가 먼저 take했으면(처리 시간 초과 등) offer가 실패하므로 코루틴은 직접 보내야 함
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled: False면 항상 offer 실패 (응답 본문으로 답장하지 않음)
+        """
+        self._lock = threading.Lock()
+        self._payload: Optional[Dict[str, Any]] = None
+        self._closed = not enabled
+
+    def offer(self, method: str, params: Dict[str, Any]) -> bool:
+        """응답 본문으로 보낼 호출 등록 (이미 닫혔거나 다른 호출이 있으면 False)"""
+        with self._lock:
+            if self._closed or self._payload is not None:
+                return False
+            self._payload = {"method": method, **params}
+            return True
+
+    def take(self) -> Optional[Dict[str, Any]]:
+        """등록된 호출을 꺼내고 닫음 (이후 offer는 실패)"""
+        with self._lock:
+            self._closed = True
+            payload, self._payload = self._payload, None
+            return payload
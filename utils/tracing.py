@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+계산 경로 추적 로그 (tracing)
+모듈별로 레벨을 켜고 끌 수 있으며, 꺼져 있으면 메시지 포맷팅/출력을 하지 않음
+
+설정 (MORTGAGE_TRACE 환경변수):
+    MORTGAGE_TRACE=debug                          # 모든 모듈 debug
+    MORTGAGE_TRACE=calculator=debug,parser=info   # 모듈별 레벨
+    MORTGAGE_TRACE=info,calculator=debug          # 기본 info, calculator만 debug
+    (미설정 또는 off: 모두 끔)
+
+사용 예:
+    _trace = get_tracer("calculator")
+    _trace.debug("kb_price: %s, region: %s", kb_price, region)   # % 포맷은 켜져 있을 때만 수행
+
+    if _trace.debug_enabled:                                     # 인자 계산 자체가 비싼 경우
+        _trace.debug("mortgages: %s", [m.get("amount") for m in mortgages])
+"""
+
+import logging
+import os
+import sys
+import threading
+from typing import Dict, Optional
+
+
+# 레벨 이름 -> logging 레벨 (off는 모두 끔)
+LEVELS: Dict[str, int] = {
+    "off": logging.CRITICAL + 10,
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+}
+
+# 추적 로그 logger 이름 접두사 (예: trace.calculator)
+LOGGER_PREFIX = "trace"
+
+_tracers: Dict[str, "Tracer"] = {}
+_module_levels: Dict[str, int] = {}
+_default_level = LEVELS["off"]
+_lock = threading.Lock()
+_handler: Optional[logging.Handler] = None
+
+
+class Tracer:
+    """
+    모듈별 추적 로그
+    레벨 확인 결과를 속성으로 들고 있어서 꺼져 있을 때는 속성 확인 한 번으로 끝남
+    """
+
+    __slots__ = ("name", "logger", "debug_enabled", "info_enabled")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.logger = logging.getLogger(f"{LOGGER_PREFIX}.{name}")
+        self.debug_enabled = False
+        self.info_enabled = False
+
+    def _apply_level(self, level: int) -> None:
+        """레벨 적용 (configure_tracing/set_trace_level에서 호출)"""
+        self.logger.setLevel(level)
+        self.debug_enabled = level <= logging.DEBUG
+        self.info_enabled = level <= logging.INFO
+
+    def debug(self, msg: str, *args) -> None:
+        """debug 레벨 추적 (꺼져 있으면 포맷팅 없이 반환)"""
+        if self.debug_enabled:
+            self.logger.debug(msg, *args)
+
+    def info(self, msg: str, *args) -> None:
+        """info 레벨 추적 (꺼져 있으면 포맷팅 없이 반환)"""
+        if self.info_enabled:
+            self.logger.info(msg, *args)
+
+
+def get_tracer(name: str) -> Tracer:
+    """
+    모듈별 Tracer 반환 (모듈 로드 시 한 번 만들어 모듈 전역으로 보관)
+
+    Args:
+        name: 모듈 이름 (예: "calculator", "parser", "validators")
+    """
+    tracer = _tracers.get(name)
+    if tracer is None:
+        with _lock:
+            tracer = _tracers.get(name)
+            if tracer is None:
+                tracer = Tracer(name)
+                tracer._apply_level(_module_levels.get(name, _default_level))
+                _tracers[name] = tracer
+                _ensure_handler()
+    return tracer
+
+
+def configure_tracing(spec: Optional[str] = None) -> None:
+    """
+    추적 레벨 설정
+
+    Args:
+        spec: "debug", "calculator=debug,parser=info" 형식 문자열
+              (None이면 MORTGAGE_TRACE 환경변수 사용)
+    """
+    global _default_level
+
+    if spec is None:
+        spec = os.getenv("MORTGAGE_TRACE", "")
+
+    default_level = LEVELS["off"]
+    module_levels: Dict[str, int] = {}
+    for part in spec.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        if "=" in part:
+            name, level_name = (p.strip() for p in part.split("=", 1))
+            if level_name in LEVELS:
+                module_levels[name] = LEVELS[level_name]
+        elif part in LEVELS:
+            default_level = LEVELS[part]
+
+    with _lock:
+        _default_level = default_level
+        _module_levels.clear()
+        _module_levels.update(module_levels)
+        for name, tracer in _tracers.items():
+            tracer._apply_level(_module_levels.get(name, _default_level))
+
+
+def set_trace_level(name: str, level_name: str) -> None:
+    """
+    모듈 하나의 추적 레벨 변경 (실행 중 변경용)
+
+    Args:
+        name: 모듈 이름
+        level_name: "off", "error", "warning", "info", "debug"
+    """
+    level = LEVELS[level_name.lower()]
+    with _lock:
+        _module_levels[name] = level
+        tracer = _tracers.get(name)
+        if tracer is not None:
+            tracer._apply_level(level)
+
+
+def set_trace_stream(stream) -> None:
+    """추적 로그 출력 대상 변경 (기본 stdout, 벤치마크 등에서 사용)"""
+    global _handler
+    with _lock:
+        parent = logging.getLogger(LOGGER_PREFIX)
+        if _handler is not None:
+            parent.removeHandler(_handler)
+        _handler = None
+    _ensure_handler(stream)
+
+
+def _ensure_handler(stream=None) -> None:
+    """추적 로그 전용 핸들러 등록 (애플리케이션 logging 설정과 독립적으로 출력)"""
+    global _handler
+    if _handler is not None:
+        return
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter("%(levelname)s [%(name)s] %(message)s"))
+    parent = logging.getLogger(LOGGER_PREFIX)
+    parent.addHandler(handler)
+    parent.setLevel(logging.DEBUG)
+    parent.propagate = False
+    _handler = handler
+
+
+# 모듈 로드 시 환경변수 설정 적용
+configure_tracing()
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+웹훅 업데이트 중복 처리 방지
+처리가 늦어지면 텔레그램이 같은 업데이트(update_id)를 다시 보내므로,
+최근 처리한 update_id를 일정 시간 동안 기억하여 다시 온 업데이트는 계산/답장 없이 바로 200으로 응답
+
+- UpdateDeduplicator: 프로세스 안 메모리 (크기 제한, 유효 시간)
+- SqliteUpdateDeduplicator: SQLite 파일 (같은 서버의 여러 작업 프로세스가 함께 사용)
+- claim(update_id)은 확인과 등록을 한 번에 하므로 처리 중에 다시 온 업데이트도 걸러짐
+- 처리를 시작하지 못한 경우(동시 처리 수 초과로 503 응답)는 release하여 다시 온 업데이트를 처리
+- stats()로 중복으로 걸러낸 횟수를 확인 (api/webhook.py GET 응답에 포함)
+
+설정 (환경변수, update_deduplicator_from_env):
+    UPDATE_DEDUP_SIZE=4096      # 기억할 최대 update_id 수, 0이면 사용 안 함
+    UPDATE_DEDUP_WINDOW=600     # 기억하는 시간 (초)
+    UPDATE_DEDUP_DB=/tmp/updates.sqlite3   # 지정하면 SQLite 사용
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+from utils.env import env_int, env_number
+
+
+# 기본 최대 항목 수 / 기억하는 시간 (초)
+DEFAULT_DEDUP_SIZE = 4096
+DEFAULT_DEDUP_WINDOW = 600.0
+
+# SQLite: 오래된 항목 정리 주기 (claim 횟수) / 잠금 대기 시간 (초)
+SQLITE_PRUNE_INTERVAL = 64
+SQLITE_TIMEOUT = 5.0
+
+
+class UpdateDedupStats(NamedTuple):
+    """중복 처리 방지 통계"""
+    backend: str  # memory, sqlite
+    size: int  # 현재 기억하는 update_id 수
+    max_size: int
+    window: float  # 기억하는 시간 (초)
+    duplicates: int  # 중복으로 걸러낸 업데이트 수
+    processed: int  # 처음 받아 처리한 업데이트 수
+    released: int  # 처리를 시작하지 못해 되돌린 수
+    evictions: int  # 크기 제한으로 제거한 항목 수
+    expirations: int  # 유효 시간이 지나 제거한 항목 수
+
+    @property
+    def duplicate_rate(self) -> float:
+        """받은 업데이트 중 중복 비율 (받은 적이 없으면 0)"""
+        received = self.duplicates + self.processed
+        return self.duplicates / received if received else 0.0
+
+
+class UpdateDeduplicator:
+    """
+    스레드 안전한 메모리 중복 처리 방지 (update_id -> 만료 시각, 오래된 순서)
+    """
+
+    backend = "memory"
+
+    def __init__(self, max_size: int = DEFAULT_DEDUP_SIZE, window: float = DEFAULT_DEDUP_WINDOW):
+        """
+        Args:
+            max_size: 기억할 최대 update_id 수 (0 이하이면 사용 안 함, claim은 항상 True)
+            window: 기억하는 시간 (초)
+        """
+        self.max_size = max_size
+        self.window = window
+        self._seen: "OrderedDict[int, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._duplicates = 0
+        self._processed = 0
+        self._released = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def claim(self, update_id: int) -> bool:
+        """
+        업데이트를 처리하겠다고 등록
+
+        Returns:
+            처음 받은 업데이트면 True (처리), 유효 시간 안에 이미 받은 업데이트면 False (중복)
+        """
+        if not self.enabled:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            if update_id in self._seen:
+                self._duplicates += 1
+                return False
+            self._seen[update_id] = now + self.window
+            self._processed += 1
+            while len(self._seen) > self.max_size:
+                self._seen.popitem(last=False)
+                self._evictions += 1
+            return True
+
+    def release(self, update_id: int) -> None:
+        """처리를 시작하지 못한 업데이트 등록 취소 (다시 오면 처리)"""
+        with self._lock:
+            if self._seen.pop(update_id, None) is not None:
+                self._processed -= 1
+                self._released += 1
+
+    def _expire(self, now: float) -> None:
+        """유효 시간이 지난 항목 제거 (lock 안에서 호출, 등록 순서 = 만료 순서)"""
+        while self._seen:
+            update_id, expires_at = next(iter(self._seen.items()))
+            if expires_at > now:
+                break
+            del self._seen[update_id]
+            self._expirations += 1
+
+    def clear(self) -> None:
+        """모든 항목 제거 (통계는 유지)"""
+        with self._lock:
+            self._seen.clear()
+
+    def stats(self) -> UpdateDedupStats:
+        """현재 통계"""
+        with self._lock:
+            self._expire(time.monotonic())
+            return UpdateDedupStats(
+                self.backend, len(self._seen), self.max_size, self.window,
+                self._duplicates, self._processed, self._released, self._evictions, self._expirations
+            )
+
+
+class SqliteUpdateDeduplicator(UpdateDeduplicator):
+    """
+    SQLite 파일을 쓰는 중복 처리 방지 (같은 파일을 쓰는 여러 프로세스가 함께 걸러냄)
+    만료 시각은 프로세스 간에 같은 벽시계(time.time) 기준, 통계의 횟수는 이 프로세스 기준
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, path: str, max_size: int = DEFAULT_DEDUP_SIZE, window: float = DEFAULT_DEDUP_WINDOW):
+        """
+        Args:
+            path: SQLite 파일 경로 (없으면 생성)
+            max_size: 기억할 최대 update_id 수 (0 이하이면 사용 안 함)
+            window: 기억하는 시간 (초)
+        """
+        super().__init__(max_size, window)
+        self.path = path
+        self._connection = None
+        self._claims = 0
+
+    def _connect(self):
+        """연결 (처음 사용할 때 생성, lock 안에서 호출)"""
+        if self._connection is None:
+            import sqlite3
+
+            connection = sqlite3.connect(
+                self.path, timeout=SQLITE_TIMEOUT, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS processed_updates ("
+                "update_id INTEGER PRIMARY KEY, expires_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS processed_updates_expires_at ON processed_updates (expires_at)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def claim(self, update_id: int) -> bool:
+        if not self.enabled:
+            return True
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            # 없거나 만료된 항목이면 등록(변경 1건), 유효한 항목이 있으면 변경 없음
+            cursor = connection.execute(
+                "INSERT INTO processed_updates (update_id, expires_at) VALUES (?, ?) "
+                "ON CONFLICT (update_id) DO UPDATE SET expires_at = excluded.expires_at "
+                "WHERE processed_updates.expires_at <= ?",
+                (update_id, now + self.window, now)
+            )
+            claimed = cursor.rowcount == 1
+            if claimed:
+                self._processed += 1
+            else:
+                self._duplicates += 1
+            self._claims += 1
+            if self._claims % SQLITE_PRUNE_INTERVAL == 0:
+                self._prune(connection, now)
+            return claimed
+
+    def release(self, update_id: int) -> None:
+        with self._lock:
+            cursor = self._connect().execute("DELETE FROM processed_updates WHERE update_id = ?", (update_id,))
+            if cursor.rowcount:
+                self._processed -= 1
+                self._released += 1
+
+    def _prune(self, connection, now: float) -> None:
+        """만료된 항목과 크기 제한을 넘은 오래된 항목 제거 (lock 안에서 호출)"""
+        self._expirations += connection.execute(
+            "DELETE FROM processed_updates WHERE expires_at <= ?", (now,)
+        ).rowcount
+        self._evictions += connection.execute(
+            "DELETE FROM processed_updates WHERE update_id IN ("
+            "SELECT update_id FROM processed_updates ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_size,)
+        ).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM processed_updates")
+
+    def stats(self) -> UpdateDedupStats:
+        with self._lock:
+            connection = self._connect()
+            self._prune(connection, time.time())
+            size = connection.execute("SELECT COUNT(*) FROM processed_updates").fetchone()[0]
+            return UpdateDedupStats(
+                self.backend, size, self.max_size, self.window,
+                self._duplicates, self._processed, self._released, self._evictions, self._expirations
+            )
+
+    def close(self) -> None:
+        """연결 닫기"""
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+
+def update_deduplicator_from_env() -> UpdateDeduplicator:
+    """UPDATE_DEDUP_SIZE, UPDATE_DEDUP_WINDOW, UPDATE_DEDUP_DB 환경변수로 생성 (잘못된 값이면 기본값)"""
+    max_size = env_int("UPDATE_DEDUP_SIZE", DEFAULT_DEDUP_SIZE)
+    window = env_number("UPDATE_DEDUP_WINDOW", DEFAULT_DEDUP_WINDOW)
+    path = os.getenv("UPDATE_DEDUP_DB")
+    if path:
+        return SqliteUpdateDeduplicator(path, max_size, window)
+    return UpdateDeduplicator(max_size, window)